@@ -148,7 +148,6 @@ class GranolaStatus(BaseModel):
     watching: bool
     granola_path: str
     pending_files: int
-    interval_seconds: int
     message: Optional[str] = None
 
 
@@ -178,17 +177,14 @@ async def get_granola_status() -> GranolaStatus:
     try:
         from api.main import _granola_processor
         running = _granola_processor.is_running if _granola_processor else False
-        interval = _granola_processor.interval_seconds if _granola_processor else 300
     except Exception:
         running = False
-        interval = 300
 
     return GranolaStatus(
         status="running" if running else "stopped",
         watching=running,
         granola_path=str(granola_path),
         pending_files=pending_count,
-        interval_seconds=interval,
         message=f"{pending_count} files pending in Granola inbox" if pending_count > 0 else "Inbox is empty"
     )
 
@@ -204,7 +200,7 @@ async def process_granola_backlog() -> GranolaProcessResponse:
         from api.services.granola_processor import GranolaProcessor
 
         processor = GranolaProcessor(settings.vault_path)
-        results = processor.process_backlog()
+        results = processor.process_backlog(force=True)
 
         return GranolaProcessResponse(
             status="success",
@@ -227,12 +223,12 @@ async def process_granola_backlog() -> GranolaProcessResponse:
 
 @router.post("/granola/start")
 async def start_granola_processor():
-    """Start the Granola processor (runs every 5 minutes)."""
+    """Start the Granola processor (processes inbox files as they arrive)."""
     try:
         from api.main import _granola_processor
         if _granola_processor:
             _granola_processor.start()
-            return {"status": "started", "message": "Granola processor started (runs every 5 minutes)"}
+            return {"status": "started", "message": "Granola processor started (watching inbox)"}
         else:
             # Create new processor if not initialized
             from api.services.granola_processor import GranolaProcessor
@@ -355,7 +351,6 @@ class OmiStatus(BaseModel):
     running: bool
     omi_events_path: str
     pending_files: int
-    interval_seconds: int
     message: Optional[str] = None
 
 
@@ -385,17 +380,14 @@ async def get_omi_status() -> OmiStatus:
     try:
         from api.main import _omi_processor
         running = _omi_processor.is_running if _omi_processor else False
-        interval = _omi_processor.interval_seconds if _omi_processor else 300
     except Exception:
         running = False
-        interval = 300
 
     return OmiStatus(
         status="running" if running else "stopped",
         running=running,
         omi_events_path=str(omi_events_path),
         pending_files=pending_count,
-        interval_seconds=interval,
         message=f"{pending_count} files pending in Omi/Events" if pending_count > 0 else "No files pending"
     )
 
@@ -414,7 +406,7 @@ async def process_omi_backlog() -> OmiProcessResponse:
         from api.services.omi_processor import OmiProcessor
 
         processor = OmiProcessor(settings.vault_path)
-        results = processor.process_backlog()
+        results = processor.process_backlog(force=True)
 
         return OmiProcessResponse(
             status="success",
@@ -437,12 +429,12 @@ async def process_omi_backlog() -> OmiProcessResponse:
 
 @router.post("/omi/start")
 async def start_omi_processor():
-    """Start the Omi processor (runs every 5 minutes)."""
+    """Start the Omi processor (processes inbox files as they arrive)."""
     try:
         from api.main import _omi_processor
         if _omi_processor:
             _omi_processor.start()
-            return {"status": "started", "message": "Omi processor started (runs every 5 minutes)"}
+            return {"status": "started", "message": "Omi processor started (watching inbox)"}
         else:
             # Create new processor if not initialized
             from api.services.omi_processor import OmiProcessor
@@ -50,6 +50,7 @@ from api.services.time_parser import (
 )
 from config.settings import settings
 from api.services.google_auth import GoogleAccount
+from api.utils.executors import GOOGLE, MODELS, offload, run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +59,8 @@ logger = logging.getLogger(__name__)
 # Parallel Source Fetching Helpers
 # =============================================================================
 
-async def _fetch_calendar_account(
+@offload(GOOGLE)
+def _fetch_calendar_account(
     account_type: GoogleAccount,
     date_ref: str | None,
 ) -> tuple[str, list]:
@@ -80,7 +82,8 @@ async def _fetch_calendar_account(
         return (account_type.value, [])
 
 
-async def _fetch_gmail_account(
+@offload(GOOGLE)
+def _fetch_gmail_account(
     account_type: GoogleAccount,
     person_email: str | None,
     is_sent_to: bool,
@@ -104,7 +107,8 @@ async def _fetch_gmail_account(
         return (account_type.value, [])
 
 
-async def _fetch_drive_account(
+@offload(GOOGLE)
+def _fetch_drive_account(
     account_type: GoogleAccount,
     search_term: str | None,
 ) -> tuple[str, list, list]:
@@ -121,7 +125,8 @@ async def _fetch_drive_account(
         return (account_type.value, [], [])
 
 
-async def _fetch_slack(query: str, top_k: int = 10) -> list:
+@offload(MODELS)
+def _fetch_slack(query: str, top_k: int = 10) -> list:
     """Fetch Slack messages."""
     try:
         from api.services.slack_indexer import get_slack_indexer
@@ -135,7 +140,8 @@ async def _fetch_slack(query: str, top_k: int = 10) -> list:
     return []
 
 
-async def _fetch_vault(query: str, top_k: int, date_filter: str | None = None) -> list:
+@offload(MODELS)
+def _fetch_vault(query: str, top_k: int, date_filter: str | None = None) -> list:
     """Fetch vault chunks using hybrid search."""
     try:
         hybrid_search = HybridSearch()
@@ -236,11 +242,13 @@ async def _execute_action_after(
             if params and params.get("to"):
                 account_str = params.get("account", "personal").lower()
                 account_type = GoogleAccount.WORK if account_str == "work" else GoogleAccount.PERSONAL
-                gmail = GmailService(account_type)
-                draft = gmail.create_draft(
-                    to=params["to"],
-                    subject=params.get("subject", ""),
-                    body=params.get("body", ""),
+                draft = await run_blocking(
+                    GOOGLE,
+                    lambda: GmailService(account_type).create_draft(
+                        to=params["to"],
+                        subject=params.get("subject", ""),
+                        body=params.get("body", ""),
+                    ),
                 )
                 if draft:
                     gmail_url = f"https://mail.google.com/mail/u/0/#drafts?compose={draft.draft_id}"
@@ -1032,11 +1040,13 @@ async def ask_stream(request: AskStreamRequest):
                         account_str = draft_params.get("account", "personal").lower()
                         account_type = GoogleAccount.WORK if account_str == "work" else GoogleAccount.PERSONAL
 
-                        gmail = GmailService(account_type)
-                        draft = gmail.create_draft(
-                            to=draft_params["to"],
-                            subject=draft_params.get("subject", ""),
-                            body=draft_params.get("body", ""),
+                        draft = await run_blocking(
+                            GOOGLE,
+                            lambda: GmailService(account_type).create_draft(
+                                to=draft_params["to"],
+                                subject=draft_params.get("subject", ""),
+                                body=draft_params.get("body", ""),
+                            ),
                         )
 
                         if draft:
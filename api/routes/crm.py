@@ -16,7 +16,7 @@ from fastapi import APIRouter, HTTPException, Query, UploadFile, File
 from pydantic import BaseModel, Field
 
 from api.services.person_entity import PersonEntity, get_person_entity_store, compute_person_category
-from api.services.interaction_store import get_interaction_store
+from api.services.interaction_store import from_epoch, get_interaction_store
 from config.people_config import InteractionConfig
 from config.settings import settings
 from api.services.source_entity import (
@@ -37,12 +37,15 @@ from api.services.relationship_discovery import (
     get_suggested_connections,
     get_connection_overlap,
 )
+from api.services.person_stats import get_person_stats_refresher
 from api.services.person_facts import (
     PersonFact,
     get_person_fact_store,
     get_person_fact_extractor,
     FACT_CATEGORIES,
 )
+from api.utils.db_connections import get_connection
+from api.utils.executors import GOOGLE, MODELS, SQLITE, offload, run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -532,7 +535,8 @@ def _get_partner_name() -> str:
 
 
 @router.get("/config", response_model=CRMConfigResponse)
-async def get_crm_config():
+@offload(SQLITE)
+def get_crm_config():
     """
     Get CRM configuration values for frontend.
 
@@ -549,7 +553,8 @@ async def get_crm_config():
 
 
 @router.get("/birthdays/today")
-async def get_todays_birthdays():
+@offload(SQLITE)
+def get_todays_birthdays():
     """Get all people with birthdays today."""
     person_store = get_person_entity_store()
     people = person_store.get_all()
@@ -565,7 +570,8 @@ async def get_todays_birthdays():
 
 
 @router.get("/birthdays/all")
-async def get_all_birthdays():
+@offload(SQLITE)
+def get_all_birthdays():
     """Get all people with birthdays, grouped by date."""
     person_store = get_person_entity_store()
     people = person_store.get_all()
@@ -593,7 +599,8 @@ async def get_all_birthdays():
 
 
 @router.get("/people", response_model=PersonListResponse)
-async def list_people(
+@offload(SQLITE)
+def list_people(
     q: Optional[str] = Query(default=None, description="Search query"),
     category: Optional[str] = Query(default=None, description="Filter by category"),
     source: Optional[str] = Query(default=None, description="Filter by source"),
@@ -707,7 +714,8 @@ async def list_people(
 
 
 @router.get("/people/{person_id}", response_model=PersonDetailResponse)
-async def get_person(
+@offload(SQLITE)
+def get_person(
     person_id: str,
     include_related: bool = Query(default=False, description="Include source entities and relationships"),
     refresh_strength: bool = Query(default=False, description="Recompute relationship strength (slower)"),
@@ -746,7 +754,8 @@ async def get_person(
 
 
 @router.patch("/people/{person_id}", response_model=PersonDetailResponse)
-async def update_person(person_id: str, request: PersonUpdateRequest):
+@offload(SQLITE)
+def update_person(person_id: str, request: PersonUpdateRequest):
     """
     Update a person's notes, tags, or category.
     """
@@ -801,7 +810,8 @@ class PersonMergeResponse(BaseModel):
 
 
 @router.post("/people/merge", response_model=PersonMergeResponse)
-async def merge_people(request: PersonMergeRequest):
+@offload(SQLITE)
+def merge_people(request: PersonMergeRequest):
     """
     Merge multiple people into a single record.
 
@@ -875,61 +885,33 @@ async def merge_people(request: PersonMergeRequest):
 # Split Helper Functions
 # ============================================================================
 
-def _recalculate_person_stats(person_id: str, int_conn, person_store) -> dict:
+def _recalculate_seen_range(person_id: str, int_conn, person_store) -> dict:
     """
-    Recalculate person stats from the interactions table.
+    Recalculate a person's first_seen/last_seen after interactions moved.
 
-    Returns dict of updated stats for logging.
-    """
-    from datetime import datetime, timezone
+    Interaction counts are refreshed separately, through the shared
+    PersonStatsRefresher.
 
+    Returns dict of old and new seen dates for logging.
+    """
     person = person_store.get_by_id(person_id)
     if not person:
         return {}
 
-    # Query interaction counts by source_type
-    cursor = int_conn.execute("""
-        SELECT source_type, COUNT(*) as count
-        FROM interactions
-        WHERE person_id = ?
-        GROUP BY source_type
-    """, (person_id,))
-
-    counts = {row[0]: row[1] for row in cursor.fetchall()}
-
-    # Map source_types to person stats
-    old_stats = {
-        'email_count': person.email_count,
-        'meeting_count': person.meeting_count,
-        'message_count': person.message_count,
-        'mention_count': person.mention_count,
-    }
-
-    person.email_count = counts.get('gmail', 0)
-    person.meeting_count = counts.get('calendar', 0)
-    person.message_count = (
-        counts.get('imessage', 0) +
-        counts.get('whatsapp', 0) +
-        counts.get('phone', 0)
-    )
-    person.mention_count = counts.get('vault', 0) + counts.get('granola', 0)
+    old_range = {'first_seen': person.first_seen, 'last_seen': person.last_seen}
 
-    # Update first_seen/last_seen from interactions
+    # ts_epoch, not the ISO strings: mixed Z/offset/naive timestamps don't sort lexically
     cursor = int_conn.execute("""
-        SELECT MIN(timestamp), MAX(timestamp)
+        SELECT MIN(ts_epoch), MAX(ts_epoch)
         FROM interactions
         WHERE person_id = ?
     """, (person_id,))
     row = cursor.fetchone()
-    interaction_first = None
-    interaction_last = None
-    if row and row[0]:
-        interaction_first = datetime.fromisoformat(row[0]).replace(tzinfo=timezone.utc)
-    if row and row[1]:
-        interaction_last = datetime.fromisoformat(row[1]).replace(tzinfo=timezone.utc)
+    interaction_first = from_epoch(row[0]) if row else None
+    interaction_last = from_epoch(row[1]) if row else None
 
     # Also check source_entities for earliest observed_at (may have older history)
-    crm_conn = sqlite3.connect(Path("data/crm.db"))
+    crm_conn = get_connection(Path("data/crm.db"))
     crm_cursor = crm_conn.execute("""
         SELECT MIN(observed_at), MAX(observed_at)
         FROM source_entities
@@ -962,14 +944,7 @@ def _recalculate_person_stats(person_id: str, int_conn, person_store) -> dict:
 
     person_store.update(person)
 
-    new_stats = {
-        'email_count': person.email_count,
-        'meeting_count': person.meeting_count,
-        'message_count': person.message_count,
-        'mention_count': person.mention_count,
-    }
-
-    return {'old': old_stats, 'new': new_stats}
+    return {'old': old_range, 'new': {'first_seen': person.first_seen, 'last_seen': person.last_seen}}
 
 
 def _recalculate_relationship_with_me(person_id: str, my_person_id: str, int_conn) -> dict:
@@ -999,13 +974,13 @@ def _recalculate_relationship_with_me(person_id: str, my_person_id: str, int_con
 
     # Get timestamps
     cursor = int_conn.execute("""
-        SELECT MIN(timestamp), MAX(timestamp)
+        SELECT MIN(ts_epoch), MAX(ts_epoch)
         FROM interactions
         WHERE person_id = ?
     """, (person_id,))
     row = cursor.fetchone()
-    first_seen = datetime.fromisoformat(row[0]).replace(tzinfo=timezone.utc) if row and row[0] else None
-    last_seen = datetime.fromisoformat(row[1]).replace(tzinfo=timezone.utc) if row and row[1] else None
+    first_seen = from_epoch(row[0]) if row else None
+    last_seen = from_epoch(row[1]) if row else None
 
     # Calculate shared counts (interactions with this person = shared with me)
     shared_events = counts.get('calendar', 0)
@@ -1119,7 +1094,8 @@ class ContactSource(BaseModel):
 
 
 @router.get("/people/{person_id}/contact-sources")
-async def get_person_contact_sources(person_id: str):
+@offload(SQLITE)
+def get_person_contact_sources(person_id: str):
     """
     Get aggregated contact sources linked to a person.
 
@@ -1144,7 +1120,7 @@ async def get_person_contact_sources(person_id: str):
         raise HTTPException(status_code=404, detail=f"Person '{person_id}' not found")
 
     crm_db = Path(__file__).parent.parent.parent / "data" / "crm.db"
-    conn = sqlite3.connect(crm_db)
+    conn = get_connection(crm_db)
     conn.row_factory = sqlite3.Row
 
     # Get all source entities for this person
@@ -1247,7 +1223,8 @@ async def get_person_contact_sources(person_id: str):
 
 
 @router.get("/people/{person_id}/source-entities")
-async def get_person_source_entities(
+@offload(SQLITE)
+def get_person_source_entities(
     person_id: str,
     limit: int = Query(default=500, ge=1, le=5000, description="Max source entities to return"),
     offset: int = Query(default=0, ge=0, description="Offset for pagination"),
@@ -1268,7 +1245,7 @@ async def get_person_source_entities(
         raise HTTPException(status_code=404, detail=f"Person '{person_id}' not found")
 
     crm_db = Path(__file__).parent.parent.parent / "data" / "crm.db"
-    conn = sqlite3.connect(crm_db)
+    conn = get_connection(crm_db)
     conn.row_factory = sqlite3.Row
 
     # Get total count first
@@ -1334,7 +1311,8 @@ async def get_person_source_entities(
 
 
 @router.post("/people/split", response_model=PersonSplitResponse)
-async def split_person(request: PersonSplitRequest):
+@offload(SQLITE)
+def split_person(request: PersonSplitRequest):
     """
     Split source entities from one person to another.
 
@@ -1396,7 +1374,7 @@ async def split_person(request: PersonSplitRequest):
 
     # Get source entity details for override creation
     crm_db = Path(__file__).parent.parent.parent / "data" / "crm.db"
-    conn = sqlite3.connect(crm_db)
+    conn = get_connection(crm_db)
     conn.row_factory = sqlite3.Row
 
     placeholders = ','.join('?' * len(request.source_entity_ids))
@@ -1433,11 +1411,11 @@ async def split_person(request: PersonSplitRequest):
     interactions_moved = 0
     if source_ids:
         int_db = Path(__file__).parent.parent.parent / "data" / "interactions.db"
-        int_conn = sqlite3.connect(int_db)
+        int_conn = get_connection(int_db)
 
         id_placeholders = ','.join('?' * len(source_ids))
         cursor = int_conn.execute(f"""
-            UPDATE interactions
+            UPDATE OR IGNORE interactions
             SET person_id = ?
             WHERE person_id = ?
             AND source_id IN ({id_placeholders})
@@ -1556,16 +1534,22 @@ async def split_person(request: PersonSplitRequest):
     logger.info("Recalculating stats and relationships...")
 
     int_db = Path(__file__).parent.parent.parent / "data" / "interactions.db"
-    int_conn_stats = sqlite3.connect(int_db)
+    int_conn_stats = get_connection(int_db)
 
-    # Recalculate stats for both persons
-    from_stats = _recalculate_person_stats(from_person.id, int_conn_stats, person_store)
-    to_stats = _recalculate_person_stats(to_person.id, int_conn_stats, person_store)
+    # Interaction counts go through the shared refresher, flushed now so the
+    # UI shows the new counts right after the split
+    refresher = get_person_stats_refresher()
+    refresher.mark_dirty([from_person.id, to_person.id])
+    refresher.flush()
 
-    if from_stats:
-        logger.info(f"  {from_person.canonical_name} stats: {from_stats['old']} -> {from_stats['new']}")
-    if to_stats:
-        logger.info(f"  {to_person.canonical_name} stats: {to_stats['old']} -> {to_stats['new']}")
+    # Recalculate first/last seen for both persons
+    from_range = _recalculate_seen_range(from_person.id, int_conn_stats, person_store)
+    to_range = _recalculate_seen_range(to_person.id, int_conn_stats, person_store)
+
+    if from_range:
+        logger.info(f"  {from_person.canonical_name} seen: {from_range['old']} -> {from_range['new']}")
+    if to_range:
+        logger.info(f"  {to_person.canonical_name} seen: {to_range['old']} -> {to_range['new']}")
 
     # Recalculate relationships with my_person_id
     my_person_id = settings.my_person_id
@@ -1609,7 +1593,8 @@ async def split_person(request: PersonSplitRequest):
 
 
 @router.get("/people/{person_id}/timeline", response_model=TimelineResponse)
-async def get_person_timeline(
+@offload(SQLITE)
+def get_person_timeline(
     person_id: str,
     source_type: Optional[str] = Query(
         default=None,
@@ -1691,7 +1676,8 @@ SOURCE_BADGES = {
 
 
 @router.get("/people/{person_id}/timeline/aggregated", response_model=AggregatedTimelineResponse)
-async def get_person_timeline_aggregated(
+@offload(SQLITE)
+def get_person_timeline_aggregated(
     person_id: str,
     source_type: Optional[str] = Query(
         default=None,
@@ -1713,10 +1699,8 @@ async def get_person_timeline_aggregated(
     Returns interactions aggregated by day, with counts and previews.
     Use include_items=True to get individual interactions within each group.
 
-    Performance notes:
-    - Default days_back=90 for fast initial load (~100ms)
-    - Use days_back=365 for full year view (may take 500ms+)
-    - include_items=False is faster for initial rendering
+    Counts come from the daily interaction rollup; only the most recent
+    interactions of each group are fetched for previews and items.
 
     Example response structure:
     ```
@@ -1760,17 +1744,18 @@ async def get_person_timeline_aggregated(
 
     interaction_store = get_interaction_store()
 
-    # Fetch interactions within the time range
-    # Use high limit for aggregation - need to support heavy users like Taylor (60k+ interactions)
-    # TODO: Optimize by doing aggregation in SQL instead of fetching all to Python
-    interactions = interaction_store.get_for_person(
+    source_types = None
+    if source_type:
+        source_types = [s.strip() for s in source_type.split(",") if s.strip()]
+
+    # Counts per day and source type: { date_str: { source_type: count } }
+    day_counts = interaction_store.get_daily_counts(
         person_id,
         days_back=days_back,
-        limit=100000,  # High limit for aggregation
-        source_type=source_type,
+        source_types=source_types,
     )
 
-    if not interactions:
+    if not day_counts:
         return AggregatedTimelineResponse(
             days=[],
             total_interactions=0,
@@ -1778,29 +1763,30 @@ async def get_person_timeline_aggregated(
             date_range_end=None,
         )
 
-    # Group interactions by date and source_type
-    # Structure: { date_str: { source_type: [interactions] } }
-    day_groups: dict[str, dict[str, list]] = defaultdict(lambda: defaultdict(list))
-
-    for interaction in interactions:
-        date_str = interaction.timestamp.strftime("%Y-%m-%d")
-        day_groups[date_str][interaction.source_type].append(interaction)
+    # Most recent interactions of each group (preview + optional items)
+    latest = interaction_store.get_latest_per_day(
+        person_id,
+        days_back=days_back,
+        source_types=source_types,
+        per_group=max_items_per_group if include_items else 1,
+    )
 
     # Build response
     days = []
-    for date_str in sorted(day_groups.keys(), reverse=True):
-        source_groups = day_groups[date_str]
+    total_interactions = 0
+    for date_str in sorted(day_counts.keys(), reverse=True):
+        source_counts = day_counts[date_str]
 
         groups = []
         day_total = 0
 
         # Sort by interaction count descending
-        for source_type in sorted(source_groups.keys(), key=lambda st: -len(source_groups[st])):
-            items_list = source_groups[source_type]
-            count = len(items_list)
+        for source_type in sorted(source_counts.keys(), key=lambda st: -source_counts[st]):
+            count = source_counts[source_type]
             day_total += count
+            items_list = latest.get((date_str, source_type), [])
 
-            # Get preview from first item
+            # Get preview from most recent item
             preview = items_list[0].title if items_list else None
             if preview and len(preview) > 50:
                 preview = preview[:47] + "..."
@@ -1832,6 +1818,7 @@ async def get_person_timeline_aggregated(
         date_obj = datetime.strptime(date_str, "%Y-%m-%d")
         date_display = date_obj.strftime("%b %d, %Y")
 
+        total_interactions += day_total
         days.append(AggregatedDayGroup(
             date=date_str,
             date_display=date_display,
@@ -1844,18 +1831,19 @@ async def get_person_timeline_aggregated(
     date_range_end = days[0].date if days else None
 
     elapsed = (time.time() - start_time) * 1000
-    logger.info(f"timeline_aggregated({person_id}) took {elapsed:.1f}ms ({len(interactions)} interactions, {days_back} days)")
+    logger.info(f"timeline_aggregated({person_id}) took {elapsed:.1f}ms ({total_interactions} interactions, {days_back} days)")
 
     return AggregatedTimelineResponse(
         days=days,
-        total_interactions=len(interactions),
+        total_interactions=total_interactions,
         date_range_start=date_range_start,
         date_range_end=date_range_end,
     )
 
 
 @router.get("/people/{person_id}/connections", response_model=ConnectionsResponse)
-async def get_person_connections(
+@offload(SQLITE)
+def get_person_connections(
     person_id: str,
     relationship_type: Optional[str] = Query(default=None, description="Filter by type"),
     limit: int = Query(default=50, ge=1, le=200, description="Max results"),
@@ -1923,7 +1911,8 @@ async def get_person_connections(
 
 
 @router.get("/people/{person_id}/strength", response_model=dict)
-async def get_person_strength_breakdown(person_id: str):
+@offload(SQLITE)
+def get_person_strength_breakdown(person_id: str):
     """
     Get detailed breakdown of relationship strength components.
 
@@ -1962,7 +1951,8 @@ def _fact_to_response(fact: PersonFact) -> PersonFactResponse:
 
 
 @router.get("/people/{person_id}/facts", response_model=PersonFactsResponse)
-async def get_person_facts(person_id: str):
+@offload(SQLITE)
+def get_person_facts(person_id: str):
     """
     Get all facts about a person.
 
@@ -2023,14 +2013,16 @@ async def extract_person_facts(person_id: str, model: Optional[str] = None):
     elif model == "haiku":
         model = PersonFactExtractor.MODEL_HAIKU
     person_store = get_person_entity_store()
-    person = person_store.get_by_id(person_id)
+    person = await run_blocking(SQLITE, person_store.get_by_id, person_id)
 
     if not person:
         raise HTTPException(status_code=404, detail=f"Person '{person_id}' not found")
 
     # Get ALL interactions for the person (extractor will sample strategically)
     interaction_store = get_interaction_store()
-    interactions = interaction_store.get_for_person(
+    interactions = await run_blocking(
+        SQLITE,
+        interaction_store.get_for_person,
         person_id,
         days_back=3650,  # Look back 10 years for full history
         limit=100000,  # No practical limit - let extractor sample
@@ -2077,7 +2069,8 @@ async def extract_person_facts(person_id: str, model: Optional[str] = None):
 
 
 @router.put("/people/{person_id}/facts/{fact_id}", response_model=PersonFactResponse)
-async def update_person_fact(person_id: str, fact_id: str, request: FactUpdateRequest):
+@offload(SQLITE)
+def update_person_fact(person_id: str, fact_id: str, request: FactUpdateRequest):
     """
     Update a fact's value or metadata.
     """
@@ -2108,7 +2101,8 @@ async def update_person_fact(person_id: str, fact_id: str, request: FactUpdateRe
 
 
 @router.delete("/people/{person_id}/facts/{fact_id}")
-async def delete_person_fact(person_id: str, fact_id: str):
+@offload(SQLITE)
+def delete_person_fact(person_id: str, fact_id: str):
     """
     Delete a fact.
     """
@@ -2127,7 +2121,8 @@ async def delete_person_fact(person_id: str, fact_id: str):
 
 
 @router.post("/people/{person_id}/facts/{fact_id}/confirm")
-async def confirm_person_fact(person_id: str, fact_id: str):
+@offload(SQLITE)
+def confirm_person_fact(person_id: str, fact_id: str):
     """
     Mark a fact as confirmed by user.
 
@@ -2148,7 +2143,8 @@ async def confirm_person_fact(person_id: str, fact_id: str):
 
 
 @router.post("/people/{person_id}/hide")
-async def hide_person(person_id: str, request: HidePersonRequest):
+@offload(SQLITE)
+def hide_person(person_id: str, request: HidePersonRequest):
     """
     Hide a person (soft delete) and blocklist their identifiers.
 
@@ -2189,7 +2185,8 @@ async def hide_person(person_id: str, request: HidePersonRequest):
 
 
 @router.get("/discover", response_model=DiscoverResponse)
-async def discover_connections(
+@offload(SQLITE)
+def discover_connections(
     person_id: Optional[str] = Query(default=None, description="Person to find suggestions for"),
     limit: int = Query(default=10, ge=1, le=50, description="Max suggestions"),
 ):
@@ -2291,14 +2288,16 @@ async def import_source_data(
 
     if source_type == "whatsapp":
         from api.services.whatsapp_import import import_whatsapp_export
-        stats = import_whatsapp_export(
+        stats = await run_blocking(
+            SQLITE,
+            import_whatsapp_export,
             content_str,
             file.filename or "chat.txt",
             source_store,
         )
     else:  # signal
         from api.services.signal_import import import_signal_export
-        stats = import_signal_export(content_str, source_store)
+        stats = await run_blocking(SQLITE, import_signal_export, content_str, source_store)
 
     return {
         "status": "completed",
@@ -2326,7 +2325,8 @@ async def sync_source(source_type: str):
 
 
 @router.post("/relationships/discover")
-async def trigger_relationship_discovery():
+@offload(SQLITE)
+def trigger_relationship_discovery():
     """
     Trigger relationship discovery across all sources.
 
@@ -2347,7 +2347,8 @@ async def trigger_relationship_discovery():
 
 
 @router.post("/strengths/update")
-async def update_relationship_strengths():
+@offload(SQLITE)
+def update_relationship_strengths():
     """
     Update relationship strength scores for all people.
     """
@@ -2359,7 +2360,8 @@ async def update_relationship_strengths():
 
 
 @router.get("/statistics", response_model=StatisticsResponse)
-async def get_crm_statistics():
+@offload(SQLITE)
+def get_crm_statistics():
     """
     Get comprehensive CRM statistics.
     """
@@ -2388,7 +2390,8 @@ async def get_crm_statistics():
 
 
 @router.get("/network", response_model=NetworkGraphResponse)
-async def get_network_graph(
+@offload(SQLITE)
+def get_network_graph(
     center_on: Optional[str] = Query(default=None, description="Person ID to center the graph on"),
     depth: int = Query(default=2, ge=1, le=4, description="Hops from center person"),
     min_strength: float = Query(default=0.0, ge=0.0, le=1.0, description="Minimum relationship strength"),
@@ -2574,7 +2577,8 @@ class RelationshipDetailResponse(BaseModel):
 
 
 @router.get("/relationship/{person_a_id}/{person_b_id}", response_model=RelationshipDetailResponse)
-async def get_relationship_details(person_a_id: str, person_b_id: str):
+@offload(SQLITE)
+def get_relationship_details(person_a_id: str, person_b_id: str):
     """
     Get detailed information about the relationship between two people.
 
@@ -2661,7 +2665,8 @@ async def get_relationship_details(person_a_id: str, person_b_id: str):
 # =======================
 
 @router.get("/slack/status")
-async def get_slack_status():
+@offload(SQLITE)
+def get_slack_status():
     """
     Get Slack integration status.
 
@@ -2680,7 +2685,8 @@ async def get_slack_status():
 
 
 @router.get("/slack/oauth/start")
-async def start_slack_oauth(state: Optional[str] = None):
+@offload(SQLITE)
+def start_slack_oauth(state: Optional[str] = None):
     """
     Start Slack OAuth flow.
 
@@ -2699,7 +2705,8 @@ async def start_slack_oauth(state: Optional[str] = None):
 
 
 @router.get("/slack/callback")
-async def slack_oauth_callback(code: str, state: Optional[str] = None):
+@offload(GOOGLE)
+def slack_oauth_callback(code: str, state: Optional[str] = None):
     """
     Handle Slack OAuth callback.
 
@@ -2723,7 +2730,8 @@ async def slack_oauth_callback(code: str, state: Optional[str] = None):
 
 
 @router.post("/slack/sync")
-async def sync_slack_users_endpoint(workspace_id: str = "default"):
+@offload(GOOGLE)
+def sync_slack_users_endpoint(workspace_id: str = "default"):
     """
     Sync Slack users to the CRM.
 
@@ -2756,7 +2764,8 @@ async def sync_slack_users_endpoint(workspace_id: str = "default"):
 
 
 @router.delete("/slack/disconnect")
-async def disconnect_slack(workspace_id: str = "default"):
+@offload(SQLITE)
+def disconnect_slack(workspace_id: str = "default"):
     """
     Disconnect a Slack workspace.
 
@@ -2777,7 +2786,8 @@ async def disconnect_slack(workspace_id: str = "default"):
 # ==================================
 
 @router.get("/contacts/status")
-async def get_contacts_status():
+@offload(SQLITE)
+def get_contacts_status():
     """
     Get Apple Contacts integration status.
 
@@ -2794,7 +2804,8 @@ async def get_contacts_status():
 
 
 @router.post("/contacts/sync")
-async def sync_contacts_endpoint():
+@offload(SQLITE)
+def sync_contacts_endpoint():
     """
     Sync Apple Contacts to the CRM.
 
@@ -2989,34 +3000,42 @@ class FamilyInteractionsResponse(BaseModel):
 
 
 @router.get("/me/stats", response_model=MeStatsResponse)
-async def get_me_stats():
+@offload(SQLITE)
+def get_me_stats():
     """
     Get aggregate statistics for the owner's personal dashboard.
 
     Returns total counts across all people in the CRM.
     """
+    from api.services.person_stats import sum_counts_by_field
+
     person_store = get_person_entity_store()
     interaction_store = get_interaction_store()
 
     # Get all people
     all_people = person_store.get_all()
     total_people = len(all_people)
+    visible_ids = {p.id for p in all_people}
 
-    # Aggregate stats from all people
-    total_emails = sum(p.email_count for p in all_people)
-    total_meetings = sum(p.meeting_count for p in all_people)
-    total_messages = sum(p.message_count for p in all_people)
+    # Aggregate lifetime counts from the daily rollup (one grouped query)
+    by_source: dict[str, int] = defaultdict(int)
+    for person_id, counts in interaction_store.get_source_counts_for_people().items():
+        if person_id in visible_ids:
+            for source_type, count in counts.items():
+                by_source[source_type] += count
+    totals = sum_counts_by_field(by_source)
 
     return MeStatsResponse(
         total_people=total_people,
-        total_emails=total_emails,
-        total_meetings=total_meetings,
-        total_messages=total_messages,
+        total_emails=totals["email_count"],
+        total_meetings=totals["meeting_count"],
+        total_messages=totals["message_count"],
     )
 
 
 @router.get("/me/timeline", response_model=TimelineResponse)
-async def get_me_timeline(
+@offload(SQLITE)
+def get_me_timeline(
     source_type: Optional[str] = Query(
         default=None,
         description="Filter by source type. Supports comma-separated values for compound "
@@ -3099,7 +3118,8 @@ async def get_me_timeline(
 
 
 @router.get("/me/interactions", response_model=MeInteractionsResponse)
-async def get_me_interactions(
+@offload(SQLITE)
+def get_me_interactions(
     days_back: int = Query(default=365, ge=1, le=3660, description="Days of history (up to 10 years)"),
     trend_period: str = Query(default="quarter", description="Trend comparison period: week, month, quarter, year"),
     health_period: str = Query(default="quarter", description="Health score history period: month, quarter, year"),
@@ -3658,7 +3678,8 @@ async def get_me_interactions(
 
 
 @router.get("/family/members", response_model=FamilyMembersResponse)
-async def get_family_members():
+@offload(SQLITE)
+def get_family_members():
     """
     Get all family members for the multi-select dropdown and visualizations.
 
@@ -3755,7 +3776,8 @@ async def get_family_members():
 
 
 @router.get("/family/stats", response_model=FamilyStatsResponse)
-async def get_family_stats(
+@offload(SQLITE)
+def get_family_stats(
     person_ids: str = Query(
         ...,
         description="Comma-separated list of person IDs to get lifetime stats for"
@@ -3764,9 +3786,11 @@ async def get_family_stats(
     """
     Get lifetime totals for selected family members.
 
-    Returns summed email_count, meeting_count, message_count from PersonEntity records.
-    These are lifetime totals independent of any time range.
+    Returns summed email, meeting and message counts from the daily interaction
+    rollup. These are lifetime totals independent of any time range.
     """
+    from api.services.person_stats import sum_counts_by_field
+
     person_store = get_person_entity_store()
 
     # Parse person IDs
@@ -3774,27 +3798,24 @@ async def get_family_stats(
     if not ids:
         return FamilyStatsResponse(total_emails=0, total_meetings=0, total_messages=0)
 
-    # Sum lifetime counts from each person's PersonEntity
-    total_emails = 0
-    total_meetings = 0
-    total_messages = 0
-
-    for person_id in ids:
-        person = person_store.get_by_id(person_id)
-        if person:
-            total_emails += person.email_count
-            total_meetings += person.meeting_count
-            total_messages += person.message_count
+    # Sum lifetime counts for the people that exist
+    ids = [person_id for person_id in dict.fromkeys(ids) if person_store.get_by_id(person_id)]
+    by_source: dict[str, int] = defaultdict(int)
+    for counts in get_interaction_store().get_source_counts_for_people(ids).values():
+        for source_type, count in counts.items():
+            by_source[source_type] += count
+    totals = sum_counts_by_field(by_source)
 
     return FamilyStatsResponse(
-        total_emails=total_emails,
-        total_meetings=total_meetings,
-        total_messages=total_messages,
+        total_emails=totals["email_count"],
+        total_meetings=totals["meeting_count"],
+        total_messages=totals["message_count"],
     )
 
 
 @router.get("/family/timeline", response_model=TimelineResponse)
-async def get_family_timeline(
+@offload(SQLITE)
+def get_family_timeline(
     person_ids: str = Query(
         ...,
         description="Comma-separated list of person IDs to include in timeline"
@@ -3876,7 +3897,8 @@ async def get_family_timeline(
 
 
 @router.get("/family/interactions", response_model=FamilyInteractionsResponse)
-async def get_family_interactions(
+@offload(SQLITE)
+def get_family_interactions(
     person_ids: str = Query(
         ...,
         description="Comma-separated list of person IDs to aggregate"
@@ -4121,7 +4143,8 @@ class CommunicationGapsResponse(BaseModel):
 
 
 @router.get("/family/communication-gaps", response_model=CommunicationGapsResponse)
-async def get_family_communication_gaps(
+@offload(SQLITE)
+def get_family_communication_gaps(
     person_ids: str = Query(
         ...,
         description="Comma-separated list of person IDs"
@@ -4243,7 +4266,8 @@ class ChannelMixResponse(BaseModel):
 
 
 @router.get("/family/channel-mix", response_model=ChannelMixResponse)
-async def get_family_channel_mix(
+@offload(SQLITE)
+def get_family_channel_mix(
     person_ids: str = Query(
         ...,
         description="Comma-separated list of person IDs"
@@ -4256,9 +4280,6 @@ async def get_family_channel_mix(
     Returns interaction counts grouped by source (imessage, gmail, calendar, etc.)
     filtered to the specified time period.
     """
-    from collections import defaultdict
-    from datetime import timedelta
-
     # Parse person IDs
     selected_ids = [pid.strip() for pid in person_ids.split(",") if pid.strip()]
     if not selected_ids:
@@ -4267,6 +4288,9 @@ async def get_family_channel_mix(
     person_store = get_person_entity_store()
     interaction_store = get_interaction_store()
 
+    # Counts by source type for all selected people in one rollup query
+    counts_by_person = interaction_store.get_source_counts_for_people(selected_ids, days_back=days_back)
+
     members = []
 
     for person_id in selected_ids:
@@ -4274,19 +4298,10 @@ async def get_family_channel_mix(
         if not person:
             continue
 
-        # Get interactions within time period (use high limit for accurate aggregation)
-        interactions = interaction_store.get_for_person(person_id, days_back=days_back, limit=10000)
-
-        # Count by source type
-        by_source: dict[str, int] = defaultdict(int)
-        for i in interactions:
-            source_type = i.source_type or 'other'
-            by_source[source_type] += 1
-
         members.append(ChannelMixMember(
             id=person_id,
             name=person.canonical_name,
-            by_source=dict(by_source),
+            by_source=counts_by_person.get(person_id, {}),
         ))
 
     return ChannelMixResponse(members=members)
@@ -4332,7 +4347,8 @@ class SyncErrorResponse(BaseModel):
 
 
 @router.get("/sync/health", response_model=list[SyncHealthResponse])
-async def get_all_sync_health():
+@offload(SQLITE)
+def get_all_sync_health():
     """
     Get health status for all sync sources.
 
@@ -4359,7 +4375,8 @@ async def get_all_sync_health():
 
 
 @router.get("/sync/health/summary", response_model=SyncHealthSummaryResponse)
-async def get_sync_health_summary():
+@offload(SQLITE)
+def get_sync_health_summary():
     """
     Get summary of sync health across all sources.
 
@@ -4374,7 +4391,8 @@ async def get_sync_health_summary():
 
 
 @router.get("/sync/health/{source}", response_model=SyncHealthResponse)
-async def get_source_sync_health(source: str):
+@offload(SQLITE)
+def get_source_sync_health(source: str):
     """
     Get health status for a specific sync source.
     """
@@ -4401,7 +4419,8 @@ async def get_source_sync_health(source: str):
 
 
 @router.get("/sync/errors", response_model=list[SyncErrorResponse])
-async def get_sync_errors(
+@offload(SQLITE)
+def get_sync_errors(
     source: Optional[str] = Query(default=None, description="Filter by source"),
     limit: int = Query(default=50, ge=1, le=200, description="Max results"),
 ):
@@ -4428,7 +4447,8 @@ async def get_sync_errors(
 
 
 @router.get("/sync/stale", response_model=list[SyncHealthResponse])
-async def get_stale_syncs():
+@offload(SQLITE)
+def get_stale_syncs():
     """
     Get list of syncs that are stale (>24 hours old).
 
@@ -4480,7 +4500,8 @@ class ReviewQueueResponse(BaseModel):
 
 
 @router.get("/review-queue", response_model=ReviewQueueResponse)
-async def get_review_queue(
+@offload(SQLITE)
+def get_review_queue(
     min_confidence: float = Query(default=0.0, ge=0.0, le=1.0, description="Minimum confidence"),
     max_confidence: float = Query(default=0.85, ge=0.0, le=1.0, description="Maximum confidence"),
     limit: int = Query(default=50, ge=1, le=200, description="Max results"),
@@ -4540,7 +4561,8 @@ async def get_review_queue(
 
 
 @router.post("/review-queue/{entity_id}/confirm")
-async def confirm_review_item(entity_id: str):
+@offload(SQLITE)
+def confirm_review_item(entity_id: str):
     """
     Confirm a low-confidence match as correct.
 
@@ -4567,7 +4589,8 @@ async def confirm_review_item(entity_id: str):
 
 
 @router.post("/review-queue/{entity_id}/reject")
-async def reject_review_item(entity_id: str, request: LinkConfirmRequest):
+@offload(SQLITE)
+def reject_review_item(entity_id: str, request: LinkConfirmRequest):
     """
     Reject a low-confidence match.
 
@@ -4635,7 +4658,8 @@ async def reject_review_item(entity_id: str, request: LinkConfirmRequest):
 
 
 @router.get("/data-health")
-async def get_data_health():
+@offload(SQLITE)
+def get_data_health():
     """
     Get comprehensive data health statistics.
 
@@ -4656,7 +4680,7 @@ async def get_data_health():
     # Interaction stats by source
     int_db = data_dir / "interactions.db"
     if int_db.exists():
-        conn = sqlite3.connect(int_db)
+        conn = get_connection(int_db)
         cursor = conn.execute("""
             SELECT source_type, COUNT(*) as total,
                    MIN(DATE(timestamp)) as earliest,
@@ -4676,7 +4700,7 @@ async def get_data_health():
     # iMessage linking stats
     imessage_db = data_dir / "imessage.db"
     if imessage_db.exists():
-        conn = sqlite3.connect(imessage_db)
+        conn = get_connection(imessage_db)
         cursor = conn.execute("""
             SELECT
                 COUNT(*) as total,
@@ -4697,7 +4721,7 @@ async def get_data_health():
     # Relationship stats
     crm_db = data_dir / "crm.db"
     if crm_db.exists():
-        conn = sqlite3.connect(crm_db)
+        conn = get_connection(crm_db)
 
         # Total relationships
         cursor = conn.execute("SELECT COUNT(*) FROM relationships")
@@ -4809,7 +4833,8 @@ class LinkOverrideResponse(BaseModel):
 
 
 @router.get("/link-overrides")
-async def get_link_overrides(person_id: Optional[str] = Query(default=None)):
+@offload(SQLITE)
+def get_link_overrides(person_id: Optional[str] = Query(default=None)):
     """
     Get all link override rules.
 
@@ -4856,7 +4881,8 @@ async def get_link_overrides(person_id: Optional[str] = Query(default=None)):
 
 
 @router.delete("/link-overrides/{override_id}")
-async def delete_link_override(override_id: str):
+@offload(SQLITE)
+def delete_link_override(override_id: str):
     """Delete a link override rule."""
     from api.services.link_override import get_link_override_store
 
@@ -4949,7 +4975,8 @@ class ToneAnalysisDetailedResponse(BaseModel):
 
 
 @router.get("/relationship/insights", response_model=RelationshipInsightsResponse)
-async def get_relationship_insights(person_id: Optional[str] = None):
+@offload(SQLITE)
+def get_relationship_insights(person_id: Optional[str] = None):
     """
     Get all relationship insights for the configured partner.
 
@@ -4990,7 +5017,8 @@ async def get_relationship_insights(person_id: Optional[str] = None):
 
 
 @router.post("/relationship/insights/generate", response_model=RelationshipInsightsResponse)
-async def generate_relationship_insights(
+@offload(MODELS)
+def generate_relationship_insights(
     person_id: Optional[str] = None,
     category: Optional[str] = None
 ):
@@ -5046,7 +5074,8 @@ async def generate_relationship_insights(
 
 
 @router.post("/relationship/insights/{insight_id}/confirm")
-async def confirm_relationship_insight(insight_id: str):
+@offload(SQLITE)
+def confirm_relationship_insight(insight_id: str):
     """
     Mark an insight as confirmed.
 
@@ -5064,7 +5093,8 @@ async def confirm_relationship_insight(insight_id: str):
 
 
 @router.delete("/relationship/insights/{insight_id}")
-async def delete_relationship_insight(insight_id: str):
+@offload(SQLITE)
+def delete_relationship_insight(insight_id: str):
     """
     Delete/dismiss an insight.
     """
@@ -5080,7 +5110,8 @@ async def delete_relationship_insight(insight_id: str):
 
 
 @router.post("/relationship/tone-analysis", response_model=ToneAnalysisResponse)
-async def analyze_relationship_tone(person_id: Optional[str] = None, months: int = 12):
+@offload(MODELS)
+def analyze_relationship_tone(person_id: Optional[str] = None, months: int = 12):
     """
     Analyze tone/sentiment in iMessage conversations over time.
 
@@ -5225,7 +5256,8 @@ MESSAGES:
 
 
 @router.post("/relationship/tone-analysis-detailed", response_model=ToneAnalysisDetailedResponse)
-async def analyze_relationship_tone_detailed(person_id: Optional[str] = None, months: int = 12):
+@offload(MODELS)
+def analyze_relationship_tone_detailed(person_id: Optional[str] = None, months: int = 12):
     """
     Analyze tone/sentiment separately for Nathan and Taylor in iMessage conversations.
 
@@ -5471,7 +5503,8 @@ class CleanupStatsResponse(BaseModel):
 
 
 @router.get("/cleanup/queue", response_model=CleanupQueueResponse)
-async def get_cleanup_queue(
+@offload(SQLITE)
+def get_cleanup_queue(
     review_type: Optional[str] = Query(
         default=None,
         description="Filter by type: 'duplicate', 'non_human', 'over_merged'"
@@ -5525,7 +5558,8 @@ async def get_cleanup_queue(
 
 
 @router.get("/cleanup/stats", response_model=CleanupStatsResponse)
-async def get_cleanup_stats():
+@offload(SQLITE)
+def get_cleanup_stats():
     """
     Get statistics about the cleanup review queue.
 
@@ -5545,7 +5579,8 @@ async def get_cleanup_stats():
 
 
 @router.post("/cleanup/{item_id}/skip")
-async def skip_cleanup_item(item_id: str):
+@offload(SQLITE)
+def skip_cleanup_item(item_id: str):
     """
     Skip a cleanup review item (mark as different people / not a duplicate).
 
@@ -5580,7 +5615,8 @@ async def skip_cleanup_item(item_id: str):
 
 
 @router.post("/cleanup/{item_id}/keep")
-async def keep_cleanup_item(item_id: str):
+@offload(SQLITE)
+def keep_cleanup_item(item_id: str):
     """
     Keep a non-human candidate as a real person (false positive).
 
@@ -5622,7 +5658,8 @@ async def keep_cleanup_item(item_id: str):
 
 
 @router.post("/cleanup/{item_id}/hide")
-async def hide_from_cleanup(item_id: str, reason: str = Query(default="Cleanup review")):
+@offload(SQLITE)
+def hide_from_cleanup(item_id: str, reason: str = Query(default="Cleanup review")):
     """
     Hide a non-human entity from the cleanup queue.
 
@@ -5668,7 +5705,8 @@ async def hide_from_cleanup(item_id: str, reason: str = Query(default="Cleanup r
 
 
 @router.post("/cleanup/{item_id}/merge")
-async def merge_from_cleanup(
+@offload(SQLITE)
+def merge_from_cleanup(
     item_id: str,
     primary_id: Optional[str] = Query(
         default=None,
@@ -36,9 +36,17 @@ TOOL_DEFINITIONS = [
                     "type": "string",
                     "description": "Natural-language search query",
                 },
+                "queries": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": (
+                        "Optional additional queries to run in the same call "
+                        "(e.g. one per person or topic). Faster than calling search_vault repeatedly."
+                    ),
+                },
                 "top_k": {
                     "type": "integer",
-                    "description": "Number of results to return (default 10)",
+                    "description": "Number of results to return per query (default 10)",
                 },
             },
             "required": ["query"],
@@ -527,7 +535,20 @@ def _tool_search_vault(inp: dict) -> str:
     from api.services.hybrid_search import HybridSearch
     hs = HybridSearch()
     top_k = inp.get("top_k", 10)
-    results = hs.search(inp["query"], top_k=top_k)
+    queries = list(dict.fromkeys([inp["query"], *inp.get("queries", [])]))
+    if len(queries) == 1:
+        return _format_vault_results(hs.search(queries[0], top_k=top_k))
+
+    # One embedding pass + one vector store request for all queries
+    results_per_query = hs.search_many(queries, top_k=top_k)
+    sections = [
+        f"### Results for: {query}\n\n{_format_vault_results(results)}"
+        for query, results in zip(queries, results_per_query)
+    ]
+    return "\n\n".join(sections)
+
+
+def _format_vault_results(results: list[dict]) -> str:
     if not results:
         return "No vault results found."
     lines = []
@@ -10,6 +10,12 @@ Finds exact matches for names, IDs, and codes that vector search may miss.
 - **Query sanitization**: Strips FTS5 special chars (', ", ?, .)
 - **Stop word removal**: Filters "what", "is", "the", etc.
 - **BM25 scores are negative**: Lower = better match
+- **Shared chunk IDs**: doc_ids match ChromaDB IDs (see chunk_ids.py) so RRF
+  fusion can merge hits found by both searches
+- **Persistent connections**: One connection per thread, reused across calls
+  (sqlite3 caches prepared statements per connection)
+- **Per-file replace**: chunk_files maps doc_id -> file_path/FTS rowid, so a
+  file's chunks are found by index instead of scanning the FTS table
 
 ## Usage
 
@@ -18,14 +24,33 @@ Finds exact matches for names, IDs, and codes that vector search may miss.
 """
 import sqlite3
 import logging
+import threading
 from pathlib import Path
 from typing import Optional
 
 from config.settings import settings
+from api.services.chunk_ids import canonicalize_chunk_id, is_summary_id, parse_chunk_id
+from api.utils.db_connections import close_all, get_connection
 
 logger = logging.getLogger(__name__)
 
 
+# Schema version tracked via PRAGMA user_version
+# 1: doc_ids migrated from {path}_{N} to canonical {path}::{N}
+# 2: chunk_files lookup table (doc_id -> file_path, FTS rowid)
+# 3: chunk_files.content_hash for chunk-level diffing on reindex
+SCHEMA_VERSION = 3
+
+_INSERT_FTS_SQL = "INSERT INTO chunks_fts (doc_id, content, file_name, people) VALUES (?, ?, ?, ?)"
+_INSERT_FILE_SQL = (
+    "INSERT OR REPLACE INTO chunk_files (doc_id, file_path, fts_rowid, content_hash) VALUES (?, ?, ?, ?)"
+)
+_SELECT_ROWID_SQL = "SELECT fts_rowid FROM chunk_files WHERE doc_id = ?"
+_SELECT_FILE_ROWS_SQL = "SELECT doc_id, fts_rowid FROM chunk_files WHERE file_path = ?"
+_DELETE_FTS_SQL = "DELETE FROM chunks_fts WHERE rowid = ?"
+_DELETE_FILE_ROW_SQL = "DELETE FROM chunk_files WHERE doc_id = ?"
+
+
 def get_bm25_db_path() -> str:
     """Get the path to the BM25 database."""
     db_dir = Path(settings.chroma_path).parent
@@ -38,6 +63,8 @@ class BM25Index:
     SQLite FTS5-backed BM25 keyword index.
 
     Provides fast keyword search to complement vector similarity.
+    Connections are cached per thread, so callers can invoke methods
+    from FastAPI's threadpool or the file watcher without reconnecting.
     """
 
     def __init__(self, db_path: Optional[str] = None):
@@ -48,13 +75,34 @@ class BM25Index:
             db_path: Path to SQLite database (default from settings)
         """
         self.db_path = db_path or get_bm25_db_path()
+        self._local = threading.local()
+        self._connections: list[sqlite3.Connection] = []
+        self._connections_lock = threading.Lock()
         self._init_db()
 
+    def _get_connection(self) -> sqlite3.Connection:
+        """Get this thread's persistent connection, checking one out on first use."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = get_connection(self.db_path)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def close(self) -> None:
+        """Close all cached connections (they reopen lazily on next use)."""
+        with self._connections_lock:
+            for conn in self._connections:
+                conn.close()
+            self._connections.clear()
+        self._local = threading.local()
+        close_all(self.db_path)
+
     def _init_db(self):
         """Create FTS5 table if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute("PRAGMA journal_mode=WAL")
+        conn = self._get_connection()
+        with conn:
             # Create FTS5 virtual table for full-text search
             # Using porter tokenizer for stemming
             conn.execute("""
@@ -66,9 +114,85 @@ class BM25Index:
                     tokenize='porter unicode61'
                 )
             """)
-            conn.commit()
-        finally:
-            conn.close()
+            # FTS5 columns can't be indexed, so keep a regular lookup table
+            # for doc_id and file_path access
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS chunk_files (
+                    doc_id TEXT PRIMARY KEY,
+                    file_path TEXT NOT NULL,
+                    fts_rowid INTEGER NOT NULL,
+                    content_hash TEXT
+                )
+            """)
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(chunk_files)")}
+            if "content_hash" not in columns:
+                # v2 databases: NULL hash means "unknown", so the chunk is rewritten on next index
+                conn.execute("ALTER TABLE chunk_files ADD COLUMN content_hash TEXT")
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_chunk_files_file_path ON chunk_files(file_path)"
+            )
+            version = conn.execute("PRAGMA user_version").fetchone()[0]
+            if version < 1:
+                migrated = migrate_legacy_chunk_ids(conn)
+                if migrated:
+                    logger.info(f"Migrated {migrated} BM25 rows to canonical chunk IDs")
+            if version < 2:
+                backfilled = backfill_chunk_files(conn)
+                if backfilled:
+                    logger.info(f"Backfilled chunk_files for {backfilled} BM25 rows")
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+
+    @staticmethod
+    def _people_str(people: Optional[list[str]]) -> str:
+        return " ".join(people) if people else ""
+
+    def _insert(
+        self,
+        conn: sqlite3.Connection,
+        doc_id: str,
+        content: str,
+        file_name: str,
+        people_str: str,
+        content_hash: Optional[str] = None
+    ) -> None:
+        """Insert one chunk into FTS and the lookup table (no commit)."""
+        cursor = conn.execute(_INSERT_FTS_SQL, (doc_id, content, file_name, people_str))
+        file_path, _ = parse_chunk_id(doc_id)
+        conn.execute(_INSERT_FILE_SQL, (doc_id, file_path, cursor.lastrowid, content_hash))
+
+    def _upsert_chunk(self, conn: sqlite3.Connection, chunk: dict) -> None:
+        """Replace one chunk dict (doc_id, content, file_name, people, content_hash)."""
+        self._delete(conn, chunk["doc_id"])
+        self._insert(
+            conn,
+            chunk["doc_id"],
+            chunk.get("content", ""),
+            chunk.get("file_name", ""),
+            self._people_str(chunk.get("people")),
+            chunk.get("content_hash"),
+        )
+
+    def _delete(self, conn: sqlite3.Connection, doc_id: str) -> None:
+        """Delete one chunk by doc_id via the lookup table (no commit)."""
+        row = conn.execute(_SELECT_ROWID_SQL, (doc_id,)).fetchone()
+        if row:
+            conn.execute(_DELETE_FTS_SQL, (row[0],))
+            conn.execute(_DELETE_FILE_ROW_SQL, (doc_id,))
+
+    def _delete_file_rows(
+        self,
+        conn: sqlite3.Connection,
+        file_path: str,
+        include_summary: bool = True
+    ) -> int:
+        """Delete all chunks for a file via the file_path index (no commit)."""
+        rows = conn.execute(_SELECT_FILE_ROWS_SQL, (file_path,)).fetchall()
+        if not include_summary:
+            rows = [row for row in rows if not is_summary_id(row[0])]
+        if rows:
+            conn.executemany(_DELETE_FTS_SQL, [(row[1],) for row in rows])
+            conn.executemany(_DELETE_FILE_ROW_SQL, [(row[0],) for row in rows])
+        return len(rows)
 
     def add_document(
         self,
@@ -86,23 +210,15 @@ class BM25Index:
             file_name: Source file name
             people: List of people mentioned
         """
-        people_str = " ".join(people) if people else ""
-
-        conn = sqlite3.connect(self.db_path)
-        try:
-            # Delete existing entry if present (for updates)
-            conn.execute(
-                "DELETE FROM chunks_fts WHERE doc_id = ?",
-                (doc_id,)
-            )
-            # Insert new entry
-            conn.execute(
-                "INSERT INTO chunks_fts (doc_id, content, file_name, people) VALUES (?, ?, ?, ?)",
-                (doc_id, content, file_name, people_str)
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        conn = self._get_connection()
+        with conn:
+            # Replaces any existing entry (for updates)
+            self._upsert_chunk(conn, {
+                "doc_id": doc_id,
+                "content": content,
+                "file_name": file_name,
+                "people": people,
+            })
 
     def delete_document(self, doc_id: str):
         """
@@ -111,15 +227,124 @@ class BM25Index:
         Args:
             doc_id: Document identifier to remove
         """
-        conn = sqlite3.connect(self.db_path)
-        try:
-            conn.execute(
-                "DELETE FROM chunks_fts WHERE doc_id = ?",
-                (doc_id,)
-            )
-            conn.commit()
-        finally:
-            conn.close()
+        conn = self._get_connection()
+        with conn:
+            self._delete(conn, doc_id)
+
+    def replace_file(
+        self,
+        file_path: str,
+        chunks: list[dict],
+        include_summary: bool = False
+    ) -> int:
+        """
+        Replace all chunks for a file in a single transaction.
+
+        Deletes every existing row for file_path (found via the indexed
+        chunk_files.file_path column) and inserts the new chunks, so stale
+        chunks from a previously longer version of the file don't linger.
+
+        Args:
+            file_path: Resolved file path the chunks belong to
+            chunks: List of dicts with doc_id, content, file_name, people
+            include_summary: Also delete the file's ::summary chunk. Defaults
+                            to False since summaries are regenerated separately
+                            (and skipped entirely with skip_summaries).
+
+        Returns:
+            Number of stale rows deleted
+        """
+        conn = self._get_connection()
+        with conn:
+            deleted = self._delete_file_rows(conn, file_path, include_summary=include_summary)
+            for chunk in chunks:
+                self._upsert_chunk(conn, chunk)
+        return deleted
+
+    def replace_files(self, files: dict[str, list[dict]]) -> int:
+        """
+        Replace chunks for many files in a single transaction.
+
+        Batched counterpart of replace_file() used by bulk reindexing.
+        Summary chunks are preserved, as in replace_file().
+
+        Args:
+            files: Mapping of file_path -> list of chunk dicts
+                   (doc_id, content, file_name, people)
+
+        Returns:
+            Number of stale rows deleted
+        """
+        conn = self._get_connection()
+        deleted = 0
+        with conn:
+            for file_path, chunks in files.items():
+                deleted += self._delete_file_rows(conn, file_path, include_summary=False)
+                for chunk in chunks:
+                    self._upsert_chunk(conn, chunk)
+        return deleted
+
+    def apply_chunk_changes(self, upserts: list[dict], delete_ids: list[str]) -> None:
+        """
+        Upsert changed chunks and delete removed ones in a single transaction.
+
+        Used for chunk-level diffing: only chunks whose content_hash changed
+        are rewritten.
+
+        Args:
+            upserts: Chunk dicts (doc_id, content, file_name, people, content_hash)
+            delete_ids: doc_ids of chunks that no longer exist
+        """
+        if not upserts and not delete_ids:
+            return
+        conn = self._get_connection()
+        with conn:
+            for doc_id in delete_ids:
+                self._delete(conn, doc_id)
+            for chunk in upserts:
+                self._upsert_chunk(conn, chunk)
+
+    def get_chunk_hashes(self, file_paths: list[str]) -> dict[str, dict[str, Optional[str]]]:
+        """
+        Get stored content hashes for the content chunks of files.
+
+        Args:
+            file_paths: Resolved file paths
+
+        Returns:
+            Mapping of file_path -> {doc_id: content_hash}. Files with no
+            indexed chunks are omitted; summary chunks are excluded.
+        """
+        hashes: dict[str, dict[str, Optional[str]]] = {}
+        if not file_paths:
+            return hashes
+        conn = self._get_connection()
+        # Stay under SQLite's bound parameter limit
+        for start in range(0, len(file_paths), 500):
+            batch = file_paths[start:start + 500]
+            placeholders = ",".join("?" * len(batch))
+            rows = conn.execute(
+                f"SELECT file_path, doc_id, content_hash FROM chunk_files WHERE file_path IN ({placeholders})",
+                batch
+            ).fetchall()
+            for file_path, doc_id, content_hash in rows:
+                if not is_summary_id(doc_id):
+                    hashes.setdefault(file_path, {})[doc_id] = content_hash
+        return hashes
+
+    def delete_file(self, file_path: str) -> int:
+        """
+        Remove every chunk (including the summary) for a file.
+
+        Args:
+            file_path: Resolved file path
+
+        Returns:
+            Number of rows deleted
+        """
+        conn = self._get_connection()
+        with conn:
+            return self._delete_file_rows(conn, file_path, include_summary=True)
 
     def _sanitize_query(self, query: str, use_or: bool = True) -> str:
         """
@@ -180,7 +405,7 @@ class BM25Index:
         if not sanitized_query:
             return []
 
-        conn = sqlite3.connect(self.db_path)
+        conn = self._get_connection()
         try:
             # FTS5 MATCH query with BM25 ranking
             # Search across content, file_name, and people
@@ -198,8 +423,11 @@ class BM25Index:
 
             results = []
             for row in cursor.fetchall():
+                file_path, chunk_index = parse_chunk_id(row[0])
                 results.append({
                     "doc_id": row[0],
+                    "file_path": file_path,
+                    "chunk_index": chunk_index,
                     "content": row[1],
                     "file_name": row[2],
                     "people": row[3].split(",") if row[3] else [],
@@ -212,8 +440,6 @@ class BM25Index:
             # Handle invalid FTS query syntax
             logger.warning(f"BM25 search error for query '{query}': {e}")
             return []
-        finally:
-            conn.close()
 
     def bulk_add(self, documents: list[dict]):
         """
@@ -222,39 +448,98 @@ class BM25Index:
         Args:
             documents: List of dicts with doc_id, content, file_name, people
         """
-        conn = sqlite3.connect(self.db_path)
-        try:
+        conn = self._get_connection()
+        with conn:
             for doc in documents:
-                people_str = " ".join(doc.get("people", [])) if doc.get("people") else ""
-                conn.execute(
-                    "DELETE FROM chunks_fts WHERE doc_id = ?",
-                    (doc["doc_id"],)
-                )
-                conn.execute(
-                    "INSERT INTO chunks_fts (doc_id, content, file_name, people) VALUES (?, ?, ?, ?)",
-                    (doc["doc_id"], doc["content"], doc["file_name"], people_str)
-                )
-            conn.commit()
-        finally:
-            conn.close()
+                self._upsert_chunk(conn, doc)
 
     def clear(self):
         """Clear all documents from the index."""
-        conn = sqlite3.connect(self.db_path)
-        try:
+        conn = self._get_connection()
+        with conn:
             conn.execute("DELETE FROM chunks_fts")
-            conn.commit()
-        finally:
-            conn.close()
+            conn.execute("DELETE FROM chunk_files")
 
     def count(self) -> int:
         """Get total number of documents in index."""
-        conn = sqlite3.connect(self.db_path)
-        try:
-            cursor = conn.execute("SELECT COUNT(*) FROM chunks_fts")
-            return cursor.fetchone()[0]
-        finally:
-            conn.close()
+        conn = self._get_connection()
+        cursor = conn.execute("SELECT COUNT(*) FROM chunk_files")
+        return cursor.fetchone()[0]
+
+
+def migrate_legacy_chunk_ids(conn: sqlite3.Connection) -> int:
+    """
+    Rewrite legacy ``{path}_{N}`` doc_ids to canonical ``{path}::{N}``.
+
+    Runs once per database (guarded by PRAGMA user_version in _init_db).
+    Caller is responsible for committing.
+
+    Args:
+        conn: Open connection to the BM25 database
+
+    Returns:
+        Number of rows rewritten
+    """
+    rows = conn.execute(
+        "SELECT rowid, doc_id FROM chunks_fts WHERE doc_id NOT LIKE '%::%'"
+    ).fetchall()
+
+    existing = {
+        row[0] for row in conn.execute(
+            "SELECT doc_id FROM chunks_fts WHERE doc_id LIKE '%::%'"
+        )
+    }
+
+    updates = []
+    duplicates = []
+    for rowid, doc_id in rows:
+        canonical = canonicalize_chunk_id(doc_id)
+        if canonical == doc_id:
+            continue
+        if canonical in existing:
+            # Already re-indexed under the canonical ID - drop the stale copy
+            duplicates.append((rowid,))
+        else:
+            updates.append((canonical, rowid))
+            existing.add(canonical)
+
+    if updates:
+        conn.executemany("UPDATE chunks_fts SET doc_id = ? WHERE rowid = ?", updates)
+    if duplicates:
+        conn.executemany("DELETE FROM chunks_fts WHERE rowid = ?", duplicates)
+    return len(updates) + len(duplicates)
+
+
+def backfill_chunk_files(conn: sqlite3.Connection) -> int:
+    """
+    Populate chunk_files from existing chunks_fts rows.
+
+    Runs once per database (guarded by PRAGMA user_version in _init_db).
+    Duplicate doc_ids left behind by older versions keep only the newest
+    row. Caller is responsible for committing.
+
+    Args:
+        conn: Open connection to the BM25 database
+
+    Returns:
+        Number of rows added to chunk_files
+    """
+    rows = conn.execute("SELECT rowid, doc_id FROM chunks_fts ORDER BY rowid").fetchall()
+
+    latest: dict[str, int] = {}
+    stale = []
+    for rowid, doc_id in rows:
+        if doc_id in latest:
+            stale.append((latest[doc_id],))
+        latest[doc_id] = rowid
+
+    if stale:
+        conn.executemany(_DELETE_FTS_SQL, stale)
+    conn.executemany(
+        _INSERT_FILE_SQL,
+        [(doc_id, parse_chunk_id(doc_id)[0], rowid, None) for doc_id, rowid in latest.items()]
+    )
+    return len(latest)
 
 
 # Singleton instance
@@ -276,4 +561,6 @@ def reset_bm25_index() -> None:
     For testing only - allows tests to start with fresh state.
     """
     global _bm25_instance
+    if _bm25_instance is not None:
+        _bm25_instance.close()
     _bm25_instance = None
@@ -72,6 +72,9 @@ class BriefingContext:
     notes: str = ""                                          # User notes on person
 
 
+# Aliases added to the keyword side of the vault search for a briefing
+MAX_ALIAS_KEYWORDS = 3
+
 BRIEFING_PROMPT = """You are LifeOS, preparing a stakeholder briefing for Nathan.
 
 Generate a concise, actionable briefing about {person_name} based on the context below.
@@ -296,11 +299,16 @@ class BriefingsService:
 
         # Search vault for mentions using hybrid search (vector + BM25)
         # Search by person name - ChromaDB doesn't support filtering on JSON array fields
-        # so we rely on semantic + keyword search with the person name
+        # so we rely on semantic + keyword search with the person name. Known
+        # aliases only widen the BM25 side, so this stays one search (and one
+        # cross-encoder pass).
         try:
+            name = context.resolved_name or resolved
+            aliases = [a for a in dict.fromkeys(context.aliases) if a != name]
             chunks = self.hybrid_search.search(
-                query=resolved,
-                top_k=15
+                query=name,
+                top_k=15,
+                extra_keywords=aliases[:MAX_ALIAS_KEYWORDS]
             )
 
             for chunk in chunks:
@@ -0,0 +1,112 @@
+"""
+Canonical chunk identifiers for LifeOS search indexes.
+
+Every chunk written to ChromaDB (vector search) or the BM25 index (keyword
+search) uses the same ID so Reciprocal Rank Fusion can merge hits for the
+same chunk from both lists.
+
+## Format
+
+- Content chunks: ``{file_path}::{chunk_index}``  (e.g. ``/vault/Note.md::3``)
+- Summary chunks: ``{file_path}::summary``
+
+Legacy BM25 rows used ``{file_path}_{chunk_index}``. ``parse_chunk_id`` still
+understands that form so old databases can be migrated (see
+``bm25_index.migrate_legacy_chunk_ids``).
+
+## Usage
+
+    from api.services.chunk_ids import make_chunk_id, parse_chunk_id
+    doc_id = make_chunk_id("/vault/Note.md", 0)   # "/vault/Note.md::0"
+    parse_chunk_id(doc_id)                         # ("/vault/Note.md", 0)
+"""
+import re
+from typing import Optional
+
+CHUNK_ID_SEPARATOR = "::"
+SUMMARY_CHUNK_SUFFIX = "summary"
+
+# Legacy BM25 format: /path/to/file.md_3
+_LEGACY_CHUNK_ID_PATTERN = re.compile(r"^(.+\.md)_(\d+)$")
+
+
+def make_chunk_id(file_path: str, chunk_index: int) -> str:
+    """
+    Build the canonical ID for a content chunk.
+
+    Args:
+        file_path: Resolved path (or source URI) of the document
+        chunk_index: Position of the chunk within the document
+
+    Returns:
+        Chunk ID in ``{file_path}::{chunk_index}`` form
+    """
+    return f"{file_path}{CHUNK_ID_SEPARATOR}{chunk_index}"
+
+
+def make_summary_id(file_path: str) -> str:
+    """
+    Build the canonical ID for a document's summary chunk.
+
+    Args:
+        file_path: Resolved path of the document
+
+    Returns:
+        Chunk ID in ``{file_path}::summary`` form
+    """
+    return f"{file_path}{CHUNK_ID_SEPARATOR}{SUMMARY_CHUNK_SUFFIX}"
+
+
+def is_summary_id(doc_id: str) -> bool:
+    """Check whether a chunk ID refers to a document summary chunk."""
+    return doc_id.endswith(f"{CHUNK_ID_SEPARATOR}{SUMMARY_CHUNK_SUFFIX}")
+
+
+def parse_chunk_id(doc_id: str) -> tuple[str, Optional[int]]:
+    """
+    Split a chunk ID into file path and chunk index.
+
+    Accepts canonical IDs and legacy ``{file_path}_{N}`` BM25 IDs.
+
+    Args:
+        doc_id: Chunk ID
+
+    Returns:
+        Tuple of (file_path, chunk_index). chunk_index is None for summary
+        chunks and for IDs that don't follow either format (in which case
+        file_path is the ID itself).
+    """
+    if CHUNK_ID_SEPARATOR in doc_id:
+        file_path, suffix = doc_id.rsplit(CHUNK_ID_SEPARATOR, 1)
+        if suffix == SUMMARY_CHUNK_SUFFIX:
+            return file_path, None
+        try:
+            return file_path, int(suffix)
+        except ValueError:
+            return doc_id, None
+
+    match = _LEGACY_CHUNK_ID_PATTERN.match(doc_id)
+    if match:
+        return match.group(1), int(match.group(2))
+
+    return doc_id, None
+
+
+def canonicalize_chunk_id(doc_id: str) -> str:
+    """
+    Rewrite a legacy ``{file_path}_{N}`` ID into canonical form.
+
+    Canonical and unrecognized IDs are returned unchanged.
+
+    Args:
+        doc_id: Chunk ID in any supported format
+
+    Returns:
+        Canonical chunk ID
+    """
+    if CHUNK_ID_SEPARATOR in doc_id:
+        return doc_id
+    match = _LEGACY_CHUNK_ID_PATTERN.match(doc_id)
+    if match:
+        return make_chunk_id(match.group(1), int(match.group(2)))
+    return doc_id
@@ -13,6 +13,7 @@ from pathlib import Path
 from typing import Optional
 
 from config.settings import settings
+from api.utils.db_connections import get_connection
 
 logger = logging.getLogger(__name__)
 
@@ -65,7 +66,7 @@ class ConversationStore:
 
     def _init_db(self):
         """Create database tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
@@ -111,7 +112,7 @@ class ConversationStore:
         title = title or "New Conversation"
         now = datetime.now()
 
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             conn.execute(
                 "INSERT INTO conversations (id, title, created_at, updated_at) VALUES (?, ?, ?, ?)",
@@ -139,7 +140,7 @@ class ConversationStore:
         Returns:
             Conversation or None if not found
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             cursor = conn.execute(
                 """
@@ -177,7 +178,7 @@ class ConversationStore:
         Returns:
             List of conversations
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             cursor = conn.execute(
                 """
@@ -216,7 +217,7 @@ class ConversationStore:
         Returns:
             True if deleted, False if not found
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             # Check if exists
             cursor = conn.execute(
@@ -267,7 +268,7 @@ class ConversationStore:
         sources_json = json.dumps(sources) if sources else None
         routing_json = json.dumps(routing) if routing else None
 
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             conn.execute(
                 """
@@ -310,7 +311,7 @@ class ConversationStore:
         Returns:
             List of messages in chronological order
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             if limit:
                 # Get last N messages
@@ -365,7 +366,7 @@ class ConversationStore:
         Returns:
             True if updated, False if not found
         """
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             cursor = conn.execute(
                 "UPDATE conversations SET title = ?, updated_at = ? WHERE id = ?",
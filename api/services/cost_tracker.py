@@ -11,6 +11,8 @@ from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Optional
 
+from api.utils.db_connections import transaction
+
 logger = logging.getLogger(__name__)
 
 # Model pricing (per million tokens)
@@ -103,7 +105,7 @@ class CostTracker:
 
     def _init_db(self):
         """Initialize database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS api_usage (
@@ -159,7 +161,7 @@ class CostTracker:
             created_at=datetime.now()
         )
 
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             conn.execute("""
                 INSERT INTO api_usage
                 (id, conversation_id, message_id, model, input_tokens, output_tokens, cost_usd, created_at)
@@ -190,7 +192,7 @@ class CostTracker:
         Returns:
             Total cost in USD
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             cursor = conn.execute("""
                 SELECT COALESCE(SUM(cost_usd), 0)
                 FROM api_usage
@@ -210,7 +212,7 @@ class CostTracker:
             Total cost in USD
         """
         since = datetime.now() - timedelta(hours=hours)
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             cursor = conn.execute("""
                 SELECT COALESCE(SUM(cost_usd), 0)
                 FROM api_usage
@@ -229,7 +231,7 @@ class CostTracker:
         Returns:
             List of UsageRecords
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("""
                 SELECT * FROM api_usage
@@ -255,7 +257,7 @@ class CostTracker:
         Returns:
             List of UsageRecords
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute("""
                 SELECT * FROM api_usage
@@ -273,7 +275,7 @@ class CostTracker:
         Returns:
             Dictionary with total tokens and cost
         """
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             cursor = conn.execute("""
                 SELECT
                     COALESCE(SUM(input_tokens), 0) as total_input,
@@ -0,0 +1,231 @@
+"""
+Persistent embedding cache for LifeOS.
+
+Stores document embeddings keyed by (model name, SHA-256 of chunk text) so
+re-indexing a note only pays for chunks whose text actually changed. Files
+that are merely touched (e.g. by Obsidian sync) or edited in one paragraph
+reuse every other chunk's embedding.
+
+## Key Design Decisions
+
+- **Content-addressed**: Key is the text hash, not file/chunk position, so
+  moved or renamed notes hit the cache too
+- **Compact storage**: Vectors stored as float16 blobs (half of float32);
+  precision loss is far below what affects cosine ranking
+- **Bounded LRU**: last_used is bumped on hits and the oldest rows are
+  evicted once max_entries is exceeded
+
+## Usage
+
+    from api.services.embedding_cache import get_embedding_cache
+    cache = get_embedding_cache()
+    hits = cache.get_many("model", ["text a", "text b"])  # {index: vector}
+"""
+import hashlib
+import logging
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# Evict down to max_entries once the cache overshoots by this fraction,
+# so eviction runs occasionally instead of on every insert
+EVICTION_SLACK = 0.05
+
+# SQLite limits the number of bound parameters per statement
+_MAX_PARAMS = 500
+
+
+def get_embedding_cache_db_path() -> str:
+    """Get the path to the embedding cache database."""
+    db_dir = Path(settings.chroma_path).parent
+    db_dir.mkdir(parents=True, exist_ok=True)
+    return str(db_dir / "embedding_cache.db")
+
+
+def hash_text(text: str) -> str:
+    """SHA-256 hex digest of a chunk's text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed LRU cache of embedding vectors.
+
+    Thread-safe: a single connection is shared behind a lock, since the
+    watcher thread and API threadpool may both embed concurrently.
+    """
+
+    def __init__(self, db_path: Optional[str] = None, max_entries: Optional[int] = None):
+        """
+        Initialize embedding cache.
+
+        Args:
+            db_path: Path to SQLite database (default from settings)
+            max_entries: Maximum cached vectors across all models (default from settings)
+        """
+        self.db_path = db_path or get_embedding_cache_db_path()
+        self.max_entries = max_entries or settings.embedding_cache_max_entries
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.db_path, timeout=30.0, check_same_thread=False)
+        self._init_db()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def _init_db(self):
+        """Create cache table if it doesn't exist."""
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS embeddings (
+                    model TEXT NOT NULL,
+                    text_hash TEXT NOT NULL,
+                    dim INTEGER NOT NULL,
+                    vector BLOB NOT NULL,
+                    last_used REAL NOT NULL,
+                    PRIMARY KEY (model, text_hash)
+                ) WITHOUT ROWID
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)"
+            )
+
+    def get_many(self, model: str, texts: list[str]) -> dict[int, list[float]]:
+        """
+        Look up cached embeddings for texts.
+
+        Args:
+            model: Embedding model name
+            texts: Texts to look up
+
+        Returns:
+            Dict mapping input index -> embedding vector, for cache hits only
+        """
+        if not texts:
+            return {}
+
+        hashes = [hash_text(t) for t in texts]
+        unique = list(dict.fromkeys(hashes))
+        found: dict[str, list[float]] = {}
+
+        with self._lock:
+            for start in range(0, len(unique), _MAX_PARAMS):
+                batch = unique[start:start + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(batch))
+                rows = self._conn.execute(
+                    f"SELECT text_hash, vector FROM embeddings "
+                    f"WHERE model = ? AND text_hash IN ({placeholders})",
+                    [model, *batch]
+                ).fetchall()
+                for text_hash, blob in rows:
+                    found[text_hash] = np.frombuffer(blob, dtype=np.float16).astype(np.float32).tolist()
+
+            if found:
+                # Bump recency for hits in one statement per batch
+                now = time.time()
+                hit_hashes = list(found)
+                with self._conn:
+                    for start in range(0, len(hit_hashes), _MAX_PARAMS):
+                        batch = hit_hashes[start:start + _MAX_PARAMS]
+                        placeholders = ",".join("?" * len(batch))
+                        self._conn.execute(
+                            f"UPDATE embeddings SET last_used = ? "
+                            f"WHERE model = ? AND text_hash IN ({placeholders})",
+                            [now, model, *batch]
+                        )
+
+        return {i: found[h] for i, h in enumerate(hashes) if h in found}
+
+    def put_many(self, model: str, texts: list[str], embeddings: list[list[float]]) -> None:
+        """
+        Store embeddings for texts, evicting least recently used rows if full.
+
+        Args:
+            model: Embedding model name
+            texts: Texts that were embedded
+            embeddings: Embedding vectors, parallel to texts
+        """
+        if not texts:
+            return
+
+        now = time.time()
+        rows = []
+        for text, embedding in zip(texts, embeddings):
+            vector = np.asarray(embedding, dtype=np.float16)
+            rows.append((model, hash_text(text), vector.shape[0], vector.tobytes(), now))
+
+        with self._lock:
+            with self._conn:
+                before = self._conn.total_changes
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (model, text_hash, dim, vector, last_used) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                # REPLACE counts as a change too, so this over-estimates slightly
+                self._count += self._conn.total_changes - before
+                if self._count > self.max_entries * (1 + EVICTION_SLACK):
+                    self._evict()
+
+    def _evict(self) -> None:
+        """Delete least recently used rows down to max_entries (lock held)."""
+        self._count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        excess = self._count - self.max_entries
+        if excess <= 0:
+            return
+        self._conn.execute(
+            "DELETE FROM embeddings WHERE (model, text_hash) IN ("
+            "  SELECT model, text_hash FROM embeddings ORDER BY last_used LIMIT ?"
+            ")",
+            (excess,)
+        )
+        self._count -= excess
+        logger.debug(f"Evicted {excess} embeddings from cache")
+
+    def count(self) -> int:
+        """Get number of cached embeddings."""
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+
+    def clear(self) -> None:
+        """Remove all cached embeddings."""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM embeddings")
+            self._count = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+# Singleton instance
+_embedding_cache: Optional[EmbeddingCache] = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Get the singleton EmbeddingCache instance."""
+    global _embedding_cache
+    if _embedding_cache is None:
+        _embedding_cache = EmbeddingCache()
+    return _embedding_cache
+
+
+def reset_embedding_cache() -> None:
+    """
+    Reset the embedding cache singleton.
+
+    For testing only - allows tests to start with fresh state.
+    """
+    global _embedding_cache
+    if _embedding_cache is not None:
+        _embedding_cache.close()
+    _embedding_cache = None
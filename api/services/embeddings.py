@@ -4,15 +4,28 @@ Embedding service using sentence-transformers.
 Uses model configured via settings.embedding_model for local embedding generation.
 Model files are cached at settings.embedding_cache_dir to save internal disk space.
 
+Document embeddings are cached by chunk text (see embedding_cache.py), so
+re-indexing only encodes text that hasn't been embedded before. Query
+embeddings are kept in a small in-process LRU with a TTL, since the agent
+loop and briefings often repeat the same search within a conversation.
+
 NOTE: sentence_transformers is imported lazily to avoid slow startup.
 This allows tests to import this module without loading the ML library.
 """
-from typing import TYPE_CHECKING, Any
+import logging
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any, Optional
 
 from config.settings import settings
 
 if TYPE_CHECKING:
     from sentence_transformers import SentenceTransformer
+    from api.services.embedding_cache import EmbeddingCache
+
+logger = logging.getLogger(__name__)
 
 
 # Model dimension lookup (for known models)
@@ -28,17 +41,28 @@ MODEL_DIMENSIONS = {
 class EmbeddingService:
     """Service for generating text embeddings."""
 
-    def __init__(self, model_name: str = None, cache_dir: str = None):
+    def __init__(
+        self,
+        model_name: str = None,
+        cache_dir: str = None,
+        embedding_cache: Optional["EmbeddingCache"] = None
+    ):
         """
         Initialize embedding service.
 
         Args:
             model_name: Name of the sentence-transformers model to use.
             cache_dir: Directory to cache model files (defaults to settings).
+            embedding_cache: Cache for document embeddings (defaults to the
+                            singleton when settings.embedding_cache_enabled)
         """
         self.model_name = model_name or settings.embedding_model
         self.cache_dir = cache_dir or getattr(settings, 'embedding_cache_dir', None)
         self._model: Any = None
+        self._embedding_cache = embedding_cache
+        # Query embedding LRU: normalized query -> (inserted_at, vector)
+        self._query_cache: OrderedDict[str, tuple[float, list[float]]] = OrderedDict()
+        self._query_cache_lock = threading.Lock()
 
     @property
     def model(self) -> "SentenceTransformer":
@@ -76,18 +100,132 @@ class EmbeddingService:
         embedding = self.model.encode(text, convert_to_numpy=True)
         return embedding.tolist()
 
+    def embed_query(self, query: str) -> list[float]:
+        """
+        Generate embedding for a search query, using the query LRU.
+
+        Queries are normalized (whitespace collapsed) before lookup and
+        encoding, so trivially different spellings of the same query share
+        an entry. Size and TTL come from settings.query_embedding_cache_size
+        and settings.query_embedding_cache_ttl; a size of 0 disables caching.
+
+        Args:
+            query: Query text (already expanded by the caller)
+
+        Returns:
+            List of floats representing the embedding vector
+        """
+        return self.embed_queries([query])[0]
+
+    def embed_queries(self, queries: list[str]) -> list[list[float]]:
+        """
+        Generate embeddings for several search queries in one model pass.
+
+        Cached queries are served from the query LRU; the remaining distinct
+        queries are encoded together in a single encode() call.
+
+        Args:
+            queries: Query texts (already expanded by the caller)
+
+        Returns:
+            List of embedding vectors, parallel to queries
+        """
+        keys = [normalize_query(q) for q in queries]
+        max_size = settings.query_embedding_cache_size
+        results: dict[str, list[float]] = {}
+
+        now = time.monotonic()
+        if max_size > 0:
+            with self._query_cache_lock:
+                for key in keys:
+                    entry = self._query_cache.get(key)
+                    if entry is None:
+                        continue
+                    inserted_at, embedding = entry
+                    if now - inserted_at < settings.query_embedding_cache_ttl:
+                        self._query_cache.move_to_end(key)
+                        results[key] = embedding
+                    else:
+                        del self._query_cache[key]
+
+        missing = [key for key in dict.fromkeys(keys) if key not in results]
+        if missing:
+            encoded = self.model.encode(missing, convert_to_numpy=True)
+            for key, embedding in zip(missing, encoded):
+                results[key] = embedding.tolist()
+
+            if max_size > 0:
+                with self._query_cache_lock:
+                    for key in missing:
+                        self._query_cache[key] = (now, results[key])
+                        self._query_cache.move_to_end(key)
+                    while len(self._query_cache) > max_size:
+                        self._query_cache.popitem(last=False)
+
+        return [results[key] for key in keys]
+
+    def clear_query_cache(self) -> None:
+        """Drop all cached query embeddings."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
     def embed_texts(self, texts: list[str]) -> list[list[float]]:
         """
         Generate embeddings for multiple texts.
 
+        Texts already in the embedding cache are not re-encoded.
+
         Args:
             texts: List of texts to embed
 
         Returns:
             List of embedding vectors
         """
-        embeddings = self.model.encode(texts, convert_to_numpy=True)
-        return [emb.tolist() for emb in embeddings]
+        if not texts:
+            return []
+
+        cache = self._get_embedding_cache()
+        if cache is None:
+            embeddings = self.model.encode(texts, convert_to_numpy=True)
+            return [emb.tolist() for emb in embeddings]
+
+        try:
+            results: dict[int, list[float]] = cache.get_many(self.model_name, texts)
+        except Exception as e:
+            logger.warning(f"Embedding cache lookup failed: {e}")
+            results = {}
+
+        # Encode each distinct uncached text once
+        missing: dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            if i not in results:
+                missing.setdefault(text, []).append(i)
+
+        if missing:
+            new_texts = list(missing)
+            new_embeddings = [
+                emb.tolist() for emb in self.model.encode(new_texts, convert_to_numpy=True)
+            ]
+            for text, embedding in zip(new_texts, new_embeddings):
+                for i in missing[text]:
+                    results[i] = embedding
+            try:
+                cache.put_many(self.model_name, new_texts, new_embeddings)
+            except Exception as e:
+                logger.warning(f"Embedding cache write failed: {e}")
+
+        return [results[i] for i in range(len(texts))]
+
+    def _get_embedding_cache(self) -> Optional["EmbeddingCache"]:
+        """Get the document embedding cache, or None if disabled/unavailable."""
+        if self._embedding_cache is None and settings.embedding_cache_enabled:
+            try:
+                from api.services.embedding_cache import get_embedding_cache
+                self._embedding_cache = get_embedding_cache()
+            except Exception as e:
+                logger.warning(f"Embedding cache unavailable: {e}")
+                return None
+        return self._embedding_cache
 
     @property
     def embedding_dimension(self) -> int:
@@ -98,6 +236,11 @@ class EmbeddingService:
         return self.model.get_sentence_embedding_dimension()
 
 
+def normalize_query(query: str) -> str:
+    """Normalize a query for embedding cache lookup (trim, collapse whitespace)."""
+    return re.sub(r"\s+", " ", query).strip()
+
+
 # Singleton instance
 _embedding_service: EmbeddingService | None = None
 
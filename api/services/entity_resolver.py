@@ -11,91 +11,22 @@ import re
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, NamedTuple, Optional
 
 from rapidfuzz import fuzz
 
+from api.services.name_index import (
+    FUZZY_NAME_THRESHOLD,
+    NAME_PREFIXES,
+    NAME_SUFFIXES,
+    NameParts,
+    ParsedName,
+    parse_name,
+)
 from api.services.person_entity import PersonEntity, PersonEntityStore, get_person_entity_store
 from config.nickname_lookup import are_name_variants
-
-# Name prefixes to strip before parsing (case-insensitive)
-NAME_PREFIXES = {'dr', 'dr.', 'mr', 'mr.', 'mrs', 'mrs.', 'ms', 'ms.', 'prof', 'prof.', 'rev', 'rev.'}
-
-# Name suffixes to strip before parsing (case-insensitive, may have trailing punctuation)
-NAME_SUFFIXES = {
-    'md', 'phd', 'jr', 'sr', 'ii', 'iii', 'iv', 'v',
-    'esq', 'mph', 'dds', 'dmd', 'do', 'rn', 'cpa',
-    'mba', 'jd', 'llm', 'msw', 'lcsw', 'psyd', 'edd',
-}
-
-
-@dataclass
-class ParsedName:
-    """Structured representation of a parsed name."""
-    first: str  # First name (required)
-    middles: list[str]  # Middle names (may be empty)
-    last: Optional[str]  # Last name (None for single-word names)
-    original: str  # Original input string
-
-
-def parse_name(name: str) -> ParsedName:
-    """
-    Parse a name into structured components.
-
-    Strips common prefixes (Dr., Mr., Mrs.) and suffixes (MD, PhD, Jr).
-    Also strips anything after a comma (credentials like ", CLC, CSC" or ", PhD").
-    Returns {first, middles[], last} structure.
-
-    Examples:
-        "John Smith" -> {first="John", middles=[], last="Smith"}
-        "Dr. Mary Katherine Palmer MD" -> {first="Mary", middles=["Katherine"], last="Palmer"}
-        "Taylor" -> {first="Taylor", middles=[], last=None}
-        "Jane Mary Smith" -> {first="Jane", middles=["Mary"], last="Smith"}
-        "Sarah Long, CLC, CSC" -> {first="Sarah", middles=[], last="Long"}
-
-    Args:
-        name: Name string to parse
-
-    Returns:
-        ParsedName with structured components
-    """
-    if not name or not name.strip():
-        return ParsedName(first="", middles=[], last=None, original=name or "")
-
-    original = name
-
-    # First, strip anything after a comma (credentials like ", PhD" or ", CLC, CSC")
-    if ',' in name:
-        name = name.split(',')[0].strip()
-
-    parts = name.strip().split()
-
-    # Strip prefixes from the beginning
-    while parts and parts[0].lower().rstrip('.,') in NAME_PREFIXES:
-        parts.pop(0)
-
-    # Strip suffixes from the end
-    while parts and parts[-1].lower().rstrip('.,') in NAME_SUFFIXES:
-        parts.pop()
-
-    if not parts:
-        # All parts were prefixes/suffixes, return original as first name
-        return ParsedName(first=original.strip(), middles=[], last=None, original=original)
-
-    if len(parts) == 1:
-        return ParsedName(first=parts[0], middles=[], last=None, original=original)
-    elif len(parts) == 2:
-        return ParsedName(first=parts[0], middles=[], last=parts[1], original=original)
-    else:
-        # 3+ parts: first, middle(s), last
-        return ParsedName(
-            first=parts[0],
-            middles=parts[1:-1],
-            last=parts[-1],
-            original=original,
-        )
 from api.services.people import resolve_person_name, PEOPLE_DICTIONARY
-from api.services.link_override import get_link_override_store
+from api.services.link_override import LinkOverride, get_link_override_store
 from config.people_config import (
     DOMAIN_CONTEXT_MAP,
     COMPANY_NORMALIZATION,
@@ -137,6 +68,15 @@ class ResolutionResult:
     disambiguation_applied: bool = False
 
 
+class ResolutionRequest(NamedTuple):
+    """One person reference to resolve with EntityResolver.resolve_many()."""
+
+    name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    context_path: Optional[str] = None
+
+
 class EntityResolver:
     """
     Resolves names/emails to PersonEntity instances.
@@ -194,6 +134,7 @@ class EntityResolver:
         name: str,
         context_path: Optional[str] = None,
         create_if_missing: bool = False,
+        link_overrides: Optional[list[LinkOverride]] = None,
     ) -> Optional[ResolutionResult]:
         """
         Pass 2 & 3: Fuzzy name matching with context boost and disambiguation.
@@ -202,6 +143,8 @@ class EntityResolver:
             name: Name to resolve (will be canonicalized)
             context_path: Vault path for context boost (e.g., "Work/ML/meeting.md")
             create_if_missing: Create new entity if no match found
+            link_overrides: Preloaded link override rules (default: read
+                from the override store)
 
         Returns:
             ResolutionResult with matched/created entity, or None
@@ -228,6 +171,7 @@ class EntityResolver:
             name=canonical,
             source_type=None,  # Will be passed in enhanced version
             context_path=context_path,
+            overrides=link_overrides,
         )
         if override:
             preferred = self._store.get_by_id(override.preferred_person_id)
@@ -290,7 +234,11 @@ class EntityResolver:
         self, name: str, context_path: Optional[str]
     ) -> list[ResolutionCandidate]:
         """
-        Score all entities against a name using structured matching.
+        Score entities against a name using structured matching.
+
+        Candidates come from the store's name blocking index, which returns
+        every person who could pass the name checks below (and nobody else
+        needs scoring).
 
         Uses a three-phase approach:
         1. Hard disqualifiers - Different last names → skip candidate
@@ -316,10 +264,10 @@ class EntityResolver:
         candidates = []
 
         # Parse the query name into components
-        query = parse_name(name)
-        query_first_lower = query.first.lower() if query.first else ""
-        query_middles_lower = [m.lower() for m in query.middles]
-        query_last_lower = query.last.lower() if query.last else None
+        query = NameParts.parse(name)
+        query_first_lower = query.first
+        query_middles_lower = query.middles
+        query_last_lower = query.last
 
         # Check if this is a first-name-only match (single word, no last name)
         # First-name mentions in notes usually refer to close contacts
@@ -330,15 +278,14 @@ class EntityResolver:
         # Check if query first name is an initial (single character)
         is_first_initial = len(query_first_lower) == 1
 
-        for entity in self._store.get_all():
-            # Parse entity's canonical name
-            entity_parsed = parse_name(entity.canonical_name)
-            entity_first_lower = entity_parsed.first.lower() if entity_parsed.first else ""
-            entity_middles_lower = [m.lower() for m in entity_parsed.middles]
-            entity_last_lower = entity_parsed.last.lower() if entity_parsed.last else None
-
-            # Also parse all aliases
-            alias_parses = [parse_name(alias) for alias in entity.aliases]
+        # Only people the blocking index says could match are scored; names
+        # come pre-parsed and lowercased
+        for indexed in self._store.get_name_candidates(query):
+            entity = indexed.entity
+            entity_first_lower = indexed.name.first
+            entity_middles_lower = indexed.name.middles
+            entity_last_lower = indexed.name.last
+            alias_parses = indexed.aliases
 
             # ===== PHASE 1: HARD DISQUALIFIERS =====
             # If both names have last names, they must match (or be initials)
@@ -351,7 +298,7 @@ class EntityResolver:
                         # Query last is initial: check prefix match
                         if entity_last_lower.startswith(query_last_lower):
                             last_name_matches = True
-                    elif fuzz.ratio(query_last_lower, entity_last_lower) >= 85:
+                    elif fuzz.ratio(query_last_lower, entity_last_lower) >= FUZZY_NAME_THRESHOLD:
                         # Fuzzy match for typos/variations
                         last_name_matches = True
 
@@ -359,12 +306,12 @@ class EntityResolver:
                 if not last_name_matches:
                     for ap in alias_parses:
                         if ap.last:
-                            ap_last = ap.last.lower()
+                            ap_last = ap.last
                             if is_last_initial:
                                 if ap_last.startswith(query_last_lower):
                                     last_name_matches = True
                                     break
-                            elif fuzz.ratio(query_last_lower, ap_last) >= 85:
+                            elif fuzz.ratio(query_last_lower, ap_last) >= FUZZY_NAME_THRESHOLD:
                                 last_name_matches = True
                                 break
 
@@ -382,7 +329,7 @@ class EntityResolver:
                     score += 50  # Exact match
                 elif is_last_initial and entity_last_lower.startswith(query_last_lower):
                     score += 35  # Initial prefix match
-                elif fuzz.ratio(query_last_lower, entity_last_lower) >= 85:
+                elif fuzz.ratio(query_last_lower, entity_last_lower) >= FUZZY_NAME_THRESHOLD:
                     score += 25  # Fuzzy match (typos/variations)
 
             # --- First name matching (25 points max) ---
@@ -403,7 +350,7 @@ class EntityResolver:
                 elif are_name_variants(query_first_lower, entity_first_lower):
                     score += 20  # Nickname match (Ben/Benjamin, Mike/Michael)
                     first_matched = True
-                elif fuzz.ratio(query_first_lower, entity_first_lower) >= 85:
+                elif fuzz.ratio(query_first_lower, entity_first_lower) >= FUZZY_NAME_THRESHOLD:
                     score += 20  # Fuzzy match (typos)
                     first_matched = True
 
@@ -415,7 +362,7 @@ class EntityResolver:
                         score += 15
                         first_matched = True
                         break
-                    elif fuzz.ratio(query_first_lower, em) >= 85:
+                    elif fuzz.ratio(query_first_lower, em) >= FUZZY_NAME_THRESHOLD:
                         score += 12
                         first_matched = True
                         break
@@ -426,7 +373,7 @@ class EntityResolver:
                     if qm == entity_first_lower:
                         score += 15
                         break
-                    elif fuzz.ratio(qm, entity_first_lower) >= 85:
+                    elif fuzz.ratio(qm, entity_first_lower) >= FUZZY_NAME_THRESHOLD:
                         score += 12
                         break
 
@@ -437,7 +384,7 @@ class EntityResolver:
                         if qm == em:
                             score += 10
                             break
-                        elif fuzz.ratio(qm, em) >= 85:
+                        elif fuzz.ratio(qm, em) >= FUZZY_NAME_THRESHOLD:
                             score += 7
                             break
 
@@ -445,9 +392,8 @@ class EntityResolver:
             best_alias_score = 0
             for ap in alias_parses:
                 alias_score = 0
-                ap_first = ap.first.lower() if ap.first else ""
-                ap_last = ap.last.lower() if ap.last else None
-                ap_middles = [m.lower() for m in ap.middles]
+                ap_first = ap.first
+                ap_middles = ap.middles
 
                 # First name match in alias
                 if query_first_lower and ap_first:
@@ -773,6 +719,7 @@ class EntityResolver:
         phone: Optional[str] = None,
         context_path: Optional[str] = None,
         create_if_missing: bool = False,
+        link_overrides: Optional[list[LinkOverride]] = None,
     ) -> Optional[ResolutionResult]:
         """
         Main entry point: resolve a person by name, email, and/or phone.
@@ -790,36 +737,24 @@ class EntityResolver:
             phone: Person's phone (E.164 format, e.g., +1XXXXXXXXXX)
             context_path: Vault path for context boost
             create_if_missing: Create new entity if not found
+            link_overrides: Preloaded link override rules (default: read
+                from the override store)
 
         Returns:
             ResolutionResult or None
         """
-        # Pass 1: Email exact match
-        if email:
-            entity = self.resolve_by_email(email)
-            if entity:
-                return ResolutionResult(
-                    entity=entity,
-                    is_new=False,
-                    confidence=1.0,
-                    match_type="email_exact",
-                )
-
-        # Pass 1b: Phone exact match
-        if phone:
-            entity = self.resolve_by_phone(phone)
-            if entity:
-                return ResolutionResult(
-                    entity=entity,
-                    is_new=False,
-                    confidence=1.0,
-                    match_type="phone_exact",
-                )
+        # Pass 1: Email / phone exact match
+        anchored = self._resolve_anchor(email, phone)
+        if anchored:
+            return anchored
 
         # Pass 2 & 3: Name matching
         if name:
             result = self.resolve_by_name(
-                name, context_path, create_if_missing=create_if_missing
+                name,
+                context_path,
+                create_if_missing=create_if_missing,
+                link_overrides=link_overrides,
             )
             if result:
                 # If we also have email/phone, add them to the entity
@@ -877,6 +812,113 @@ class EntityResolver:
 
         return None
 
+    def _resolve_anchor(
+        self, email: Optional[str], phone: Optional[str]
+    ) -> Optional[ResolutionResult]:
+        """Pass 1: exact email match, then exact phone match."""
+        if email:
+            entity = self.resolve_by_email(email)
+            if entity:
+                return ResolutionResult(
+                    entity=entity,
+                    is_new=False,
+                    confidence=1.0,
+                    match_type="email_exact",
+                )
+
+        if phone:
+            entity = self.resolve_by_phone(phone)
+            if entity:
+                return ResolutionResult(
+                    entity=entity,
+                    is_new=False,
+                    confidence=1.0,
+                    match_type="phone_exact",
+                )
+
+        return None
+
+    def resolve_many(
+        self,
+        requests: Iterable[tuple],
+        create_if_missing: bool = False,
+    ) -> list[Optional[ResolutionResult]]:
+        """
+        Resolve a batch of people, e.g. every participant seen in a sync.
+
+        Gives the same results as calling resolve() on each request in
+        order, but:
+        - identical requests are resolved once, at their first occurrence
+        - people already known by email/phone are matched in one pass
+          before any name matching
+        - link overrides are read once for the whole batch
+        - fuzzy matching uses the store's name blocking index, so each
+          name only scores its own candidates
+
+        New entities are added to the store as they are created (so later
+        requests can match them) and are persisted by the caller's next
+        store save(), as with resolve().
+
+        Args:
+            requests: ResolutionRequest or (name, email, phone, context_path)
+                tuples; trailing fields may be omitted
+            create_if_missing: Create new entities for unmatched requests
+
+        Returns:
+            One ResolutionResult (or None) per request, in input order.
+            Repeats of a request that created a person report that person
+            as an existing exact match, like a second resolve() call would.
+        """
+        keys = [ResolutionRequest(*request) for request in requests]
+        unique = list(dict.fromkeys(keys))
+        results: dict[ResolutionRequest, Optional[ResolutionResult]] = {}
+
+        # Pass 1 in bulk: anchor everyone already known by email/phone
+        pending = []
+        for key in unique:
+            anchored = self._resolve_anchor(key.email, key.phone)
+            if anchored:
+                results[key] = anchored
+            else:
+                pending.append(key)
+
+        link_overrides = None
+        if any(key.name for key in pending):
+            link_overrides = get_link_override_store().get_all()
+
+        # Remaining requests in input order: resolve() re-checks the anchors,
+        # which may now point at people created earlier in this batch
+        for key in pending:
+            results[key] = self.resolve(
+                name=key.name,
+                email=key.email,
+                phone=key.phone,
+                context_path=key.context_path,
+                create_if_missing=create_if_missing,
+                link_overrides=link_overrides,
+            )
+
+        resolved = []
+        seen: set[ResolutionRequest] = set()
+        for key in keys:
+            result = results[key]
+            if key in seen and result and result.is_new and result.entity:
+                if key.email:
+                    match_type = "email_exact"
+                elif key.phone:
+                    match_type = "phone_exact"
+                else:
+                    match_type = "name_exact"
+                result = ResolutionResult(
+                    entity=result.entity,
+                    is_new=False,
+                    confidence=1.0,
+                    match_type=match_type,
+                )
+            seen.add(key)
+            resolved.append(result)
+        return resolved
+
     def _extract_name_from_email(self, email: str) -> str:
         """
         Extract a display name from an email address.
@@ -13,13 +13,15 @@ Per PRD P0.1:
 """
 import re
 import logging
-import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 import frontmatter
 
+from api.services.inbox_processing import InboxProcessorMixin
+from api.services.vault_catalog import VaultCatalog, get_vault_catalog
+
 logger = logging.getLogger(__name__)
 
 
@@ -179,32 +181,34 @@ CURRENT_COLLEAGUES = _get_current_colleagues()
 EFFECTIVE_CLASSIFICATION_RULES = _build_classification_rules()
 
 
-class GranolaProcessor:
+class GranolaProcessor(InboxProcessorMixin):
     """
     Process meeting notes from Granola inbox folder.
 
-    Runs every 5 minutes (configurable) to classify and move notes
-    to appropriate destinations based on content patterns defined in the PRD.
+    Classifies and moves notes to appropriate destinations based on content
+    patterns defined in the PRD, within seconds of them arriving (driven by
+    the vault catalog's file watcher).
     """
 
-    def __init__(self, vault_path: str, interval_seconds: int = 300):
+    NOTE_ID_KEY = "granola_id"
+
+    def __init__(self, vault_path: str, catalog: Optional[VaultCatalog] = None, max_workers: Optional[int] = None):
         """
         Initialize Granola processor.
 
         Args:
             vault_path: Path to Obsidian vault
-            interval_seconds: How often to check for new files (default: 300 = 5 minutes)
+            catalog: Vault catalog for duplicate lookups and file events (uses the vault's singleton if None)
+            max_workers: Inbox worker threads (default: settings.inbox_processor_workers)
         """
         self.vault_path = Path(vault_path)
+        self.catalog = catalog if catalog is not None else get_vault_catalog(self.vault_path)
         self.granola_path = self.vault_path / "Granola"
-        self.interval_seconds = interval_seconds
-        self._timer: Optional[threading.Timer] = None
-        self._running = False
-        self._lock = threading.Lock()
+        self._init_inbox("Granola", self.granola_path, max_workers)
 
     def find_files_by_granola_id(self, granola_id: str, exclude_path: Optional[Path] = None) -> list[Path]:
         """
-        Find all files in the vault with the given granola_id.
+        Find all files in the vault with the given granola_id (a vault catalog lookup).
 
         Args:
             granola_id: The Granola ID to search for
@@ -213,18 +217,10 @@ class GranolaProcessor:
         Returns:
             List of paths to files with matching granola_id
         """
-        matches = []
-        for md_file in self.vault_path.rglob("*.md"):
-            if exclude_path and md_file == exclude_path:
-                continue
-            try:
-                content = md_file.read_text(encoding="utf-8")
-                post = frontmatter.loads(content)
-                if post.metadata.get("granola_id") == granola_id:
-                    matches.append(md_file)
-            except Exception:
-                continue
-        return matches
+        return [
+            path for path in self.catalog.find_paths("granola_id", granola_id)
+            if path != exclude_path and path.exists()
+        ]
 
     def delete_duplicates_by_granola_id(self, granola_id: str, keep_path: Optional[Path] = None) -> int:
         """
@@ -242,12 +238,21 @@ class GranolaProcessor:
         for dup_path in duplicates:
             try:
                 dup_path.unlink()
+                self.catalog.remove_file(dup_path)
                 logger.info(f"Deleted duplicate granola file: {dup_path}")
                 deleted += 1
             except Exception as e:
                 logger.error(f"Failed to delete duplicate {dup_path}: {e}")
         return deleted
 
+    def _update_catalog(self, *paths: Path) -> None:
+        """Re-catalog files this processor wrote, moved or deleted."""
+        for path in paths:
+            try:
+                self.catalog.refresh_file(path)
+            except Exception as e:
+                logger.warning(f"Failed to update vault catalog for {path}: {e}")
+
     def classify_note(self, content: str, filename: str) -> tuple[str, list[str], str]:
         """
         Classify a note based on filename and content patterns.
@@ -482,8 +487,10 @@ class GranolaProcessor:
                     dest_path.unlink()
                 except Exception:
                     pass
+                self._update_catalog(path, dest_path)
                 return None
 
+        self._update_catalog(path, dest_path)
         logger.info(f"Processed: {path.name} -> {destination} ({rationale})")
         return str(dest_path)
 
@@ -610,8 +617,10 @@ class GranolaProcessor:
                     dest_path.unlink()
                 except Exception:
                     pass
+                self._update_catalog(path, dest_path)
                 return None
 
+        self._update_catalog(path, dest_path)
         logger.info(f"Reclassified: {path.name} -> {destination} ({rationale})")
         return str(dest_path)
 
@@ -665,22 +674,12 @@ class GranolaProcessor:
         Returns:
             Dict mapping granola_id to list of file paths (only for IDs with 2+ files)
         """
-        granola_files: dict[str, list[Path]] = {}
-
-        for md_file in self.vault_path.rglob("*.md"):
-            try:
-                content = md_file.read_text(encoding="utf-8")
-                post = frontmatter.loads(content)
-                granola_id = post.metadata.get("granola_id")
-                if granola_id:
-                    if granola_id not in granola_files:
-                        granola_files[granola_id] = []
-                    granola_files[granola_id].append(md_file)
-            except Exception:
-                continue
-
-        # Return only duplicates (2+ files with same granola_id)
-        return {gid: paths for gid, paths in granola_files.items() if len(paths) > 1}
+        duplicates = {}
+        for granola_id, paths in self.catalog.find_duplicates("granola_id").items():
+            existing = [path for path in paths if path.exists()]
+            if len(existing) > 1:
+                duplicates[granola_id] = existing
+        return duplicates
 
     def deduplicate_all(self) -> dict:
         """
@@ -750,6 +749,7 @@ class GranolaProcessor:
                 if path != best_path:
                     try:
                         path.unlink()
+                        self.catalog.remove_file(path)
                         detail["deleted"].append(str(path))
                         results["files_deleted"] += 1
                         logger.info(f"Deleted duplicate: {path}")
@@ -765,10 +765,14 @@ class GranolaProcessor:
         )
         return results
 
-    def process_backlog(self) -> dict:
+    def process_backlog(self, force: bool = False) -> dict:
         """
         Process all existing files in the Granola folder.
 
+        Args:
+            force: Also re-process files that were already processed and
+                   haven't changed since
+
         Returns:
             Dict with 'processed', 'failed', 'skipped' counts and 'moves' list
         """
@@ -785,7 +789,10 @@ class GranolaProcessor:
 
         for md_file in self.granola_path.glob("*.md"):
             try:
-                new_path = self.process_file(str(md_file))
+                if force:
+                    new_path = self.process_file(str(md_file))
+                else:
+                    new_path = self.process_if_changed(str(md_file))
                 if new_path:
                     results["processed"] += 1
                     results["moves"].append({
@@ -804,67 +811,11 @@ class GranolaProcessor:
         )
         return results
 
-    def _run_cycle(self):
-        """Run one processing cycle and schedule the next."""
-        if not self._running:
-            return
-
-        logger.debug("Running Granola processor cycle")
-        try:
-            results = self.process_backlog()
-            if results["processed"] > 0:
-                logger.info(f"Granola cycle: processed {results['processed']} files")
-        except Exception as e:
-            logger.error(f"Granola processor cycle failed: {e}")
-            # Record failure for nightly batch report
-            try:
-                from api.services.notifications import record_failure
-                record_failure("Granola processor", str(e))
-            except Exception as notify_err:
-                logger.error(f"Failed to record Granola failure: {notify_err}")
-
-        # Schedule next run
-        if self._running:
-            self._timer = threading.Timer(self.interval_seconds, self._run_cycle)
-            self._timer.daemon = True
-            self._timer.start()
-
-    def start(self) -> None:
-        """Start the processor (runs every interval_seconds)."""
-        with self._lock:
-            if self._running:
-                logger.debug("Granola processor already running")
-                return
-
-            if not self.granola_path.exists():
-                logger.warning(f"Granola folder does not exist: {self.granola_path}")
-                return
-
-            self._running = True
-
-            # Run immediately on start
-            logger.info(f"Starting Granola processor (interval: {self.interval_seconds}s)")
-            self._run_cycle()
-
     # Alias for backward compatibility
     def start_watching(self) -> None:
         """Alias for start() for backward compatibility."""
         self.start()
 
-    def stop(self) -> None:
-        """Stop the processor."""
-        with self._lock:
-            self._running = False
-            if self._timer:
-                self._timer.cancel()
-                self._timer = None
-            logger.info("Stopped Granola processor")
-
-    @property
-    def is_running(self) -> bool:
-        """Check if processor is running."""
-        return self._running
-
     # Alias for backward compatibility
     @property
     def is_watching(self) -> bool:
@@ -18,6 +18,7 @@ from typing import Optional
 from api.services.sheets import get_sheets_service
 from api.services.google_auth import GoogleAccount
 from config.settings import settings
+from api.utils.db_connections import transaction
 
 logger = logging.getLogger(__name__)
 
@@ -120,7 +121,7 @@ class GSheetSyncService:
 
     def _init_db(self):
         """Initialize SQLite database for tracking synced rows."""
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS synced_rows (
@@ -158,7 +159,7 @@ class GSheetSyncService:
 
     def _is_row_synced(self, sheet_id: str, row_hash: str) -> bool:
         """Check if a row has already been synced."""
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             cursor = conn.execute(
                 "SELECT 1 FROM synced_rows WHERE sheet_id = ? AND row_hash = ?",
                 (sheet_id, row_hash)
@@ -167,7 +168,7 @@ class GSheetSyncService:
 
     def _mark_row_synced(self, sheet_id: str, entry: JournalEntry):
         """Mark a row as synced in the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             conn.execute(
                 """INSERT OR IGNORE INTO synced_rows
                    (sheet_id, row_hash, entry_date, raw_data)
@@ -178,7 +179,7 @@ class GSheetSyncService:
 
     def _get_all_synced_entries(self, sheet_id: str) -> list[dict]:
         """Get all previously synced entries for rebuilding rolling doc."""
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             cursor = conn.execute(
                 """SELECT entry_date, raw_data FROM synced_rows
                    WHERE sheet_id = ? ORDER BY entry_date DESC""",
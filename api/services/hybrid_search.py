@@ -30,6 +30,7 @@ from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 
 from config.settings import settings
+from api.services.chunk_ids import parse_chunk_id
 from api.services.query_classifier import classify_query
 
 # Lazy imports to avoid slow ChromaDB initialization at import time
@@ -261,20 +262,11 @@ def deduplicate_overlapping_chunks(results: list[dict]) -> list[dict]:
         file_path = result.get("file_path", "") or result.get("metadata", {}).get("file_path", "")
 
         # Extract chunk index from result
-        chunk_idx = result.get("metadata", {}).get("chunk_index", -1)
-        if chunk_idx == -1:
-            # Try to extract from ID (format: /path/file.md::N or /path/file.md_N)
-            doc_id = result.get("id", "")
-            if "::" in doc_id:
-                try:
-                    chunk_idx = int(doc_id.split("::")[-1])
-                except ValueError:
-                    chunk_idx = -1
-            elif "_" in doc_id:
-                try:
-                    chunk_idx = int(doc_id.rsplit("_", 1)[-1])
-                except ValueError:
-                    chunk_idx = -1
+        chunk_idx = result.get("metadata", {}).get("chunk_index")
+        if chunk_idx is None or chunk_idx == -1:
+            # Fall back to the chunk ID (summary chunks have no index)
+            _, parsed_idx = parse_chunk_id(result.get("id", ""))
+            chunk_idx = parsed_idx if parsed_idx is not None else -1
 
         if not file_path:
             # No file path, can't deduplicate, include it
@@ -300,6 +292,32 @@ def deduplicate_overlapping_chunks(results: list[dict]) -> list[dict]:
     return deduplicated
 
 
+def has_decisive_lead(results: list[dict], margin: float) -> bool:
+    """
+    Check whether the top result leads the rest by a decisive margin.
+
+    Used to skip cross-encoder re-ranking (the costliest search step) when
+    vector and BM25 retrieval already agree on a clear winner. The lead is
+    measured on pre-boost fused scores (rrf_score): a recency or filename
+    boost can put one hit far ahead without saying anything about how the
+    hits below it should be ordered, so boosted winners still get reranked.
+
+    Args:
+        results: Results sorted by hybrid_score (descending)
+        margin: Required relative lead, (top - runner-up) / top; <= 0 never skips
+
+    Returns:
+        True if reranking can be skipped
+    """
+    if margin <= 0 or len(results) < 2:
+        return False
+    top = results[0].get("rrf_score", 0)
+    runner_up = max(r.get("rrf_score", 0) for r in results[1:])
+    if top <= 0:
+        return False
+    return (top - runner_up) / top >= margin
+
+
 class HybridSearch:
     """
     Main search orchestrator combining vector and BM25 search.
@@ -350,7 +368,8 @@ class HybridSearch:
         top_k: int = 20,
         apply_recency_boost: bool = True,
         use_reranker: bool | None = None,
-        rerank_candidates: int = 50
+        rerank_candidates: int = 50,
+        extra_keywords: Optional[list[str]] = None
     ) -> list[dict]:
         """
         Perform hybrid search combining vector and BM25 with optional cross-encoder re-ranking.
@@ -372,6 +391,8 @@ class HybridSearch:
             apply_recency_boost: Apply recency boosting (default True)
             use_reranker: Apply cross-encoder re-ranking (default True)
             rerank_candidates: Number of candidates to fetch for re-ranking (default 50)
+            extra_keywords: Extra terms (e.g. a person's aliases) matched by
+                BM25 only; the vector search and re-ranking use the query alone
 
         Returns:
             List of dicts with id, content, file_path, file_name, hybrid_score
@@ -391,6 +412,81 @@ class HybridSearch:
         vector_store = self._get_vector_store()
         vector_results = vector_store.search(query=expanded_query, top_k=fetch_k)
 
+        bm25_query = " ".join([expanded_query, *(extra_keywords or [])])
+        return self._rank_results(
+            expanded_query, vector_results, top_k, fetch_k, apply_recency_boost, use_reranker,
+            bm25_query=bm25_query
+        )
+
+    def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 20,
+        apply_recency_boost: bool = True,
+        use_reranker: bool | None = None,
+        rerank_candidates: int = 50
+    ) -> list[list[dict]]:
+        """
+        Run hybrid search for several queries, batching the vector side.
+
+        All queries are embedded in one model pass and sent to ChromaDB in
+        one request (VectorStore.search_many); BM25, fusion and re-ranking
+        then run per query exactly as in search().
+
+        Args:
+            queries: Search query strings
+            top_k: Maximum results to return per query
+            apply_recency_boost: Apply recency boosting (default True)
+            use_reranker: Apply cross-encoder re-ranking (default from settings)
+            rerank_candidates: Number of candidates to fetch for re-ranking (default 50)
+
+        Returns:
+            One result list per query, in the same order as queries
+        """
+        if not queries:
+            return []
+
+        if use_reranker is None:
+            use_reranker = settings.reranker_enabled
+
+        fetch_k = rerank_candidates if use_reranker else top_k
+        expanded_queries = [expand_person_names(query) for query in queries]
+
+        vector_store = self._get_vector_store()
+        vector_results_per_query = vector_store.search_many(expanded_queries, top_k=fetch_k)
+
+        return [
+            self._rank_results(
+                expanded_query, vector_results, top_k, fetch_k, apply_recency_boost, use_reranker
+            )
+            for expanded_query, vector_results in zip(expanded_queries, vector_results_per_query)
+        ]
+
+    def _rank_results(
+        self,
+        expanded_query: str,
+        vector_results: list[dict],
+        top_k: int,
+        fetch_k: int,
+        apply_recency_boost: bool,
+        use_reranker: bool,
+        bm25_query: Optional[str] = None
+    ) -> list[dict]:
+        """
+        Fuse vector results with BM25, apply boosts and optional re-ranking.
+
+        Args:
+            expanded_query: Query after person name expansion
+            vector_results: Results from the vector store for this query
+            top_k: Maximum results to return
+            fetch_k: Number of candidates fetched from each retriever
+            apply_recency_boost: Apply recency boosting
+            use_reranker: Apply cross-encoder re-ranking
+            bm25_query: Keyword query for BM25 (default expanded_query)
+
+        Returns:
+            List of dicts with id, content, file_path, file_name, hybrid_score
+        """
         # Extract doc IDs and create lookup
         vector_doc_ids = []
         results_by_id = {}
@@ -408,7 +504,7 @@ class HybridSearch:
 
         if bm25_index:
             try:
-                bm25_results = bm25_index.search(expanded_query, limit=fetch_k)
+                bm25_results = bm25_index.search(bm25_query or expanded_query, limit=fetch_k)
                 bm25_doc_ids = [r["doc_id"] for r in bm25_results]
                 # Store BM25 results for later lookup
                 bm25_results_by_id = {r["doc_id"]: r for r in bm25_results}
@@ -447,8 +543,7 @@ class HybridSearch:
             elif doc_id in bm25_results_by_id:
                 # BM25-only result - use the content from BM25
                 bm25_result = bm25_results_by_id[doc_id]
-                # Extract file path from doc_id (format: /path/to/file.md_chunkN)
-                file_path = doc_id.rsplit("_", 1)[0] if "_" in doc_id else doc_id
+                file_path = bm25_result.get("file_path") or parse_chunk_id(doc_id)[0]
                 result = {
                     "id": doc_id,
                     "content": bm25_result.get("content", ""),
@@ -459,6 +554,7 @@ class HybridSearch:
                         "file_name": bm25_result.get("file_name", ""),
                         "file_path": file_path,
                         "source": file_path,
+                        "chunk_index": bm25_result.get("chunk_index"),
                     }
                 }
             else:
@@ -495,6 +591,13 @@ class HybridSearch:
         # Deduplicate overlapping chunks (important with 20% overlap)
         final_results = deduplicate_overlapping_chunks(final_results)
 
+        # Skip the cross-encoder when retrieval alone is already decisive
+        if use_reranker and len(final_results) > top_k and has_decisive_lead(
+            final_results, settings.reranker_skip_margin
+        ):
+            logger.debug("Top result leads decisively, skipping cross-encoder")
+            use_reranker = False
+
         # Apply cross-encoder re-ranking if enabled and we have enough candidates
         if use_reranker and len(final_results) > top_k:
             try:
@@ -16,6 +16,8 @@ from pathlib import Path
 from typing import Optional
 
 from api.services.phone_utils import normalize_phone
+from api.utils.db_connections import transaction
+from api.utils.fts import build_match_query, ensure_fts_index
 
 logger = logging.getLogger(__name__)
 
@@ -24,6 +26,12 @@ logger = logging.getLogger(__name__)
 APPLE_EPOCH_OFFSET = 978307200  # Seconds from Unix epoch to Apple epoch
 NANOS_PER_SECOND = 1_000_000_000
 
+# Columns selected for IMessageRecord, qualified for FTS joins
+_RECORD_COLUMNS = """
+    m.rowid, m.text, m.timestamp, m.is_from_me, m.handle,
+    m.handle_normalized, m.service, m.person_entity_id
+"""
+
 
 def apple_timestamp_to_datetime(apple_ts: int) -> Optional[datetime]:
     """
@@ -60,6 +68,20 @@ def datetime_to_apple_timestamp(dt: datetime) -> int:
     return int(apple_seconds * NANOS_PER_SECOND)
 
 
+def _timestamp_bound(value: datetime | str, end_of_day: bool = False) -> str:
+    """
+    Format a date filter for comparison with stored ISO timestamps.
+
+    Accepts datetimes or ISO strings; a bare YYYY-MM-DD end date covers
+    the whole day.
+    """
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if end_of_day and len(value) == 10:
+        return f"{value}T23:59:59.999999"
+    return value
+
+
 def extract_text_from_attributed_body(blob: bytes) -> Optional[str]:
     """
     Extract text content from NSAttributedString binary data.
@@ -142,6 +164,22 @@ class IMessageRecord:
     handle_normalized: Optional[str]  # E.164 phone number if applicable
     service: str  # "iMessage", "SMS", "RCS"
     person_entity_id: Optional[str] = None  # Joined PersonEntity ID
+    match_snippet: Optional[str] = None  # Highlighted excerpt (text search only)
+
+    @classmethod
+    def from_row(cls, row: sqlite3.Row) -> "IMessageRecord":
+        """Create from a row selected with _RECORD_COLUMNS."""
+        return cls(
+            rowid=row["rowid"],
+            text=row["text"],
+            timestamp=datetime.fromisoformat(row["timestamp"]),
+            is_from_me=bool(row["is_from_me"]),
+            handle=row["handle"],
+            handle_normalized=row["handle_normalized"],
+            service=row["service"],
+            person_entity_id=row["person_entity_id"],
+            match_snippet=row["match_snippet"] if "match_snippet" in row.keys() else None,
+        )
 
 
 class IMessageStore:
@@ -152,6 +190,7 @@ class IMessageStore:
     - Export from macOS Messages database
     - Incremental sync tracking
     - Query by phone number / person entity
+    - Full-text search via the messages_fts FTS5 index
     """
 
     # Source database path (macOS Messages)
@@ -171,7 +210,7 @@ class IMessageStore:
         """Create the local database schema if it doesn't exist."""
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.executescript("""
                 CREATE TABLE IF NOT EXISTS messages (
@@ -199,10 +238,12 @@ class IMessageStore:
                     value TEXT NOT NULL
                 );
             """)
+            if ensure_fts_index(conn, "messages_fts", "messages", "text"):
+                logger.info("Built messages_fts full-text index")
 
     def _get_last_synced_rowid(self) -> int:
         """Get the last synced ROWID for incremental sync."""
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             cursor = conn.execute(
                 "SELECT value FROM sync_state WHERE key = 'last_rowid'"
             )
@@ -211,7 +252,7 @@ class IMessageStore:
 
     def _set_last_synced_rowid(self, rowid: int) -> None:
         """Update the last synced ROWID."""
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             conn.execute(
                 """
                 INSERT OR REPLACE INTO sync_state (key, value)
@@ -355,20 +396,27 @@ class IMessageStore:
         return stats
 
     def _insert_batch(self, batch: list) -> None:
-        """Insert a batch of messages."""
-        with sqlite3.connect(self.storage_path) as conn:
+        """Insert a batch of messages (upsert, so the FTS triggers see replacements)."""
+        with transaction(self.storage_path) as conn:
             conn.executemany(
                 """
-                INSERT OR REPLACE INTO messages
+                INSERT INTO messages
                 (rowid, text, timestamp, is_from_me, handle, handle_normalized, service)
                 VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(rowid) DO UPDATE SET
+                    text = excluded.text,
+                    timestamp = excluded.timestamp,
+                    is_from_me = excluded.is_from_me,
+                    handle = excluded.handle,
+                    handle_normalized = excluded.handle_normalized,
+                    service = excluded.service
                 """,
                 batch,
             )
 
     def _clear_data(self) -> None:
         """Clear all exported data (for full resync)."""
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             conn.execute("DELETE FROM messages")
             conn.execute("DELETE FROM sync_state")
         logger.info("Cleared iMessage export data for full resync")
@@ -385,7 +433,7 @@ class IMessageStore:
         """
         total_updated = 0
 
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             for phone, entity_id in phone_to_entity.items():
                 cursor = conn.execute(
                     """
@@ -413,7 +461,7 @@ class IMessageStore:
         """
         total_updated = 0
 
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             for handle, entity_id in handle_to_entity.items():
                 # Match case-insensitively on handle
                 cursor = conn.execute(
@@ -462,23 +510,11 @@ class IMessageStore:
         query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
 
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(query, params)
 
-            return [
-                IMessageRecord(
-                    rowid=row["rowid"],
-                    text=row["text"],
-                    timestamp=datetime.fromisoformat(row["timestamp"]),
-                    is_from_me=bool(row["is_from_me"]),
-                    handle=row["handle"],
-                    handle_normalized=row["handle_normalized"],
-                    service=row["service"],
-                    person_entity_id=row["person_entity_id"],
-                )
-                for row in cursor
-            ]
+            return [IMessageRecord.from_row(row) for row in cursor]
 
     def get_messages_for_entity(
         self,
@@ -512,23 +548,11 @@ class IMessageStore:
         query += " ORDER BY timestamp DESC LIMIT ?"
         params.append(limit)
 
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(query, params)
 
-            return [
-                IMessageRecord(
-                    rowid=row["rowid"],
-                    text=row["text"],
-                    timestamp=datetime.fromisoformat(row["timestamp"]),
-                    is_from_me=bool(row["is_from_me"]),
-                    handle=row["handle"],
-                    handle_normalized=row["handle_normalized"],
-                    service=row["service"],
-                    person_entity_id=row["person_entity_id"],
-                )
-                for row in cursor
-            ]
+            return [IMessageRecord.from_row(row) for row in cursor]
 
     def search_messages(
         self,
@@ -538,61 +562,56 @@ class IMessageStore:
         entity_id: Optional[str] = None,
     ) -> list[IMessageRecord]:
         """
-        Search messages by text content.
+        Search messages by text content, best matches first.
+
+        Uses the FTS5 index: words are ANDed, "quoted words" match as a
+        phrase and word* matches as a prefix. Each record carries a
+        highlighted match_snippet.
 
         Args:
-            query: Search query (case-insensitive substring)
+            query: Search query
             limit: Maximum results
             phone: Optional filter by phone number
             entity_id: Optional filter by entity ID
 
         Returns:
-            List of matching IMessageRecord objects
+            List of matching IMessageRecord objects, ranked by relevance
         """
-        sql = """
-            SELECT rowid, text, timestamp, is_from_me, handle,
-                   handle_normalized, service, person_entity_id
-            FROM messages
-            WHERE text LIKE ?
+        match = build_match_query(query)
+        if match is None:
+            return []
+
+        sql = f"""
+            SELECT {_RECORD_COLUMNS},
+                   snippet(messages_fts, 0, '**', '**', '…', 16) AS match_snippet
+            FROM messages_fts
+            JOIN messages m ON m.rowid = messages_fts.rowid
+            WHERE messages_fts MATCH ?
         """
-        params = [f"%{query}%"]
+        params: list = [match]
 
         if phone:
-            sql += " AND handle_normalized = ?"
+            sql += " AND m.handle_normalized = ?"
             params.append(phone)
 
         if entity_id:
-            sql += " AND person_entity_id = ?"
+            sql += " AND m.person_entity_id = ?"
             params.append(entity_id)
 
-        sql += " ORDER BY timestamp DESC LIMIT ?"
+        sql += " ORDER BY bm25(messages_fts), m.timestamp DESC LIMIT ?"
         params.append(limit)
 
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.execute(sql, params)
-
-            return [
-                IMessageRecord(
-                    rowid=row["rowid"],
-                    text=row["text"],
-                    timestamp=datetime.fromisoformat(row["timestamp"]),
-                    is_from_me=bool(row["is_from_me"]),
-                    handle=row["handle"],
-                    handle_normalized=row["handle_normalized"],
-                    service=row["service"],
-                    person_entity_id=row["person_entity_id"],
-                )
-                for row in cursor
-            ]
+            return [IMessageRecord.from_row(row) for row in conn.execute(sql, params)]
 
     def query_messages(
         self,
         entity_id: Optional[str] = None,
         phone: Optional[str] = None,
         search_term: Optional[str] = None,
-        start_date: Optional[datetime] = None,
-        end_date: Optional[datetime] = None,
+        start_date: Optional[datetime | str] = None,
+        end_date: Optional[datetime | str] = None,
         direction: Optional[str] = None,  # "sent", "received", or None for both
         limit: int = 100,
     ) -> list[IMessageRecord]:
@@ -605,68 +624,60 @@ class IMessageStore:
         Args:
             entity_id: Filter by PersonEntity ID
             phone: Filter by E.164 phone number
-            search_term: Search within message text (case-insensitive)
-            start_date: Only messages after this datetime
-            end_date: Only messages before this datetime
+            search_term: Search within message text (FTS5: words ANDed,
+                "phrases" and prefix* supported)
+            start_date: Only messages after this datetime (or ISO date string)
+            end_date: Only messages before this datetime (or ISO date string)
             direction: "sent" for is_from_me=1, "received" for is_from_me=0
             limit: Maximum messages to return
 
         Returns:
             List of IMessageRecord objects, ordered by timestamp DESC
         """
-        sql = """
-            SELECT rowid, text, timestamp, is_from_me, handle,
-                   handle_normalized, service, person_entity_id
-            FROM messages
-            WHERE 1=1
-        """
-        params = []
+        match = build_match_query(search_term) if search_term else None
+        if search_term and match is None:
+            return []
+
+        if match:
+            sql = f"""
+                SELECT {_RECORD_COLUMNS},
+                       snippet(messages_fts, 0, '**', '**', '…', 16) AS match_snippet
+                FROM messages_fts
+                JOIN messages m ON m.rowid = messages_fts.rowid
+                WHERE messages_fts MATCH ?
+            """
+            params: list = [match]
+        else:
+            sql = f"SELECT {_RECORD_COLUMNS} FROM messages m WHERE 1=1"
+            params = []
 
         if entity_id:
-            sql += " AND person_entity_id = ?"
+            sql += " AND m.person_entity_id = ?"
             params.append(entity_id)
 
         if phone:
-            sql += " AND handle_normalized = ?"
+            sql += " AND m.handle_normalized = ?"
             params.append(phone)
 
-        if search_term:
-            sql += " AND text LIKE ?"
-            params.append(f"%{search_term}%")
-
         if start_date:
-            sql += " AND timestamp >= ?"
-            params.append(start_date.isoformat())
+            sql += " AND m.timestamp >= ?"
+            params.append(_timestamp_bound(start_date))
 
         if end_date:
-            sql += " AND timestamp <= ?"
-            params.append(end_date.isoformat())
+            sql += " AND m.timestamp <= ?"
+            params.append(_timestamp_bound(end_date, end_of_day=True))
 
         if direction == "sent":
-            sql += " AND is_from_me = 1"
+            sql += " AND m.is_from_me = 1"
         elif direction == "received":
-            sql += " AND is_from_me = 0"
+            sql += " AND m.is_from_me = 0"
 
-        sql += " ORDER BY timestamp DESC LIMIT ?"
+        sql += " ORDER BY m.timestamp DESC LIMIT ?"
         params.append(limit)
 
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             conn.row_factory = sqlite3.Row
-            cursor = conn.execute(sql, params)
-
-            return [
-                IMessageRecord(
-                    rowid=row["rowid"],
-                    text=row["text"],
-                    timestamp=datetime.fromisoformat(row["timestamp"]),
-                    is_from_me=bool(row["is_from_me"]),
-                    handle=row["handle"],
-                    handle_normalized=row["handle_normalized"],
-                    service=row["service"],
-                    person_entity_id=row["person_entity_id"],
-                )
-                for row in cursor
-            ]
+            return [IMessageRecord.from_row(row) for row in conn.execute(sql, params)]
 
     def format_messages_for_context(
         self,
@@ -717,7 +728,7 @@ class IMessageStore:
 
     def get_statistics(self) -> dict:
         """Get statistics about the exported messages."""
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             stats = {}
 
             # Total messages
@@ -781,7 +792,7 @@ class IMessageStore:
         """
         cutoff = datetime.now(timezone.utc).isoformat()
 
-        with sqlite3.connect(self.storage_path) as conn:
+        with transaction(self.storage_path) as conn:
             conn.row_factory = sqlite3.Row
             cursor = conn.execute(
                 """
@@ -853,7 +864,7 @@ def join_imessages_to_entities() -> dict:
     entity_store = get_person_entity_store()
 
     # Get unique phone numbers from messages
-    with sqlite3.connect(store.storage_path) as conn:
+    with transaction(store.storage_path) as conn:
         cursor = conn.execute(
             """
             SELECT DISTINCT handle_normalized
@@ -941,18 +952,43 @@ def sync_and_join_imessages() -> dict:
     }
 
 
+def _whatsapp_record(interaction) -> IMessageRecord:
+    """Present a WhatsApp message interaction as an IMessageRecord."""
+    return IMessageRecord(
+        rowid=0,
+        text=interaction.snippet or "",
+        timestamp=interaction.timestamp,
+        is_from_me=interaction.title.startswith("WhatsApp →"),
+        handle="",
+        handle_normalized=None,
+        service="WhatsApp",
+        person_entity_id=interaction.person_id,
+    )
+
+
+def _as_day(value: Optional[datetime | str]) -> Optional[str]:
+    """YYYY-MM-DD for a datetime or ISO date string filter."""
+    if value is None:
+        return None
+    if isinstance(value, datetime):
+        return value.strftime("%Y-%m-%d")
+    return value[:10]
+
+
 def query_person_messages(
     entity_id: str,
     search_term: Optional[str] = None,
-    start_date: Optional[datetime] = None,
-    end_date: Optional[datetime] = None,
+    start_date: Optional[datetime | str] = None,
+    end_date: Optional[datetime | str] = None,
     limit: int = 100,
 ) -> dict:
     """
-    Query iMessage history for a person - designed for orchestrator use.
+    Query iMessage and WhatsApp history for a person - designed for orchestrator use.
 
     This function is called by the chat orchestrator when it needs to
     retrieve message history with specific parameters (date ranges, search terms).
+    iMessages come from the local export, WhatsApp messages from their
+    interaction records; both are searched through FTS5 indexes.
 
     Args:
         entity_id: PersonEntity ID to query messages for
@@ -968,6 +1004,8 @@ def query_person_messages(
         - count: Number of messages returned
         - date_range: Actual date range of returned messages
     """
+    from api.services.interaction_store import get_interaction_store
+
     store = get_imessage_store()
 
     messages = store.query_messages(
@@ -978,6 +1016,20 @@ def query_person_messages(
         limit=limit,
     )
 
+    whatsapp = get_interaction_store().query_messages(
+        person_id=entity_id,
+        search_term=search_term,
+        start_day=_as_day(start_date),
+        end_day=_as_day(end_date),
+        limit=limit,
+    )
+    if whatsapp:
+        messages = sorted(
+            messages + [_whatsapp_record(i) for i in whatsapp],
+            key=lambda m: m.timestamp,
+            reverse=True,
+        )[:limit]
+
     # Reverse to show chronological order (oldest first)
     messages_chronological = list(reversed(messages))
 
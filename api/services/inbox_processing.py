@@ -0,0 +1,308 @@
+"""
+Event-driven processing for vault inbox folders (Granola/, Omi/Events/).
+
+The Granola and Omi processors used to wake every 5 minutes and re-read
+every file in their inbox. They now subscribe to the vault catalog's
+watcher: each debounced create/modify event for an inbox file is handed
+to a small worker pool, and a ledger of (path, content hash) skips files
+that were already looked at and haven't changed.
+
+## Key Design Decisions
+
+- **Shared observer**: events come from VaultCatalog's single watchdog
+  observer (already debounced per file), not a per-processor watcher
+- **Ledger of files left in place**: a file that is processed and moved
+  out of the inbox is dropped from the ledger, so an identical re-sync
+  is processed again; a file that was skipped or failed is recorded and
+  not retried until its content changes
+- **Bounded pool**: settings.inbox_processor_workers threads per
+  processor. A path already queued or running is not queued twice; if it
+  changes mid-run it is re-queued once the run finishes
+- **Per-note locks**: two copies of the same note (same granola_id/omi_id)
+  are never moved at the same time, since each deletes the other's
+  duplicates
+- **One lifecycle**: InboxProcessorMixin holds process_if_changed(),
+  start() and stop() for both processors. The catalog's watcher is
+  reference counted, so stopping one processor never stops the observer
+  another processor still listens to
+"""
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, Optional, Union
+
+from config.settings import settings
+from api.utils.db_connections import get_connection, transaction
+
+logger = logging.getLogger(__name__)
+
+LOCK_STRIPES = 16
+
+
+class ProcessedFileLedger:
+    """(path, content hash) of inbox files a processor looked at and left in place."""
+
+    def __init__(self, processor: str, db_path: str):
+        """
+        Initialize the ledger.
+
+        Args:
+            processor: Processor name ("granola", "omi"); ledgers share a table
+            db_path: Path to SQLite database (the vault catalog's)
+        """
+        self.processor = processor
+        self.db_path = db_path
+        with transaction(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS processed_files (
+                    processor TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    processed_at TEXT NOT NULL,
+                    PRIMARY KEY (processor, path)
+                )
+            """)
+
+    def is_unchanged(self, file_path: Union[str, Path], content_hash: str) -> bool:
+        """True if this exact content at this path was already processed."""
+        conn = get_connection(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT content_hash FROM processed_files WHERE processor = ? AND path = ?",
+                (self.processor, str(file_path)),
+            ).fetchone()
+        finally:
+            conn.close()
+        return row is not None and row[0] == content_hash
+
+    def record(self, file_path: Union[str, Path], content_hash: str) -> None:
+        """Remember that this content was processed and left where it is."""
+        with transaction(self.db_path) as conn:
+            conn.execute(
+                """
+                INSERT INTO processed_files (processor, path, content_hash, processed_at)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT(processor, path) DO UPDATE SET
+                    content_hash = excluded.content_hash,
+                    processed_at = excluded.processed_at
+                """,
+                (self.processor, str(file_path), content_hash, datetime.now().isoformat()),
+            )
+
+    def discard(self, file_path: Union[str, Path]) -> None:
+        """Forget a path (its file was moved out of the inbox)."""
+        with transaction(self.db_path) as conn:
+            conn.execute(
+                "DELETE FROM processed_files WHERE processor = ? AND path = ?",
+                (self.processor, str(file_path)),
+            )
+
+
+class StripedLocks:
+    """A fixed set of locks picked by key, so per-key locking stays bounded."""
+
+    def __init__(self, stripes: int = LOCK_STRIPES):
+        self._locks = [threading.Lock() for _ in range(stripes)]
+
+    def __call__(self, key: str) -> threading.Lock:
+        return self._locks[hash(key) % len(self._locks)]
+
+
+class InboxDispatcher:
+    """
+    Queue inbox files from vault catalog events onto a bounded worker pool.
+
+    Only markdown files directly inside the inbox folder are handled, the
+    same files the old process_backlog() glob picked up.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        inbox_path: Path,
+        handle: Callable[[str], Optional[str]],
+        max_workers: Optional[int] = None,
+    ):
+        """
+        Initialize the dispatcher.
+
+        Args:
+            name: Processor name, used for thread names and failure reports
+            inbox_path: Folder whose files are processed
+            handle: Called with each file path on a worker thread
+            max_workers: Pool size (default: settings.inbox_processor_workers)
+        """
+        self.name = name
+        self.inbox_path = Path(inbox_path)
+        self.handle = handle
+        self.max_workers = max(1, max_workers or settings.inbox_processor_workers)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._queued: set[str] = set()
+        self._requeue: set[str] = set()
+        self._lock = threading.Lock()
+
+    def matches(self, file_path: str) -> bool:
+        path = Path(file_path)
+        return path.suffix == ".md" and path.parent == self.inbox_path
+
+    def on_vault_event(self, file_path: str, action: str) -> None:
+        """VaultCatalog listener: queue created/modified inbox files."""
+        if action != "delete" and self.matches(file_path):
+            self.submit(file_path)
+
+    def submit(self, file_path: str) -> bool:
+        """
+        Queue a file unless it is already queued.
+
+        Returns:
+            True if queued (or marked to re-run after the current run)
+        """
+        with self._lock:
+            if self._executor is None:
+                return False
+            if file_path in self._queued:
+                self._requeue.add(file_path)
+                return True
+            self._queued.add(file_path)
+            self._executor.submit(self._run, file_path)
+            return True
+
+    def _run(self, file_path: str) -> None:
+        # A change that lands after this point re-queues the file below
+        with self._lock:
+            self._requeue.discard(file_path)
+        try:
+            self.handle(file_path)
+        except Exception as e:
+            logger.error(f"{self.name} processor failed on {file_path}: {e}")
+            # Record failure for nightly batch report
+            try:
+                from api.services.notifications import record_failure
+                record_failure(f"{self.name} processor", str(e))
+            except Exception as notify_err:
+                logger.error(f"Failed to record {self.name} failure: {notify_err}")
+        finally:
+            with self._lock:
+                self._queued.discard(file_path)
+                rerun = file_path in self._requeue
+                self._requeue.discard(file_path)
+        if rerun:
+            self.submit(file_path)
+
+    def start(self) -> None:
+        """Start the worker pool."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix=f"{self.name}Inbox",
+                )
+
+    def stop(self, wait: bool = False) -> None:
+        """Stop the worker pool, dropping files that haven't started."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+            self._queued.clear()
+            self._requeue.clear()
+        if executor is not None:
+            executor.shutdown(wait=wait, cancel_futures=True)
+
+    @property
+    def is_running(self) -> bool:
+        return self._executor is not None
+
+
+class InboxProcessorMixin:
+    """
+    Event-driven inbox lifecycle shared by GranolaProcessor and OmiProcessor.
+
+    Subclasses set NOTE_ID_KEY, call _init_inbox() from __init__ after
+    self.catalog is set, and implement process_file().
+    """
+
+    NOTE_ID_KEY: str = ""
+
+    def _init_inbox(self, name: str, inbox_path: Path, max_workers: Optional[int] = None) -> None:
+        """
+        Set up the ledger, note locks and worker pool for one inbox folder.
+
+        Args:
+            name: Processor name ("Granola", "Omi")
+            inbox_path: Folder whose files are processed
+            max_workers: Inbox worker threads (default: settings.inbox_processor_workers)
+        """
+        self._ledger = ProcessedFileLedger(name.lower(), self.catalog.db_path)
+        self._note_locks = StripedLocks()
+        self._dispatcher = InboxDispatcher(name, inbox_path, self.process_if_changed, max_workers)
+        self._running = False
+        self._lock = threading.Lock()
+
+    def process_if_changed(self, file_path: str) -> Optional[str]:
+        """
+        Process an inbox file unless this exact content was already processed.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            New path if moved, None if skipped or unchanged
+        """
+        entry = self.catalog.refresh_file(file_path)
+        if entry is None:
+            return None  # Already moved or deleted
+        if self._ledger.is_unchanged(entry.path, entry.content_hash):
+            logger.debug(f"Unchanged since last processed, skipping: {file_path}")
+            return None
+
+        # Copies of one note delete each other as duplicates; never move them at once
+        with self._note_locks(str(entry.frontmatter.get(self.NOTE_ID_KEY) or entry.path)):
+            new_path = self.process_file(file_path)
+
+        current = self.catalog.get(entry.path)
+        if current is None:
+            self._ledger.discard(entry.path)
+        else:
+            # Left in place: don't look at it again until it changes
+            self._ledger.record(entry.path, current.content_hash)
+        return new_path
+
+    def start(self) -> None:
+        """Start processing inbox files as they are created or modified."""
+        name, inbox_path = self._dispatcher.name, self._dispatcher.inbox_path
+        with self._lock:
+            if self._running:
+                logger.debug(f"{name} processor already running")
+                return
+
+            if not inbox_path.exists():
+                logger.warning(f"{name} inbox folder does not exist: {inbox_path}")
+                return
+
+            self._running = True
+            self._dispatcher.start()
+            self.catalog.subscribe(self._dispatcher.on_vault_event)
+            self.catalog.start_watching()
+
+            # Catch up on files that arrived while nothing was watching
+            backlog = sorted(inbox_path.glob("*.md"))
+            for md_file in backlog:
+                self._dispatcher.submit(str(md_file))
+            logger.info(f"Started {name} processor ({len(backlog)} backlog files queued)")
+
+    def stop(self) -> None:
+        """Stop the processor, releasing its hold on the catalog watcher."""
+        with self._lock:
+            if not self._running:
+                return
+            self._running = False
+            self.catalog.unsubscribe(self._dispatcher.on_vault_event)
+            self._dispatcher.stop()
+            self.catalog.stop_watching()
+            logger.info(f"Stopped {self._dispatcher.name} processor")
+
+    @property
+    def is_running(self) -> bool:
+        """Check if processor is running."""
+        return self._running
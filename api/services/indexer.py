@@ -5,21 +5,29 @@ Watches the Obsidian vault for file changes and indexes content to ChromaDB.
 Supports incremental indexing based on file modification times.
 """
 import gc
+import hashlib
 import os
-import re
 import time
 import json
+import queue
 import threading
 import logging
+from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timezone
-from watchdog.observers import Observer
-from watchdog.events import FileSystemEventHandler, FileSystemEvent
 
+from config.settings import settings
 from api.services.chunker import chunk_document, extract_frontmatter, add_context_to_chunks
 from api.services.vectorstore import VectorStore
 from api.services.bm25_index import BM25Index
+from api.services.chunk_ids import make_chunk_id, make_summary_id
 from api.services.people import extract_people_from_text
+from api.services.vault_catalog import (
+    VaultCatalog,
+    extract_note_date,
+    get_vault_catalog,
+    infer_note_type,
+)
 
 # V2 People System integration
 try:
@@ -43,57 +51,52 @@ except ImportError:
 logger = logging.getLogger(__name__)
 
 
-class VaultEventHandler(FileSystemEventHandler):
-    """Handle file system events in the vault."""
+@dataclass
+class PreparedFile:
+    """A vault file that has been read, chunked and contextualized but not yet written."""
 
-    def __init__(self, indexer: "IndexerService"):
-        self.indexer = indexer
-        self._debounce_timers: dict[str, threading.Timer] = {}
-        self._lock = threading.Lock()
+    source_path: str  # Path as passed in (key in vault_index_state.json)
+    path: Path
+    body: str
+    is_granola: bool
+    all_people: list[str]
+    metadata: dict
+    chunks: list[dict]
 
-    def _debounced_process(self, file_path: str, action: str):
-        """Process file change with debouncing."""
-        with self._lock:
-            # Cancel existing timer for this file
-            if file_path in self._debounce_timers:
-                self._debounce_timers[file_path].cancel()
+    def chunk_id(self, chunk: dict) -> str:
+        """Canonical chunk ID for one of this file's chunks."""
+        return make_chunk_id(self.metadata["file_path"], chunk["chunk_index"])
 
-            # Create new timer
-            def process():
-                with self._lock:
-                    self._debounce_timers.pop(file_path, None)
-                if action == "delete":
-                    self.indexer.delete_file(file_path)
-                else:
-                    self.indexer.index_file(file_path)
-
-            timer = threading.Timer(1.0, process)  # 1 second debounce
-            self._debounce_timers[file_path] = timer
-            timer.start()
-
-    def on_created(self, event: FileSystemEvent):
-        if not event.is_directory and event.src_path.endswith(".md"):
-            logger.info(f"File created: {event.src_path}")
-            self._debounced_process(event.src_path, "index")
-
-    def on_modified(self, event: FileSystemEvent):
-        if not event.is_directory and event.src_path.endswith(".md"):
-            logger.info(f"File modified: {event.src_path}")
-            self._debounced_process(event.src_path, "index")
-
-    def on_deleted(self, event: FileSystemEvent):
-        if not event.is_directory and event.src_path.endswith(".md"):
-            logger.info(f"File deleted: {event.src_path}")
-            self._debounced_process(event.src_path, "delete")
+    def chunk_hash(self, chunk: dict) -> str:
+        """
+        Hash of everything written for a chunk (text plus stored metadata).
 
-    def on_moved(self, event: FileSystemEvent):
-        if not event.is_directory:
-            if hasattr(event, 'src_path') and event.src_path.endswith(".md"):
-                logger.info(f"File moved from: {event.src_path}")
-                self._debounced_process(event.src_path, "delete")
-            if hasattr(event, 'dest_path') and event.dest_path.endswith(".md"):
-                logger.info(f"File moved to: {event.dest_path}")
-                self._debounced_process(event.dest_path, "index")
+        Metadata is included so a changed date, tag or people list still
+        rewrites the chunk even when its text is identical.
+        """
+        payload = {
+            "chunk": chunk,
+            "file_name": self.metadata.get("file_name"),
+            "modified_date": self.metadata.get("modified_date"),
+            "note_type": self.metadata.get("note_type"),
+            "people": sorted(self.metadata.get("people") or []),
+            "tags": self.metadata.get("tags"),
+        }
+        encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def bm25_chunks(self, chunks: list[dict] | None = None) -> list[dict]:
+        """Build BM25 rows for this file's chunks (or a subset of them)."""
+        return [
+            {
+                "doc_id": self.chunk_id(chunk),
+                "content": chunk.get("content", ""),
+                "file_name": self.path.name,
+                "people": self.all_people if self.all_people else None,
+                "content_hash": self.chunk_hash(chunk),
+            }
+            for chunk in (self.chunks if chunks is None else chunks)
+        ]
 
 
 class IndexerService:
@@ -114,6 +117,7 @@ class IndexerService:
         interaction_store=None,
         source_entity_store=None,
         entity_resolver=None,
+        catalog: VaultCatalog | None = None,
     ):
         """
         Initialize indexer.
@@ -124,6 +128,7 @@ class IndexerService:
             interaction_store: Optional InteractionStore (uses singleton if None)
             source_entity_store: Optional SourceEntityStore (uses singleton if None)
             entity_resolver: Optional EntityResolver (uses singleton if None)
+            catalog: Optional VaultCatalog (uses the vault's singleton if None)
         """
         self.vault_path = Path(vault_path)
         self.db_path = Path(db_path)
@@ -132,6 +137,7 @@ class IndexerService:
         self._interaction_store = interaction_store
         self._source_entity_store = source_entity_store
         self._entity_resolver = entity_resolver
+        self._catalog = catalog
 
         # Initialize vector store
         self.vector_store = VectorStore()
@@ -139,10 +145,16 @@ class IndexerService:
         # Initialize BM25 keyword index
         self.bm25_index = BM25Index()
 
-        # File watcher
-        self._observer: Observer | None = None
+        # File watching goes through the vault catalog's shared observer
         self._watching = False
 
+    @property
+    def catalog(self) -> VaultCatalog:
+        """Vault catalog used for file discovery and change events."""
+        if self._catalog is None:
+            self._catalog = get_vault_catalog(self.vault_path)
+        return self._catalog
+
     def _load_index_state(self) -> dict:
         """Load the index state (file paths -> last indexed mtime)."""
         state_path = Path(self.INDEX_STATE_FILE)
@@ -166,7 +178,10 @@ class IndexerService:
         Uses incremental indexing by default - only indexes files that have
         changed since the last index run. Use force=True to reindex everything.
 
-        Progress is saved incrementally every 50 files, so crashes don't lose work.
+        Files are read and chunked on a producer thread while chunks from many
+        files are accumulated into batches of settings.index_batch_size, each
+        embedded in one call and flushed to ChromaDB and BM25 in bulk. Progress
+        is saved after every flush, so crashes don't lose work.
 
         Args:
             force: If True, reindex all files regardless of modification time
@@ -179,9 +194,10 @@ class IndexerService:
         # so we can resume if interrupted
         index_state = self._load_index_state()
 
-        # Get all current markdown files with their mtimes
-        all_md_files = list(self.vault_path.rglob("*.md"))
-        current_files = {str(f): f.stat().st_mtime for f in all_md_files}
+        # Get all current markdown files with their mtimes (one stat walk,
+        # shared with the Granola/Omi processors through the catalog)
+        self.catalog.reconcile()
+        current_files = self.catalog.mtimes()
 
         # Determine which files need indexing
         files_to_index = []
@@ -201,13 +217,13 @@ class IndexerService:
         deleted_files = set(index_state.keys()) - set(current_files.keys())
 
         if force:
-            already_done = len(all_md_files) - len(files_to_index)
+            already_done = len(current_files) - len(files_to_index)
             if already_done > 0:
                 logger.info(f"RESUMING FULL REINDEX: {len(files_to_index)} remaining, {already_done} already indexed")
             else:
-                logger.info(f"FULL REINDEX: {len(all_md_files)} files")
+                logger.info(f"FULL REINDEX: {len(current_files)} files")
         else:
-            logger.info(f"Incremental index: {len(files_to_index)} changed, {len(deleted_files)} deleted, {len(all_md_files) - len(files_to_index)} unchanged")
+            logger.info(f"Incremental index: {len(files_to_index)} changed, {len(deleted_files)} deleted, {len(current_files) - len(files_to_index)} unchanged")
 
         # Delete removed files from index
         for file_path in deleted_files:
@@ -219,29 +235,51 @@ class IndexerService:
             except Exception as e:
                 logger.error(f"Failed to remove {file_path} from index: {e}")
 
-        # Index changed files, saving progress incrementally
+        # Index changed files in cross-file batches, saving progress after each flush
         count = 0
         all_affected_person_ids: set[str] = set()
-        save_interval = 10  # Save state every N files (small to survive timeouts)
-
-        for file_path, mtime in files_to_index:
-            try:
-                affected_ids = self.index_file(file_path, skip_stats_refresh=True, skip_summaries=skip_summaries)
-                if affected_ids:
-                    all_affected_person_ids.update(affected_ids)
-
-                # Update state for this file
+        batch_size = settings.index_batch_size
+        pending: list[tuple[PreparedFile, float]] = []
+        pending_chunks = 0
+
+        def flush() -> None:
+            nonlocal count, pending_chunks
+            if not pending:
+                return
+            written = self._write_batch(pending, skip_summaries=skip_summaries, incremental=not force)
+            for prepared, mtime in written:
+                # Update state only once the file's chunks are persisted
+                index_state[prepared.source_path] = mtime
+                count += 1
+            pending.clear()
+            pending_chunks = 0
+            self._save_index_state(index_state)
+            gc.collect()  # Prevent memory bloat during long indexing runs
+            logger.info(f"  Indexed {count}/{len(files_to_index)} files (progress saved)...")
+
+        for file_path, mtime, prepared, error in self._iter_prepared_files(files_to_index):
+            if error is not None:
+                logger.error(f"Failed to index {file_path}: {error}")
+                continue
+            if prepared is None:
+                # Vanished or unreadable since the scan - nothing to index
                 index_state[file_path] = mtime
                 count += 1
+                continue
 
-                # Save progress and clean up memory periodically
-                if count % save_interval == 0:
-                    self._save_index_state(index_state)
-                    gc.collect()  # Prevent memory bloat during long indexing runs
-                    logger.info(f"  Indexed {count}/{len(files_to_index)} files (progress saved)...")
-
+            try:
+                affected_ids = self._apply_side_effects(prepared, skip_stats_refresh=True)
+                all_affected_person_ids.update(affected_ids)
             except Exception as e:
                 logger.error(f"Failed to index {file_path}: {e}")
+                continue
+
+            pending.append((prepared, mtime))
+            pending_chunks += len(prepared.chunks)
+            if pending_chunks >= batch_size:
+                flush()
+
+        flush()
 
         # Final save
         self._save_index_state(index_state)
@@ -262,36 +300,146 @@ class IndexerService:
 
         return count
 
+    def _iter_prepared_files(self, files: list[tuple[str, float]]):
+        """
+        Read, chunk and contextualize files on a producer thread.
+
+        Preparation is pure CPU/disk work with no shared state, so it runs
+        ahead of the writer (bounded by settings.index_prefetch_files) while
+        the caller embeds and persists earlier batches.
+
+        Args:
+            files: List of (file_path, mtime) tuples
+
+        Yields:
+            (file_path, mtime, PreparedFile | None, Exception | None) in input order
+        """
+        results: queue.Queue = queue.Queue(maxsize=max(1, settings.index_prefetch_files))
+        stop = threading.Event()
+        done = object()
+
+        def produce():
+            try:
+                for file_path, mtime in files:
+                    if stop.is_set():
+                        return
+                    try:
+                        item = (file_path, mtime, self._prepare_file(file_path), None)
+                    except Exception as e:
+                        item = (file_path, mtime, None, e)
+                    results.put(item)
+            finally:
+                results.put(done)
+
+        producer = threading.Thread(target=produce, name="vault-index-reader", daemon=True)
+        producer.start()
+        try:
+            while True:
+                item = results.get()
+                if item is done:
+                    break
+                yield item
+        finally:
+            stop.set()
+            # Unblock the producer if it's waiting on a full queue
+            while producer.is_alive():
+                try:
+                    results.get_nowait()
+                except queue.Empty:
+                    producer.join(timeout=0.1)
+
+    def _write_batch(
+        self,
+        batch: list[tuple["PreparedFile", float]],
+        skip_summaries: bool = False,
+        incremental: bool = True
+    ) -> list[tuple["PreparedFile", float]]:
+        """
+        Persist a batch of prepared files to ChromaDB and BM25 in bulk.
+
+        If the bulk write fails, falls back to writing files one at a time
+        so a single bad file doesn't lose the rest of the batch.
+
+        Args:
+            batch: List of (PreparedFile, mtime) tuples
+            skip_summaries: If True, skip LLM summary generation
+            incremental: If True, only write chunks that changed (see _write_index)
+
+        Returns:
+            The (PreparedFile, mtime) tuples that were written successfully
+        """
+        prepared_files = [prepared for prepared, _ in batch]
+        try:
+            self._write_index(prepared_files, incremental=incremental)
+            written = batch
+        except Exception as e:
+            logger.warning(f"Batch write of {len(batch)} files failed, retrying per file: {e}")
+            written = []
+            for prepared, mtime in batch:
+                try:
+                    self._write_index([prepared], incremental=incremental)
+                    written.append((prepared, mtime))
+                except Exception as file_error:
+                    logger.error(f"Failed to index {prepared.source_path}: {file_error}")
+
+        if not skip_summaries:
+            for prepared, _ in written:
+                self._index_summary(prepared)
+
+        return written
+
     def index_file(self, file_path: str, skip_stats_refresh: bool = False, skip_summaries: bool = False) -> set[str] | None:
         """
         Index a single file.
 
         Args:
             file_path: Path to the file
-            skip_stats_refresh: If True, return affected person IDs instead of refreshing.
-                               Used by index_all() to batch refresh at the end.
+            skip_stats_refresh: If True, return affected person IDs instead of queueing
+                               a refresh. Used by index_all() to batch refresh at the end.
             skip_summaries: If True, skip LLM summary generation for faster indexing.
 
         Returns:
             Set of affected person IDs if skip_stats_refresh=True, else None
         """
+        prepared = self._prepare_file(file_path)
+        if prepared is None:
+            return
+
+        affected_person_ids = self._apply_side_effects(prepared, skip_stats_refresh=skip_stats_refresh)
+
+        self._write_index([prepared])
+
+        if not skip_summaries:
+            self._index_summary(prepared)
+
+        logger.debug(f"Indexed {file_path} with {len(prepared.chunks)} chunks")
+
+        # Return affected person IDs for batch refresh (when called from index_all)
+        if skip_stats_refresh:
+            return affected_person_ids
+        return None
+
+    def _prepare_file(self, file_path: str) -> "PreparedFile | None":
+        """
+        Read, parse, chunk and contextualize a file without writing anything.
+
+        Safe to call from a worker thread (no store access).
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            PreparedFile, or None if the file is missing, not markdown, or unreadable
+        """
         path = Path(file_path)
         if not path.exists() or not path.suffix == ".md":
-            return
+            return None
 
         try:
             content = path.read_text(encoding="utf-8")
         except Exception as e:
             logger.error(f"Failed to read {file_path}: {e}")
-            return
-
-        # Reindex task files for the task manager cache
-        if "LifeOS/Tasks/" in str(path):
-            try:
-                from api.services.task_manager import get_task_manager
-                get_task_manager().reindex_file(str(path))
-            except Exception as e:
-                logger.warning(f"Task reindex failed for {file_path}: {e}")
+            return None
 
         # Extract frontmatter
         frontmatter, body = extract_frontmatter(content)
@@ -312,12 +460,57 @@ class IndexerService:
         # Merge people lists (unique)
         all_people = list(set(extracted_people + frontmatter_people))
 
+        # Build metadata - use resolve() to get real path (handles symlinks like /var -> /private/var)
+        metadata = {
+            "file_path": str(path.resolve()),
+            "file_name": path.name,
+            "modified_date": extract_note_date(path, frontmatter, body),
+            "note_type": infer_note_type(path),
+            "people": all_people,
+            "tags": frontmatter.get("tags", []),
+            "granola_id": frontmatter.get("granola_id"),  # For context generation
+        }
+
+        # Add contextual prefixes to chunks (P9.1 - improves retrieval by 35-50%)
+        chunks = add_context_to_chunks(chunks, path, metadata)
+
+        return PreparedFile(
+            source_path=file_path,
+            path=path,
+            body=body,
+            is_granola=is_granola,
+            all_people=all_people,
+            metadata=metadata,
+            chunks=chunks,
+        )
+
+    def _apply_side_effects(self, prepared: "PreparedFile", skip_stats_refresh: bool = False) -> set[str]:
+        """
+        Update the task cache and v2 people system for a prepared file.
+
+        Args:
+            prepared: File prepared by _prepare_file()
+            skip_stats_refresh: If True, don't queue a person stats refresh here
+                               (caller will batch refresh)
+
+        Returns:
+            Set of affected person IDs
+        """
+        path = prepared.path
+
+        # Reindex task files for the task manager cache
+        if "LifeOS/Tasks/" in str(path):
+            try:
+                from api.services.task_manager import get_task_manager
+                get_task_manager().reindex_file(str(path))
+            except Exception as e:
+                logger.warning(f"Task reindex failed for {prepared.source_path}: {e}")
+
         # Sync to v2 people system if available
         affected_person_ids: set[str] = set()
-        if HAS_V2_PEOPLE and all_people:
+        if HAS_V2_PEOPLE and prepared.all_people:
             try:
-                from datetime import timezone
-                note_date_str = self._extract_note_date(path, frontmatter, body)
+                note_date_str = prepared.metadata["modified_date"]
 
                 if note_date_str:
                     # Dated note: use extracted date
@@ -328,85 +521,134 @@ class IndexerService:
                     note_date = UNDATED_SENTINEL
                     logger.debug(f"Undated note (using sentinel date): {path.name}")
 
-                affected_person_ids = self._sync_people_to_v2(path, all_people, note_date, is_granola)
+                affected_person_ids = self._sync_people_to_v2(
+                    path, prepared.all_people, note_date, prepared.is_granola
+                )
 
-                # Refresh stats for affected people (unless caller will batch refresh)
+                # Queue stats refresh for affected people (unless caller will batch refresh);
+                # watcher bursts are coalesced into one refresh by the shared refresher
                 if affected_person_ids and not skip_stats_refresh:
-                    from api.services.person_stats import refresh_person_stats
-                    refresh_person_stats(list(affected_person_ids))
+                    from api.services.person_stats import get_person_stats_refresher
+                    get_person_stats_refresher().mark_dirty(affected_person_ids)
 
             except Exception as e:
-                logger.warning(f"Failed to sync people to v2 for {file_path}: {e}")
+                logger.warning(f"Failed to sync people to v2 for {prepared.source_path}: {e}")
 
-        # Build metadata - use resolve() to get real path (handles symlinks like /var -> /private/var)
-        metadata = {
-            "file_path": str(path.resolve()),
-            "file_name": path.name,
-            "modified_date": self._extract_note_date(path, frontmatter, body),
-            "note_type": self._infer_note_type(path),
-            "people": all_people,
-            "tags": frontmatter.get("tags", []),
-            "granola_id": frontmatter.get("granola_id"),  # For context generation
-        }
+        return affected_person_ids
 
-        # Add contextual prefixes to chunks (P9.1 - improves retrieval by 35-50%)
-        chunks = add_context_to_chunks(chunks, path, metadata)
+    def _write_index(self, prepared_files: list["PreparedFile"], incremental: bool = True) -> None:
+        """
+        Write prepared files' chunks to the vector store and BM25 index.
 
-        # Update in vector store (handles deletion of old chunks)
-        self.vector_store.update_document(chunks, metadata)
-
-        # Update in BM25 index for keyword search
-        # First delete any existing chunks for this file
-        self.bm25_index.delete_document(str(path.resolve()))
-        # Add each chunk to BM25
-        for i, chunk in enumerate(chunks):
-            doc_id = f"{path.resolve()}_{i}"
-            self.bm25_index.add_document(
-                doc_id=doc_id,
-                content=chunk.get("content", ""),
-                file_name=path.name,
-                people=all_people if all_people else None
+        With incremental=True, each file's chunk hashes are compared to the
+        hashes stored in BM25 from the previous index, and only chunks that
+        were added or changed are upserted (and removed ones deleted). An
+        append to a daily note or transcript then costs O(edit), not O(file).
+        Files with no stored hashes are fully replaced.
+
+        All chunks to write are embedded in one call and sent with one
+        ChromaDB request and one BM25 transaction.
+
+        Args:
+            prepared_files: Files prepared by _prepare_file()
+            incremental: If False, fully replace every file's chunks
+                        (used by force reindex, e.g. after clearing vectors)
+        """
+        if not prepared_files:
+            return
+
+        previous_hashes = {}
+        if incremental:
+            previous_hashes = self.bm25_index.get_chunk_hashes(
+                [prepared.metadata["file_path"] for prepared in prepared_files]
             )
 
-        # Generate document summary for discovery queries (P9.4)
-        # Uses tiered summarization: SKIP for archives, HIGH for important content
-        if not skip_summaries:
-            try:
-                from api.services.summarizer import (
-                    generate_summary, get_summary_tier, SummaryTier, add_summary_failure
-                )
+        full_replace: list[PreparedFile] = []
+        changed_docs: list[tuple[list[dict], dict]] = []
+        bm25_upserts: list[dict] = []
+        removed_ids: list[str] = []
+
+        for prepared in prepared_files:
+            previous = previous_hashes.get(prepared.metadata["file_path"])
+            if not previous:
+                full_replace.append(prepared)
+                continue
+
+            changed = [
+                chunk for chunk in prepared.chunks
+                if previous.get(prepared.chunk_id(chunk)) != prepared.chunk_hash(chunk)
+            ]
+            current_ids = {prepared.chunk_id(chunk) for chunk in prepared.chunks}
+            removed_ids.extend(doc_id for doc_id in previous if doc_id not in current_ids)
+            if changed:
+                changed_docs.append((changed, prepared.metadata))
+                bm25_upserts.extend(prepared.bm25_chunks(changed))
+
+        # Vector store first: BM25 holds the hashes, so if this fails the
+        # chunks are still seen as changed on the next attempt
+        if full_replace:
+            self.vector_store.update_documents(
+                [(prepared.chunks, prepared.metadata) for prepared in full_replace]
+            )
+        if changed_docs:
+            self.vector_store.upsert_documents(changed_docs)
+        if removed_ids:
+            self.vector_store.delete_chunks(removed_ids)
+
+        # Same chunk IDs as the vector store for RRF fusion
+        if full_replace:
+            self.bm25_index.replace_files(
+                {prepared.metadata["file_path"]: prepared.bm25_chunks() for prepared in full_replace}
+            )
+        self.bm25_index.apply_chunk_changes(bm25_upserts, removed_ids)
 
-                tier = get_summary_tier(file_path)
+        if incremental and previous_hashes:
+            unchanged = sum(len(p.chunks) for p in prepared_files) - sum(len(c) for c, _ in changed_docs)
+            logger.debug(
+                f"Chunk diff: {len(full_replace)} files replaced, {len(bm25_upserts)} chunks upserted, "
+                f"{len(removed_ids)} deleted, {unchanged} unchanged"
+            )
 
-                if tier == SummaryTier.SKIP:
-                    logger.debug(f"Skipping summary for {file_path} (tier: SKIP)")
-                else:
-                    summary, success = generate_summary(body, path.name)
-                    if success and summary:
-                        summary_id = f"{path.resolve()}::summary"
-                        summary_content = f"Document summary for {path.name}: {summary}"
-
-                        # Add summary chunk to BM25 (for keyword search)
-                        self.bm25_index.add_document(
-                            doc_id=summary_id,
-                            content=summary_content,
-                            file_name=path.name,
-                            people=all_people if all_people else None
-                        )
-
-                        logger.debug(f"Generated summary for {file_path} (tier: {tier.value})")
-                    elif not success:
-                        # Track failure for retry at end of indexing
-                        add_summary_failure(file_path, path.name)
-            except Exception as e:
-                logger.warning(f"Summary generation failed for {file_path}: {e}")
+    def _index_summary(self, prepared: "PreparedFile") -> None:
+        """
+        Generate document summary for discovery queries (P9.4).
 
-        logger.debug(f"Indexed {file_path} with {len(chunks)} chunks")
+        Uses tiered summarization: SKIP for archives, HIGH for important content.
 
-        # Return affected person IDs for batch refresh (when called from index_all)
-        if skip_stats_refresh:
-            return affected_person_ids
-        return None
+        Args:
+            prepared: File prepared by _prepare_file()
+        """
+        file_path = prepared.source_path
+        path = prepared.path
+        try:
+            from api.services.summarizer import (
+                generate_summary, get_summary_tier, SummaryTier, add_summary_failure
+            )
+
+            tier = get_summary_tier(file_path)
+
+            if tier == SummaryTier.SKIP:
+                logger.debug(f"Skipping summary for {file_path} (tier: SKIP)")
+            else:
+                summary, success = generate_summary(prepared.body, path.name)
+                if success and summary:
+                    summary_id = make_summary_id(prepared.metadata["file_path"])
+                    summary_content = f"Document summary for {path.name}: {summary}"
+
+                    # Add summary chunk to BM25 (for keyword search)
+                    self.bm25_index.add_document(
+                        doc_id=summary_id,
+                        content=summary_content,
+                        file_name=path.name,
+                        people=prepared.all_people if prepared.all_people else None
+                    )
+
+                    logger.debug(f"Generated summary for {file_path} (tier: {tier.value})")
+                elif not success:
+                    # Track failure for retry at end of indexing
+                    add_summary_failure(file_path, path.name)
+        except Exception as e:
+            logger.warning(f"Summary generation failed for {file_path}: {e}")
 
     def delete_file(self, file_path: str) -> None:
         """
@@ -419,11 +661,8 @@ class IndexerService:
         # This works even for non-existent files
         real_path = os.path.realpath(file_path)
         self.vector_store.delete_document(real_path)
-        self.bm25_index.delete_document(real_path)
-
-        # Also delete summary chunk if exists
-        summary_id = f"{real_path}::summary"
-        self.bm25_index.delete_document(summary_id)
+        # Removes content chunks and the summary chunk
+        self.bm25_index.delete_file(real_path)
 
         logger.debug(f"Deleted {file_path} from index (resolved: {real_path})")
 
@@ -465,7 +704,7 @@ class IndexerService:
 
                 summary = retry_summary(body, file_name)
                 if summary:
-                    summary_id = f"{path.resolve()}::summary"
+                    summary_id = make_summary_id(str(path.resolve()))
                     summary_content = f"Document summary for {file_name}: {summary}"
 
                     # Add to BM25 index
@@ -485,92 +724,6 @@ class IndexerService:
 
         return success_count
 
-    def _extract_note_date(self, path: Path, frontmatter: dict, body: str = "") -> str:
-        """
-        Extract note date using priority cascade.
-
-        Priority:
-        1. Filename patterns (YYYY-MM-DD, YYYYMMDD)
-        2. Frontmatter fields: created, date, created_at, creation_date
-        3. Body text: "Created: ...", "Date: ..."
-        4. Return empty string (NO file timestamp fallback)
-
-        Args:
-            path: Path to the file
-            frontmatter: Parsed frontmatter dict
-            body: Note body content (for searching date patterns)
-
-        Returns:
-            ISO format date string or empty string if no date found
-        """
-        from api.utils.date_parser import parse_note_date
-
-        filename = path.stem  # filename without extension
-
-        # 1. Look for YYYY-MM-DD pattern in filename
-        match = re.search(r"(\d{4})-(\d{2})-(\d{2})", filename)
-        if match:
-            return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
-
-        # 2. Look for YYYYMMDD pattern in filename (e.g., "Meeting 20250925.md")
-        match = re.search(r"(\d{4})(\d{2})(\d{2})", filename)
-        if match:
-            year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
-            if 2000 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31:
-                return f"{year:04d}-{month:02d}-{day:02d}"
-
-        # 3. Frontmatter fields
-        for field in ['created', 'date', 'created_at', 'creation_date']:
-            if field in frontmatter:
-                value = frontmatter[field]
-                if isinstance(value, datetime):
-                    return value.strftime("%Y-%m-%d")
-                if isinstance(value, str):
-                    parsed = parse_note_date(value)
-                    if parsed:
-                        return parsed
-
-        # 4. Body text patterns (first 2000 chars)
-        body_sample = body[:2000] if body else ""
-        for pattern in [r"Created:\s*(.+?)(?:\n|$)", r"Date:\s*(.+?)(?:\n|$)"]:
-            match = re.search(pattern, body_sample, re.IGNORECASE)
-            if match:
-                parsed = parse_note_date(match.group(1).strip())
-                if parsed:
-                    return parsed
-
-        # 5. No reliable date found - return empty string
-        # The vector store will give these a neutral recency score
-        return ""
-
-    def _infer_note_type(self, path: Path) -> str:
-        """
-        Infer note type from folder path.
-
-        Args:
-            path: Path to the file
-
-        Returns:
-            Note type string
-        """
-        path_str = str(path).lower()
-        # Also check case-sensitive for ML
-        path_str_orig = str(path)
-
-        # ML folder = current job (high priority)
-        if "/ML/" in path_str_orig or "\\ML\\" in path_str_orig:
-            return "ML"
-        elif "granola" in path_str:
-            return "Granola"
-        elif "personal" in path_str:
-            return "Personal"
-        elif "work" in path_str:
-            return "Work"
-        elif "lifeos" in path_str:
-            return "LifeOS"
-        else:
-            return "Other"
-
     def _sync_people_to_v2(
         self,
         path: Path,
@@ -613,15 +766,29 @@ class IndexerService:
             f"Syncing {len(people)} people to v2 from {path.name}"
         )
 
-        for person_name in people:
+        # Resolve everyone in the note in one batch, with the context path for
+        # domain boosting (e.g., files in Work/ folders boost work domain matches)
+        try:
+            results = resolver.resolve_many(
+                [(person_name, None, None, file_path_str) for person_name in people],
+                create_if_missing=True,
+            )
+        except Exception as e:
+            # Fall back to one resolve per name so a single bad name only
+            # skips that person, not the whole note
+            logger.warning(f"Batch resolve failed for {path.name}, resolving individually: {e}")
+            results = None
+
+        for i, person_name in enumerate(people):
             try:
-                # Resolve person with context path for domain boosting
-                # e.g., file in Work/ folders will boost work domain (LIFEOS_WORK_DOMAIN) matches
-                result = resolver.resolve(
-                    name=person_name,
-                    context_path=file_path_str,
-                    create_if_missing=True,
-                )
+                if results is not None:
+                    result = results[i]
+                else:
+                    result = resolver.resolve(
+                        name=person_name,
+                        context_path=file_path_str,
+                        create_if_missing=True,
+                    )
 
                 if not result:
                     logger.debug(f"Could not resolve person: {person_name}")
@@ -704,28 +871,28 @@ class IndexerService:
 
         return affected_person_ids
 
+    def _on_vault_event(self, file_path: str, action: str) -> None:
+        """Index or delete a file after a (debounced) catalog watcher event."""
+        if action == "delete":
+            self.delete_file(file_path)
+        else:
+            self.index_file(file_path)
+
     def start_watching(self) -> None:
         """Start watching the vault for changes."""
         if self._watching:
             return
 
-        self._observer = Observer()
-        event_handler = VaultEventHandler(self)
-        self._observer.schedule(
-            event_handler,
-            str(self.vault_path),
-            recursive=True
-        )
-        self._observer.start()
+        self.catalog.subscribe(self._on_vault_event)
+        self.catalog.start_watching()
         self._watching = True
-        logger.info(f"Started watching {self.vault_path}")
+        logger.info(f"Indexer subscribed to changes in {self.vault_path}")
 
     def stop(self) -> None:
         """Stop watching and cleanup."""
-        if self._observer:
-            self._observer.stop()
-            self._observer.join(timeout=5)
-            self._observer = None
+        if self._watching:
+            self.catalog.unsubscribe(self._on_vault_event)
+            self.catalog.stop_watching()
         self._watching = False
         logger.info("Stopped watching")
 
@@ -3,6 +3,22 @@ Interaction Store for LifeOS People System v2.
 
 Stores lightweight interaction records with links to sources.
 Each interaction represents a single touchpoint (email, meeting, note mention).
+
+`timestamp` keeps the ISO string as recorded (with its original offset, which
+timeline views use for the local date). Range filters, ordering and
+aggregates use the indexed `ts_epoch` column instead: UTC epoch seconds,
+backfilled on startup and kept in sync by triggers for writers that insert
+rows with raw SQL.
+
+Per-person counts are served from `interaction_daily_rollup`, one row per
+(person_id, day, source_type, subtype, source_account) with a count. The
+subtype (gmail direction, calendar meeting size) is derived once at write
+time, and the rollup is maintained by triggers on every insert, update and
+delete of `interactions`.
+
+Message text from chat sources without a local archive of their own
+(WhatsApp) is searchable through `interactions_fts`, a trigger-maintained
+FTS5 index over `snippet` for those rows only (see api/utils/fts.py).
 """
 import sqlite3
 import json
@@ -18,6 +34,8 @@ from config.settings import settings
 from config.people_config import InteractionConfig
 
 from api.utils.datetime_utils import make_aware as _make_aware
+from api.utils.db_connections import get_connection
+from api.utils.fts import build_match_query, ensure_fts_index
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +43,77 @@ logger = logging.getLogger(__name__)
 # while being filterable in timeline views
 UNDATED_SENTINEL = datetime(1970, 1, 1, tzinfo=timezone.utc)
 
+# SQL expression converting an ISO timestamp column to UTC epoch seconds
+# (handles -05:00 / +00:00 / Z offsets; naive values are treated as UTC)
+EPOCH_SQL = "CAST(strftime('%s', {column}) AS INTEGER)"
+
+# Weighting subtype of an interaction row ('' when the source has none).
+# Gmail direction comes from the title prefix, calendar size from attendee_count.
+SUBTYPE_SQL = """CASE
+    WHEN {row}source_type = 'gmail' AND {row}title LIKE '→ %' THEN 'gmail_sent'
+    WHEN {row}source_type = 'gmail' AND {row}title LIKE '← %' THEN 'gmail_received'
+    WHEN {row}source_type = 'gmail' AND {row}title LIKE '↔ %' THEN 'gmail_cc'
+    WHEN {row}source_type = 'calendar' AND {row}attendee_count = 1 THEN 'calendar_1on1'
+    WHEN {row}source_type = 'calendar' AND {row}attendee_count BETWEEN 2 AND 5 THEN 'calendar_small_group'
+    WHEN {row}source_type = 'calendar' AND {row}attendee_count >= 6 THEN 'calendar_large_meeting'
+    ELSE ''
+END"""
+
+# Rollup key columns computed from an interactions row (NEW./OLD. in triggers)
+_ROLLUP_KEY_SQL = (
+    "{row}person_id, substr({row}timestamp, 1, 10), {row}source_type, "
+    + SUBTYPE_SQL + ", COALESCE({row}source_account, '')"
+)
+
+# Source types whose snippet is the message text, indexed by interactions_fts
+MESSAGE_SOURCE_TYPES = ("whatsapp",)
+_MESSAGE_FTS_WHERE = "{row}source_type IN (" + ", ".join(f"'{t}'" for t in MESSAGE_SOURCE_TYPES) + ")"
+
+# Person IDs per IN (...) query (stays under SQLite's bound-parameter limit)
+_QUERY_BATCH_SIZE = 500
+
+# Widest UTC offset in either direction, used to pad calendar-day windows
+_MAX_OFFSET = timedelta(hours=14)
+
+
+def to_epoch(dt: datetime) -> int:
+    """Convert a datetime to UTC epoch seconds (naive datetimes are treated as UTC)."""
+    return int(_make_aware(dt).timestamp())
+
+
+def from_epoch(ts: Optional[int]) -> Optional[datetime]:
+    """Convert UTC epoch seconds (e.g. MIN/MAX(ts_epoch)) to an aware datetime."""
+    if ts is None:
+        return None
+    return datetime.fromtimestamp(ts, tz=timezone.utc)
+
+
+def day_window_clause(start_day: str, end_day: str) -> tuple[str, list]:
+    """
+    Build a WHERE clause matching interactions recorded on calendar days
+    start_day..end_day (inclusive, YYYY-MM-DD).
+
+    Days are matched on the date as recorded in `timestamp` (its local
+    offset), but the ts_epoch range is padded by the widest UTC offset so
+    the filter is still served by the ts_epoch indexes.
+
+    Args:
+        start_day: First day (YYYY-MM-DD)
+        end_day: Last day (YYYY-MM-DD)
+
+    Returns:
+        Tuple of (SQL fragment, params)
+    """
+    start = datetime.strptime(start_day, "%Y-%m-%d").replace(tzinfo=timezone.utc)
+    end = datetime.strptime(end_day, "%Y-%m-%d").replace(tzinfo=timezone.utc) + timedelta(days=1)
+    clause = "ts_epoch >= ? AND ts_epoch < ? AND substr(timestamp, 1, 10) BETWEEN ? AND ?"
+    return clause, [to_epoch(start - _MAX_OFFSET), to_epoch(end + _MAX_OFFSET), start_day, end_day]
+
+
+def _rollup_cutoff_day(days_back: int) -> str:
+    """First recorded day (YYYY-MM-DD) included in a days_back rollup window."""
+    return (datetime.now(timezone.utc) - timedelta(days=days_back)).strftime("%Y-%m-%d")
+
 
 def get_interaction_db_path() -> str:
     """Get the path to the interactions database."""
@@ -196,7 +285,7 @@ class InteractionStore:
 
     def _init_db(self):
         """Create database tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute(
@@ -215,30 +304,6 @@ class InteractionStore:
             """
             )
 
-            # Index for efficient person + time queries
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_interactions_person_timestamp
-                ON interactions(person_id, timestamp DESC)
-            """
-            )
-
-            # Index for source deduplication
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_interactions_source
-                ON interactions(source_type, source_id)
-            """
-            )
-
-            # Index for time-based queries
-            conn.execute(
-                """
-                CREATE INDEX IF NOT EXISTS idx_interactions_timestamp
-                ON interactions(timestamp DESC)
-            """
-            )
-
             # Migration: Add source_account and attendee_count columns if missing
             cursor = conn.execute("PRAGMA table_info(interactions)")
             columns = {row[1] for row in cursor.fetchall()}
@@ -251,14 +316,182 @@ class InteractionStore:
                 conn.execute("ALTER TABLE interactions ADD COLUMN attendee_count INTEGER")
                 logger.info("Added attendee_count column to interactions table")
 
+            self._migrate_ts_epoch(conn, columns)
+            self._migrate_unique_source(conn)
+            self._migrate_daily_rollup(conn)
+            if ensure_fts_index(conn, "interactions_fts", "interactions", "snippet", where=_MESSAGE_FTS_WHERE):
+                logger.info("Built interactions_fts message index")
+
             conn.commit()
             logger.info(f"Initialized interaction database at {self.db_path}")
         finally:
             conn.close()
 
+    def _migrate_ts_epoch(self, conn: sqlite3.Connection, columns: set[str]) -> None:
+        """
+        Add the ts_epoch column, its sync triggers and the ts_epoch indexes.
+
+        Rows written by add() carry ts_epoch; the triggers fill it in for
+        sync scripts that INSERT/UPDATE rows with raw SQL.
+        """
+        if "ts_epoch" not in columns:
+            conn.execute("ALTER TABLE interactions ADD COLUMN ts_epoch INTEGER")
+            logger.info("Added ts_epoch column to interactions table")
+
+        # Backfill (no-op once every row has a value)
+        cursor = conn.execute(
+            f"UPDATE interactions SET ts_epoch = {EPOCH_SQL.format(column='timestamp')} "
+            "WHERE ts_epoch IS NULL"
+        )
+        if cursor.rowcount:
+            logger.info(f"Backfilled ts_epoch for {cursor.rowcount} interactions")
+
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_interactions_ts_epoch_insert
+            AFTER INSERT ON interactions
+            WHEN NEW.ts_epoch IS NULL
+            BEGIN
+                UPDATE interactions SET ts_epoch = {EPOCH_SQL.format(column='NEW.timestamp')}
+                WHERE rowid = NEW.rowid;
+            END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_interactions_ts_epoch_update
+            AFTER UPDATE OF timestamp ON interactions
+            BEGIN
+                UPDATE interactions SET ts_epoch = {EPOCH_SQL.format(column='NEW.timestamp')}
+                WHERE rowid = NEW.rowid;
+            END
+        """)
+
+        # Covering index for per-person range + aggregate queries (timelines,
+        # counts by source/account/meeting size)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_interactions_person_ts
+            ON interactions(person_id, ts_epoch, source_type, source_account, attendee_count)
+        """)
+        # Per-source range scans grouped by person (relationship discovery)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_interactions_source_ts
+            ON interactions(source_type, ts_epoch, person_id)
+        """)
+        # Global time-range queries (dashboard, timeline)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_interactions_ts
+            ON interactions(ts_epoch)
+        """)
+        # Superseded by the ts_epoch indexes above
+        conn.execute("DROP INDEX IF EXISTS idx_interactions_person_timestamp")
+        conn.execute("DROP INDEX IF EXISTS idx_interactions_timestamp")
+
+    def _migrate_unique_source(self, conn: sqlite3.Connection) -> None:
+        """
+        Enforce one interaction per (source_type, source_id, person_id).
+
+        person_id is part of the key because some sources legitimately link
+        one source item to several people (a photo, a vault note). Exact
+        duplicates left by older syncs are removed before the index is built.
+        Also serves source lookups (get_by_source).
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_interactions_source_unique'"
+        ).fetchone()
+        if exists:
+            return
+
+        cursor = conn.execute("""
+            DELETE FROM interactions
+            WHERE source_id IS NOT NULL
+              AND rowid NOT IN (
+                SELECT MIN(rowid) FROM interactions
+                WHERE source_id IS NOT NULL
+                GROUP BY source_type, source_id, person_id
+              )
+        """)
+        if cursor.rowcount:
+            logger.info(f"Removed {cursor.rowcount} duplicate interactions")
+
+        conn.execute("""
+            CREATE UNIQUE INDEX idx_interactions_source_unique
+            ON interactions(source_type, source_id, person_id)
+        """)
+        # Superseded by the unique index (same leading columns)
+        conn.execute("DROP INDEX IF EXISTS idx_interactions_source")
+
+    def _migrate_daily_rollup(self, conn: sqlite3.Connection) -> None:
+        """
+        Create the daily rollup table, its maintenance triggers and backfill it.
+
+        The triggers keep counts exact for plain INSERT/UPDATE/DELETE and for
+        UPSERTs. Rows removed by INSERT OR REPLACE only fire the delete trigger
+        with recursive_triggers on, so writers use ON CONFLICT instead.
+        """
+        exists = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'interaction_daily_rollup'"
+        ).fetchone()
+
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS interaction_daily_rollup (
+                person_id TEXT NOT NULL,
+                day TEXT NOT NULL,
+                source_type TEXT NOT NULL,
+                subtype TEXT NOT NULL DEFAULT '',
+                source_account TEXT NOT NULL DEFAULT '',
+                count INTEGER NOT NULL,
+                PRIMARY KEY (person_id, day, source_type, subtype, source_account)
+            ) WITHOUT ROWID
+        """)
+        # Range scans across all people (batch strength computation)
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_rollup_day
+            ON interaction_daily_rollup(day, person_id)
+        """)
+
+        increment = f"""
+            INSERT INTO interaction_daily_rollup
+            (person_id, day, source_type, subtype, source_account, count)
+            VALUES ({_ROLLUP_KEY_SQL.format(row='NEW.')}, 1)
+            ON CONFLICT(person_id, day, source_type, subtype, source_account)
+            DO UPDATE SET count = count + 1;
+        """
+        decrement = f"""
+            UPDATE interaction_daily_rollup SET count = count - 1
+            WHERE (person_id, day, source_type, subtype, source_account)
+                = ({_ROLLUP_KEY_SQL.format(row='OLD.')});
+            DELETE FROM interaction_daily_rollup WHERE count <= 0
+              AND (person_id, day, source_type, subtype, source_account)
+                = ({_ROLLUP_KEY_SQL.format(row='OLD.')});
+        """
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_interactions_rollup_insert
+            AFTER INSERT ON interactions
+            BEGIN {increment} END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_interactions_rollup_delete
+            AFTER DELETE ON interactions
+            BEGIN {decrement} END
+        """)
+        conn.execute(f"""
+            CREATE TRIGGER IF NOT EXISTS trg_interactions_rollup_update
+            AFTER UPDATE OF person_id, timestamp, source_type, title, source_account, attendee_count
+            ON interactions
+            BEGIN {decrement} {increment} END
+        """)
+
+        if not exists:
+            conn.execute(f"""
+                INSERT INTO interaction_daily_rollup
+                (person_id, day, source_type, subtype, source_account, count)
+                SELECT {_ROLLUP_KEY_SQL.format(row='')}, COUNT(*)
+                FROM interactions
+                GROUP BY 1, 2, 3, 4, 5
+            """)
+            logger.info("Built interaction_daily_rollup from existing interactions")
+
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+        return get_connection(self.db_path)
 
     def add(self, interaction: Interaction) -> Interaction:
         """
@@ -283,8 +516,8 @@ class InteractionStore:
             conn.execute(
                 """
                 INSERT INTO interactions
-                (id, person_id, timestamp, source_type, title, snippet, source_link, source_id, created_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                (id, person_id, timestamp, source_type, title, snippet, source_link, source_id, created_at, ts_epoch)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
             """,
                 (
                     interaction.id,
@@ -296,6 +529,7 @@ class InteractionStore:
                     interaction.source_link,
                     interaction.source_id,
                     interaction.created_at.isoformat(),
+                    to_epoch(interaction.timestamp),
                 ),
             )
             conn.commit()
@@ -305,6 +539,82 @@ class InteractionStore:
         finally:
             conn.close()
 
+    def add_many(
+        self, interactions: list[Interaction], on_conflict: str = "ignore"
+    ) -> tuple[int, set[str]]:
+        """
+        Insert many interactions in a single transaction.
+
+        Merge chains are resolved once per distinct person_id in the batch.
+        Rows that collide with an existing (source_type, source_id, person_id)
+        are skipped ("ignore") or have their content overwritten ("replace").
+
+        Args:
+            interactions: Interactions to insert (person_id is updated in place
+                to the canonical ID)
+            on_conflict: "ignore" or "replace"
+
+        Returns:
+            Tuple of (rows inserted or replaced, affected person IDs)
+        """
+        if on_conflict == "ignore":
+            conflict_sql = "DO NOTHING"
+        elif on_conflict == "replace":
+            conflict_sql = """DO UPDATE SET
+                timestamp = excluded.timestamp, title = excluded.title,
+                snippet = excluded.snippet, source_link = excluded.source_link,
+                source_account = excluded.source_account,
+                attendee_count = excluded.attendee_count, ts_epoch = excluded.ts_epoch"""
+        else:
+            raise ValueError(f"Unknown on_conflict mode: {on_conflict!r}")
+
+        if not interactions:
+            return 0, set()
+
+        # Follow merge chains once per person, not once per row
+        from api.services.person_entity import get_person_entity_store
+        person_store = get_person_entity_store()
+        canonical_ids = {
+            person_id: person_store.get_canonical_id(person_id)
+            for person_id in {i.person_id for i in interactions}
+        }
+
+        sql = f"""
+            INSERT INTO interactions
+            (id, person_id, timestamp, source_type, title, snippet, source_link, source_id,
+             created_at, source_account, attendee_count, ts_epoch)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(source_type, source_id, person_id) {conflict_sql}
+        """
+
+        inserted = 0
+        affected_person_ids: set[str] = set()
+        conn = self._get_connection()
+        try:
+            with conn:
+                for interaction in interactions:
+                    interaction.person_id = canonical_ids[interaction.person_id]
+                    cursor = conn.execute(sql, (
+                        interaction.id,
+                        interaction.person_id,
+                        interaction.timestamp.isoformat(),
+                        interaction.source_type,
+                        interaction.title,
+                        interaction.snippet,
+                        interaction.source_link,
+                        interaction.source_id,
+                        interaction.created_at.isoformat(),
+                        interaction.source_account,
+                        interaction.attendee_count,
+                        to_epoch(interaction.timestamp),
+                    ))
+                    if cursor.rowcount > 0:
+                        inserted += 1
+                        affected_person_ids.add(interaction.person_id)
+            return inserted, affected_person_ids
+        finally:
+            conn.close()
+
     def add_if_not_exists(
         self, interaction: Interaction
     ) -> tuple[Interaction, bool]:
@@ -395,73 +705,101 @@ class InteractionStore:
             # Build query based on filters
             if specific_date:
                 # Filter to a specific day
-                date_start = f"{specific_date}T00:00:00"
-                date_end = f"{specific_date}T23:59:59"
-
-                if source_types:
-                    # Use IN clause for multiple source types
-                    placeholders = ",".join("?" * len(source_types))
-                    cursor = conn.execute(
-                        f"""
-                        SELECT * FROM interactions
-                        WHERE person_id = ? AND timestamp >= ? AND timestamp <= ?
-                            AND source_type IN ({placeholders})
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                        """,
-                        (person_id, date_start, date_end, *source_types, limit),
-                    )
-                else:
-                    cursor = conn.execute(
-                        """
-                        SELECT * FROM interactions
-                        WHERE person_id = ? AND timestamp >= ? AND timestamp <= ?
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                        """,
-                        (person_id, date_start, date_end, limit),
-                    )
+                where, params = day_window_clause(specific_date, specific_date)
             else:
                 # Use days_back cutoff
                 if days_back is None:
                     days_back = InteractionConfig.DEFAULT_WINDOW_DAYS
                 now = datetime.now(timezone.utc)
                 cutoff = now - timedelta(days=days_back)
+                where, params = "ts_epoch > ? AND ts_epoch <= ?", [to_epoch(cutoff), to_epoch(now)]
+
+            query = f"SELECT * FROM interactions WHERE person_id = ? AND {where}"
+            params = [person_id, *params]
+            if source_types:
+                # Use IN clause for multiple source types
+                placeholders = ",".join("?" * len(source_types))
+                query += f" AND source_type IN ({placeholders})"
+                params.extend(source_types)
+            query += " ORDER BY ts_epoch DESC LIMIT ?"
+            params.append(limit)
 
-                if source_types:
-                    # Use IN clause for multiple source types
-                    placeholders = ",".join("?" * len(source_types))
-                    cursor = conn.execute(
-                        f"""
-                        SELECT * FROM interactions
-                        WHERE person_id = ? AND timestamp > ? AND timestamp <= ?
-                            AND source_type IN ({placeholders})
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                        """,
-                        (person_id, cutoff.isoformat(), now.isoformat(), *source_types, limit),
-                    )
-                else:
-                    cursor = conn.execute(
-                        """
-                        SELECT * FROM interactions
-                        WHERE person_id = ? AND timestamp > ? AND timestamp <= ?
-                        ORDER BY timestamp DESC
-                        LIMIT ?
-                        """,
-                        (person_id, cutoff.isoformat(), now.isoformat(), limit),
-                    )
-
+            cursor = conn.execute(query, params)
             return [Interaction.from_row(row) for row in cursor.fetchall()]
         finally:
             conn.close()
 
+    def query_messages(
+        self,
+        person_id: Optional[str] = None,
+        search_term: Optional[str] = None,
+        start_day: Optional[str] = None,
+        end_day: Optional[str] = None,
+        limit: int = 100,
+        ranked: bool = False,
+    ) -> list[Interaction]:
+        """
+        Query chat message interactions (MESSAGE_SOURCE_TYPES), optionally by text.
+
+        Text search goes through interactions_fts: words are ANDed, "quoted
+        words" match as a phrase and word* as a prefix.
+
+        Args:
+            person_id: Filter by PersonEntity ID
+            search_term: Text to search for in the message
+            start_day: First recorded day to include (YYYY-MM-DD)
+            end_day: Last recorded day to include (YYYY-MM-DD)
+            limit: Maximum messages to return
+            ranked: Order text matches by relevance instead of most recent first
+
+        Returns:
+            List of message interactions
+        """
+        match = build_match_query(search_term) if search_term else None
+        if search_term and match is None:
+            return []
+
+        if match:
+            query = """
+                SELECT i.* FROM interactions_fts
+                JOIN interactions i ON i.rowid = interactions_fts.rowid
+                WHERE interactions_fts MATCH ?
+            """
+            params: list = [match]
+        else:
+            placeholders = ",".join("?" * len(MESSAGE_SOURCE_TYPES))
+            query = f"SELECT i.* FROM interactions i WHERE i.source_type IN ({placeholders})"
+            params = list(MESSAGE_SOURCE_TYPES)
+
+        if person_id:
+            query += " AND i.person_id = ?"
+            params.append(person_id)
+        if start_day or end_day:
+            where, window_params = day_window_clause(start_day or "1970-01-01", end_day or "2999-12-31")
+            query += f" AND {where}"
+            params.extend(window_params)
+
+        if match and ranked:
+            query += " ORDER BY bm25(interactions_fts), i.ts_epoch DESC"
+        else:
+            query += " ORDER BY i.ts_epoch DESC"
+        query += " LIMIT ?"
+        params.append(limit)
+
+        conn = self._get_connection()
+        try:
+            return [Interaction.from_row(row) for row in conn.execute(query, params)]
+        finally:
+            conn.close()
+
     def get_interaction_counts(
         self, person_id: str, days_back: int = None
     ) -> dict[str, int]:
         """
         Get count of interactions by source type for a person.
 
+        Reads the daily rollup, so the window covers whole recorded days.
+
         Args:
             person_id: PersonEntity ID
             days_back: Only count interactions from last N days
@@ -472,18 +810,16 @@ class InteractionStore:
         if days_back is None:
             days_back = InteractionConfig.DEFAULT_WINDOW_DAYS
 
-        cutoff = datetime.now() - timedelta(days=days_back)
-
         conn = self._get_connection()
         try:
             cursor = conn.execute(
                 """
-                SELECT source_type, COUNT(*) as count
-                FROM interactions
-                WHERE person_id = ? AND timestamp > ?
+                SELECT source_type, SUM(count)
+                FROM interaction_daily_rollup
+                WHERE person_id = ? AND day >= ?
                 GROUP BY source_type
             """,
-                (person_id, cutoff.isoformat()),
+                (person_id, _rollup_cutoff_day(days_back)),
             )
 
             return {row[0]: row[1] for row in cursor.fetchall()}
@@ -496,8 +832,9 @@ class InteractionStore:
         """
         Get interaction counts with subtype detail for weight calculation.
 
-        For gmail: parses direction from title prefix (→/←/↔)
-        For calendar: derives size from attendee_count
+        For gmail: direction from title prefix (→/←/↔)
+        For calendar: size from attendee_count
+        Subtypes are derived at write time and read from the daily rollup.
 
         Args:
             person_id: PersonEntity ID
@@ -506,47 +843,190 @@ class InteractionStore:
         Returns:
             List of dicts with keys: source_type, subtype, source_account, count
         """
+        return self.get_all_interaction_counts_with_subtypes(
+            days_back, person_ids=[person_id]
+        ).get(person_id, [])
+
+    def get_all_interaction_counts_with_subtypes(
+        self, days_back: int = None, person_ids: Optional[list[str]] = None
+    ) -> dict[str, list[dict]]:
+        """
+        Get subtype interaction counts for many people in grouped queries.
+
+        Args:
+            days_back: Only count interactions from last N days
+            person_ids: People to include (default: everyone with interactions)
+
+        Returns:
+            Dict mapping person_id to a list of dicts with keys:
+            source_type, subtype, source_account, count
+        """
         if days_back is None:
             days_back = InteractionConfig.DEFAULT_WINDOW_DAYS
 
-        cutoff = datetime.now() - timedelta(days=days_back)
+        query = """
+            SELECT person_id, source_type, subtype, source_account, SUM(count)
+            FROM interaction_daily_rollup
+            WHERE day >= ?{person_filter}
+            GROUP BY person_id, source_type, subtype, source_account
+        """
+        results: dict[str, list[dict]] = {}
+        conn = self._get_connection()
+        try:
+            for sql, params in self._person_batches(query, person_ids):
+                cursor = conn.execute(sql, [_rollup_cutoff_day(days_back), *params])
+                for person_id, source_type, subtype, source_account, count in cursor:
+                    results.setdefault(person_id, []).append({
+                        "source_type": source_type,
+                        "source_account": source_account or None,
+                        "subtype": subtype or None,
+                        "count": count,
+                    })
+            return results
+        finally:
+            conn.close()
+
+    def get_source_counts_for_people(
+        self, person_ids: Optional[list[str]] = None, days_back: Optional[int] = None
+    ) -> dict[str, dict[str, int]]:
+        """
+        Get interaction counts by source type for many people.
 
+        Args:
+            person_ids: People to include (default: everyone with interactions)
+            days_back: Only count interactions from last N days (default: all time)
+
+        Returns:
+            Dict mapping person_id to {source_type: count}
+        """
+        cutoff_day = _rollup_cutoff_day(days_back) if days_back is not None else ""
+        query = """
+            SELECT person_id, source_type, SUM(count)
+            FROM interaction_daily_rollup
+            WHERE day >= ?{person_filter}
+            GROUP BY person_id, source_type
+        """
+        results: dict[str, dict[str, int]] = {}
         conn = self._get_connection()
         try:
-            cursor = conn.execute(
-                """
-                SELECT
-                    source_type,
-                    source_account,
-                    CASE
-                        WHEN source_type = 'gmail' AND title LIKE '→ %' THEN 'gmail_sent'
-                        WHEN source_type = 'gmail' AND title LIKE '← %' THEN 'gmail_received'
-                        WHEN source_type = 'gmail' AND title LIKE '↔ %' THEN 'gmail_cc'
-                        WHEN source_type = 'calendar' AND attendee_count = 1 THEN 'calendar_1on1'
-                        WHEN source_type = 'calendar' AND attendee_count BETWEEN 2 AND 5 THEN 'calendar_small_group'
-                        WHEN source_type = 'calendar' AND attendee_count >= 6 THEN 'calendar_large_meeting'
-                        ELSE NULL
-                    END as subtype,
-                    COUNT(*) as count
-                FROM interactions
-                WHERE person_id = ? AND timestamp > ?
-                GROUP BY source_type, subtype, source_account
-            """,
-                (person_id, cutoff.isoformat()),
-            )
+            for sql, params in self._person_batches(query, person_ids):
+                for person_id, source_type, count in conn.execute(sql, [cutoff_day, *params]):
+                    results.setdefault(person_id, {})[source_type] = count
+            return results
+        finally:
+            conn.close()
 
-            results = []
+    def get_daily_counts(
+        self,
+        person_id: str,
+        days_back: int = None,
+        source_types: Optional[list[str]] = None,
+    ) -> dict[str, dict[str, int]]:
+        """
+        Get interaction counts per recorded day and source type for a person.
+
+        Args:
+            person_id: PersonEntity ID
+            days_back: Only include the last N days (up to today)
+            source_types: Only include these source types
+
+        Returns:
+            Dict mapping day (YYYY-MM-DD) to {source_type: count}
+        """
+        if days_back is None:
+            days_back = InteractionConfig.DEFAULT_WINDOW_DAYS
+
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        query = """
+            SELECT day, source_type, SUM(count)
+            FROM interaction_daily_rollup
+            WHERE person_id = ? AND day BETWEEN ? AND ?
+        """
+        params = [person_id, _rollup_cutoff_day(days_back), today]
+        if source_types:
+            query += f" AND source_type IN ({','.join('?' * len(source_types))})"
+            params.extend(source_types)
+        query += " GROUP BY day, source_type"
+
+        results: dict[str, dict[str, int]] = {}
+        conn = self._get_connection()
+        try:
+            for day, source_type, count in conn.execute(query, params):
+                results.setdefault(day, {})[source_type] = count
+            return results
+        finally:
+            conn.close()
+
+    def get_latest_per_day(
+        self,
+        person_id: str,
+        days_back: int = None,
+        source_types: Optional[list[str]] = None,
+        per_group: int = 1,
+    ) -> dict[tuple[str, str], list[Interaction]]:
+        """
+        Get the most recent interactions of each (day, source_type) group.
+
+        Uses the same recorded-day window as get_daily_counts().
+
+        Args:
+            person_id: PersonEntity ID
+            days_back: Only include the last N days (up to today)
+            source_types: Only include these source types
+            per_group: Interactions to return per group
+
+        Returns:
+            Dict mapping (day, source_type) to interactions, most recent first
+        """
+        if days_back is None:
+            days_back = InteractionConfig.DEFAULT_WINDOW_DAYS
+
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        where, params = day_window_clause(_rollup_cutoff_day(days_back), today)
+        query = f"SELECT * FROM interactions WHERE person_id = ? AND {where}"
+        params = [person_id, *params]
+        if source_types:
+            query += f" AND source_type IN ({','.join('?' * len(source_types))})"
+            params.extend(source_types)
+
+        conn = self._get_connection()
+        try:
+            cursor = conn.execute(f"""
+                SELECT * FROM (
+                    SELECT *, ROW_NUMBER() OVER (
+                        PARTITION BY substr(timestamp, 1, 10), source_type
+                        ORDER BY ts_epoch DESC
+                    ) AS group_rank
+                    FROM ({query})
+                )
+                WHERE group_rank <= ?
+                ORDER BY ts_epoch DESC
+            """, [*params, per_group])
+
+            results: dict[tuple[str, str], list[Interaction]] = {}
             for row in cursor.fetchall():
-                results.append({
-                    "source_type": row[0],
-                    "source_account": row[1],
-                    "subtype": row[2],
-                    "count": row[3],
-                })
+                interaction = Interaction.from_row(row[:-1])
+                day = row[2][:10]
+                results.setdefault((day, interaction.source_type), []).append(interaction)
             return results
         finally:
             conn.close()
 
+    @staticmethod
+    def _person_batches(query: str, person_ids: Optional[list[str]]):
+        """
+        Yield (sql, params) for a query with a {person_filter} placeholder,
+        one per batch of person IDs (a single unfiltered query if None).
+        """
+        if person_ids is None:
+            yield query.format(person_filter=""), []
+            return
+        person_ids = list(dict.fromkeys(person_ids))
+        for i in range(0, len(person_ids), _QUERY_BATCH_SIZE):
+            batch = person_ids[i:i + _QUERY_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            yield query.format(person_filter=f" AND person_id IN ({placeholders})"), batch
+
     def get_for_people_batch(
         self,
         person_ids: set[str],
@@ -578,16 +1058,16 @@ class InteractionStore:
         conn = self._get_connection()
         try:
             # Fetch all interactions for the given people in one query
-            # Order by person_id, timestamp DESC so we can process in order
+            # Order by person_id, ts_epoch DESC so we can process in order
             cursor = conn.execute(
                 f"""
                 SELECT * FROM interactions
                 WHERE person_id IN ({placeholders})
-                  AND timestamp >= ?
-                  AND timestamp <= ?
-                ORDER BY person_id, timestamp DESC
+                  AND ts_epoch >= ?
+                  AND ts_epoch <= ?
+                ORDER BY person_id, ts_epoch DESC
             """,
-                person_ids_list + [cutoff.isoformat(), now.isoformat()],
+                person_ids_list + [to_epoch(cutoff), to_epoch(now)],
             )
 
             # Build result dict, respecting per-person limit
@@ -606,12 +1086,12 @@ class InteractionStore:
         """Get the most recent interaction with a person (excludes future dates)."""
         conn = self._get_connection()
         try:
-            now = datetime.now(timezone.utc).isoformat()
+            now = to_epoch(datetime.now(timezone.utc))
             cursor = conn.execute(
                 """
                 SELECT * FROM interactions
-                WHERE person_id = ? AND timestamp <= ?
-                ORDER BY timestamp DESC
+                WHERE person_id = ? AND ts_epoch <= ?
+                ORDER BY ts_epoch DESC
                 LIMIT 1
             """,
                 (person_id, now),
@@ -641,12 +1121,13 @@ class InteractionStore:
         """
         conn = self._get_connection()
         try:
-            now = datetime.now(timezone.utc).isoformat()
+            now = to_epoch(datetime.now(timezone.utc))
+            # Bare `timestamp` column takes its value from the MAX(ts_epoch) row
             cursor = conn.execute(
                 """
-                SELECT source_type, MAX(timestamp) as last_ts
+                SELECT source_type, timestamp, MAX(ts_epoch)
                 FROM interactions
-                WHERE person_id = ? AND timestamp <= ?
+                WHERE person_id = ? AND ts_epoch <= ?
                 GROUP BY source_type
                 """,
                 (person_id, now),
@@ -675,9 +1156,10 @@ class InteractionStore:
         """
         conn = self._get_connection()
         try:
+            # Bare `timestamp` column takes its value from the MIN(ts_epoch) row
             cursor = conn.execute(
                 """
-                SELECT person_id, MIN(timestamp) as first_timestamp, COUNT(*) as cnt
+                SELECT person_id, timestamp, MIN(ts_epoch), COUNT(*) as cnt
                 FROM interactions
                 GROUP BY person_id
                 HAVING cnt >= ?
@@ -737,8 +1219,9 @@ class InteractionStore:
             # Calculate time window boundaries
             from datetime import timedelta
             time_delta = timedelta(hours=time_window_hours)
-            window_start = (target.timestamp - time_delta).isoformat()
-            window_end = (target.timestamp + time_delta).isoformat()
+            target_epoch = to_epoch(target.timestamp)
+            window_start = to_epoch(target.timestamp - time_delta)
+            window_end = to_epoch(target.timestamp + time_delta)
 
             # Get messages before the target
             cursor = conn.execute(
@@ -746,15 +1229,15 @@ class InteractionStore:
                 SELECT * FROM interactions
                 WHERE person_id = ?
                   AND source_type = ?
-                  AND timestamp < ?
-                  AND timestamp >= ?
-                ORDER BY timestamp DESC
+                  AND ts_epoch < ?
+                  AND ts_epoch >= ?
+                ORDER BY ts_epoch DESC
                 LIMIT ?
             """,
                 (
                     target.person_id,
                     target.source_type,
-                    target.timestamp.isoformat(),
+                    target_epoch,
                     window_start,
                     window,
                 ),
@@ -768,15 +1251,15 @@ class InteractionStore:
                 SELECT * FROM interactions
                 WHERE person_id = ?
                   AND source_type = ?
-                  AND timestamp > ?
-                  AND timestamp <= ?
-                ORDER BY timestamp ASC
+                  AND ts_epoch > ?
+                  AND ts_epoch <= ?
+                ORDER BY ts_epoch ASC
                 LIMIT ?
             """,
                 (
                     target.person_id,
                     target.source_type,
-                    target.timestamp.isoformat(),
+                    target_epoch,
                     window_end,
                     window,
                 ),
@@ -980,8 +1463,9 @@ class InteractionStore:
             # Date range
             date_range = conn.execute(
                 """
-                SELECT MIN(timestamp), MAX(timestamp)
-                FROM interactions
+                SELECT
+                    (SELECT timestamp FROM interactions ORDER BY ts_epoch ASC LIMIT 1),
+                    (SELECT timestamp FROM interactions ORDER BY ts_epoch DESC LIMIT 1)
             """
             ).fetchone()
 
@@ -1023,37 +1507,20 @@ class InteractionStore:
         """
         conn = self._get_connection()
         try:
-            # Handle specific date filter (overrides start/end range)
-            # Note: Timestamps in DB are ISO format (e.g., 2023-02-24T16:00:00-05:00)
-            # Use simple date comparison which works with ISO strings
+            # Specific date overrides start/end range. Days are matched on the
+            # recorded local date, with the ts_epoch index doing the range scan
             if specific_date:
-                # For single date: timestamp >= 'YYYY-MM-DD' AND timestamp < next day
-                start_str = specific_date
-                # Calculate next day for exclusive upper bound
-                from datetime import datetime as dt, timedelta
-                next_day = (dt.strptime(specific_date, '%Y-%m-%d') + timedelta(days=1)).strftime('%Y-%m-%d')
-                end_str = next_day
-                use_less_than = True
-            else:
-                # Format dates for SQLite
-                start_str = start_date.strftime('%Y-%m-%d')
-                end_str = end_date.strftime('%Y-%m-%d 23:59:59')
-                use_less_than = False
-
-            # Build query - use < for specific date (exclusive upper bound), <= otherwise
-            if use_less_than:
-                query = """
-                    SELECT id, person_id, timestamp, source_type, title, snippet, source_link, source_id
-                    FROM interactions
-                    WHERE timestamp >= ? AND timestamp < ?
-                """
+                where, params = day_window_clause(specific_date, specific_date)
             else:
-                query = """
-                    SELECT id, person_id, timestamp, source_type, title, snippet, source_link, source_id
-                    FROM interactions
-                    WHERE timestamp >= ? AND timestamp <= ?
-                """
-            params = [start_str, end_str]
+                where, params = day_window_clause(
+                    start_date.strftime('%Y-%m-%d'), end_date.strftime('%Y-%m-%d')
+                )
+
+            query = f"""
+                SELECT id, person_id, timestamp, source_type, title, snippet, source_link, source_id
+                FROM interactions
+                WHERE {where}
+            """
 
             # Exclude specific person IDs if provided
             if exclude_person_ids:
@@ -1069,7 +1536,7 @@ class InteractionStore:
                     query += f" AND source_type IN ({placeholders})"
                     params.extend(source_types)
 
-            query += " ORDER BY timestamp DESC"
+            query += " ORDER BY ts_epoch DESC"
 
             # Apply limit if specified
             if limit:
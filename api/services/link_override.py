@@ -13,6 +13,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Optional
 
+from api.utils.db_connections import get_connection
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,7 +69,7 @@ class LinkOverrideStore:
 
     def _ensure_table(self):
         """Ensure the link_overrides table exists."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         conn.execute("""
             CREATE TABLE IF NOT EXISTS link_overrides (
                 id TEXT PRIMARY KEY,
@@ -94,7 +96,7 @@ class LinkOverrideStore:
         if not override.created_at:
             override.created_at = datetime.now(timezone.utc)
 
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         conn.execute("""
             INSERT INTO link_overrides
             (id, name_pattern, source_type, context_pattern, preferred_person_id, rejected_person_id, reason, created_at)
@@ -117,7 +119,7 @@ class LinkOverrideStore:
 
     def get_all(self) -> list[LinkOverride]:
         """Get all link override rules."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         conn.row_factory = sqlite3.Row
 
         cursor = conn.execute("""
@@ -148,7 +150,8 @@ class LinkOverrideStore:
         self,
         name: str,
         source_type: str = None,
-        context_path: str = None
+        context_path: str = None,
+        overrides: Optional[list[LinkOverride]] = None,
     ) -> Optional[LinkOverride]:
         """
         Find the most specific override matching the given parameters.
@@ -159,10 +162,15 @@ class LinkOverrideStore:
         3. name + context_pattern
         4. name only
 
+        Args:
+            overrides: Rules from an earlier get_all() call, so batch
+                callers read the table once (default: read it now)
+
         Returns:
             Most specific matching override, or None
         """
-        overrides = self.get_all()
+        if overrides is None:
+            overrides = self.get_all()
 
         # Score each override by specificity
         matches = []
@@ -184,7 +192,7 @@ class LinkOverrideStore:
 
     def delete(self, override_id: str) -> bool:
         """Delete a link override rule."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         cursor = conn.execute("""
             DELETE FROM link_overrides WHERE id = ?
         """, (override_id,))
@@ -195,7 +203,7 @@ class LinkOverrideStore:
 
     def get_for_person(self, person_id: str) -> list[LinkOverride]:
         """Get all overrides that affect a specific person."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         conn.row_factory = sqlite3.Row
 
         cursor = conn.execute("""
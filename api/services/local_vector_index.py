@@ -0,0 +1,708 @@
+"""
+Embedded vector index for LifeOS.
+
+In-process alternative to the ChromaDB HTTP server, selected with
+LIFEOS_VECTOR_BACKEND=local. Removes the ChromaDB process (and its
+watchdog) and the HTTP hop from every search and index write.
+
+## Key Design Decisions
+
+- **Chroma-compatible surface**: LocalVectorClient / LocalVectorCollection
+  implement the subset of the chromadb client and collection API that
+  LifeOS uses (add/upsert/get/query/delete/count with `where` filters), so
+  VectorStore, SlackIndexer etc. work unchanged on either backend
+- **Memory-mapped float16 matrix**: one L2-normalized row per chunk in
+  vectors.f16, so cosine similarity is a dot product and the OS page cache
+  keeps the matrix hot without loading it on startup
+- **SQLite sidecar**: ids, documents and metadata live in meta.db;
+  `where` filters are translated to SQL over json_extract()
+- **Exact scan, IVF when large**: small collections are scanned exactly
+  (one matmul). Above settings.local_vector_ivf_min_rows an IVF index
+  (spherical k-means coarse quantizer) is built lazily in memory and
+  queries probe settings.local_vector_ivf_nprobe lists. Rows written
+  (upserted or reused) after the build are scanned exactly until the
+  index is rebuilt
+- **Multi-process safe reads**: writers flush vectors before committing
+  metadata; other processes notice the commit via PRAGMA data_version and
+  reload their row map
+- **Multi-process safe writes**: writers hold an flock on write.lock from
+  refresh through row allocation, vector write and metadata commit, so a
+  sync script and the API server never hand out the same free row
+
+## Usage
+
+    from api.services.local_vector_index import get_local_vector_client
+    collection = get_local_vector_client().get_or_create_collection("lifeos_vault")
+    collection.upsert(ids=[...], embeddings=[...], documents=[...], metadatas=[...])
+    results = collection.query(query_embeddings=[q], n_results=10)
+"""
+import fcntl
+import json
+import logging
+import re
+import shutil
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILE = "vectors.f16"
+METADATA_DB = "meta.db"
+WRITE_LOCK_FILE = "write.lock"
+
+# Rows scored per matmul block during exact scans
+_SCAN_BLOCK_ROWS = 65_536
+
+# Rebuild the IVF index once this fraction of rows was written after the build
+_IVF_REBUILD_FRACTION = 0.1
+
+# k-means settings for the IVF coarse quantizer
+_IVF_TRAIN_SAMPLE = 50_000
+_IVF_TRAIN_ITERATIONS = 10
+
+# SQLite limits the number of bound parameters per statement
+_MAX_PARAMS = 500
+
+_COMPARISON_OPS = {"$eq": "=", "$ne": "!=", "$gt": ">", "$gte": ">=", "$lt": "<", "$lte": "<="}
+_METADATA_KEY = re.compile(r"^[A-Za-z0-9_.-]+$")
+
+_DEFAULT_GET_INCLUDE = ("metadatas", "documents")
+_DEFAULT_QUERY_INCLUDE = ("metadatas", "documents", "distances")
+
+
+def get_local_vector_path() -> Path:
+    """Get the directory holding local vector collections."""
+    path = Path(settings.local_vector_path)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def _normalize_rows(embeddings) -> np.ndarray:
+    """Convert embeddings to a float32 matrix with unit-length rows."""
+    matrix = np.asarray(embeddings, dtype=np.float32)
+    if matrix.ndim == 1:
+        matrix = matrix.reshape(1, -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+def where_to_sql(where: dict) -> tuple[str, list]:
+    """
+    Translate a Chroma-style `where` filter to a SQL condition.
+
+    Supports equality shorthand ({"key": value}), the comparison operators
+    $eq/$ne/$gt/$gte/$lt/$lte, $in/$nin, and $and/$or combinations.
+
+    Args:
+        where: Filter dict
+
+    Returns:
+        Tuple of (SQL condition over the metadata column, bound parameters)
+
+    Raises:
+        ValueError: If the filter uses an unsupported operator or key
+    """
+    clauses = []
+    params: list = []
+
+    for key, condition in where.items():
+        if key in ("$and", "$or"):
+            parts = [where_to_sql(sub) for sub in condition]
+            joiner = " AND " if key == "$and" else " OR "
+            clauses.append("(" + joiner.join(sql for sql, _ in parts) + ")")
+            for _, sub_params in parts:
+                params.extend(sub_params)
+            continue
+
+        if not _METADATA_KEY.match(key):
+            raise ValueError(f"Unsupported metadata key: {key!r}")
+        column = f"json_extract(metadata, '$.\"{key}\"')"
+
+        if not isinstance(condition, dict):
+            condition = {"$eq": condition}
+
+        for op, value in condition.items():
+            if op in _COMPARISON_OPS:
+                clauses.append(f"{column} {_COMPARISON_OPS[op]} ?")
+                params.append(value)
+            elif op in ("$in", "$nin"):
+                values = list(value)
+                if not values:
+                    clauses.append("0" if op == "$in" else "1")
+                    continue
+                negate = "NOT " if op == "$nin" else ""
+                clauses.append(f"{column} {negate}IN ({','.join('?' * len(values))})")
+                params.extend(values)
+            else:
+                raise ValueError(f"Unsupported where operator: {op}")
+
+    return " AND ".join(clauses) or "1", params
+
+
+class LocalVectorCollection:
+    """
+    A named collection of vectors, documents and metadata on local disk.
+
+    Thread-safe: all access goes through one lock, and a single SQLite
+    connection is shared behind it (as in EmbeddingCache). Use
+    LocalVectorClient to open collections so each directory is only opened
+    once per process.
+    """
+
+    def __init__(self, name: str, path: Path):
+        """
+        Open (or create) a collection directory.
+
+        Args:
+            name: Collection name
+            path: Directory holding vectors.f16 and meta.db
+        """
+        self.name = name
+        self.path = Path(path)
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._vectors_path = self.path / VECTORS_FILE
+        self._write_lock_path = self.path / WRITE_LOCK_FILE
+        self._lock = threading.RLock()
+
+        self._conn = sqlite3.connect(
+            str(self.path / METADATA_DB), timeout=30.0, check_same_thread=False
+        )
+        self._init_db()
+
+        self._dim: Optional[int] = None
+        self._capacity = 0
+        self._vectors: Optional[np.memmap] = None
+        self._row_ids: list[Optional[str]] = []
+        self._rows_by_id: dict[str, int] = {}
+        self._live = np.zeros(0, dtype=bool)
+        self._data_version = None
+        self._ivf: Optional[dict] = None
+        self._load()
+
+    def _init_db(self):
+        """Create metadata tables if they don't exist."""
+        with self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS chunks (
+                    row INTEGER PRIMARY KEY,
+                    id TEXT NOT NULL UNIQUE,
+                    document TEXT,
+                    metadata TEXT NOT NULL DEFAULT '{}'
+                )
+            """)
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS info (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL
+                )
+            """)
+
+    # ------------------------------------------------------------------
+    # In-memory state
+    # ------------------------------------------------------------------
+
+    def _load(self):
+        """(Re)load dimension, row map and vector mapping from disk."""
+        row = self._conn.execute("SELECT value FROM info WHERE key = 'dim'").fetchone()
+        self._dim = int(row[0]) if row else None
+
+        self._vectors = None
+        self._capacity = 0
+        if self._dim and self._vectors_path.exists():
+            self._capacity = self._vectors_path.stat().st_size // (self._dim * 2)
+            if self._capacity:
+                self._vectors = np.memmap(
+                    self._vectors_path, dtype=np.float16, mode="r+",
+                    shape=(self._capacity, self._dim)
+                )
+
+        self._row_ids = [None] * self._capacity
+        self._rows_by_id = {}
+        self._live = np.zeros(self._capacity, dtype=bool)
+        for row_num, doc_id in self._conn.execute("SELECT row, id FROM chunks"):
+            if row_num < self._capacity:
+                self._row_ids[row_num] = doc_id
+                self._rows_by_id[doc_id] = row_num
+                self._live[row_num] = True
+
+        self._data_version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        # Another process may have rewritten any row; retrain on next use
+        self._ivf = None
+
+    def _refresh(self):
+        """Reload state if another process committed changes (lock held)."""
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        if version != self._data_version:
+            logger.debug(f"Collection {self.name} changed on disk, reloading")
+            self._load()
+
+    @contextmanager
+    def _write_locked(self):
+        """Hold the in-process lock and the collection's cross-process write lock."""
+        with self._lock:
+            with open(self._write_lock_path, "a") as lock_file:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+                try:
+                    yield
+                finally:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _ensure_capacity(self, needed: int):
+        """Grow the vector file to hold at least `needed` rows (lock held)."""
+        if needed <= self._capacity:
+            return
+        new_capacity = max(needed, self._capacity * 2, 1024)
+        if self._vectors is not None:
+            self._vectors.flush()
+            self._vectors = None
+        with open(self._vectors_path, "ab") as f:
+            f.truncate(new_capacity * self._dim * 2)
+        self._vectors = np.memmap(
+            self._vectors_path, dtype=np.float16, mode="r+", shape=(new_capacity, self._dim)
+        )
+        self._row_ids.extend([None] * (new_capacity - self._capacity))
+        self._live = np.concatenate([self._live, np.zeros(new_capacity - self._capacity, dtype=bool)])
+        self._capacity = new_capacity
+
+    # ------------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------------
+
+    def add(self, ids, embeddings, documents=None, metadatas=None) -> None:
+        """Add records; ids that already exist are left unchanged (like Chroma)."""
+        self._write(ids, embeddings, documents, metadatas, overwrite=False)
+
+    def upsert(self, ids, embeddings, documents=None, metadatas=None) -> None:
+        """Insert records, replacing any with the same id."""
+        self._write(ids, embeddings, documents, metadatas, overwrite=True)
+
+    def _write(self, ids, embeddings, documents, metadatas, overwrite: bool) -> None:
+        """Write vectors to the matrix, then commit their metadata."""
+        if not ids:
+            return
+        if embeddings is None:
+            raise ValueError("Local vector index requires precomputed embeddings")
+        vectors = _normalize_rows(embeddings)
+        if len(vectors) != len(ids):
+            raise ValueError(f"Got {len(vectors)} embeddings for {len(ids)} ids")
+        documents = documents or [None] * len(ids)
+        metadatas = metadatas or [None] * len(ids)
+
+        with self._write_locked():
+            self._refresh()
+            if self._dim is None:
+                self._dim = vectors.shape[1]
+                with self._conn:
+                    self._conn.execute(
+                        "INSERT OR REPLACE INTO info (key, value) VALUES ('dim', ?)", (str(self._dim),)
+                    )
+            elif vectors.shape[1] != self._dim:
+                raise ValueError(
+                    f"Embedding dimension {vectors.shape[1]} does not match collection dimensionality {self._dim}"
+                )
+
+            # Last occurrence wins for duplicate ids within one call
+            latest = {doc_id: i for i, doc_id in enumerate(ids)}
+            positions = [
+                i for doc_id, i in latest.items()
+                if overwrite or doc_id not in self._rows_by_id
+            ]
+            if not positions:
+                return
+
+            new_count = sum(1 for i in positions if ids[i] not in self._rows_by_id)
+            free_rows = np.flatnonzero(~self._live)
+            if len(free_rows) < new_count:
+                self._ensure_capacity(int(self._live.sum()) + new_count)
+                free_rows = np.flatnonzero(~self._live)
+
+            rows = []
+            free_iter = iter(free_rows.tolist())
+            for i in positions:
+                existing = self._rows_by_id.get(ids[i])
+                rows.append(existing if existing is not None else next(free_iter))
+
+            self._vectors[rows] = vectors[positions].astype(np.float16)
+            self._vectors.flush()
+            self._mark_unindexed(rows)
+
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO chunks (row, id, document, metadata) VALUES (?, ?, ?, ?)",
+                    [
+                        (row, ids[i], documents[i], json.dumps(metadatas[i] or {}))
+                        for row, i in zip(rows, positions)
+                    ]
+                )
+
+            for row, i in zip(rows, positions):
+                self._row_ids[row] = ids[i]
+                self._rows_by_id[ids[i]] = row
+                self._live[row] = True
+
+    def delete(self, ids: Optional[list[str]] = None, where: Optional[dict] = None) -> None:
+        """
+        Delete records by id and/or metadata filter.
+
+        Raises:
+            ValueError: If neither ids nor where is given (like Chroma)
+        """
+        if ids is None and where is None:
+            raise ValueError("You must provide either ids or where to delete.")
+        with self._write_locked():
+            self._refresh()
+            rows = self._select_rows(ids=ids, where=where)
+            if not rows:
+                return
+            with self._conn:
+                for start in range(0, len(rows), _MAX_PARAMS):
+                    batch = rows[start:start + _MAX_PARAMS]
+                    self._conn.execute(
+                        f"DELETE FROM chunks WHERE row IN ({','.join('?' * len(batch))})", batch
+                    )
+            self._mark_unindexed(rows)
+            for row in rows:
+                doc_id = self._row_ids[row]
+                self._rows_by_id.pop(doc_id, None)
+                self._row_ids[row] = None
+                self._live[row] = False
+
+    # ------------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------------
+
+    def count(self) -> int:
+        """Get number of records in the collection."""
+        with self._lock:
+            self._refresh()
+            return int(self._live.sum())
+
+    def get(
+        self,
+        ids: Optional[list[str]] = None,
+        where: Optional[dict] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        include: Optional[list[str]] = None
+    ) -> dict:
+        """
+        Get records by id and/or metadata filter.
+
+        Returns:
+            Dict with "ids" plus "documents", "metadatas" and "embeddings"
+            lists for whichever of those were requested in include
+        """
+        include = _DEFAULT_GET_INCLUDE if include is None else include
+        with self._lock:
+            self._refresh()
+            rows = self._select_rows(ids=ids, where=where)
+            if offset:
+                rows = rows[offset:]
+            if limit is not None:
+                rows = rows[:limit]
+            records = self._fetch_records(rows, include)
+            result = {
+                "ids": [self._row_ids[row] for row in rows],
+                "documents": [records[row][0] for row in rows] if "documents" in include else None,
+                "metadatas": [records[row][1] for row in rows] if "metadatas" in include else None,
+                "embeddings": None,
+            }
+            if "embeddings" in include:
+                result["embeddings"] = [
+                    self._vectors[row].astype(np.float32).tolist() for row in rows
+                ]
+            return result
+
+    def query(
+        self,
+        query_embeddings,
+        n_results: int = 10,
+        where: Optional[dict] = None,
+        include: Optional[list[str]] = None
+    ) -> dict:
+        """
+        Find the nearest records to each query embedding (cosine distance).
+
+        Returns:
+            Dict of per-query lists: "ids", "distances", and "documents" /
+            "metadatas" if requested in include
+        """
+        include = _DEFAULT_QUERY_INCLUDE if include is None else include
+        queries = _normalize_rows(query_embeddings)
+
+        with self._lock:
+            self._refresh()
+            if self._dim is not None and queries.shape[1] != self._dim:
+                raise ValueError(
+                    f"Query dimension {queries.shape[1]} does not match collection dimensionality {self._dim}"
+                )
+
+            if self._vectors is None or not self._live.any():
+                per_query = [([], np.zeros(0)) for _ in range(len(queries))]
+            elif where:
+                rows = np.asarray(self._select_rows(where=where), dtype=np.int64)
+                per_query = [self._top_k(queries[i:i + 1], rows, n_results)[0] for i in range(len(queries))]
+            elif self._use_ivf():
+                per_query = [self._ivf_top_k(queries[i], n_results) for i in range(len(queries))]
+            else:
+                per_query = self._top_k(queries, np.flatnonzero(self._live), n_results)
+
+            all_rows = sorted({int(row) for rows, _ in per_query for row in rows})
+            records = self._fetch_records(all_rows, include)
+            ids = [[self._row_ids[row] for row in rows] for rows, _ in per_query]
+
+        result = {"ids": ids, "distances": [], "documents": None, "metadatas": None, "embeddings": None}
+        if "documents" in include:
+            result["documents"] = [[records[row][0] for row in rows] for rows, _ in per_query]
+        if "metadatas" in include:
+            result["metadatas"] = [[records[row][1] for row in rows] for rows, _ in per_query]
+        result["distances"] = [[float(1 - s) for s in scores] for _, scores in per_query]
+        return result
+
+    def _select_rows(self, ids: Optional[list[str]] = None, where: Optional[dict] = None) -> list[int]:
+        """Resolve an id list and/or where filter to row numbers (lock held)."""
+        if ids is not None:
+            rows = [self._rows_by_id[doc_id] for doc_id in ids if doc_id in self._rows_by_id]
+            if where is None:
+                return rows
+            allowed = set(self._select_rows(where=where))
+            return [row for row in rows if row in allowed]
+
+        if where is None:
+            return np.flatnonzero(self._live).tolist()
+
+        condition, params = where_to_sql(where)
+        return [
+            row for (row,) in self._conn.execute(
+                f"SELECT row FROM chunks WHERE {condition} ORDER BY row", params
+            )
+        ]
+
+    def _fetch_records(self, rows: list[int], include) -> dict[int, tuple]:
+        """Load (document, metadata) for rows from SQLite (lock held)."""
+        if not rows or not ({"documents", "metadatas"} & set(include)):
+            return {row: (None, None) for row in rows}
+        records = {}
+        for start in range(0, len(rows), _MAX_PARAMS):
+            batch = rows[start:start + _MAX_PARAMS]
+            for row, document, metadata in self._conn.execute(
+                f"SELECT row, document, metadata FROM chunks WHERE row IN ({','.join('?' * len(batch))})",
+                batch
+            ):
+                records[row] = (document, json.loads(metadata))
+        return records
+
+    def _top_k(self, queries: np.ndarray, rows: np.ndarray, k: int) -> list[tuple[list[int], np.ndarray]]:
+        """
+        Exact top-k by dot product over the given rows (lock held).
+
+        Returns:
+            One (rows, scores) pair per query, best first
+        """
+        if len(rows) == 0 or k <= 0:
+            return [([], np.zeros(0)) for _ in range(len(queries))]
+
+        candidate_scores = []
+        candidate_rows = []
+        for start in range(0, len(rows), _SCAN_BLOCK_ROWS):
+            block = rows[start:start + _SCAN_BLOCK_ROWS]
+            scores = self._vectors[block].astype(np.float32) @ queries.T  # (block, queries)
+            keep = min(k, len(block))
+            if keep < len(block):
+                top = np.argpartition(-scores, keep - 1, axis=0)[:keep]
+            else:
+                top = np.broadcast_to(np.arange(len(block))[:, None], scores.shape)
+            candidate_scores.append(np.take_along_axis(scores, top, axis=0))
+            candidate_rows.append(block[top])
+
+        scores = np.concatenate(candidate_scores)
+        rows_by_score = np.concatenate(candidate_rows)
+        order = np.argsort(-scores, axis=0, kind="stable")[:k]
+        best_scores = np.take_along_axis(scores, order, axis=0)
+        best_rows = np.take_along_axis(rows_by_score, order, axis=0)
+        return [
+            (best_rows[:, q].tolist(), best_scores[:, q])
+            for q in range(len(queries))
+        ]
+
+    # ------------------------------------------------------------------
+    # IVF index
+    # ------------------------------------------------------------------
+
+    def _use_ivf(self) -> bool:
+        """Whether unfiltered queries should go through the IVF index (lock held)."""
+        if int(self._live.sum()) < settings.local_vector_ivf_min_rows:
+            return False
+        if self._ivf is None or len(self._unindexed_rows()) > _IVF_REBUILD_FRACTION * self._ivf["size"]:
+            self._build_ivf()
+        return True
+
+    def _unindexed_rows(self) -> np.ndarray:
+        """Live rows written since the IVF index was built (lock held)."""
+        indexed = self._ivf["indexed"]
+        live = self._live
+        if len(live) > len(indexed):
+            indexed = np.concatenate([indexed, np.zeros(len(live) - len(indexed), dtype=bool)])
+        return np.flatnonzero(live & ~indexed[:len(live)])
+
+    def _mark_unindexed(self, rows: list[int]):
+        """Drop rewritten or deleted rows from the IVF lists' coverage (lock held)."""
+        if self._ivf is None:
+            return
+        indexed = self._ivf["indexed"]
+        rows = np.asarray(rows, dtype=np.int64)
+        indexed[rows[rows < len(indexed)]] = False
+
+    def _build_ivf(self):
+        """Train the coarse quantizer and assign all live rows (lock held)."""
+        rows = np.flatnonzero(self._live)
+        n_lists = max(1, int(np.sqrt(len(rows))))
+        rng = np.random.default_rng(0)
+
+        sample_rows = rows if len(rows) <= _IVF_TRAIN_SAMPLE else np.sort(
+            rng.choice(rows, _IVF_TRAIN_SAMPLE, replace=False)
+        )
+        sample = self._vectors[sample_rows].astype(np.float32)
+        centroids = sample[rng.choice(len(sample), n_lists, replace=False)].copy()
+
+        for _ in range(_IVF_TRAIN_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            sums = np.zeros_like(centroids)
+            np.add.at(sums, assignment, sample)
+            norms = np.linalg.norm(sums, axis=1, keepdims=True)
+            non_empty = norms[:, 0] > 0
+            centroids[non_empty] = sums[non_empty] / norms[non_empty]
+
+        assignment = np.empty(len(rows), dtype=np.int64)
+        for start in range(0, len(rows), _SCAN_BLOCK_ROWS):
+            block = rows[start:start + _SCAN_BLOCK_ROWS]
+            assignment[start:start + len(block)] = np.argmax(
+                self._vectors[block].astype(np.float32) @ centroids.T, axis=1
+            )
+
+        order = np.argsort(assignment, kind="stable")
+        sorted_rows = rows[order]
+        offsets = np.searchsorted(assignment[order], np.arange(n_lists + 1))
+
+        indexed = np.zeros(len(self._live), dtype=bool)
+        indexed[rows] = True
+        self._ivf = {
+            "centroids": centroids,
+            "rows": sorted_rows,
+            "offsets": offsets,
+            "indexed": indexed,
+            "size": len(rows),
+        }
+        logger.info(f"Built IVF index for {self.name}: {len(rows)} rows, {n_lists} lists")
+
+    def _ivf_top_k(self, query: np.ndarray, k: int) -> tuple[list[int], np.ndarray]:
+        """Approximate top-k for one query by probing the nearest lists (lock held)."""
+        ivf = self._ivf
+        centroid_scores = ivf["centroids"] @ query
+        n_probe = min(settings.local_vector_ivf_nprobe, len(centroid_scores))
+        probe = np.argpartition(-centroid_scores, n_probe - 1)[:n_probe]
+
+        candidates = [ivf["rows"][ivf["offsets"][j]:ivf["offsets"][j + 1]] for j in probe]
+        candidates.append(self._unindexed_rows())
+
+        rows = np.unique(np.concatenate(candidates))
+        rows = rows[self._live[rows]]
+        return self._top_k(query.reshape(1, -1), rows, k)[0]
+
+    def close(self) -> None:
+        """Flush vectors and close the metadata database."""
+        with self._lock:
+            if self._vectors is not None:
+                self._vectors.flush()
+                self._vectors = None
+            self._conn.close()
+
+
+class LocalVectorClient:
+    """
+    Minimal stand-in for chromadb's client over local collections.
+
+    Collections are cached so every VectorStore in the process shares one
+    LocalVectorCollection (and its in-memory row map) per name.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        """
+        Initialize client.
+
+        Args:
+            path: Directory holding one subdirectory per collection (default from settings)
+        """
+        self.path = Path(path) if path else get_local_vector_path()
+        self._collections: dict[str, LocalVectorCollection] = {}
+        self._lock = threading.Lock()
+
+    def get_or_create_collection(self, name: str, metadata: Optional[dict] = None) -> LocalVectorCollection:
+        """Open a collection, creating it if needed (metadata is accepted for Chroma compatibility)."""
+        with self._lock:
+            if name not in self._collections:
+                self._collections[name] = LocalVectorCollection(name, self.path / name)
+            return self._collections[name]
+
+    def get_collection(self, name: str) -> LocalVectorCollection:
+        """
+        Open an existing collection.
+
+        Raises:
+            ValueError: If the collection doesn't exist
+        """
+        if name not in self._collections and not (self.path / name / METADATA_DB).exists():
+            raise ValueError(f"Collection {name} does not exist.")
+        return self.get_or_create_collection(name)
+
+    def delete_collection(self, name: str) -> None:
+        """Delete a collection and its files."""
+        with self._lock:
+            collection = self._collections.pop(name, None)
+            if collection is not None:
+                collection.close()
+            shutil.rmtree(self.path / name, ignore_errors=True)
+
+    def close(self) -> None:
+        """Close all open collections."""
+        with self._lock:
+            for collection in self._collections.values():
+                collection.close()
+            self._collections.clear()
+
+
+# Singleton instance
+_local_vector_client: Optional[LocalVectorClient] = None
+_client_lock = threading.Lock()
+
+
+def get_local_vector_client() -> LocalVectorClient:
+    """Get the singleton LocalVectorClient instance."""
+    global _local_vector_client
+    with _client_lock:
+        if _local_vector_client is None:
+            _local_vector_client = LocalVectorClient()
+        return _local_vector_client
+
+
+def reset_local_vector_client() -> None:
+    """
+    Reset the local vector client singleton.
+
+    For testing only - allows tests to start with fresh state.
+    """
+    global _local_vector_client
+    with _client_lock:
+        if _local_vector_client is not None:
+            _local_vector_client.close()
+        _local_vector_client = None
@@ -149,39 +149,47 @@ def _find_people_notes(names: list[str], search: any) -> list[RelatedNote]:
     """
     Find People notes for the given names.
 
-    Searches for notes in People folders matching attendee names.
+    Searches for notes in People folders matching attendee names. All
+    attendee queries go through one batched search (one embedding pass and
+    one vector store request) rather than one search per attendee.
     """
     notes = []
     seen_paths = set()
 
-    for name in names[:5]:  # Limit to avoid too many searches
-        # Search for person's dedicated note
-        query = f"{name} file:People"
-        try:
-            results = search.search(query, top_k=3, use_reranker=False)
-            for result in results:
-                file_path = result.get("file_path", "")
-                file_name = result.get("file_name", "") or result.get("metadata", {}).get("file_name", "")
-
-                # Skip archived content
-                if "zArchive" in file_path:
-                    continue
-
-                # Check if this is actually a People note
-                if "People" in file_path and file_path not in seen_paths:
-                    # Verify the name appears in the filename
-                    name_parts = name.lower().split()
-                    file_lower = file_name.lower()
-                    if any(part in file_lower for part in name_parts):
-                        notes.append(RelatedNote(
-                            title=file_name.replace(".md", ""),
-                            path=file_path,
-                            relevance="attendee",
-                        ))
-                        seen_paths.add(file_path)
-                        break  # One note per person
-        except Exception as e:
-            logger.warning(f"Failed to search for person {name}: {e}")
+    names = names[:5]  # Limit to avoid too many searches
+    if not names:
+        return notes
+
+    # Search for each person's dedicated note
+    queries = [f"{name} file:People" for name in names]
+    try:
+        results_per_name = search.search_many(queries, top_k=3, use_reranker=False)
+    except Exception as e:
+        logger.warning(f"Failed to search for people {names}: {e}")
+        return notes
+
+    for name, results in zip(names, results_per_name):
+        for result in results:
+            file_path = result.get("file_path", "")
+            file_name = result.get("file_name", "") or result.get("metadata", {}).get("file_name", "")
+
+            # Skip archived content
+            if "zArchive" in file_path:
+                continue
+
+            # Check if this is actually a People note
+            if "People" in file_path and file_path not in seen_paths:
+                # Verify the name appears in the filename
+                name_parts = name.lower().split()
+                file_lower = file_name.lower()
+                if any(part in file_lower for part in name_parts):
+                    notes.append(RelatedNote(
+                        title=file_name.replace(".md", ""),
+                        path=file_path,
+                        relevance="attendee",
+                    ))
+                    seen_paths.add(file_path)
+                    break  # One note per person
 
     return notes
 
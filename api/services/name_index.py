@@ -0,0 +1,289 @@
+"""
+Name parsing and candidate blocking for entity resolution.
+
+Fuzzy name resolution used to parse and fuzzy-compare every person in the
+store for every unmatched name. NameBlockingIndex keeps each person's name
+pre-parsed and bucketed by name component, so a lookup only scores people
+who could possibly match.
+
+## Key Design Decisions
+
+- **Exact blocking**: the blocks mirror EntityResolver's matching rules
+  (last names within fuzz.ratio >= 85 or sharing an initial; first names
+  that are equal, initials, nickname variants or within ratio 85; first
+  name = middle name). Every person the scorer could accept is returned,
+  so resolution results are unchanged
+- **Batch fuzzy matching**: ratios against all distinct last/first/middle
+  names are computed in one rapidfuzz.process.cdist call instead of one
+  fuzz.ratio call per person
+- **Store order**: candidates come back in the store's insertion order,
+  which the scorer relies on to break ties
+- **Incremental**: PersonEntityStore updates the index on add/update/delete
+  (merges go through update + delete)
+"""
+from collections import defaultdict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Iterable, Optional
+
+import numpy as np
+from rapidfuzz import fuzz, process
+
+from config.nickname_lookup import get_name_variants
+
+if TYPE_CHECKING:
+    from api.services.person_entity import PersonEntity
+
+# Name prefixes to strip before parsing (case-insensitive)
+NAME_PREFIXES = {'dr', 'dr.', 'mr', 'mr.', 'mrs', 'mrs.', 'ms', 'ms.', 'prof', 'prof.', 'rev', 'rev.'}
+
+# Name suffixes to strip before parsing (case-insensitive, may have trailing punctuation)
+NAME_SUFFIXES = {
+    'md', 'phd', 'jr', 'sr', 'ii', 'iii', 'iv', 'v',
+    'esq', 'mph', 'dds', 'dmd', 'do', 'rn', 'cpa',
+    'mba', 'jd', 'llm', 'msw', 'lcsw', 'psyd', 'edd',
+}
+
+# fuzz.ratio threshold the resolver treats as the same name
+FUZZY_NAME_THRESHOLD = 85
+
+
+@dataclass
+class ParsedName:
+    """Structured representation of a parsed name."""
+    first: str  # First name (required)
+    middles: list[str]  # Middle names (may be empty)
+    last: Optional[str]  # Last name (None for single-word names)
+    original: str  # Original input string
+
+
+def parse_name(name: str) -> ParsedName:
+    """
+    Parse a name into structured components.
+
+    Strips common prefixes (Dr., Mr., Mrs.) and suffixes (MD, PhD, Jr).
+    Also strips anything after a comma (credentials like ", CLC, CSC" or ", PhD").
+    Returns {first, middles[], last} structure.
+
+    Examples:
+        "John Smith" -> {first="John", middles=[], last="Smith"}
+        "Dr. Mary Katherine Palmer MD" -> {first="Mary", middles=["Katherine"], last="Palmer"}
+        "Taylor" -> {first="Taylor", middles=[], last=None}
+        "Jane Mary Smith" -> {first="Jane", middles=["Mary"], last="Smith"}
+        "Sarah Long, CLC, CSC" -> {first="Sarah", middles=[], last="Long"}
+
+    Args:
+        name: Name string to parse
+
+    Returns:
+        ParsedName with structured components
+    """
+    if not name or not name.strip():
+        return ParsedName(first="", middles=[], last=None, original=name or "")
+
+    original = name
+
+    # First, strip anything after a comma (credentials like ", PhD" or ", CLC, CSC")
+    if ',' in name:
+        name = name.split(',')[0].strip()
+
+    parts = name.strip().split()
+
+    # Strip prefixes from the beginning
+    while parts and parts[0].lower().rstrip('.,') in NAME_PREFIXES:
+        parts.pop(0)
+
+    # Strip suffixes from the end
+    while parts and parts[-1].lower().rstrip('.,') in NAME_SUFFIXES:
+        parts.pop()
+
+    if not parts:
+        # All parts were prefixes/suffixes, return original as first name
+        return ParsedName(first=original.strip(), middles=[], last=None, original=original)
+
+    if len(parts) == 1:
+        return ParsedName(first=parts[0], middles=[], last=None, original=original)
+    elif len(parts) == 2:
+        return ParsedName(first=parts[0], middles=[], last=parts[1], original=original)
+    else:
+        # 3+ parts: first, middle(s), last
+        return ParsedName(
+            first=parts[0],
+            middles=parts[1:-1],
+            last=parts[-1],
+            original=original,
+        )
+
+
+@dataclass
+class NameParts:
+    """Lowercased components of one parsed name."""
+    first: str
+    middles: list[str]
+    last: Optional[str]
+
+    @classmethod
+    def parse(cls, name: str) -> "NameParts":
+        parsed = parse_name(name)
+        return cls(
+            first=parsed.first.lower() if parsed.first else "",
+            middles=[m.lower() for m in parsed.middles],
+            last=parsed.last.lower() if parsed.last else None,
+        )
+
+
+@dataclass
+class IndexedName:
+    """A person's canonical name and aliases, parsed once at index time."""
+    entity: "PersonEntity"
+    name: NameParts
+    aliases: list[NameParts]
+    order: int  # Insertion order, matching the store's iteration order
+
+
+class _Block:
+    """Distinct name keys -> entity IDs, with a cached key list for cdist."""
+
+    def __init__(self):
+        self.ids: dict[str, set[str]] = defaultdict(set)
+        self._keys: Optional[list[str]] = None
+
+    def add(self, key: str, entity_id: str) -> None:
+        if key not in self.ids:
+            self._keys = None
+        self.ids[key].add(entity_id)
+
+    def discard(self, key: str, entity_id: str) -> None:
+        ids = self.ids.get(key)
+        if ids is None:
+            return
+        ids.discard(entity_id)
+        if not ids:
+            del self.ids[key]
+            self._keys = None
+
+    def get(self, key: str) -> set[str]:
+        return self.ids.get(key, set())
+
+    def fuzzy(self, query: str) -> Iterable[str]:
+        """IDs under every key with fuzz.ratio(query, key) >= FUZZY_NAME_THRESHOLD."""
+        if self._keys is None:
+            self._keys = list(self.ids)
+        if not self._keys:
+            return
+        scores = process.cdist(
+            [query],
+            self._keys,
+            scorer=fuzz.ratio,
+            score_cutoff=FUZZY_NAME_THRESHOLD,
+            dtype=np.float64,
+        )[0]
+        for i in np.flatnonzero(scores >= FUZZY_NAME_THRESHOLD):
+            yield from self.ids[self._keys[i]]
+
+
+class NameBlockingIndex:
+    """
+    Pre-parsed names of every person, bucketed for candidate lookup.
+
+    Blocks:
+    - last: canonical and alias last names
+    - last_initial: first letter of those last names
+    - first: canonical first names
+    - first_initial: first letter of canonical first names
+    - middle: canonical middle names
+    """
+
+    def __init__(self):
+        self._entries: dict[str, IndexedName] = {}
+        self._keys: dict[str, list[tuple[_Block, str]]] = {}
+        self._next_order = 0
+        self._last = _Block()
+        self._last_initial = _Block()
+        self._first = _Block()
+        self._first_initial = _Block()
+        self._middle = _Block()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def add(self, entity: "PersonEntity") -> IndexedName:
+        """Index (or re-index) an entity, keeping its original position."""
+        previous = self._entries.get(entity.id)
+        self._unindex(entity.id)
+
+        name = NameParts.parse(entity.canonical_name)
+        aliases = [NameParts.parse(alias) for alias in entity.aliases]
+        if previous is not None:
+            order = previous.order
+        else:
+            order = self._next_order
+            self._next_order += 1
+        entry = IndexedName(entity=entity, name=name, aliases=aliases, order=order)
+        self._entries[entity.id] = entry
+
+        keys: list[tuple[_Block, str]] = []
+        for parts in [name, *aliases]:
+            if parts.last:
+                keys.append((self._last, parts.last))
+                keys.append((self._last_initial, parts.last[0]))
+        if name.first:
+            keys.append((self._first, name.first))
+            keys.append((self._first_initial, name.first[0]))
+        for middle in name.middles:
+            keys.append((self._middle, middle))
+
+        for block, key in keys:
+            block.add(key, entity.id)
+        self._keys[entity.id] = keys
+        return entry
+
+    def remove(self, entity_id: str) -> None:
+        """Drop an entity from the index."""
+        self._unindex(entity_id)
+        self._entries.pop(entity_id, None)
+
+    def _unindex(self, entity_id: str) -> None:
+        for block, key in self._keys.pop(entity_id, []):
+            block.discard(key, entity_id)
+
+    def get(self, entity_id: str) -> Optional[IndexedName]:
+        """Get the indexed name for an entity ID."""
+        return self._entries.get(entity_id)
+
+    def candidates(self, query: NameParts) -> list[IndexedName]:
+        """
+        Find every indexed person the resolver could match to a query name.
+
+        With a last name, that is anyone whose canonical or alias last name
+        matches it (prefix match for an initial, otherwise fuzzy). Without
+        one, it is anyone whose canonical first or middle name matches the
+        query's first name.
+
+        Args:
+            query: Parsed query name
+
+        Returns:
+            Indexed names in insertion order
+        """
+        ids: set[str] = set()
+        if query.last:
+            if len(query.last) == 1:
+                ids |= self._last_initial.get(query.last)
+            else:
+                ids.update(self._last.fuzzy(query.last))
+        elif query.first:
+            first = query.first
+            ids |= self._first.get(first)
+            # Entity first name is an initial of the query's
+            ids |= self._first.get(first[0])
+            if len(first) == 1:
+                ids |= self._first_initial.get(first)
+            for variant in get_name_variants(first):
+                ids |= self._first.get(variant)
+            ids.update(self._first.fuzzy(first))
+            ids |= self._middle.get(first)
+            ids.update(self._middle.fuzzy(first))
+
+        entries = [self._entries[entity_id] for entity_id in ids]
+        entries.sort(key=lambda e: e.order)
+        return entries
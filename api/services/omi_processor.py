@@ -13,13 +13,15 @@ Destinations:
 """
 import re
 import logging
-import threading
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
 
 import frontmatter
 
+from api.services.inbox_processing import InboxProcessorMixin
+from api.services.vault_catalog import VaultCatalog, get_vault_catalog
+
 logger = logging.getLogger(__name__)
 
 
@@ -121,28 +123,30 @@ PERSONAL_FINANCE_PATTERNS = [
 ]
 
 
-class OmiProcessor:
+class OmiProcessor(InboxProcessorMixin):
     """
     Process event notes from Omi/Events folder.
 
-    Runs every 5 minutes (configurable) to classify and move notes
-    to appropriate destinations based on category and content patterns.
+    Classifies and moves notes to appropriate destinations based on category
+    and content patterns, within seconds of them arriving (driven by the
+    vault catalog's file watcher).
     """
 
-    def __init__(self, vault_path: str, interval_seconds: int = 300):
+    NOTE_ID_KEY = "omi_id"
+
+    def __init__(self, vault_path: str, catalog: Optional[VaultCatalog] = None, max_workers: Optional[int] = None):
         """
         Initialize Omi processor.
 
         Args:
             vault_path: Path to Obsidian vault
-            interval_seconds: How often to check for new files (default: 300 = 5 minutes)
+            catalog: Vault catalog for duplicate lookups and file events (uses the vault's singleton if None)
+            max_workers: Inbox worker threads (default: settings.inbox_processor_workers)
         """
         self.vault_path = Path(vault_path)
+        self.catalog = catalog if catalog is not None else get_vault_catalog(self.vault_path)
         self.omi_events_path = self.vault_path / "Omi" / "Events"
-        self.interval_seconds = interval_seconds
-        self._timer: Optional[threading.Timer] = None
-        self._running = False
-        self._lock = threading.Lock()
+        self._init_inbox("Omi", self.omi_events_path, max_workers)
 
         # Destination folders (all under vault_path)
         # Work path loaded from settings
@@ -158,7 +162,7 @@ class OmiProcessor:
 
     def find_files_by_omi_id(self, omi_id: str, exclude_path: Optional[Path] = None) -> list[Path]:
         """
-        Find all files in the vault with the given omi_id.
+        Find all files in the vault with the given omi_id (a vault catalog lookup).
 
         Args:
             omi_id: The Omi ID to search for
@@ -167,18 +171,10 @@ class OmiProcessor:
         Returns:
             List of paths to files with matching omi_id
         """
-        matches = []
-        for md_file in self.vault_path.rglob("*.md"):
-            if exclude_path and md_file == exclude_path:
-                continue
-            try:
-                content = md_file.read_text(encoding="utf-8")
-                post = frontmatter.loads(content)
-                if post.metadata.get("omi_id") == omi_id:
-                    matches.append(md_file)
-            except Exception:
-                continue
-        return matches
+        return [
+            path for path in self.catalog.find_paths("omi_id", omi_id)
+            if path != exclude_path and path.exists()
+        ]
 
     def delete_duplicates_by_omi_id(self, omi_id: str, keep_path: Optional[Path] = None) -> int:
         """
@@ -196,12 +192,21 @@ class OmiProcessor:
         for dup_path in duplicates:
             try:
                 dup_path.unlink()
+                self.catalog.remove_file(dup_path)
                 logger.info(f"Deleted duplicate omi file: {dup_path}")
                 deleted += 1
             except Exception as e:
                 logger.error(f"Failed to delete duplicate {dup_path}: {e}")
         return deleted
 
+    def _update_catalog(self, *paths: Path) -> None:
+        """Re-catalog files this processor wrote, moved or deleted."""
+        for path in paths:
+            try:
+                self.catalog.refresh_file(path)
+            except Exception as e:
+                logger.warning(f"Failed to update vault catalog for {path}: {e}")
+
     def _matches_patterns(self, text: str, patterns: list[str]) -> bool:
         """Check if text matches any of the given patterns."""
         text_lower = text.lower()
@@ -452,8 +457,10 @@ class OmiProcessor:
                     dest_path.unlink()
                 except Exception:
                     pass
+                self._update_catalog(path, dest_path)
                 return None
 
+        self._update_catalog(path, dest_path)
         logger.info(f"Processed: {path.name} -> {destination} ({rationale})")
         return str(dest_path)
 
@@ -573,8 +580,10 @@ class OmiProcessor:
                     dest_path.unlink()
                 except Exception:
                     pass
+                self._update_catalog(path, dest_path)
                 return None
 
+        self._update_catalog(path, dest_path)
         logger.info(f"Reclassified: {path.name} -> {destination} ({rationale})")
         return str(dest_path)
 
@@ -628,21 +637,12 @@ class OmiProcessor:
         Returns:
             Dict mapping omi_id to list of file paths (only for IDs with 2+ files)
         """
-        omi_files: dict[str, list[Path]] = {}
-
-        for md_file in self.vault_path.rglob("*.md"):
-            try:
-                content = md_file.read_text(encoding="utf-8")
-                post = frontmatter.loads(content)
-                omi_id = post.metadata.get("omi_id")
-                if omi_id:
-                    if omi_id not in omi_files:
-                        omi_files[omi_id] = []
-                    omi_files[omi_id].append(md_file)
-            except Exception:
-                continue
-
-        return {oid: paths for oid, paths in omi_files.items() if len(paths) > 1}
+        duplicates = {}
+        for omi_id, paths in self.catalog.find_duplicates("omi_id").items():
+            existing = [path for path in paths if path.exists()]
+            if len(existing) > 1:
+                duplicates[omi_id] = existing
+        return duplicates
 
     def deduplicate_all(self) -> dict:
         """
@@ -706,6 +706,7 @@ class OmiProcessor:
                 if path != best_path:
                     try:
                         path.unlink()
+                        self.catalog.remove_file(path)
                         detail["deleted"].append(str(path))
                         results["files_deleted"] += 1
                         logger.info(f"Deleted duplicate: {path}")
@@ -721,10 +722,14 @@ class OmiProcessor:
         )
         return results
 
-    def process_backlog(self) -> dict:
+    def process_backlog(self, force: bool = False) -> dict:
         """
         Process all existing files in the Omi/Events folder.
 
+        Args:
+            force: Also re-process files that were already processed and
+                   haven't changed since
+
         Returns:
             Dict with 'processed', 'failed', 'skipped' counts and 'moves' list
         """
@@ -741,7 +746,10 @@ class OmiProcessor:
 
         for md_file in self.omi_events_path.glob("*.md"):
             try:
-                new_path = self.process_file(str(md_file))
+                if force:
+                    new_path = self.process_file(str(md_file))
+                else:
+                    new_path = self.process_if_changed(str(md_file))
                 if new_path:
                     results["processed"] += 1
                     results["moves"].append({
@@ -760,62 +768,6 @@ class OmiProcessor:
         )
         return results
 
-    def _run_cycle(self):
-        """Run one processing cycle and schedule the next."""
-        if not self._running:
-            return
-
-        logger.debug("Running Omi processor cycle")
-        try:
-            results = self.process_backlog()
-            if results["processed"] > 0:
-                logger.info(f"Omi cycle: processed {results['processed']} files")
-        except Exception as e:
-            logger.error(f"Omi processor cycle failed: {e}")
-            # Record failure for nightly batch report
-            try:
-                from api.services.notifications import record_failure
-                record_failure("Omi processor", str(e))
-            except Exception as notify_err:
-                logger.error(f"Failed to record Omi failure: {notify_err}")
-
-        # Schedule next run
-        if self._running:
-            self._timer = threading.Timer(self.interval_seconds, self._run_cycle)
-            self._timer.daemon = True
-            self._timer.start()
-
-    def start(self) -> None:
-        """Start the processor (runs every interval_seconds)."""
-        with self._lock:
-            if self._running:
-                logger.debug("Omi processor already running")
-                return
-
-            if not self.omi_events_path.exists():
-                logger.warning(f"Omi/Events folder does not exist: {self.omi_events_path}")
-                return
-
-            self._running = True
-
-            # Run immediately on start
-            logger.info(f"Starting Omi processor (interval: {self.interval_seconds}s)")
-            self._run_cycle()
-
-    def stop(self) -> None:
-        """Stop the processor."""
-        with self._lock:
-            self._running = False
-            if self._timer:
-                self._timer.cancel()
-                self._timer = None
-            logger.info("Stopped Omi processor")
-
-    @property
-    def is_running(self) -> bool:
-        """Check if processor is running."""
-        return self._running
-
 
 # Singleton instance
 _processor_instance: Optional[OmiProcessor] = None
@@ -166,6 +166,8 @@ def sync_gmail_to_v2(
 
         logger.info(f"Gmail v2 sync: found {len(messages)} sent emails to process")
 
+        # Collect every recipient first so repeat correspondents resolve once
+        recipients = []
         for msg in messages:
             stats["emails_processed"] += 1
 
@@ -173,10 +175,7 @@ def sync_gmail_to_v2(
             if not hasattr(msg, 'to') or not msg.to:
                 continue
 
-            # Parse recipients
-            recipients = msg.to.split(',')
-
-            for recipient in recipients:
+            for recipient in msg.to.split(','):
                 name, email = parse_email_recipient(recipient)
 
                 if not email or '@' not in email:
@@ -187,45 +186,47 @@ def sync_gmail_to_v2(
                     stats["emails_excluded"] += 1
                     continue
 
-                # Resolve entity (create if missing)
-                result = resolver.resolve(
-                    name=name,
-                    email=email,
-                    create_if_missing=True,
-                )
+                recipients.append((msg, name, email))
 
-                if not result:
-                    continue
+        # Resolve entities (create if missing)
+        results = resolver.resolve_many(
+            [(name, email) for _, name, email in recipients],
+            create_if_missing=True,
+        )
 
-                entity = result.entity
+        for (msg, _, _), result in zip(recipients, results):
+            if not result:
+                continue
 
-                if result.is_new:
-                    stats["entities_created"] += 1
+            entity = result.entity
 
-                # Create interaction
-                interaction = create_gmail_interaction(
-                    person_id=entity.id,
-                    message_id=msg.message_id,
-                    subject=msg.subject or "(no subject)",
-                    timestamp=msg.date,
-                    snippet=msg.snippet,
-                )
+            if result.is_new:
+                stats["entities_created"] += 1
 
-                # Add if not duplicate
-                _, was_added = store.add_if_not_exists(interaction)
+            # Create interaction
+            interaction = create_gmail_interaction(
+                person_id=entity.id,
+                message_id=msg.message_id,
+                subject=msg.subject or "(no subject)",
+                timestamp=msg.date,
+                snippet=msg.snippet,
+            )
 
-                if was_added:
-                    stats["interactions_created"] += 1
+            # Add if not duplicate
+            _, was_added = store.add_if_not_exists(interaction)
 
-                    # Update entity stats
-                    entity.email_count = (entity.email_count or 0) + 1
-                    if _is_newer(msg.date, entity.last_seen):
-                        entity.last_seen = _make_aware(msg.date)
-                    if "gmail" not in entity.sources:
-                        entity.sources.append("gmail")
+            if was_added:
+                stats["interactions_created"] += 1
 
-                    resolver.store.update(entity)
-                    stats["entities_updated"] += 1
+                # Update entity stats
+                entity.email_count = (entity.email_count or 0) + 1
+                if _is_newer(msg.date, entity.last_seen):
+                    entity.last_seen = _make_aware(msg.date)
+                if "gmail" not in entity.sources:
+                    entity.sources.append("gmail")
+
+                resolver.store.update(entity)
+                stats["entities_updated"] += 1
 
     except Exception as e:
         logger.error(f"Failed to sync Gmail to v2: {e}")
@@ -297,6 +298,8 @@ def sync_calendar_to_v2(
 
             logger.info(f"Calendar v2 sync ({cal_service.account_type.value}): found {len(events)} events to process")
 
+            # Collect attendees across all events so repeat attendees resolve once
+            attendees = []
             for event in events:
                 stats["events_processed"] += 1
 
@@ -310,7 +313,6 @@ def sync_calendar_to_v2(
                     stats["events_skipped"] += 1
                     continue
 
-                # Process each attendee
                 for attendee_str in event.attendees:
                     # Parse attendee (could be email or "Name" format)
                     if '@' in attendee_str:
@@ -322,49 +324,50 @@ def sync_calendar_to_v2(
                         # Just a name
                         name = attendee_str
                         email = None
+                    attendees.append((event, name, email))
 
-                    # Resolve entity
-                    result = resolver.resolve(
-                        name=name,
-                        email=email,
-                        create_if_missing=True,
-                    )
+            # Resolve entities
+            results = resolver.resolve_many(
+                [(name, email) for _, name, email in attendees],
+                create_if_missing=True,
+            )
 
-                    if not result:
-                        continue
+            for (event, _, _), result in zip(attendees, results):
+                if not result:
+                    continue
 
-                    entity = result.entity
+                entity = result.entity
 
-                    if result.is_new:
-                        stats["entities_created"] += 1
+                if result.is_new:
+                    stats["entities_created"] += 1
 
-                    # Create interaction
-                    interaction = create_calendar_interaction(
-                        person_id=entity.id,
-                        event_id=event.event_id,
-                        title=event.title,
-                        timestamp=event.start_time,
-                        snippet=event.description[:200] if event.description else None,
-                    )
+                # Create interaction
+                interaction = create_calendar_interaction(
+                    person_id=entity.id,
+                    event_id=event.event_id,
+                    title=event.title,
+                    timestamp=event.start_time,
+                    snippet=event.description[:200] if event.description else None,
+                )
 
-                    # Add if not duplicate
-                    _, was_added = store.add_if_not_exists(interaction)
+                # Add if not duplicate
+                _, was_added = store.add_if_not_exists(interaction)
 
-                    if was_added:
-                        stats["interactions_created"] += 1
+                if was_added:
+                    stats["interactions_created"] += 1
 
-                        # Update entity stats
-                        entity.meeting_count = (entity.meeting_count or 0) + 1
-                        # Only update last_seen if event is not in the future
-                        now = datetime.now(timezone.utc)
-                        event_ts = _make_aware(event.start_time)
-                        if event_ts <= now and _is_newer(event_ts, entity.last_seen):
-                            entity.last_seen = event_ts
-                        if "calendar" not in entity.sources:
-                            entity.sources.append("calendar")
+                    # Update entity stats
+                    entity.meeting_count = (entity.meeting_count or 0) + 1
+                    # Only update last_seen if event is not in the future
+                    now = datetime.now(timezone.utc)
+                    event_ts = _make_aware(event.start_time)
+                    if event_ts <= now and _is_newer(event_ts, entity.last_seen):
+                        entity.last_seen = event_ts
+                    if "calendar" not in entity.sources:
+                        entity.sources.append("calendar")
 
-                        resolver.store.update(entity)
-                        stats["entities_updated"] += 1
+                    resolver.store.update(entity)
+                    stats["entities_updated"] += 1
 
         except Exception as e:
             logger.error(f"Failed to sync calendar ({cal_service.account_type.value}) to v2: {e}")
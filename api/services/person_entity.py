@@ -11,8 +11,9 @@ Key changes from PersonRecord:
 import fcntl
 import json
 import logging
-import os
 import sqlite3
+import threading
+import time
 import uuid
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timezone
@@ -22,7 +23,9 @@ from typing import Optional, TYPE_CHECKING
 if TYPE_CHECKING:
     from api.services.people_aggregator import PersonRecord
 
+from api.services.name_index import IndexedName, NameBlockingIndex, NameParts
 from api.utils.datetime_utils import make_aware as _make_aware
+from api.utils.db_connections import get_connection
 
 logger = logging.getLogger(__name__)
 
@@ -425,7 +428,10 @@ class PersonEntityStore:
     """
     Storage layer for PersonEntity objects.
 
-    Provides CRUD operations and persistence to JSON file.
+    Provides CRUD operations and persistence to a SQLite database with one
+    JSON row per entity (people_entities.db next to the legacy
+    people_entities.json, which is imported once on first load). Changes are
+    tracked per entity, so save() only writes what add/update/delete touched.
 
     IMPORTANT - ID DURABILITY WARNING:
     ==================================
@@ -435,14 +441,14 @@ class PersonEntityStore:
     - Hardcoded in settings (e.g., my_person_id for the CRM owner)
     - Used in merged_person_ids.json to track person merges
 
-    NEVER delete or rebuild people_entities.json from scratch unless absolutely
+    NEVER delete or rebuild people_entities.db (or .json) from scratch unless absolutely
     necessary. Doing so will:
     - Generate NEW IDs for everyone, breaking all relationships
     - Invalidate hardcoded IDs like my_person_id in settings
     - Break the merge history tracking
 
     If you need to fix data issues, prefer:
-    - Editing individual entities via the API or directly in the JSON
+    - Editing individual entities via the API or directly in the database
     - Using the merge/split functionality to reorganize people
     - Running incremental syncs (which look up existing entities by email/phone/name)
     """
@@ -451,21 +457,31 @@ class PersonEntityStore:
     MERGED_IDS_PATH = Path(__file__).parent.parent.parent / "data" / "merged_person_ids.json"
     # Path to CRM database (shared with link_override)
     CRM_DB_PATH = Path(__file__).parent.parent.parent / "data" / "crm.db"
+    # Minimum time between rolling backups taken by save()
+    BACKUP_INTERVAL_SECONDS = 3600
 
     def __init__(self, storage_path: str = "./data/people_entities.json"):
         """
         Initialize the entity store.
 
         Args:
-            storage_path: Path to JSON file for persistence
+            storage_path: Path to the legacy JSON file; the database lives
+                alongside it with a .db suffix
         """
         self.storage_path = Path(storage_path)
+        self.db_path = self.storage_path.with_suffix(".db")
         self._entities: dict[str, PersonEntity] = {}  # Keyed by entity ID
         self._email_index: dict[str, str] = {}  # email.lower() → entity ID
         self._name_index: dict[str, str] = {}  # canonical_name.lower() → entity ID
         self._phone_index: dict[str, str] = {}  # E.164 phone → entity ID
+        self._name_blocks = NameBlockingIndex()  # Pre-parsed names for fuzzy resolution
         self._merged_ids: dict[str, str] = {}  # secondary_id -> primary_id
         self._blocklist: set[str] = set()  # Blocked emails/phones (lowercase)
+        self._dirty_ids: set[str] = set()  # Added/updated since last save
+        self._deleted_ids: set[str] = set()  # Deleted since last save
+        self._lock = threading.RLock()  # Guards entities, indices and the dirty/deleted sets
+        self._save_lock = threading.Lock()  # Serializes save() so writes land in order
+        self._last_backup_at = float("-inf")
         self._ensure_blocklist_table()
         self._load_blocklist()
         self._load()
@@ -485,7 +501,7 @@ class PersonEntityStore:
     def _ensure_blocklist_table(self) -> None:
         """Create the person_blocklist table if it doesn't exist."""
         self.CRM_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(self.CRM_DB_PATH)
+        conn = get_connection(self.CRM_DB_PATH)
         conn.execute("""
             CREATE TABLE IF NOT EXISTS person_blocklist (
                 identifier TEXT PRIMARY KEY,  -- Email or phone (lowercase)
@@ -501,7 +517,7 @@ class PersonEntityStore:
     def _load_blocklist(self) -> None:
         """Load blocked identifiers from database."""
         try:
-            conn = sqlite3.connect(self.CRM_DB_PATH)
+            conn = get_connection(self.CRM_DB_PATH)
             cursor = conn.execute("SELECT identifier FROM person_blocklist")
             self._blocklist = {row[0] for row in cursor}
             conn.close()
@@ -526,7 +542,7 @@ class PersonEntityStore:
                           person_name: str, reason: str) -> None:
         """Add an identifier to the blocklist."""
         identifier = identifier.lower()
-        conn = sqlite3.connect(self.CRM_DB_PATH)
+        conn = get_connection(self.CRM_DB_PATH)
         conn.execute("""
             INSERT OR REPLACE INTO person_blocklist
             (identifier, identifier_type, person_name, reason, created_at)
@@ -587,29 +603,67 @@ class PersonEntityStore:
             person_id = self._merged_ids[person_id]
         return person_id
 
-    def _load(self) -> None:
-        """Load entities from disk."""
-        if not self.storage_path.exists():
-            logger.info(f"No existing entity store at {self.storage_path}")
-            return
+    def _get_connection(self) -> sqlite3.Connection:
+        """Open the entity database, creating the schema if needed."""
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        # Entities are the source of truth for everything else; keep full fsync
+        conn = get_connection(self.db_path, synchronous="FULL")
+        conn.execute("""
+            CREATE TABLE IF NOT EXISTS person_entities (
+                id TEXT PRIMARY KEY,
+                data TEXT NOT NULL,  -- PersonEntity.to_dict() as JSON
+                updated_at TIMESTAMP NOT NULL
+            )
+        """)
+        return conn
 
-        # Check for empty file
-        if self.storage_path.stat().st_size == 0:
-            logger.info(f"Empty entity store at {self.storage_path}")
+    def _load(self) -> None:
+        """Load entities from disk, importing the legacy JSON file on first run."""
+        if not self.db_path.exists() and not self.storage_path.exists():
+            # Nothing to load yet; save() creates the database
             return
 
+        conn = self._get_connection()
         try:
-            with open(self.storage_path, "r") as f:
-                data = json.load(f)
+            if conn.execute("SELECT COUNT(*) FROM person_entities").fetchone()[0] == 0:
+                self._import_legacy_json(conn)
 
-            for entity_data in data:
-                entity = PersonEntity.from_dict(entity_data)
+            for entity_id, data in conn.execute("SELECT id, data FROM person_entities"):
+                try:
+                    entity = PersonEntity.from_dict(json.loads(data))
+                except Exception as e:
+                    logger.error(f"Skipping unreadable entity {entity_id}: {e}")
+                    continue
                 self._entities[entity.id] = entity
                 self._index_entity(entity)
-
-            logger.info(f"Loaded {len(self._entities)} entities from {self.storage_path}")
         except Exception as e:
             logger.error(f"Failed to load entity store: {e}")
+        finally:
+            conn.close()
+
+        if self._entities:
+            logger.info(f"Loaded {len(self._entities)} entities from {self.db_path}")
+
+    def _import_legacy_json(self, conn: sqlite3.Connection) -> None:
+        """
+        One-time import of people_entities.json into the entity database.
+
+        The JSON file is left in place as a pre-migration backup.
+        """
+        if not self.storage_path.exists() or self.storage_path.stat().st_size == 0:
+            logger.info(f"No existing entity store at {self.storage_path}")
+            return
+
+        with open(self.storage_path, "r") as f:
+            data = json.load(f)
+
+        now = datetime.now(timezone.utc).isoformat()
+        with conn:
+            conn.executemany(
+                "INSERT OR REPLACE INTO person_entities (id, data, updated_at) VALUES (?, ?, ?)",
+                [(entity_data["id"], json.dumps(entity_data), now) for entity_data in data],
+            )
+        logger.info(f"Imported {len(data)} entities from {self.storage_path} into {self.db_path}")
 
     def _index_entity(self, entity: PersonEntity) -> None:
         """Add entity to lookup indices."""
@@ -631,6 +685,9 @@ class PersonEntityStore:
             if phone:
                 self._phone_index[phone] = entity.id
 
+        # Name blocking index (re-indexing keeps the entity's position)
+        self._name_blocks.add(entity)
+
     def _remove_from_indices(self, entity: PersonEntity) -> None:
         """Remove entity from lookup indices."""
         for email in entity.emails:
@@ -649,80 +706,119 @@ class PersonEntityStore:
 
     def save(self) -> None:
         """
-        Persist entities to disk with atomic writes and rolling backups.
+        Persist pending changes to disk.
+
+        Only entities touched through add()/update()/delete() since the last
+        save are written, so a single-person update costs one row upsert
+        instead of rewriting the whole store.
+
+        The pending sets are swapped out under the store lock before writing,
+        so changes made by other threads during the write are kept for the
+        next save; if the write fails, the swapped-out IDs are queued again.
 
         Safety features:
-        1. Writes to temp file first, validates JSON, then atomic rename
-        2. Creates rolling backup before each save (keeps last 5)
-        3. Validates entity count doesn't drastically drop (>50% loss = abort)
+        1. All pending changes commit in a single SQLite transaction (WAL, synchronous=FULL)
+        2. Creates a rolling backup at most once per BACKUP_INTERVAL_SECONDS (keeps last 2)
+        3. Aborts if the save would delete more than 50% of stored entities
         """
-        import shutil
-        import tempfile
-
-        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        data = [entity.to_dict() for entity in self._entities.values()]
+        with self._save_lock:
+            with self._lock:
+                if not self._dirty_ids and not self._deleted_ids:
+                    return
+                dirty_ids, self._dirty_ids = self._dirty_ids, set()
+                deleted_ids, self._deleted_ids = self._deleted_ids, set()
+                now = datetime.now(timezone.utc).isoformat()
+                rows = [
+                    (entity_id, json.dumps(self._entities[entity_id].to_dict()), now)
+                    for entity_id in dirty_ids
+                    if entity_id in self._entities
+                ]
 
-        # Pre-save validation: prevent drastic entity count drops
-        if self.storage_path.exists():
             try:
-                with open(self.storage_path) as f:
-                    old_data = json.load(f)
-                old_count = len(old_data)
-                new_count = len(data)
-                # If we're losing more than 50% of entities, abort (likely corruption)
-                if old_count > 100 and new_count < old_count * 0.5:
+                self._write(rows, deleted_ids)
+            except BaseException:
+                with self._lock:
+                    # A newer add/delete of the same ID wins over the requeued one
+                    self._dirty_ids |= dirty_ids - self._deleted_ids
+                    self._deleted_ids |= deleted_ids - self._dirty_ids
+                raise
+
+    def _write(self, rows: list[tuple[str, str, str]], deleted_ids: set[str]) -> None:
+        """Upsert entity rows and delete removed IDs in one transaction."""
+        conn = self._get_connection()
+        try:
+            # Pre-save validation: prevent drastic entity count drops
+            if deleted_ids:
+                old_count = conn.execute("SELECT COUNT(*) FROM person_entities").fetchone()[0]
+                if old_count > 100 and len(deleted_ids) > old_count * 0.5:
                     raise ValueError(
-                        f"Save aborted: entity count dropped from {old_count} to {new_count} "
+                        f"Save aborted: deleting {len(deleted_ids)} of {old_count} entities "
                         f"(>{50}% loss). This may indicate corruption. Check data before saving."
                     )
-            except json.JSONDecodeError:
-                pass  # Old file was corrupt, OK to overwrite
 
-        # Create rolling backup before save
-        if self.storage_path.exists():
-            try:
-                from config.settings import settings
-                backup_dir = Path(settings.backup_path)
-                backup_dir.mkdir(parents=True, exist_ok=True)
-                timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                backup_path = backup_dir / f"people_entities.{timestamp}.json"
-                shutil.copy(self.storage_path, backup_path)
-                logger.info(f"Created backup: {backup_path}")
-
-                # Keep only last 2 backups
-                backups = sorted(backup_dir.glob("people_entities.*.json"))
-                for old_backup in backups[:-2]:
-                    old_backup.unlink()
-                    logger.debug(f"Removed old backup: {old_backup}")
-            except Exception as e:
-                logger.warning(f"Could not create backup: {e}")
-                # Continue with save - backup failure shouldn't block saves
+            self._maybe_backup(conn)
 
-        # Write to temp file first (atomic write pattern)
-        temp_fd, temp_path = tempfile.mkstemp(
-            suffix=".json", dir=self.storage_path.parent
-        )
-        try:
-            with os.fdopen(temp_fd, "w") as f:
-                json.dump(data, f, indent=2)
-
-            # Validate the temp file: re-read and verify count
-            with open(temp_path) as f:
-                validated_data = json.load(f)
-            if len(validated_data) != len(data):
-                raise ValueError(
-                    f"Write validation failed: expected {len(data)}, got {len(validated_data)}"
+            with conn:
+                conn.executemany("""
+                    INSERT INTO person_entities (id, data, updated_at) VALUES (?, ?, ?)
+                    ON CONFLICT(id) DO UPDATE SET data = excluded.data, updated_at = excluded.updated_at
+                """, rows)
+                conn.executemany(
+                    "DELETE FROM person_entities WHERE id = ?",
+                    [(entity_id,) for entity_id in deleted_ids],
                 )
 
-            # Atomic rename (same filesystem = atomic on POSIX)
-            shutil.move(temp_path, self.storage_path)
-            logger.info(f"Saved {len(data)} entities to {self.storage_path}")
+            logger.info(f"Saved {len(rows)} entities, deleted {len(deleted_ids)} in {self.db_path}")
+        finally:
+            conn.close()
+
+    def _maybe_backup(self, conn: sqlite3.Connection) -> None:
+        """Create a rolling backup if the last one is older than BACKUP_INTERVAL_SECONDS."""
+        if time.monotonic() - self._last_backup_at < self.BACKUP_INTERVAL_SECONDS:
+            return
+        self._last_backup_at = time.monotonic()
+        self.create_backup(conn)
+
+    def create_backup(self, conn: Optional[sqlite3.Connection] = None) -> Optional[Path]:
+        """
+        Create a backup of the entity database.
+
+        Uses LIFEOS_BACKUP_PATH from settings.
+        Keeps only 2 most recent backups.
 
-        except Exception:
-            # Clean up temp file on failure
-            if os.path.exists(temp_path):
-                os.unlink(temp_path)
-            raise
+        Args:
+            conn: Open connection to back up from (opens one if not given)
+
+        Returns:
+            Path to backup file if created, None on failure
+        """
+        try:
+            from config.settings import settings
+            backup_dir = Path(settings.backup_path)
+            backup_dir.mkdir(parents=True, exist_ok=True)
+            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+            backup_path = backup_dir / f"people_entities.{timestamp}.db"
+
+            source = conn or self._get_connection()
+            dest = sqlite3.connect(backup_path)
+            try:
+                source.backup(dest)
+            finally:
+                dest.close()
+                if conn is None:
+                    source.close()
+            logger.info(f"Created backup: {backup_path}")
+
+            # Keep only last 2 backups
+            backups = sorted(backup_dir.glob("people_entities.*.db"))
+            for old_backup in backups[:-2]:
+                old_backup.unlink()
+                logger.debug(f"Removed old backup: {old_backup}")
+            return backup_path
+        except Exception as e:
+            logger.warning(f"Could not create backup: {e}")
+            # Continue with save - backup failure shouldn't block saves
+            return None
 
     def add(self, entity: PersonEntity) -> Optional[PersonEntity]:
         """
@@ -751,8 +847,10 @@ class PersonEntityStore:
 
         # Store a copy to avoid reference issues
         stored = PersonEntity.from_dict(entity.to_dict())
-        self._entities[stored.id] = stored
-        self._index_entity(stored)
+        with self._lock:
+            self._entities[stored.id] = stored
+            self._index_entity(stored)
+            self._mark_dirty(stored.id)
         return stored
 
     def update(self, entity: PersonEntity) -> PersonEntity:
@@ -765,15 +863,17 @@ class PersonEntityStore:
         Returns:
             The updated entity (a copy is stored internally)
         """
-        # Get the OLD stored entity (not the passed-in one which may have been modified)
-        old_entity = self._entities.get(entity.id)
-        if old_entity:
-            self._remove_from_indices(old_entity)
-
         # Store a copy to avoid reference issues
         stored = PersonEntity.from_dict(entity.to_dict())
-        self._entities[stored.id] = stored
-        self._index_entity(stored)
+        with self._lock:
+            # Get the OLD stored entity (not the passed-in one which may have been modified)
+            old_entity = self._entities.get(entity.id)
+            if old_entity:
+                self._remove_from_indices(old_entity)
+
+            self._entities[stored.id] = stored
+            self._index_entity(stored)
+            self._mark_dirty(stored.id)
         return stored
 
     def delete(self, entity_id: str) -> bool:
@@ -786,12 +886,22 @@ class PersonEntityStore:
         Returns:
             True if deleted, False if not found
         """
-        entity = self._entities.pop(entity_id, None)
-        if entity:
-            self._remove_from_indices(entity)
-            return True
+        with self._lock:
+            entity = self._entities.pop(entity_id, None)
+            if entity:
+                self._remove_from_indices(entity)
+                self._name_blocks.remove(entity_id)
+                self._dirty_ids.discard(entity_id)
+                self._deleted_ids.add(entity_id)
+                return True
         return False
 
+    def _mark_dirty(self, entity_id: str) -> None:
+        """Queue an entity to be written on the next save()."""
+        with self._lock:
+            self._dirty_ids.add(entity_id)
+            self._deleted_ids.discard(entity_id)
+
     def get_by_id(self, entity_id: str) -> Optional[PersonEntity]:
         """
         Get entity by ID, following merge chain if needed.
@@ -824,6 +934,24 @@ class PersonEntityStore:
             return self.get_by_id(entity_id)  # Uses canonical ID
         return None
 
+    def get_name_candidates(self, query: NameParts) -> list[IndexedName]:
+        """
+        Get pre-parsed names of the people a fuzzy name lookup could match.
+
+        Applies the same filtering as get_all() (no hidden or merged people)
+        and returns entries in get_all() order.
+
+        Args:
+            query: Parsed, lowercased name being resolved
+
+        Returns:
+            List of IndexedName entries
+        """
+        return [
+            entry for entry in self._name_blocks.candidates(query)
+            if not entry.entity.hidden and entry.entity.id not in self._merged_ids
+        ]
+
     def reload_merged_ids(self) -> None:
         """Reload merged IDs mapping from disk (call after a merge operation)."""
         self._load_merged_ids()
@@ -942,7 +1070,7 @@ def get_person_entity_store(
     Get or create the singleton PersonEntityStore.
 
     Args:
-        storage_path: Path to JSON file for persistence
+        storage_path: Path to the legacy JSON file (database lives alongside it)
 
     Returns:
         PersonEntityStore instance
@@ -32,6 +32,7 @@ from typing import Optional, Any
 from config.settings import settings
 from api.utils.datetime_utils import make_aware as _make_aware
 from api.utils.db_paths import get_crm_db_path
+from api.utils.db_connections import get_connection
 
 logger = logging.getLogger(__name__)
 
@@ -141,7 +142,7 @@ class PersonFactStore:
 
     def _init_db(self):
         """Create the person_facts table if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
@@ -210,7 +211,7 @@ class PersonFactStore:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+        return get_connection(self.db_path)
 
     def add(self, fact: PersonFact) -> PersonFact:
         """Add a new fact."""
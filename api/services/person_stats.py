@@ -4,19 +4,65 @@ Person stats refresh - keeps PersonEntity counts in sync with InteractionStore.
 This module provides the ONLY correct way to update PersonEntity counts.
 All sync scripts MUST call refresh_person_stats() after modifying interactions.
 
+Long-running processes (file watcher, API routes) should instead mark people
+dirty on the shared PersonStatsRefresher, which coalesces IDs in memory and
+refreshes them together: a burst of 200 vault file events becomes one
+aggregate query and one entity store save.
+
 Usage:
     from api.services.person_stats import refresh_person_stats
 
     # At end of sync script:
     affected_person_ids = {'uuid1', 'uuid2', ...}
     refresh_person_stats(list(affected_person_ids))
+
+    # From event handlers (flushed after settings.person_stats_flush_interval):
+    from api.services.person_stats import get_person_stats_refresher
+    get_person_stats_refresher().mark_dirty(affected_person_ids)
 """
+import atexit
 import sqlite3
 import logging
-from typing import Optional
+import threading
+from typing import Iterable, Optional
+
+from api.utils.db_connections import get_connection
 
 logger = logging.getLogger(__name__)
 
+# Person IDs per aggregate query (stays under SQLite's bound-parameter limit)
+_QUERY_BATCH_SIZE = 500
+
+# PersonEntity count field fed by each interaction source_type
+COUNT_FIELD_BY_SOURCE = {
+    'gmail': 'email_count',
+    'calendar': 'meeting_count',
+    'vault': 'mention_count',
+    'granola': 'mention_count',
+    'imessage': 'message_count',
+    'whatsapp': 'message_count',
+    'sms': 'message_count',
+    'slack': 'message_count',
+}
+
+
+def sum_counts_by_field(counts: dict[str, int]) -> dict[str, int]:
+    """
+    Fold per-source interaction counts into PersonEntity count fields.
+
+    Args:
+        counts: Dict mapping source_type to count
+
+    Returns:
+        Dict with email_count, meeting_count, mention_count, message_count
+    """
+    totals = dict.fromkeys(('email_count', 'meeting_count', 'mention_count', 'message_count'), 0)
+    for source_type, count in counts.items():
+        field = COUNT_FIELD_BY_SOURCE.get(source_type)
+        if field:
+            totals[field] += count
+    return totals
+
 
 def refresh_person_stats(person_ids: Optional[list[str]] = None, save: bool = True) -> dict:
     """
@@ -36,7 +82,7 @@ def refresh_person_stats(person_ids: Optional[list[str]] = None, save: bool = Tr
     from api.services.interaction_store import get_interaction_db_path
 
     store = get_person_entity_store()
-    conn = sqlite3.connect(get_interaction_db_path())
+    conn = get_connection(get_interaction_db_path())
 
     stats = {'updated': 0, 'total_interactions': 0}
 
@@ -77,18 +123,23 @@ def refresh_person_stats(person_ids: Optional[list[str]] = None, save: bool = Tr
                     stats['updated'] += 1
 
     else:
-        # Targeted refresh - only specified people
-        for person_id in person_ids:
-            cursor = conn.execute("""
-                SELECT source_type, COUNT(*) as cnt
+        # Targeted refresh - one aggregate query per batch of people
+        person_ids = list(dict.fromkeys(person_ids))
+        person_counts = {person_id: {} for person_id in person_ids}
+        for i in range(0, len(person_ids), _QUERY_BATCH_SIZE):
+            batch = person_ids[i:i + _QUERY_BATCH_SIZE]
+            placeholders = ",".join("?" * len(batch))
+            cursor = conn.execute(f"""
+                SELECT person_id, source_type, COUNT(*) as cnt
                 FROM interactions
-                WHERE person_id = ?
-                GROUP BY source_type
-            """, (person_id,))
-
-            counts = {row[0]: row[1] for row in cursor}
-            stats['total_interactions'] += sum(counts.values())
+                WHERE person_id IN ({placeholders})
+                GROUP BY person_id, source_type
+            """, batch)
+            for pid, source_type, count in cursor:
+                person_counts[pid][source_type] = count
+                stats['total_interactions'] += count
 
+        for person_id, counts in person_counts.items():
             entity = store.get_by_id(person_id)
             if entity:
                 _apply_counts_to_entity(entity, counts)
@@ -98,7 +149,7 @@ def refresh_person_stats(person_ids: Optional[list[str]] = None, save: bool = Tr
     conn.close()
 
     if save:
-        store.save()  # Uses file locking
+        store.save()  # Writes only the updated entities
 
     if stats['updated'] > 0:
         logger.info(f"Refreshed stats for {stats['updated']} people ({stats['total_interactions']} interactions)")
@@ -106,6 +157,115 @@ def refresh_person_stats(person_ids: Optional[list[str]] = None, save: bool = Tr
     return stats
 
 
+class PersonStatsRefresher:
+    """
+    Write-behind coalescing of person stats refreshes.
+
+    Callers mark person IDs dirty; the first mark starts a timer and every
+    ID marked before it fires is refreshed in a single refresh_person_stats()
+    call. flush() refreshes pending IDs immediately (end of sync, shutdown).
+    """
+
+    def __init__(self, flush_interval: Optional[float] = None):
+        """
+        Initialize the refresher.
+
+        Args:
+            flush_interval: Seconds between the first dirty mark and the flush
+                (default: settings.person_stats_flush_interval)
+        """
+        if flush_interval is None:
+            from config.settings import settings
+            flush_interval = settings.person_stats_flush_interval
+        self.flush_interval = flush_interval
+        self._dirty: set[str] = set()
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+        # Serializes flushes so a timer flush and an explicit flush don't overlap
+        self._flush_lock = threading.Lock()
+
+    def mark_dirty(self, person_ids: Iterable[str]) -> None:
+        """
+        Queue people for a stats refresh.
+
+        Args:
+            person_ids: IDs of people whose interactions changed
+        """
+        with self._lock:
+            self._dirty.update(pid for pid in person_ids if pid)
+            if not self._dirty or self._timer is not None:
+                return
+            if self.flush_interval <= 0:
+                flush_now = True
+            else:
+                flush_now = False
+                self._timer = threading.Timer(self.flush_interval, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if flush_now:
+            self.flush()
+
+    def pending(self) -> int:
+        """Number of people waiting for a refresh."""
+        with self._lock:
+            return len(self._dirty)
+
+    def flush(self) -> dict:
+        """
+        Refresh all pending people now.
+
+        Returns:
+            Stats dict from refresh_person_stats (empty counts if nothing pending)
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                person_ids = list(self._dirty)
+                self._dirty.clear()
+
+            if not person_ids:
+                return {'updated': 0, 'total_interactions': 0}
+
+            try:
+                return refresh_person_stats(person_ids)
+            except Exception as e:
+                logger.error(f"Person stats flush failed for {len(person_ids)} people: {e}")
+                # Re-queue so the next flush retries them
+                with self._lock:
+                    self._dirty.update(person_ids)
+                return {'updated': 0, 'total_interactions': 0}
+
+
+_refresher: Optional[PersonStatsRefresher] = None
+_refresher_lock = threading.Lock()
+
+
+def get_person_stats_refresher() -> PersonStatsRefresher:
+    """Get or create the shared PersonStatsRefresher (flushed at interpreter exit)."""
+    global _refresher
+    if _refresher is None:
+        with _refresher_lock:
+            if _refresher is None:
+                _refresher = PersonStatsRefresher()
+                atexit.register(_refresher.flush)
+    return _refresher
+
+
+def reset_person_stats_refresher() -> None:
+    """Discard the shared refresher and any pending refresh (for testing)."""
+    global _refresher
+    with _refresher_lock:
+        if _refresher is not None:
+            atexit.unregister(_refresher.flush)
+            with _refresher._lock:
+                if _refresher._timer is not None:
+                    _refresher._timer.cancel()
+                _refresher._dirty.clear()
+        _refresher = None
+
+
 def _apply_counts_to_entity(entity, counts: dict[str, int]) -> None:
     """
     Apply interaction counts to a PersonEntity.
@@ -116,15 +276,8 @@ def _apply_counts_to_entity(entity, counts: dict[str, int]) -> None:
     - vault, granola -> mention_count
     - imessage, whatsapp, sms, slack -> message_count
     """
-    entity.email_count = counts.get('gmail', 0)
-    entity.meeting_count = counts.get('calendar', 0)
-    entity.mention_count = counts.get('vault', 0) + counts.get('granola', 0)
-    entity.message_count = (
-        counts.get('imessage', 0) +
-        counts.get('whatsapp', 0) +
-        counts.get('sms', 0) +
-        counts.get('slack', 0)
-    )
+    for field, total in sum_counts_by_field(counts).items():
+        setattr(entity, field, total)
 
     # Update sources list to include any source types with interactions
     interaction_sources = set(counts.keys())
@@ -148,7 +301,7 @@ def verify_person_stats(fix: bool = False) -> dict:
     from api.services.interaction_store import get_interaction_db_path
 
     store = get_person_entity_store()
-    conn = sqlite3.connect(get_interaction_db_path())
+    conn = get_connection(get_interaction_db_path())
 
     discrepancies = {}
 
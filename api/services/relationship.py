@@ -17,6 +17,7 @@ from typing import Optional
 
 from api.services.source_entity import get_crm_db_path
 from api.utils.datetime_utils import make_aware as _make_aware
+from api.utils.db_connections import get_connection
 
 logger = logging.getLogger(__name__)
 
@@ -27,6 +28,21 @@ TYPE_FRIEND = "friend"
 TYPE_FAMILY = "family"
 TYPE_INFERRED = "inferred"  # Discovered through shared contexts
 
+# Per-source columns a discovery pass may overwrite in upsert_many()
+_SOURCE_COUNT_FIELDS = {
+    "shared_events_count",
+    "shared_threads_count",
+    "shared_messages_count",
+    "shared_whatsapp_count",
+    "shared_slack_count",
+    "shared_phone_calls_count",
+    "shared_photos_count",
+    "is_linkedin_connection",
+}
+
+# Pairs per read-back query (2 bound parameters each)
+_PAIR_BATCH_SIZE = 400
+
 
 @dataclass
 class Relationship:
@@ -321,7 +337,7 @@ class RelationshipStore:
 
     def _init_db(self):
         """Create database tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS relationships (
@@ -381,7 +397,7 @@ class RelationshipStore:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+        return get_connection(self.db_path)
 
     def _normalize_ids(self, person_a_id: str, person_b_id: str) -> tuple[str, str]:
         """Ensure person_a_id < person_b_id for uniqueness."""
@@ -464,6 +480,105 @@ class RelationshipStore:
 
         return self.add(relationship), True
 
+    def upsert_many(
+        self,
+        relationships: list[Relationship],
+        context: str,
+        count_field: Optional[str] = None,
+    ) -> list[Relationship]:
+        """
+        Merge relationships discovered from one source in a single transaction.
+
+        New pairs are inserted as given. For existing pairs, count_field is
+        overwritten with the new value, first/last seen are widened (earliest
+        first_seen_together, latest last_seen_together; NULLs never replace a
+        date) and context is appended to shared_contexts if missing.
+
+        Args:
+            relationships: Relationships to merge (one per pair)
+            context: Shared context of the source (e.g. "calendar")
+            count_field: Per-source column to overwrite, or None to only merge
+                contexts and dates
+
+        Returns:
+            The stored relationships for all given pairs
+        """
+        if count_field is not None and count_field not in _SOURCE_COUNT_FIELDS:
+            raise ValueError(f"Unknown relationship count field: {count_field}")
+        if not relationships:
+            return []
+
+        count_update = f"{count_field} = excluded.{count_field}," if count_field else ""
+        now = datetime.now(timezone.utc).isoformat()
+
+        conn = self._get_connection()
+        try:
+            conn.executemany(f"""
+                INSERT INTO relationships
+                (id, person_a_id, person_b_id, relationship_type, shared_contexts,
+                 shared_events_count, shared_threads_count, first_seen_together,
+                 last_seen_together, created_at, updated_at,
+                 shared_messages_count, shared_whatsapp_count, shared_slack_count,
+                 is_linkedin_connection, shared_phone_calls_count, shared_photos_count)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(person_a_id, person_b_id) DO UPDATE SET
+                    {count_update}
+                    first_seen_together = CASE
+                        WHEN first_seen_together IS NULL
+                          OR julianday(excluded.first_seen_together) < julianday(first_seen_together)
+                        THEN excluded.first_seen_together ELSE first_seen_together END,
+                    last_seen_together = CASE
+                        WHEN last_seen_together IS NULL
+                          OR julianday(excluded.last_seen_together) > julianday(last_seen_together)
+                        THEN excluded.last_seen_together ELSE last_seen_together END,
+                    shared_contexts = CASE
+                        WHEN EXISTS (SELECT 1 FROM json_each(COALESCE(shared_contexts, '[]')) WHERE value = ?)
+                        THEN shared_contexts
+                        ELSE json_insert(COALESCE(shared_contexts, '[]'), '$[#]', ?) END,
+                    updated_at = ?
+            """, [
+                (
+                    rel.id,
+                    rel.person_a_id,
+                    rel.person_b_id,
+                    rel.relationship_type,
+                    json.dumps(rel.shared_contexts),
+                    rel.shared_events_count,
+                    rel.shared_threads_count,
+                    rel.first_seen_together.isoformat() if rel.first_seen_together else None,
+                    rel.last_seen_together.isoformat() if rel.last_seen_together else None,
+                    rel.created_at.isoformat(),
+                    rel.updated_at.isoformat(),
+                    rel.shared_messages_count,
+                    rel.shared_whatsapp_count,
+                    rel.shared_slack_count,
+                    1 if rel.is_linkedin_connection else 0,
+                    rel.shared_phone_calls_count,
+                    rel.shared_photos_count,
+                    context,
+                    context,
+                    now,
+                )
+                for rel in relationships
+            ])
+
+            # Read back the merged rows (2 parameters per pair)
+            pairs = list(dict.fromkeys((rel.person_a_id, rel.person_b_id) for rel in relationships))
+            results = []
+            for i in range(0, len(pairs), _PAIR_BATCH_SIZE):
+                batch = pairs[i:i + _PAIR_BATCH_SIZE]
+                values = ",".join(["(?, ?)"] * len(batch))
+                cursor = conn.execute(
+                    f"SELECT * FROM relationships WHERE (person_a_id, person_b_id) IN (VALUES {values})",
+                    [pid for pair in batch for pid in pair],
+                )
+                results.extend(Relationship.from_row(row) for row in cursor.fetchall())
+
+            conn.commit()
+            return results
+        finally:
+            conn.close()
+
     def update(self, relationship: Relationship) -> Relationship:
         """
         Update an existing relationship.
@@ -13,7 +13,7 @@ from datetime import datetime, timedelta, timezone
 from typing import Optional
 
 from api.services.person_entity import PersonEntity, get_person_entity_store
-from api.services.interaction_store import get_interaction_store, get_interaction_db_path
+from api.services.interaction_store import get_interaction_store, get_interaction_db_path, to_epoch, from_epoch
 from api.services.relationship import (
     Relationship,
     get_relationship_store,
@@ -103,10 +103,10 @@ def discover_from_calendar(
         FROM interactions
         WHERE source_type = 'calendar'
           AND source_id LIKE '%:%'
-          AND timestamp >= ?
+          AND ts_epoch >= ?
     """
 
-    cursor = conn.execute(query, (cutoff.isoformat(),))
+    cursor = conn.execute(query, (to_epoch(cutoff),))
 
     # Group by event, resolving participants to person IDs
     # Also track event timestamps
@@ -165,33 +165,19 @@ def discover_from_calendar(
             # Cap last_seen at today to exclude future events
             last_seen = min(max(event_dates), now) if event_dates else now
 
-            existing = relationship_store.get_between(person_a_id, person_b_id)
-
-            if existing:
-                # Update existing relationship
-                existing.shared_events_count = len(events)
-                # Extend date range if needed
-                if not existing.first_seen_together or _datetime_lt(first_seen, existing.first_seen_together):
-                    existing.first_seen_together = first_seen
-                if not existing.last_seen_together or _datetime_gt(last_seen, existing.last_seen_together):
-                    existing.last_seen_together = last_seen
-                if "calendar" not in existing.shared_contexts:
-                    existing.shared_contexts.append("calendar")
-                relationship_store.update(existing)
-                relationships.append(existing)
-            else:
-                # Create new relationship
-                rel = Relationship(
-                    person_a_id=person_a_id,
-                    person_b_id=person_b_id,
-                    relationship_type=TYPE_COWORKER,
-                    shared_events_count=len(events),
-                    first_seen_together=first_seen,
-                    last_seen_together=last_seen,
-                    shared_contexts=["calendar"],
-                )
-                relationship_store.add(rel)
-                relationships.append(rel)
+            relationships.append(Relationship(
+                person_a_id=person_a_id,
+                person_b_id=person_b_id,
+                relationship_type=TYPE_COWORKER,
+                shared_events_count=len(events),
+                first_seen_together=first_seen,
+                last_seen_together=last_seen,
+                shared_contexts=["calendar"],
+            ))
+
+    relationships = relationship_store.upsert_many(
+        relationships, context="calendar", count_field="shared_events_count"
+    )
 
     logger.info(f"Discovered {len(relationships)} relationships from calendar")
     return relationships
@@ -236,18 +222,18 @@ def discover_from_calendar_direct(
         SELECT
             person_id,
             COUNT(DISTINCT substr(source_id, 1, instr(source_id, ':') - 1)) as event_count,
-            MIN(timestamp) as first_event,
-            MAX(timestamp) as last_event
+            MIN(ts_epoch) as first_event,
+            MAX(ts_epoch) as last_event
         FROM interactions
         WHERE source_type = 'calendar'
-          AND timestamp >= ?
+          AND ts_epoch >= ?
           AND person_id IS NOT NULL
           AND person_id != ?
         GROUP BY person_id
         HAVING COUNT(DISTINCT substr(source_id, 1, instr(source_id, ':') - 1)) >= ?
     """
 
-    cursor = conn.execute(query, (cutoff.isoformat(), my_person_id, min_events))
+    cursor = conn.execute(query, (to_epoch(cutoff), my_person_id, min_events))
 
     relationships = []
     for row in cursor:
@@ -258,8 +244,8 @@ def discover_from_calendar_direct(
 
         # Parse dates, capping last_seen at today to exclude future events
         now = datetime.now(timezone.utc)
-        first_seen = datetime.fromisoformat(first_event.replace('Z', '+00:00')) if first_event else now
-        last_seen_raw = datetime.fromisoformat(last_event.replace('Z', '+00:00')) if last_event else now
+        first_seen = from_epoch(first_event) if first_event is not None else now
+        last_seen_raw = from_epoch(last_event) if last_event is not None else now
         last_seen = min(last_seen_raw, now)
 
         # Normalize pair order
@@ -268,33 +254,22 @@ def discover_from_calendar_direct(
         else:
             person_a_id, person_b_id = other_person_id, my_person_id
 
-        existing = relationship_store.get_between(person_a_id, person_b_id)
-
-        if existing:
-            existing.shared_events_count = event_count
-            if not existing.first_seen_together or _datetime_lt(first_seen, existing.first_seen_together):
-                existing.first_seen_together = first_seen
-            if not existing.last_seen_together or _datetime_gt(last_seen, existing.last_seen_together):
-                existing.last_seen_together = last_seen
-            if "calendar" not in existing.shared_contexts:
-                existing.shared_contexts.append("calendar")
-            relationship_store.update(existing)
-            relationships.append(existing)
-        else:
-            rel = Relationship(
-                person_a_id=person_a_id,
-                person_b_id=person_b_id,
-                relationship_type=TYPE_INFERRED,
-                shared_events_count=event_count,
-                first_seen_together=first_seen,
-                last_seen_together=last_seen,
-                shared_contexts=["calendar"],
-            )
-            relationship_store.add(rel)
-            relationships.append(rel)
+        relationships.append(Relationship(
+            person_a_id=person_a_id,
+            person_b_id=person_b_id,
+            relationship_type=TYPE_INFERRED,
+            shared_events_count=event_count,
+            first_seen_together=first_seen,
+            last_seen_together=last_seen,
+            shared_contexts=["calendar"],
+        ))
 
     conn.close()
 
+    relationships = relationship_store.upsert_many(
+        relationships, context="calendar", count_field="shared_events_count"
+    )
+
     logger.info(f"Discovered/updated {len(relationships)} relationships from calendar (direct)")
     return relationships
 
@@ -341,12 +316,12 @@ def discover_from_email_threads(
         SELECT title, person_id, timestamp
         FROM interactions
         WHERE source_type = 'gmail'
-          AND timestamp >= ?
+          AND ts_epoch >= ?
           AND title IS NOT NULL
           AND title != ''
     """
 
-    cursor = conn.execute(query, (cutoff.isoformat(),))
+    cursor = conn.execute(query, (to_epoch(cutoff),))
 
     # Build thread -> participants mapping and track dates
     # IMPORTANT: Include my_person_id in every thread since this is MY gmail
@@ -396,30 +371,19 @@ def discover_from_email_threads(
             first_seen = min(all_dates) if all_dates else None
             last_seen = max(all_dates) if all_dates else None
 
-            existing = relationship_store.get_between(person_a_id, person_b_id)
-
-            if existing:
-                existing.shared_threads_count = len(threads)
-                if not existing.first_seen_together or _datetime_lt(first_seen, existing.first_seen_together):
-                    existing.first_seen_together = first_seen
-                if not existing.last_seen_together or _datetime_gt(last_seen, existing.last_seen_together):
-                    existing.last_seen_together = last_seen
-                if "gmail" not in existing.shared_contexts:
-                    existing.shared_contexts.append("gmail")
-                relationship_store.update(existing)
-                relationships.append(existing)
-            else:
-                rel = Relationship(
-                    person_a_id=person_a_id,
-                    person_b_id=person_b_id,
-                    relationship_type=TYPE_INFERRED,
-                    shared_threads_count=len(threads),
-                    first_seen_together=first_seen,
-                    last_seen_together=last_seen,
-                    shared_contexts=["gmail"],
-                )
-                relationship_store.add(rel)
-                relationships.append(rel)
+            relationships.append(Relationship(
+                person_a_id=person_a_id,
+                person_b_id=person_b_id,
+                relationship_type=TYPE_INFERRED,
+                shared_threads_count=len(threads),
+                first_seen_together=first_seen,
+                last_seen_together=last_seen,
+                shared_contexts=["gmail"],
+            ))
+
+    relationships = relationship_store.upsert_many(
+        relationships, context="gmail", count_field="shared_threads_count"
+    )
 
     logger.info(f"Discovered {len(relationships)} relationships from email")
     return relationships
@@ -441,22 +405,31 @@ def discover_from_vault_comments(
     Returns:
         List of discovered relationships
     """
-    interaction_store = get_interaction_store()
+    import sqlite3
+
     relationship_store = get_relationship_store()
     person_store = get_person_entity_store()
+    known_ids = {person.id for person in person_store.get_all()}
+
+    cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
+
+    # Group vault interactions by note (source_id = file path) in one scan
+    conn = sqlite3.connect(get_interaction_db_path())
+    cursor = conn.execute("""
+        SELECT DISTINCT source_id, person_id
+        FROM interactions
+        WHERE source_type = 'vault'
+          AND ts_epoch >= ?
+          AND source_id IS NOT NULL AND source_id != ''
+          AND person_id IS NOT NULL
+    """, (to_epoch(cutoff),))
 
-    # Group vault interactions by note (source_id = file path)
     note_mentions: dict[str, list[str]] = defaultdict(list)
+    for source_id, person_id in cursor:
+        if person_id in known_ids:
+            note_mentions[source_id].append(person_id)
 
-    for person in person_store.get_all():
-        interactions = interaction_store.get_for_person(
-            person.id,
-            days_back=days_back,
-            source_type="vault",
-        )
-        for interaction in interactions:
-            if interaction.source_id:
-                note_mentions[interaction.source_id].append(person.id)
+    conn.close()
 
     # Find pairs who are mentioned together
     pair_notes: dict[tuple[str, str], list[str]] = defaultdict(list)
@@ -474,28 +447,18 @@ def discover_from_vault_comments(
     relationships = []
     for (person_a_id, person_b_id), notes in pair_notes.items():
         if len(notes) >= min_co_mentions:
-            existing = relationship_store.get_between(person_a_id, person_b_id)
-
-            if existing:
-                # Don't overwrite last_seen_together - vault notes don't have interaction timestamps
-                # Only update contexts
-                if "vault" not in existing.shared_contexts:
-                    existing.shared_contexts.append("vault")
-                    relationship_store.update(existing)
-                relationships.append(existing)
-            else:
-                # Vault notes don't have interaction timestamps,
-                # so we leave first_seen_together and last_seen_together as None
-                rel = Relationship(
-                    person_a_id=person_a_id,
-                    person_b_id=person_b_id,
-                    relationship_type=TYPE_INFERRED,
-                    first_seen_together=None,
-                    last_seen_together=None,
-                    shared_contexts=["vault"],
-                )
-                relationship_store.add(rel)
-                relationships.append(rel)
+            # Vault notes don't have interaction timestamps, so dates stay None
+            # (existing relationships only gain the context)
+            relationships.append(Relationship(
+                person_a_id=person_a_id,
+                person_b_id=person_b_id,
+                relationship_type=TYPE_INFERRED,
+                first_seen_together=None,
+                last_seen_together=None,
+                shared_contexts=["vault"],
+            ))
+
+    relationships = relationship_store.upsert_many(relationships, context="vault")
 
     logger.info(f"Discovered {len(relationships)} relationships from vault")
     return relationships
@@ -537,11 +500,11 @@ def discover_from_messaging_groups(
         FROM interactions
         WHERE source_type = 'whatsapp'
           AND title LIKE 'WhatsApp group:%'
-          AND timestamp >= ?
+          AND ts_epoch >= ?
         GROUP BY title, person_id
     """
 
-    cursor = conn.execute(query, (cutoff.isoformat(),))
+    cursor = conn.execute(query, (to_epoch(cutoff),))
 
     # Build group -> participants mapping
     group_participants: dict[str, set[str]] = defaultdict(set)
@@ -570,28 +533,18 @@ def discover_from_messaging_groups(
     relationships = []
     for (person_a_id, person_b_id), groups in pair_groups.items():
         if len(groups) >= min_shared_groups:
-            existing = relationship_store.get_between(person_a_id, person_b_id)
-
-            if existing:
-                # Don't overwrite last_seen_together - group membership doesn't have interaction timestamps
-                # Only update contexts
-                if "whatsapp" not in existing.shared_contexts:
-                    existing.shared_contexts.append("whatsapp")
-                    relationship_store.update(existing)
-                relationships.append(existing)
-            else:
-                # Group membership doesn't have interaction timestamps,
-                # so we leave first_seen_together and last_seen_together as None
-                rel = Relationship(
-                    person_a_id=person_a_id,
-                    person_b_id=person_b_id,
-                    relationship_type=TYPE_INFERRED,
-                    first_seen_together=None,
-                    last_seen_together=None,
-                    shared_contexts=["whatsapp"],
-                )
-                relationship_store.add(rel)
-                relationships.append(rel)
+            # Group membership doesn't have interaction timestamps, so dates
+            # stay None (existing relationships only gain the context)
+            relationships.append(Relationship(
+                person_a_id=person_a_id,
+                person_b_id=person_b_id,
+                relationship_type=TYPE_INFERRED,
+                first_seen_together=None,
+                last_seen_together=None,
+                shared_contexts=["whatsapp"],
+            ))
+
+    relationships = relationship_store.upsert_many(relationships, context="whatsapp")
 
     logger.info(f"Discovered {len(relationships)} relationships from WhatsApp groups")
     return relationships
@@ -635,18 +588,18 @@ def discover_from_imessage_direct(
         SELECT
             person_id,
             COUNT(*) as message_count,
-            MIN(timestamp) as first_message,
-            MAX(timestamp) as last_message
+            MIN(ts_epoch) as first_message,
+            MAX(ts_epoch) as last_message
         FROM interactions
         WHERE source_type IN ('imessage', 'sms')
-          AND timestamp >= ?
+          AND ts_epoch >= ?
           AND person_id IS NOT NULL
           AND person_id != ?
         GROUP BY person_id
         HAVING COUNT(*) >= ?
     """
 
-    cursor = conn.execute(query, (cutoff.isoformat(), my_person_id, min_messages))
+    cursor = conn.execute(query, (to_epoch(cutoff), my_person_id, min_messages))
 
     relationships = []
     for row in cursor:
@@ -656,8 +609,8 @@ def discover_from_imessage_direct(
         last_message = row['last_message']
 
         # Parse dates - use None if no date, never default to today
-        first_seen = datetime.fromisoformat(first_message.replace('Z', '+00:00')) if first_message else None
-        last_seen = datetime.fromisoformat(last_message.replace('Z', '+00:00')) if last_message else None
+        first_seen = from_epoch(first_message)
+        last_seen = from_epoch(last_message)
 
         # Normalize pair order (my_person_id vs other)
         if my_person_id < other_person_id:
@@ -665,36 +618,22 @@ def discover_from_imessage_direct(
         else:
             person_a_id, person_b_id = other_person_id, my_person_id
 
-        existing = relationship_store.get_between(person_a_id, person_b_id)
-
-        if existing:
-            # Update existing relationship
-            existing.shared_messages_count = message_count
-            # Update dates only if they extend the range
-            if not existing.first_seen_together or _datetime_lt(first_seen, existing.first_seen_together):
-                existing.first_seen_together = first_seen
-            if not existing.last_seen_together or _datetime_gt(last_seen, existing.last_seen_together):
-                existing.last_seen_together = last_seen
-            if "imessage" not in existing.shared_contexts:
-                existing.shared_contexts.append("imessage")
-            relationship_store.update(existing)
-            relationships.append(existing)
-        else:
-            # Create new relationship
-            rel = Relationship(
-                person_a_id=person_a_id,
-                person_b_id=person_b_id,
-                relationship_type=TYPE_INFERRED,
-                shared_messages_count=message_count,
-                first_seen_together=first_seen,
-                last_seen_together=last_seen,
-                shared_contexts=["imessage"],
-            )
-            relationship_store.add(rel)
-            relationships.append(rel)
+        relationships.append(Relationship(
+            person_a_id=person_a_id,
+            person_b_id=person_b_id,
+            relationship_type=TYPE_INFERRED,
+            shared_messages_count=message_count,
+            first_seen_together=first_seen,
+            last_seen_together=last_seen,
+            shared_contexts=["imessage"],
+        ))
 
     conn.close()
 
+    relationships = relationship_store.upsert_many(
+        relationships, context="imessage", count_field="shared_messages_count"
+    )
+
     logger.info(f"Discovered/updated {len(relationships)} relationships from iMessage")
     return relationships
 
@@ -736,19 +675,19 @@ def discover_from_whatsapp_direct(
         SELECT
             person_id,
             COUNT(*) as message_count,
-            MIN(timestamp) as first_message,
-            MAX(timestamp) as last_message
+            MIN(ts_epoch) as first_message,
+            MAX(ts_epoch) as last_message
         FROM interactions
         WHERE source_type = 'whatsapp'
           AND title NOT LIKE 'WhatsApp group:%'
-          AND timestamp >= ?
+          AND ts_epoch >= ?
           AND person_id IS NOT NULL
           AND person_id != ?
         GROUP BY person_id
         HAVING COUNT(*) >= ?
     """
 
-    cursor = conn.execute(query, (cutoff.isoformat(), my_person_id, min_messages))
+    cursor = conn.execute(query, (to_epoch(cutoff), my_person_id, min_messages))
 
     relationships = []
     for row in cursor:
@@ -758,8 +697,8 @@ def discover_from_whatsapp_direct(
         last_message = row['last_message']
 
         # Parse dates - use None if no date, never default to today
-        first_seen = datetime.fromisoformat(first_message.replace('Z', '+00:00')) if first_message else None
-        last_seen = datetime.fromisoformat(last_message.replace('Z', '+00:00')) if last_message else None
+        first_seen = from_epoch(first_message)
+        last_seen = from_epoch(last_message)
 
         # Normalize pair order
         if my_person_id < other_person_id:
@@ -767,33 +706,22 @@ def discover_from_whatsapp_direct(
         else:
             person_a_id, person_b_id = other_person_id, my_person_id
 
-        existing = relationship_store.get_between(person_a_id, person_b_id)
-
-        if existing:
-            existing.shared_whatsapp_count = message_count
-            if not existing.first_seen_together or _datetime_lt(first_seen, existing.first_seen_together):
-                existing.first_seen_together = first_seen
-            if not existing.last_seen_together or _datetime_gt(last_seen, existing.last_seen_together):
-                existing.last_seen_together = last_seen
-            if "whatsapp" not in existing.shared_contexts:
-                existing.shared_contexts.append("whatsapp")
-            relationship_store.update(existing)
-            relationships.append(existing)
-        else:
-            rel = Relationship(
-                person_a_id=person_a_id,
-                person_b_id=person_b_id,
-                relationship_type=TYPE_INFERRED,
-                shared_whatsapp_count=message_count,
-                first_seen_together=first_seen,
-                last_seen_together=last_seen,
-                shared_contexts=["whatsapp"],
-            )
-            relationship_store.add(rel)
-            relationships.append(rel)
+        relationships.append(Relationship(
+            person_a_id=person_a_id,
+            person_b_id=person_b_id,
+            relationship_type=TYPE_INFERRED,
+            shared_whatsapp_count=message_count,
+            first_seen_together=first_seen,
+            last_seen_together=last_seen,
+            shared_contexts=["whatsapp"],
+        ))
 
     conn.close()
 
+    relationships = relationship_store.upsert_many(
+        relationships, context="whatsapp", count_field="shared_whatsapp_count"
+    )
+
     logger.info(f"Discovered/updated {len(relationships)} relationships from WhatsApp")
     return relationships
 
@@ -836,18 +764,18 @@ def discover_from_phone_calls(
         SELECT
             person_id,
             COUNT(*) as call_count,
-            MIN(timestamp) as first_call,
-            MAX(timestamp) as last_call
+            MIN(ts_epoch) as first_call,
+            MAX(ts_epoch) as last_call
         FROM interactions
         WHERE source_type = 'phone'
-          AND timestamp >= ?
+          AND ts_epoch >= ?
           AND person_id IS NOT NULL
           AND person_id != ?
         GROUP BY person_id
         HAVING COUNT(*) >= ?
     """
 
-    cursor = conn.execute(query, (cutoff.isoformat(), my_person_id, min_calls))
+    cursor = conn.execute(query, (to_epoch(cutoff), my_person_id, min_calls))
 
     relationships = []
     for row in cursor:
@@ -857,8 +785,8 @@ def discover_from_phone_calls(
         last_call = row['last_call']
 
         # Parse dates - use None if no date, never default to today
-        first_seen = datetime.fromisoformat(first_call.replace('Z', '+00:00')) if first_call else None
-        last_seen = datetime.fromisoformat(last_call.replace('Z', '+00:00')) if last_call else None
+        first_seen = from_epoch(first_call)
+        last_seen = from_epoch(last_call)
 
         # Normalize pair order
         if my_person_id < other_person_id:
@@ -866,33 +794,22 @@ def discover_from_phone_calls(
         else:
             person_a_id, person_b_id = other_person_id, my_person_id
 
-        existing = relationship_store.get_between(person_a_id, person_b_id)
-
-        if existing:
-            existing.shared_phone_calls_count = call_count
-            if not existing.first_seen_together or _datetime_lt(first_seen, existing.first_seen_together):
-                existing.first_seen_together = first_seen
-            if not existing.last_seen_together or _datetime_gt(last_seen, existing.last_seen_together):
-                existing.last_seen_together = last_seen
-            if "phone" not in existing.shared_contexts:
-                existing.shared_contexts.append("phone")
-            relationship_store.update(existing)
-            relationships.append(existing)
-        else:
-            rel = Relationship(
-                person_a_id=person_a_id,
-                person_b_id=person_b_id,
-                relationship_type=TYPE_INFERRED,
-                shared_phone_calls_count=call_count,
-                first_seen_together=first_seen,
-                last_seen_together=last_seen,
-                shared_contexts=["phone"],
-            )
-            relationship_store.add(rel)
-            relationships.append(rel)
+        relationships.append(Relationship(
+            person_a_id=person_a_id,
+            person_b_id=person_b_id,
+            relationship_type=TYPE_INFERRED,
+            shared_phone_calls_count=call_count,
+            first_seen_together=first_seen,
+            last_seen_together=last_seen,
+            shared_contexts=["phone"],
+        ))
 
     conn.close()
 
+    relationships = relationship_store.upsert_many(
+        relationships, context="phone", count_field="shared_phone_calls_count"
+    )
+
     logger.info(f"Discovered/updated {len(relationships)} relationships from phone calls")
     return relationships
 
@@ -992,11 +909,10 @@ def discover_from_slack_direct(
 
     logger.info(f"Found {len(slack_to_person)} Slack users mapped to people ({name_matched} by name)")
 
-    # Query ChromaDB for Slack messages
+    # Query the vector store for Slack messages
     try:
-        import chromadb
-        client = chromadb.HttpClient(host='localhost', port=8001)
-        collection = client.get_collection('lifeos_slack')
+        from api.services.vectorstore import VectorStore
+        collection = VectorStore(collection_name='lifeos_slack')._collection
     except Exception as e:
         logger.warning(f"Could not connect to ChromaDB for Slack: {e}")
         return []
@@ -1068,30 +984,19 @@ def discover_from_slack_direct(
         else:
             person_a_id, person_b_id = other_person_id, my_person_id
 
-        existing = relationship_store.get_between(person_a_id, person_b_id)
-
-        if existing:
-            existing.shared_slack_count = message_count
-            if not existing.first_seen_together or _datetime_lt(first_seen, existing.first_seen_together):
-                existing.first_seen_together = first_seen
-            if not existing.last_seen_together or _datetime_gt(last_seen, existing.last_seen_together):
-                existing.last_seen_together = last_seen
-            if "slack" not in existing.shared_contexts:
-                existing.shared_contexts.append("slack")
-            relationship_store.update(existing)
-            relationships.append(existing)
-        else:
-            rel = Relationship(
-                person_a_id=person_a_id,
-                person_b_id=person_b_id,
-                relationship_type=TYPE_INFERRED,
-                shared_slack_count=message_count,
-                first_seen_together=first_seen,
-                last_seen_together=last_seen,
-                shared_contexts=["slack"],
-            )
-            relationship_store.add(rel)
-            relationships.append(rel)
+        relationships.append(Relationship(
+            person_a_id=person_a_id,
+            person_b_id=person_b_id,
+            relationship_type=TYPE_INFERRED,
+            shared_slack_count=message_count,
+            first_seen_together=first_seen,
+            last_seen_together=last_seen,
+            shared_contexts=["slack"],
+        ))
+
+    relationships = relationship_store.upsert_many(
+        relationships, context="slack", count_field="shared_slack_count"
+    )
 
     logger.info(f"Discovered/updated {len(relationships)} relationships from Slack")
     return relationships
@@ -1134,43 +1039,35 @@ def discover_linkedin_connections() -> list[Relationship]:
 
     logger.info(f"Found {len(linkedin_connections)} LinkedIn connections")
 
+    # Pairs already flagged need no update
+    already_flagged = {
+        rel.other_person(my_person_id)
+        for rel in relationship_store.get_for_people_batch({my_person_id}).get(my_person_id, [])
+        if rel.is_linkedin_connection
+    }
+
     # Create/update relationships between ME and my LinkedIn connections
     relationships = []
 
     for other_person_id in linkedin_connections:
-        if other_person_id == my_person_id:
-            continue  # Skip self
-
-        # Normalize pair order
-        if my_person_id < other_person_id:
-            person_a_id, person_b_id = my_person_id, other_person_id
-        else:
-            person_a_id, person_b_id = other_person_id, my_person_id
-
-        existing = relationship_store.get_between(person_a_id, person_b_id)
-
-        if existing:
-            if not existing.is_linkedin_connection:
-                existing.is_linkedin_connection = True
-                if "linkedin" not in existing.shared_contexts:
-                    existing.shared_contexts.append("linkedin")
-                relationship_store.update(existing)
-                relationships.append(existing)
-        else:
-            # Create new relationship
-            # Note: LinkedIn connections don't have interaction timestamps,
-            # so we leave first_seen_together and last_seen_together as None
-            rel = Relationship(
-                person_a_id=person_a_id,
-                person_b_id=person_b_id,
-                relationship_type=TYPE_INFERRED,
-                is_linkedin_connection=True,
-                first_seen_together=None,
-                last_seen_together=None,
-                shared_contexts=["linkedin"],
-            )
-            relationship_store.add(rel)
-            relationships.append(rel)
+        if other_person_id == my_person_id or other_person_id in already_flagged:
+            continue  # Skip self and unchanged pairs
+
+        # Note: LinkedIn connections don't have interaction timestamps,
+        # so new relationships leave first_seen_together and last_seen_together as None
+        relationships.append(Relationship(
+            person_a_id=my_person_id,
+            person_b_id=other_person_id,
+            relationship_type=TYPE_INFERRED,
+            is_linkedin_connection=True,
+            first_seen_together=None,
+            last_seen_together=None,
+            shared_contexts=["linkedin"],
+        ))
+
+    relationships = relationship_store.upsert_many(
+        relationships, context="linkedin", count_field="is_linkedin_connection"
+    )
 
     logger.info(f"Updated {len(relationships)} relationships with LinkedIn flag")
     return relationships
@@ -1192,7 +1089,7 @@ def discover_from_shared_photos(
     Returns:
         List of discovered/updated relationships
     """
-    from collections import defaultdict
+    import sqlite3
     from config.settings import settings
 
     if not settings.photos_enabled:
@@ -1200,29 +1097,29 @@ def discover_from_shared_photos(
         return []
 
     relationship_store = get_relationship_store()
-    interaction_store = get_interaction_store()
+    person_store = get_person_entity_store()
+    known_ids = {person.id for person in person_store.get_all()}
 
     cutoff = datetime.now(timezone.utc) - timedelta(days=days_back)
 
     # Get all photo interactions grouped by source_id (asset UUID)
-    # to find photos with multiple people
-    photo_people: dict[str, list[tuple[str, datetime]]] = defaultdict(list)
+    # to find photos with multiple people, in one scan
+    conn = sqlite3.connect(get_interaction_db_path())
+    cursor = conn.execute("""
+        SELECT source_id, person_id, ts_epoch
+        FROM interactions
+        WHERE source_type = 'photos'
+          AND ts_epoch >= ?
+          AND source_id IS NOT NULL AND source_id != ''
+          AND person_id IS NOT NULL
+    """, (to_epoch(cutoff),))
 
-    # Query all photos interactions
-    from api.services.person_entity import get_person_entity_store
-    person_store = get_person_entity_store()
+    photo_people: dict[str, list[tuple[str, datetime]]] = defaultdict(list)
+    for source_id, person_id, ts_epoch in cursor:
+        if person_id in known_ids:
+            photo_people[source_id].append((person_id, from_epoch(ts_epoch)))
 
-    for person in person_store.get_all():
-        interactions = interaction_store.get_for_person(
-            person.id,
-            source_type="photos",
-        )
-        for interaction in interactions:
-            if interaction.source_id and interaction.timestamp:
-                if _ensure_tz_aware(interaction.timestamp) >= cutoff:
-                    photo_people[interaction.source_id].append(
-                        (person.id, interaction.timestamp)
-                    )
+    conn.close()
 
     # Find photos with 2+ people
     multi_person_photos = {
@@ -1253,36 +1150,19 @@ def discover_from_shared_photos(
         if len(timestamps) < min_shared_photos:
             continue
 
-        first_seen = min(timestamps)
-        last_seen = max(timestamps)
-
-        existing = relationship_store.get_between(person_a_id, person_b_id)
-
-        if existing:
-            # Update existing relationship
-            existing.shared_photos_count = len(timestamps)
-            # Extend date range if needed
-            if not existing.first_seen_together or _datetime_lt(first_seen, existing.first_seen_together):
-                existing.first_seen_together = first_seen
-            if not existing.last_seen_together or _datetime_gt(last_seen, existing.last_seen_together):
-                existing.last_seen_together = last_seen
-            if "photos" not in existing.shared_contexts:
-                existing.shared_contexts.append("photos")
-            relationship_store.update(existing)
-            relationships.append(existing)
-        else:
-            # Create new relationship
-            rel = Relationship(
-                person_a_id=person_a_id,
-                person_b_id=person_b_id,
-                relationship_type=TYPE_INFERRED,
-                shared_photos_count=len(timestamps),
-                first_seen_together=first_seen,
-                last_seen_together=last_seen,
-                shared_contexts=["photos"],
-            )
-            relationship_store.add(rel)
-            relationships.append(rel)
+        relationships.append(Relationship(
+            person_a_id=person_a_id,
+            person_b_id=person_b_id,
+            relationship_type=TYPE_INFERRED,
+            shared_photos_count=len(timestamps),
+            first_seen_together=min(timestamps),
+            last_seen_together=max(timestamps),
+            shared_contexts=["photos"],
+        ))
+
+    relationships = relationship_store.upsert_many(
+        relationships, context="photos", count_field="shared_photos_count"
+    )
 
     logger.info(f"Discovered {len(relationships)} relationships from photos")
     return relationships
@@ -26,6 +26,7 @@ from typing import Optional, Any
 from config.settings import settings
 from api.utils.datetime_utils import make_aware as _make_aware
 from api.utils.db_paths import get_crm_db_path
+from api.utils.db_connections import get_connection
 
 logger = logging.getLogger(__name__)
 
@@ -151,7 +152,7 @@ class RelationshipInsightStore:
 
     def _init_db(self):
         """Create the relationship_insights table if it doesn't exist."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS relationship_insights (
@@ -186,7 +187,7 @@ class RelationshipInsightStore:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+        return get_connection(self.db_path)
 
     def get_all(self, person_id: str) -> list[RelationshipInsight]:
         """Get all insights for a person."""
@@ -46,8 +46,21 @@ from config.relationship_weights import (
 )
 import math
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Window for "lifetime" interaction counts in hybrid frequency (10 years)
+LIFETIME_WINDOW_DAYS = 3650
+
+# Cumulative Dunbar circle sizes for circles 1-6 (5, 15, 50, 150, 500, 1500).
+# Circle 0 is reserved for manual overrides, circle 7 for peripheral contacts.
+_CIRCLE_THRESHOLDS = np.array([5, 20, 70, 220, 720, 2220])
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ONE_MICROSECOND = timedelta(microseconds=1)
+_MICROSECONDS_PER_DAY = 86_400_000_000
+
 
 def compute_recency_score(last_seen: Optional[datetime]) -> float:
     """
@@ -270,7 +283,11 @@ def compute_relationship_strength_weighted(
     return round(strength * 100, 1)
 
 
-def compute_strength_for_person(person: PersonEntity) -> float:
+def compute_strength_for_person(
+    person: PersonEntity,
+    recent_interactions: Optional[list[dict]] = None,
+    lifetime_interactions: Optional[list[dict]] = None,
+) -> float:
     """
     Compute relationship strength for a PersonEntity.
 
@@ -286,6 +303,10 @@ def compute_strength_for_person(person: PersonEntity) -> float:
 
     Args:
         person: PersonEntity to compute strength for
+        recent_interactions: Prefetched subtype counts within FREQUENCY_WINDOW_DAYS
+            (fetched from the interaction store if None)
+        lifetime_interactions: Prefetched subtype counts within LIFETIME_WINDOW_DAYS
+            (fetched from the interaction store if None)
 
     Returns:
         Relationship strength between 0 and 100
@@ -296,16 +317,18 @@ def compute_strength_for_person(person: PersonEntity) -> float:
     interaction_store = get_interaction_store()
 
     # Get recent interaction counts with subtype detail (within frequency window)
-    recent_interactions = interaction_store.get_interaction_counts_with_subtypes(
-        person.id,
-        days_back=FREQUENCY_WINDOW_DAYS,
-    )
+    if recent_interactions is None:
+        recent_interactions = interaction_store.get_interaction_counts_with_subtypes(
+            person.id,
+            days_back=FREQUENCY_WINDOW_DAYS,
+        )
 
     # Get lifetime interaction counts with subtype detail (all-time, 10 years)
-    lifetime_interactions = interaction_store.get_interaction_counts_with_subtypes(
-        person.id,
-        days_back=3650,  # 10 years
-    )
+    if lifetime_interactions is None:
+        lifetime_interactions = interaction_store.get_interaction_counts_with_subtypes(
+            person.id,
+            days_back=LIFETIME_WINDOW_DAYS,
+        )
 
     # Get source types from interactions
     sources = list({item["source_type"] for item in lifetime_interactions})
@@ -389,44 +412,287 @@ def update_strength_for_person(person_id: str) -> Optional[float]:
     return strength
 
 
+def _epoch_microseconds(dt: datetime) -> int:
+    """Exact UTC epoch microseconds of a datetime (naive values are UTC)."""
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return (dt - _EPOCH) // _ONE_MICROSECOND
+
+
+def _weighted_counts(
+    index: dict[str, int],
+    counts_by_person: dict[str, list[dict]],
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Flatten subtype counts into per-person weighted and raw totals.
+
+    Rows are summed in list order, matching compute_weighted_interaction_count_detailed().
+
+    Returns:
+        (weighted totals, raw totals), both aligned with index
+    """
+    weight_cache: dict[tuple, float] = {}
+    rows: list[int] = []
+    counts: list[int] = []
+    weights: list[float] = []
+    for person_id, items in counts_by_person.items():
+        i = index.get(person_id)
+        if i is None:
+            continue
+        for item in items:
+            key = (item["source_type"], item.get("subtype"), item.get("source_account"))
+            weight = weight_cache.get(key)
+            if weight is None:
+                weight = weight_cache[key] = get_interaction_weight(*key)
+            rows.append(i)
+            counts.append(item["count"])
+            weights.append(weight)
+
+    row_index = np.asarray(rows, dtype=np.int64)
+    count_values = np.asarray(counts, dtype=np.float64)
+    weighted = np.bincount(
+        row_index, weights=count_values * np.asarray(weights, dtype=np.float64), minlength=len(index)
+    )
+    raw = np.bincount(row_index, weights=count_values, minlength=len(index))
+    return weighted, raw
+
+
+def _scaled_frequency(weighted: np.ndarray, target: float) -> np.ndarray:
+    """Vectorized frequency scaling (log or linear), 0 for no interactions."""
+    if USE_LOG_FREQUENCY_SCALING:
+        with np.errstate(divide="ignore", invalid="ignore"):
+            score = np.minimum(1.0, np.log(1 + weighted) / math.log(1 + target))
+    else:
+        score = np.minimum(1.0, weighted / target)
+    return np.where(weighted > 0, score, 0.0)
+
+
+def compute_strengths_batch(
+    people: list[PersonEntity],
+    recent_by_person: dict[str, list[dict]],
+    lifetime_by_person: dict[str, list[dict]],
+    relationships_with_me: Optional[dict] = None,
+) -> np.ndarray:
+    """
+    Compute relationship strength for many people at once.
+
+    Produces the same scores as compute_strength_for_person(), with the
+    recency, frequency and diversity components evaluated on column arrays.
+
+    Args:
+        people: PersonEntities to score
+        recent_by_person: Subtype counts within FREQUENCY_WINDOW_DAYS by person ID
+        lifetime_by_person: Subtype counts within LIFETIME_WINDOW_DAYS by person ID
+        relationships_with_me: Relationships with the CRM owner keyed by the
+            other person's ID (for LinkedIn/family bonuses)
+
+    Returns:
+        Array of strengths (0-100) aligned with people
+    """
+    from api.services.relationship import TYPE_FAMILY
+    from config.settings import settings
+
+    n = len(people)
+    index = {person.id: i for i, person in enumerate(people)}
+    relationships_with_me = relationships_with_me or {}
+
+    recent_weighted, _ = _weighted_counts(index, recent_by_person)
+    lifetime_weighted, lifetime_total = _weighted_counts(index, lifetime_by_person)
+
+    # Recency: whole days since last_seen (future dates capped at now)
+    now_us = _epoch_microseconds(datetime.now(timezone.utc))
+    has_last_seen = np.array([p.last_seen is not None for p in people], dtype=bool)
+    last_seen_us = np.array(
+        [_epoch_microseconds(p.last_seen) if p.last_seen else now_us for p in people],
+        dtype=np.int64,
+    )
+    days_since = np.maximum(now_us - last_seen_us, 0) // _MICROSECONDS_PER_DAY
+    recency = np.where(has_last_seen, np.maximum(0.0, 1.0 - days_since / RECENCY_WINDOW_DAYS), 0.0)
+
+    # Frequency: hybrid of recent and lifetime weighted counts
+    recent_score = _scaled_frequency(recent_weighted, FREQUENCY_TARGET)
+    if LIFETIME_FREQUENCY_ENABLED:
+        lifetime_score = _scaled_frequency(lifetime_weighted, LIFETIME_FREQUENCY_TARGET)
+        frequency = (recent_score * RECENT_FREQUENCY_WEIGHT) + (lifetime_score * LIFETIME_FREQUENCY_WEIGHT)
+    else:
+        frequency = recent_score
+
+    # Diversity: interaction sources plus the person's own source list
+    source_counts = np.array([
+        len({item["source_type"] for item in lifetime_by_person.get(p.id, [])} | set(p.sources))
+        for p in people
+    ], dtype=np.float64)
+    diversity = np.minimum(1.0, source_counts / len(SOURCE_TYPES))
+
+    # Recency discount for low/zero interaction contacts
+    low_multiplier = np.where(
+        lifetime_total == 0,
+        ZERO_INTERACTION_RECENCY_MULTIPLIER,
+        ZERO_INTERACTION_RECENCY_MULTIPLIER + (
+            (1.0 - ZERO_INTERACTION_RECENCY_MULTIPLIER) *
+            (lifetime_total / MIN_INTERACTIONS_FOR_FULL_RECENCY)
+        ),
+    )
+    recency = np.where(lifetime_total < MIN_INTERACTIONS_FOR_FULL_RECENCY, recency * low_multiplier, recency)
+
+    base_strength = (
+        recency * RECENCY_WEIGHT +
+        frequency * FREQUENCY_WEIGHT +
+        diversity * DIVERSITY_WEIGHT
+    ) * 100
+
+    # LinkedIn (3%) and family (5%) multipliers for relationships with me
+    linkedin = np.zeros(n, dtype=bool)
+    family = np.zeros(n, dtype=bool)
+    my_person_id = settings.my_person_id
+    if my_person_id:
+        for i, person in enumerate(people):
+            rel = relationships_with_me.get(person.id) if person.id != my_person_id else None
+            if rel:
+                linkedin[i] = rel.is_linkedin_connection
+                family[i] = rel.relationship_type == TYPE_FAMILY
+    multiplier = np.ones(n)
+    multiplier = np.where(linkedin, multiplier * 1.03, multiplier)
+    multiplier = np.where(family, multiplier * 1.05, multiplier)
+
+    # Python round() keeps half-way cases identical to the per-person path
+    return np.array(
+        [min(100.0, round(value, 1)) for value in (base_strength * multiplier).tolist()],
+        dtype=np.float64,
+    )
+
+
+def assign_dunbar_circles(
+    person_ids: list[str],
+    strengths: np.ndarray,
+    is_work: np.ndarray,
+) -> np.ndarray:
+    """
+    Rank non-peripheral contacts into Dunbar circles 1-6.
+
+    Non-work people are ranked by effective strength (ties keep input order)
+    and fill circles by cumulative size. Work people don't consume slots; they
+    get the first circle whose weakest non-work member they match or beat.
+    CIRCLE_OVERRIDES_BY_ID wins over both and doesn't consume slots.
+
+    Args:
+        person_ids: Non-peripheral person IDs
+        strengths: Effective strengths aligned with person_ids
+        is_work: Work-category mask aligned with person_ids
+
+    Returns:
+        Array of circles aligned with person_ids
+    """
+    circles = np.full(len(person_ids), 6, dtype=np.int64)
+    overridden = np.array([pid in CIRCLE_OVERRIDES_BY_ID for pid in person_ids], dtype=bool)
+
+    # Non-work, non-override people in descending strength order define the circles
+    order = np.argsort(-strengths, kind="stable")
+    ranked = order[~is_work[order] & ~overridden[order]]
+    ranked_circles = np.minimum(
+        np.searchsorted(_CIRCLE_THRESHOLDS, np.arange(len(ranked)), side="right") + 1, 6
+    )
+    circles[ranked] = ranked_circles
+
+    # Weakest member of each circle is its strength cutoff
+    cutoffs = {
+        circle: strengths[ranked[ranked_circles == circle][-1]]
+        for circle in range(1, 7)
+        if np.any(ranked_circles == circle)
+    }
+
+    # Work people take the smallest circle whose cutoff they reach
+    work = np.flatnonzero(is_work & ~overridden)
+    work_circles = np.full(len(work), 6, dtype=np.int64)
+    for circle in range(6, 0, -1):
+        if circle in cutoffs:
+            work_circles[strengths[work] >= cutoffs[circle]] = circle
+    circles[work] = work_circles
+
+    for i in np.flatnonzero(overridden):
+        circles[i] = CIRCLE_OVERRIDES_BY_ID[person_ids[i]]
+
+    return circles
+
+
 def update_all_strengths() -> dict:
     """
     Update relationship strength for all people.
 
-    Also updates is_peripheral_contact and dunbar_circle for all people.
+    Also updates is_peripheral_contact, category and dunbar_circle for all
+    people. Scores and circles are computed in one batch and written back
+    with a single save.
 
     Returns:
         Statistics about the update
     """
+    from api.services.relationship import get_relationship_store
+    from config.settings import settings
+
     store = get_person_entity_store()
-    people = store.get_all()
+    all_people = store.get_all(include_hidden=True)
+    people = [p for p in all_people if not p.hidden]
 
-    updated = 0
-    failed = 0
-    peripheral_count = 0
+    # Two grouped rollup queries instead of two scans per person
+    interaction_store = get_interaction_store()
+    recent_by_person = interaction_store.get_all_interaction_counts_with_subtypes(
+        days_back=FREQUENCY_WINDOW_DAYS,
+    )
+    lifetime_by_person = interaction_store.get_all_interaction_counts_with_subtypes(
+        days_back=LIFETIME_WINDOW_DAYS,
+    )
 
-    for person in people:
+    # My relationships (bonus flags) and everyone's source entities, one query each
+    relationships_with_me = {}
+    my_person_id = settings.my_person_id
+    if my_person_id:
+        for rel in get_relationship_store().get_for_people_batch({my_person_id})[my_person_id]:
+            relationships_with_me[rel.other_person(my_person_id)] = rel
+    source_entities = get_source_entity_store().get_for_people_batch(
+        [p.id for p in people], limit_per_person=500,
+    )
+
+    strengths = compute_strengths_batch(
+        people, recent_by_person, lifetime_by_person, relationships_with_me,
+    )
+    overrides = np.array([STRENGTH_OVERRIDES_BY_ID.get(p.id, np.nan) for p in people], dtype=np.float64)
+    strengths = np.where(np.isnan(overrides), strengths, overrides)
+    peripheral = strengths < PERIPHERAL_THRESHOLD
+
+    # Category is rule-based per person; failures leave that person unchanged
+    new_values: dict[str, dict] = {}
+    failed = 0
+    for person, strength, is_peripheral in zip(people, strengths.tolist(), peripheral.tolist()):
         try:
-            strength = compute_strength_for_person(person)
-            # Apply manual override if defined
-            override = STRENGTH_OVERRIDES_BY_ID.get(person.id)
-            if override is not None:
-                strength = override
-            person.relationship_strength = strength
-            person.is_peripheral_contact = strength < PERIPHERAL_THRESHOLD
-            if person.is_peripheral_contact:
-                person.dunbar_circle = 7  # Pre-assign peripheral contacts to circle 7
-                peripheral_count += 1
-            # Sync category from computed value (keeps stored value in sync with UI)
-            person.category = compute_person_category(person)
-            store.update(person)
-            updated += 1
+            category = compute_person_category(person, source_entities.get(person.id, []))
         except Exception as e:
             logger.error(f"Failed to update strength for {person.id}: {e}")
             failed += 1
-
-    # Compute Dunbar circles for non-peripheral contacts
-    circles_result = compute_all_dunbar_circles(store)
+            continue
+        new_values[person.id] = {
+            "relationship_strength": strength,
+            "is_peripheral_contact": is_peripheral,
+            "category": category,
+        }
+        if is_peripheral:
+            new_values[person.id]["dunbar_circle"] = 7  # Peripheral contacts are circle 7
+
+    # Dunbar circles across all (including hidden) non-peripheral contacts
+    def effective(person: PersonEntity, field: str):
+        return new_values.get(person.id, {}).get(field, getattr(person, field))
+
+    non_peripheral = [p for p in all_people if not effective(p, "is_peripheral_contact")]
+    circle_strengths = np.array([
+        STRENGTH_OVERRIDES_BY_ID.get(p.id, effective(p, "relationship_strength") or 0)
+        for p in non_peripheral
+    ], dtype=np.float64)
+    is_work = np.array([effective(p, "category") == "work" for p in non_peripheral], dtype=bool)
+    circles = assign_dunbar_circles([p.id for p in non_peripheral], circle_strengths, is_work)
+    for person, circle in zip(non_peripheral, circles.tolist()):
+        new_values.setdefault(person.id, {})["dunbar_circle"] = circle
+
+    # Write back only people whose values changed
+    changed = _apply_person_values(store, all_people, new_values)
 
     # Apply tag overrides
     tags_result = apply_tag_overrides(store)
@@ -434,17 +700,44 @@ def update_all_strengths() -> dict:
     # Save all updates
     store.save()
 
-    logger.info(f"Updated relationship strength for {updated} people ({failed} failed, {peripheral_count} peripheral)")
+    updated = len(people) - failed
+    peripheral_count = sum(
+        1 for values in new_values.values()
+        if values.get("is_peripheral_contact")
+    )
+    logger.info(
+        f"Updated relationship strength for {updated} people "
+        f"({failed} failed, {peripheral_count} peripheral, {changed} changed)"
+    )
     return {
         "updated": updated,
         "failed": failed,
         "total": len(people),
         "peripheral_count": peripheral_count,
-        "circles_computed": circles_result.get("assigned", 0),
+        "circles_computed": len(non_peripheral),
         "tags_applied": tags_result.get("applied", 0),
     }
 
 
+def _apply_person_values(store, people: list[PersonEntity], new_values: dict[str, dict]) -> int:
+    """
+    Set computed fields on people and queue the changed ones for the next save.
+
+    Returns:
+        Number of people updated
+    """
+    changed = 0
+    for person in people:
+        values = new_values.get(person.id)
+        if not values or all(getattr(person, field) == value for field, value in values.items()):
+            continue
+        for field, value in values.items():
+            setattr(person, field, value)
+        store.update(person)
+        changed += 1
+    return changed
+
+
 def _get_effective_strength(person: PersonEntity) -> float:
     """Get relationship strength, applying manual overrides if defined (by ID)."""
     override = STRENGTH_OVERRIDES_BY_ID.get(person.id)
@@ -468,7 +761,9 @@ def compute_all_dunbar_circles(store=None) -> dict:
     - Circle 6: Next 1500 (recognizable)
     - Circle 7: Everyone else (peripheral, pre-assigned)
 
-    Manual STRENGTH_OVERRIDES are respected when ranking people.
+    Manual STRENGTH_OVERRIDES are respected when ranking people. Work-category
+    people don't count toward the thresholds; they get the circle of non-work
+    people with similar strength (see assign_dunbar_circles()).
 
     Args:
         store: PersonEntityStore instance (optional, will get if not provided)
@@ -479,82 +774,21 @@ def compute_all_dunbar_circles(store=None) -> dict:
     if store is None:
         store = get_person_entity_store()
 
-    # Get all non-peripheral contacts, sorted by effective strength descending
-    # Effective strength = override if defined, else computed strength
     all_people = store.get_all(include_hidden=True)
     non_peripheral = [p for p in all_people if not p.is_peripheral_contact]
-    non_peripheral.sort(key=_get_effective_strength, reverse=True)
-
-    # Separate work category people - they don't count toward thresholds
-    # but will still be assigned circles based on strength cutoffs
-    non_work = [p for p in non_peripheral if p.category != "work"]
-    work_people = [p for p in non_peripheral if p.category == "work"]
-
-    # Sort non-work by strength (already sorted, but ensure it)
-    non_work.sort(key=_get_effective_strength, reverse=True)
-
-    # Dunbar circle thresholds (cumulative sizes) - starts at circle 1
-    # Circle 0 is RESERVED for manual overrides only (e.g., spouse, children)
-    # Circle 1: top 5, Circle 2: next 15, Circle 3: next 50, etc.
-    # Thresholds are calculated based on non-work people only
-    circle_thresholds = [5, 20, 70, 220, 720, 2220]  # 5, 15, 50, 150, 500, 1500
-
-    assigned = 0
-    ranking_index = 0  # Separate counter for non-override, non-work people
-
-    # Track strength cutoffs for each circle (min strength to be in that circle)
-    # Will be populated as we assign non-work people
-    circle_strength_cutoffs = {}  # circle -> min strength
-
-    # First pass: assign circles to non-work people (they define the thresholds)
-    for person in non_work:
-        # Check for manual circle override first
-        if person.id in CIRCLE_OVERRIDES_BY_ID:
-            circle = CIRCLE_OVERRIDES_BY_ID[person.id]
-            # Override people don't count toward ranking thresholds
-        else:
-            # Find which circle this person belongs to based on their ranking
-            # among non-override people (circle 0 overrides don't consume slots)
-            circle = 6  # Default to circle 6 if beyond all thresholds
-            for c, threshold in enumerate(circle_thresholds):
-                if ranking_index < threshold:
-                    circle = c + 1  # +1 because circle 0 is reserved
-                    break
-            ranking_index += 1
-
-            # Record this person's strength as the cutoff for this circle
-            # (last person in each circle defines the minimum strength)
-            strength = _get_effective_strength(person)
-            circle_strength_cutoffs[circle] = strength
-
-        if person.dunbar_circle != circle:
-            person.dunbar_circle = circle
-            store.update(person)
-        assigned += 1
-
-    # Second pass: assign circles to work people based on strength cutoffs
-    # Work people get the same circle as non-work people with similar strength
-    for person in work_people:
-        if person.id in CIRCLE_OVERRIDES_BY_ID:
-            circle = CIRCLE_OVERRIDES_BY_ID[person.id]
-        else:
-            strength = _get_effective_strength(person)
-            # Find which circle this strength qualifies for
-            circle = 6  # Default
-            for c in range(1, 7):
-                cutoff = circle_strength_cutoffs.get(c)
-                if cutoff is not None and strength >= cutoff:
-                    circle = c
-                    break
-
-        if person.dunbar_circle != circle:
-            person.dunbar_circle = circle
-            store.update(person)
-        assigned += 1
-
-    logger.info(f"Computed Dunbar circles for {assigned} non-peripheral contacts")
+
+    strengths = np.array([_get_effective_strength(p) for p in non_peripheral], dtype=np.float64)
+    is_work = np.array([p.category == "work" for p in non_peripheral], dtype=bool)
+    circles = assign_dunbar_circles([p.id for p in non_peripheral], strengths, is_work)
+
+    _apply_person_values(store, non_peripheral, {
+        person.id: {"dunbar_circle": circle}
+        for person, circle in zip(non_peripheral, circles.tolist())
+    })
+
+    logger.info(f"Computed Dunbar circles for {len(non_peripheral)} non-peripheral contacts")
     return {
-        "assigned": assigned,
+        "assigned": len(non_peripheral),
         "total_non_peripheral": len(non_peripheral),
     }
 
@@ -14,15 +14,28 @@ Cross-encoders differ from bi-encoders:
 This allows cross-encoders to catch nuances that bi-encoders miss,
 like negation, specificity, and contextual relevance.
 
+## Performance
+
+Cross-encoding is the largest CPU cost of a vault search, so:
+- Pairs are scored in batches of settings.reranker_batch_size and truncated
+  to settings.reranker_max_length tokens
+- Scores are kept in a bounded LRU keyed by (query hash, chunk id, content
+  hash), so repeated agent searches only score new candidates
+
 ## Usage
 
     from api.services.reranker import get_reranker
     reranker = get_reranker()
     reranked = reranker.rerank(query, results, top_k=10)
 """
+import hashlib
 import logging
+import threading
+from collections import OrderedDict
 from typing import Optional, TYPE_CHECKING
 
+from config.settings import settings
+
 if TYPE_CHECKING:
     from sentence_transformers import CrossEncoder
 
@@ -37,26 +50,93 @@ class RerankerService:
     Caches model in memory for subsequent calls.
     """
 
-    def __init__(self, model_name: str = "cross-encoder/ms-marco-MiniLM-L6-v2"):
+    def __init__(
+        self,
+        model_name: str = "cross-encoder/ms-marco-MiniLM-L6-v2",
+        batch_size: Optional[int] = None,
+        max_length: Optional[int] = None,
+        cache_size: Optional[int] = None
+    ):
         """
         Initialize reranker service.
 
         Args:
             model_name: HuggingFace model name for cross-encoder.
                        Default is ms-marco-MiniLM-L6-v2 (~90MB, fast, accurate).
+            batch_size: Pairs per predict batch (default from settings)
+            max_length: Max tokens per (query, chunk) pair (default from settings)
+            cache_size: Max cached scores, 0 disables (default from settings)
         """
         self.model_name = model_name
+        self.batch_size = batch_size or settings.reranker_batch_size
+        self.max_length = max_length or settings.reranker_max_length
+        self.cache_size = settings.reranker_score_cache_size if cache_size is None else cache_size
         self._model: Optional["CrossEncoder"] = None
+        self._score_cache: OrderedDict[tuple[str, str, str], float] = OrderedDict()
+        self._cache_lock = threading.Lock()
 
     def _get_model(self) -> "CrossEncoder":
         """Lazy-load cross-encoder model."""
         if self._model is None:
             from sentence_transformers import CrossEncoder
             logger.info(f"Loading cross-encoder model: {self.model_name}")
-            self._model = CrossEncoder(self.model_name)
+            self._model = CrossEncoder(self.model_name, max_length=self.max_length)
             logger.info("Cross-encoder model loaded")
         return self._model
 
+    def _score_pairs(self, query: str, results: list[dict], content_key: str) -> list[float]:
+        """
+        Score (query, result) pairs, using cached scores where available.
+
+        Args:
+            query: Search query string
+            results: Results to score
+            content_key: Key in result dict containing text to score
+
+        Returns:
+            Cross-encoder scores, parallel to results
+        """
+        query_hash = hashlib.sha1(query.encode("utf-8")).hexdigest()
+        keys = []
+        for r in results:
+            content = r.get(content_key, "")
+            # Content hash keeps scores correct after a chunk is reindexed
+            content_hash = hashlib.sha1(content.encode("utf-8")).hexdigest()
+            keys.append((query_hash, str(r.get("id", "")), content_hash))
+
+        scores: dict[int, float] = {}
+        if self.cache_size > 0:
+            with self._cache_lock:
+                for i, key in enumerate(keys):
+                    if key in self._score_cache:
+                        self._score_cache.move_to_end(key)
+                        scores[i] = self._score_cache[key]
+
+        missing = [i for i in range(len(results)) if i not in scores]
+        if missing:
+            model = self._get_model()
+            pairs = [(query, results[i].get(content_key, "")) for i in missing]
+            predicted = model.predict(pairs, batch_size=self.batch_size, show_progress_bar=False)
+            for i, score in zip(missing, predicted):
+                scores[i] = float(score)
+
+            if self.cache_size > 0:
+                with self._cache_lock:
+                    for i in missing:
+                        self._score_cache[keys[i]] = scores[i]
+                        self._score_cache.move_to_end(keys[i])
+                    while len(self._score_cache) > self.cache_size:
+                        self._score_cache.popitem(last=False)
+
+        if len(missing) < len(results):
+            logger.debug(f"Reranker score cache: {len(results) - len(missing)}/{len(results)} hits")
+        return [scores[i] for i in range(len(results))]
+
+    def clear_cache(self) -> None:
+        """Drop all cached scores."""
+        with self._cache_lock:
+            self._score_cache.clear()
+
     def rerank(
         self,
         query: str,
@@ -121,14 +201,9 @@ class RerankerService:
                 r["cross_encoder_score"] = r.get("hybrid_score", 0.5)
             return protected_results + unprotected_results
 
-        model = self._get_model()
-
-        # Prepare query-document pairs for unprotected results only
-        pairs = [(query, r.get(content_key, "")) for r in unprotected_results]
-
-        # Score all pairs
+        # Score query-document pairs for unprotected results only
         try:
-            scores = model.predict(pairs, show_progress_bar=False)
+            scores = self._score_pairs(query, unprotected_results, content_key)
         except Exception as e:
             logger.error(f"Cross-encoder scoring failed: {e}")
             # Fall back to original ranking
@@ -170,7 +245,6 @@ def get_reranker() -> RerankerService:
     """Get singleton reranker instance."""
     global _reranker_instance
     if _reranker_instance is None:
-        from config.settings import settings
         model_name = getattr(settings, "reranker_model", "cross-encoder/ms-marco-MiniLM-L6-v2")
         _reranker_instance = RerankerService(model_name=model_name)
     return _reranker_instance
@@ -19,6 +19,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from api.utils.db_connections import get_connection
+
 logger = logging.getLogger(__name__)
 
 # Database path (same as CRM)
@@ -136,8 +138,7 @@ class ReviewQueueStore:
     def _get_conn(self) -> sqlite3.Connection:
         """Get a database connection."""
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
-        conn = sqlite3.connect(str(self.db_path))
-        conn.execute("PRAGMA journal_mode=WAL")
+        conn = get_connection(self.db_path)
         conn.row_factory = sqlite3.Row
         return conn
 
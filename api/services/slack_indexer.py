@@ -31,6 +31,9 @@ logger = logging.getLogger(__name__)
 # Collection name for Slack messages
 SLACK_COLLECTION = "lifeos_slack"
 
+# Messages embedded and upserted per vector store call
+INDEX_BATCH_SIZE = 200
+
 
 class SlackIndexer:
     """
@@ -116,6 +119,59 @@ class SlackIndexer:
             return user.real_name or user.display_name or user.username
         return user_id
 
+    def _build_message_document(
+        self,
+        message: SlackMessage,
+        channel_name: str,
+        channel_type: str,
+        user_name: str,
+        team_id: Optional[str] = None,
+    ) -> Optional[tuple[list[dict], dict]]:
+        """
+        Build the (chunks, metadata) vector store document for a message.
+
+        Returns:
+            Document tuple, or None for messages with no text
+        """
+        if not message.text or not message.text.strip():
+            return None
+
+        # Create document ID per PRD: slack:{channel_id}:{message_ts}
+        doc_id = f"slack:{message.channel_id}:{message.ts}"
+
+        # Build metadata for filtering and display
+        metadata = {
+            "file_path": doc_id,
+            "file_name": f"Slack: {channel_name}",
+            "modified_date": message.timestamp.strftime("%Y-%m-%d"),
+            "note_type": "slack_message",
+            "people": [user_name] if user_name and user_name != "Unknown" else [],
+            "tags": ["slack", channel_type],
+        }
+
+        # Slack-specific metadata stored in chunk
+        extra_meta = {
+            "source_type": "slack",
+            "channel_id": message.channel_id,
+            "channel_name": channel_name,
+            "channel_type": channel_type,
+            "user_id": message.user_id,
+            "user_name": user_name,
+            "timestamp": message.timestamp.isoformat(),
+            "team_id": team_id or SLACK_TEAM_ID or "default",
+        }
+
+        if message.thread_ts:
+            extra_meta["thread_ts"] = message.thread_ts
+
+        # Create a single chunk for this message
+        chunks = [{
+            "content": message.text,
+            "chunk_index": 0,
+            **extra_meta,
+        }]
+        return chunks, metadata
+
     def index_message(
         self,
         message: SlackMessage,
@@ -146,43 +202,10 @@ class SlackIndexer:
             if user_name is None:
                 user_name = self._get_user_display_name(message.user_id)
 
-            # Create document ID per PRD: slack:{channel_id}:{message_ts}
-            doc_id = f"slack:{message.channel_id}:{message.ts}"
-
-            # Build metadata for filtering and display
-            metadata = {
-                "file_path": doc_id,
-                "file_name": f"Slack: {channel_name}",
-                "modified_date": message.timestamp.strftime("%Y-%m-%d"),
-                "note_type": "slack_message",
-                "people": [user_name] if user_name and user_name != "Unknown" else [],
-                "tags": ["slack", channel_type],
-            }
-
-            # Slack-specific metadata stored in chunk
-            extra_meta = {
-                "source_type": "slack",
-                "channel_id": message.channel_id,
-                "channel_name": channel_name,
-                "channel_type": channel_type,
-                "user_id": message.user_id,
-                "user_name": user_name,
-                "timestamp": message.timestamp.isoformat(),
-                "team_id": team_id or SLACK_TEAM_ID or "default",
-            }
-
-            if message.thread_ts:
-                extra_meta["thread_ts"] = message.thread_ts
-
-            # Create a single chunk for this message
-            chunks = [{
-                "content": message.text,
-                "chunk_index": 0,
-                **extra_meta,
-            }]
-
-            # Add to vector store (upsert behavior via delete + add)
-            self.vector_store.add_document(chunks=chunks, metadata=metadata)
+            chunks, metadata = self._build_message_document(
+                message, channel_name, channel_type, user_name, team_id
+            )
+            self.vector_store.upsert_documents([(chunks, metadata)])
             return True
 
         except Exception as e:
@@ -198,6 +221,10 @@ class SlackIndexer:
         """
         Index multiple messages from a channel.
 
+        Messages are embedded and upserted INDEX_BATCH_SIZE at a time, so a
+        long DM history costs one embed call and one ChromaDB write per batch
+        instead of per message. A failed batch is logged and skipped.
+
         Args:
             messages: List of SlackMessage objects
             channel: SlackChannel object
@@ -213,17 +240,29 @@ class SlackIndexer:
         channel_type = self._get_channel_type(channel)
         team_id = SLACK_TEAM_ID or workspace_id
 
-        indexed = 0
+        documents = []
         for message in messages:
+            if not message.text or not message.text.strip():
+                continue
             user_name = self._get_user_display_name(message.user_id, workspace_id)
-            if self.index_message(
+            documents.append(self._build_message_document(
                 message=message,
                 channel_name=channel_name,
                 channel_type=channel_type,
                 user_name=user_name,
                 team_id=team_id,
-            ):
-                indexed += 1
+            ))
+
+        indexed = 0
+        for i in range(0, len(documents), INDEX_BATCH_SIZE):
+            batch = documents[i:i + INDEX_BATCH_SIZE]
+            try:
+                self.vector_store.upsert_documents(batch)
+                indexed += len(batch)
+            except Exception as e:
+                logger.error(
+                    f"Failed to index {len(batch)} messages from {channel.channel_id}: {e}"
+                )
 
         return indexed
 
@@ -27,6 +27,8 @@ from api.services.slack_integration import (
 from api.services.slack_indexer import SlackIndexer, get_slack_indexer
 from api.services.source_entity import SourceEntityStore, get_source_entity_store
 from api.services.interaction_store import Interaction, InteractionStore
+from api.utils.db_connections import get_connection
+from api.utils.db_paths import get_crm_db_path
 
 logger = logging.getLogger(__name__)
 
@@ -35,6 +37,116 @@ DEFAULT_DM_HISTORY_DAYS = None  # Full history for DMs
 DEFAULT_CHANNEL_HISTORY_DAYS = 90  # 90 days for channels
 
 
+class SlackChannelStateStore:
+    """
+    High-water marks for incremental Slack sync.
+
+    One row per channel with the newest indexed message and how many
+    messages have been indexed, so incremental sync can pick its `oldest`
+    cursor without scanning the ChromaDB collection.
+    """
+
+    def __init__(self, db_path: Optional[str] = None):
+        """
+        Initialize the store.
+
+        Args:
+            db_path: Path to SQLite database (default: CRM database)
+        """
+        self.db_path = db_path or get_crm_db_path()
+        self._init_db()
+
+    def _init_db(self) -> None:
+        """Create the channel state table if it doesn't exist."""
+        conn = get_connection(self.db_path)
+        try:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS slack_channel_state (
+                    channel_id TEXT PRIMARY KEY,
+                    latest_ts TEXT NOT NULL,
+                    latest_at TIMESTAMP NOT NULL,
+                    message_count INTEGER NOT NULL DEFAULT 0,
+                    updated_at TIMESTAMP NOT NULL
+                )
+            """)
+            conn.commit()
+        finally:
+            conn.close()
+
+    def get(self, channel_id: str) -> Optional[dict]:
+        """
+        Get the high-water mark for a channel.
+
+        Returns:
+            Dict with latest_ts, latest_at (datetime) and message_count,
+            or None if the channel has never been synced
+        """
+        conn = get_connection(self.db_path)
+        try:
+            row = conn.execute(
+                "SELECT latest_ts, latest_at, message_count FROM slack_channel_state WHERE channel_id = ?",
+                (channel_id,),
+            ).fetchone()
+        finally:
+            conn.close()
+        if not row:
+            return None
+        return {
+            "latest_ts": row[0],
+            "latest_at": datetime.fromisoformat(row[1]),
+            "message_count": row[2],
+        }
+
+    def get_latest_timestamp(self, channel_id: str) -> Optional[datetime]:
+        """Get the newest indexed message time for a channel, if any."""
+        state = self.get(channel_id)
+        return state["latest_at"] if state else None
+
+    def advance(
+        self,
+        channel_id: str,
+        latest_ts: str,
+        latest_at: datetime,
+        indexed: int,
+        reset: bool = False,
+    ) -> None:
+        """
+        Move a channel's high-water mark forward.
+
+        The mark never moves backwards, so re-fetching an overlap window
+        can't rewind it.
+
+        Args:
+            channel_id: Slack channel ID
+            latest_ts: Slack ts of the newest message just indexed
+            latest_at: Timestamp of that message
+            indexed: Number of messages indexed for the first time
+            reset: Replace message_count instead of adding to it (full sync)
+        """
+        now = datetime.now(timezone.utc).isoformat()
+        conn = get_connection(self.db_path)
+        try:
+            conn.execute(
+                """
+                INSERT INTO slack_channel_state
+                    (channel_id, latest_ts, latest_at, message_count, updated_at)
+                VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(channel_id) DO UPDATE SET
+                    latest_ts = CASE WHEN julianday(excluded.latest_at) > julianday(latest_at)
+                                     THEN excluded.latest_ts ELSE latest_ts END,
+                    latest_at = CASE WHEN julianday(excluded.latest_at) > julianday(latest_at)
+                                     THEN excluded.latest_at ELSE latest_at END,
+                    message_count = CASE WHEN ? THEN excluded.message_count
+                                         ELSE message_count + excluded.message_count END,
+                    updated_at = excluded.updated_at
+                """,
+                (channel_id, latest_ts, latest_at.isoformat(), indexed, now, reset),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+
 class SlackSync:
     """
     Orchestrates Slack data sync to LifeOS.
@@ -51,6 +163,7 @@ class SlackSync:
         indexer: Optional[SlackIndexer] = None,
         entity_store: Optional[SourceEntityStore] = None,
         interaction_store: Optional[InteractionStore] = None,
+        channel_state: Optional[SlackChannelStateStore] = None,
     ):
         """
         Initialize sync orchestrator.
@@ -60,11 +173,13 @@ class SlackSync:
             indexer: Slack message indexer (uses singleton if not provided)
             entity_store: Source entity store (uses singleton if not provided)
             interaction_store: Interaction store (creates new if not provided)
+            channel_state: Channel high-water mark store (creates new if not provided)
         """
         self._client = client
         self._indexer = indexer
         self._entity_store = entity_store
         self._interaction_store = interaction_store
+        self._channel_state = channel_state
         self._workspace_id = get_workspace_id()
 
     @property
@@ -95,6 +210,13 @@ class SlackSync:
             self._interaction_store = InteractionStore()
         return self._interaction_store
 
+    @property
+    def channel_state(self) -> SlackChannelStateStore:
+        """Get channel high-water mark store."""
+        if self._channel_state is None:
+            self._channel_state = SlackChannelStateStore()
+        return self._channel_state
+
     def sync_users(self) -> dict:
         """
         Sync Slack users to SourceEntity store.
@@ -263,12 +385,16 @@ class SlackSync:
 
         # Determine oldest timestamp for fetch
         oldest = None
+        latest_indexed = None
         if not full:
-            # Incremental sync: get latest indexed timestamp
-            oldest = self.indexer.get_latest_timestamp(channel.channel_id)
-            if oldest:
+            # Incremental sync: start from the channel's high-water mark. Channels
+            # indexed before marks existed fall back to scanning the collection once.
+            latest_indexed = self.channel_state.get_latest_timestamp(channel.channel_id)
+            if latest_indexed is None:
+                latest_indexed = self.indexer.get_latest_timestamp(channel.channel_id)
+            if latest_indexed:
                 # Add small buffer to avoid missing messages
-                oldest = oldest - timedelta(seconds=1)
+                oldest = latest_indexed - timedelta(seconds=1)
                 logger.debug(f"Incremental sync for {channel.channel_id} from {oldest}")
 
         if oldest is None and history_days:
@@ -295,6 +421,30 @@ class SlackSync:
         )
         stats["messages_indexed"] = indexed
 
+        # Advance the high-water mark only if every message made it in, so a
+        # failed batch is fetched again on the next incremental run
+        indexable = [m for m in messages if m.text and m.text.strip()]
+        expected = len(indexable)
+        if indexed == expected:
+            newest = max(messages, key=lambda m: m.timestamp)
+            # The overlap buffer re-fetches messages that were already counted
+            new_messages = sum(
+                1 for m in indexable
+                if latest_indexed is None or m.timestamp > latest_indexed
+            )
+            self.channel_state.advance(
+                channel_id=channel.channel_id,
+                latest_ts=newest.ts,
+                latest_at=newest.timestamp,
+                indexed=new_messages,
+                reset=full,
+            )
+        else:
+            logger.warning(
+                f"Indexed {indexed}/{expected} messages from {channel.channel_id}; "
+                f"not advancing high-water mark"
+            )
+
         # Create interactions for DMs
         if create_interactions and (channel.is_im or channel.is_mpim):
             interactions_created, affected_ids, channel_msg_counts = self._create_interactions_for_channel(
@@ -335,8 +485,6 @@ class SlackSync:
         if not messages:
             return 0, affected_person_ids, message_counts
 
-        created = 0
-
         # For DMs, resolve the other person
         dm_partner_id = channel.name if channel.is_im else None
         if not dm_partner_id:
@@ -369,6 +517,7 @@ class SlackSync:
             messages_by_date[date_key].append(msg)
 
         # Create one interaction per date
+        interactions = []
         for date_key, day_messages in messages_by_date.items():
             # Use earliest message timestamp for the interaction
             earliest = min(day_messages, key=lambda m: m.timestamp)
@@ -390,7 +539,7 @@ class SlackSync:
             team_id = SLACK_TEAM_ID or self._workspace_id
             source_link = f"slack://channel?team={team_id}&id={channel.channel_id}"
 
-            interaction = Interaction(
+            interactions.append(Interaction(
                 id=str(uuid.uuid4()),
                 person_id=person_id,
                 timestamp=earliest.timestamp,
@@ -399,13 +548,10 @@ class SlackSync:
                 snippet=snippet,
                 source_link=source_link,
                 source_id=source_id,
-            )
+            ))
 
-            # Add if not already exists
-            _, was_added = self.interaction_store.add_if_not_exists(interaction)
-            if was_added:
-                created += 1
-                affected_person_ids.add(person_id)
+        # Insert all days in one transaction, skipping days already recorded
+        created, affected_person_ids = self.interaction_store.add_many(interactions)
 
         return created, affected_person_ids, message_counts
 
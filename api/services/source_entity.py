@@ -20,6 +20,7 @@ from typing import Optional
 from config.settings import settings
 from api.utils.datetime_utils import make_aware as _make_aware
 from api.utils.db_paths import get_crm_db_path
+from api.utils.db_connections import get_connection
 
 logger = logging.getLogger(__name__)
 
@@ -188,7 +189,7 @@ class SourceEntityStore:
 
     def _init_db(self):
         """Create database tables if they don't exist."""
-        conn = sqlite3.connect(self.db_path)
+        conn = get_connection(self.db_path)
         try:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
@@ -280,7 +281,7 @@ class SourceEntityStore:
 
     def _get_connection(self) -> sqlite3.Connection:
         """Get a database connection."""
-        return sqlite3.connect(self.db_path)
+        return get_connection(self.db_path)
 
     def add(self, entity: SourceEntity, validate_person: bool = True) -> SourceEntity:
         """
@@ -621,6 +622,60 @@ class SourceEntityStore:
         finally:
             conn.close()
 
+    def get_for_people_batch(
+        self,
+        person_ids: list[str],
+        limit_per_person: Optional[int] = None,
+    ) -> dict[str, list[SourceEntity]]:
+        """
+        Get source entities for many canonical people in batched queries.
+
+        This is much more efficient than calling get_for_person() in a loop.
+
+        Args:
+            person_ids: Canonical person IDs
+            limit_per_person: Maximum entities per person (None for all)
+
+        Returns:
+            Dict mapping person_id to source entities, most recent first
+        """
+        result: dict[str, list[SourceEntity]] = {pid: [] for pid in person_ids}
+        ids_list = list(result)
+
+        conn = self._get_connection()
+        try:
+            # Batches stay under SQLite's bound-parameter limit
+            for i in range(0, len(ids_list), 500):
+                batch = ids_list[i:i + 500]
+                placeholders = ",".join("?" * len(batch))
+                query = f"""
+                    SELECT * FROM source_entities
+                    WHERE canonical_person_id IN ({placeholders})
+                """
+                if limit_per_person is None:
+                    cursor = conn.execute(f"{query} ORDER BY observed_at DESC", batch)
+                    rows = cursor.fetchall()
+                else:
+                    # Apply the per-person limit in SQL so only kept rows are built
+                    cursor = conn.execute(f"""
+                        SELECT * FROM (
+                            SELECT *, ROW_NUMBER() OVER (
+                                PARTITION BY canonical_person_id
+                                ORDER BY observed_at DESC
+                            ) AS person_rank
+                            FROM ({query})
+                        )
+                        WHERE person_rank <= ?
+                        ORDER BY observed_at DESC
+                    """, [*batch, limit_per_person])
+                    rows = [row[:-1] for row in cursor.fetchall()]
+                for row in rows:
+                    entity = SourceEntity.from_row(row)
+                    result[entity.canonical_person_id].append(entity)
+            return result
+        finally:
+            conn.close()
+
     def get_unlinked(
         self,
         source_type: Optional[str] = None,
@@ -12,6 +12,8 @@ from enum import Enum
 from pathlib import Path
 from typing import Optional
 
+from api.utils.db_connections import get_connection
+
 logger = logging.getLogger(__name__)
 
 # Sync health database path
@@ -222,8 +224,7 @@ class SyncHealth:
 def get_sync_health_db() -> sqlite3.Connection:
     """Get connection to sync health database."""
     SYNC_HEALTH_DB_PATH.parent.mkdir(parents=True, exist_ok=True)
-    conn = sqlite3.connect(str(SYNC_HEALTH_DB_PATH))
-    conn.execute("PRAGMA journal_mode=WAL")
+    conn = get_connection(SYNC_HEALTH_DB_PATH)
     conn.row_factory = sqlite3.Row
     _init_schema(conn)
     return conn
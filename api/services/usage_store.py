@@ -11,6 +11,7 @@ from pathlib import Path
 from dataclasses import dataclass
 
 from config.settings import settings
+from api.utils.db_connections import transaction
 
 logger = logging.getLogger(__name__)
 
@@ -45,7 +46,7 @@ class UsageStore:
 
     def _init_db(self):
         """Initialize the database schema."""
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS usage (
@@ -87,7 +88,7 @@ class UsageStore:
         """
         now = datetime.now().isoformat()
 
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             cursor = conn.execute(
                 """
                 INSERT INTO usage (timestamp, model, input_tokens, output_tokens, cost_usd, conversation_id)
@@ -132,7 +133,7 @@ class UsageStore:
             query += " WHERE timestamp <= ?"
             params = [end_date.isoformat()]
 
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             row = conn.execute(query, params).fetchone()
 
             return {
@@ -173,7 +174,7 @@ class UsageStore:
             ORDER BY date ASC
         """
 
-        with sqlite3.connect(self.db_path) as conn:
+        with transaction(self.db_path) as conn:
             rows = conn.execute(query, [start_date.isoformat()]).fetchall()
 
             return [
@@ -0,0 +1,755 @@
+"""
+Persistent catalog of vault markdown files.
+
+The vault indexer, Granola processor and Omi processor each used to walk
+the whole vault on their own: the indexer stat'ed every file on every run,
+and the processors read and parsed every file's frontmatter once per
+processed note just to find duplicates by granola_id/omi_id. VaultCatalog
+keeps one SQLite record per file (stat, content hash, frontmatter, note
+date and type) so those become indexed lookups.
+
+## Key Design Decisions
+
+- **One scan, many readers**: reconcile() walks the vault once, stat'ing
+  every file but only reading files whose mtime/size changed; a changed
+  stat with an unchanged content hash skips re-parsing
+- **Indexed frontmatter**: every top-level scalar frontmatter value (and
+  each element of list values such as people and tags) is stored in
+  vault_file_keys with an index on (key, value), so find("granola_id", x)
+  is a point lookup
+- **One observer**: start_watching() owns the vault's watchdog observer.
+  Events are debounced per file, applied to the catalog, then passed to
+  subscribers (the indexer, inbox processors), instead of each service
+  running its own observer. Starts and stops are reference counted, so
+  the observer runs until every service that started it has stopped
+- **Reconciled on startup**: start_watching() reconciles in the background
+  after the observer is running; lookups wait for that scan, and the first
+  lookup in a process without a watcher reconciles first
+- **Writers refresh**: services that write or delete vault files call
+  refresh_file()/remove_file() so the catalog is current even without a
+  watcher. Callers that act on lookups should still check the file exists
+- **Per-vault rows**: rows carry their vault root and every query filters
+  on it, so a catalog only ever sees its own vault's files
+"""
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+from dataclasses import dataclass, field
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, Union
+
+import frontmatter
+from watchdog.events import FileSystemEvent, FileSystemEventHandler
+from watchdog.observers import Observer
+
+from config.settings import settings
+from api.utils.db_connections import get_connection, transaction
+
+logger = logging.getLogger(__name__)
+
+# Per-file debounce for watcher events (editors write files in bursts)
+DEBOUNCE_SECONDS = 1.0
+
+# (path, action) with action "index" or "delete"
+CatalogListener = Callable[[str, str], None]
+
+
+def get_vault_catalog_db_path() -> str:
+    """Get the path to the vault catalog database."""
+    db_dir = Path(settings.chroma_path).parent
+    db_dir.mkdir(parents=True, exist_ok=True)
+    return str(db_dir / "vault_catalog.db")
+
+
+def extract_note_date(path: Path, metadata: dict, body: str = "") -> str:
+    """
+    Extract a note's date using a priority cascade.
+
+    Priority:
+    1. Filename patterns (YYYY-MM-DD, YYYYMMDD)
+    2. Frontmatter fields: created, date, created_at, creation_date
+    3. Body text: "Created: ...", "Date: ..."
+    4. Return empty string (NO file timestamp fallback)
+
+    Args:
+        path: Path to the file
+        metadata: Parsed frontmatter dict
+        body: Note body content (for searching date patterns)
+
+    Returns:
+        ISO format date string or empty string if no date found
+    """
+    from api.utils.date_parser import parse_note_date
+
+    filename = path.stem  # filename without extension
+
+    # 1. Look for YYYY-MM-DD pattern in filename
+    match = re.search(r"(\d{4})-(\d{2})-(\d{2})", filename)
+    if match:
+        return f"{match.group(1)}-{match.group(2)}-{match.group(3)}"
+
+    # 2. Look for YYYYMMDD pattern in filename (e.g., "Meeting 20250925.md")
+    match = re.search(r"(\d{4})(\d{2})(\d{2})", filename)
+    if match:
+        year, month, day = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        if 2000 <= year <= 2100 and 1 <= month <= 12 and 1 <= day <= 31:
+            return f"{year:04d}-{month:02d}-{day:02d}"
+
+    # 3. Frontmatter fields
+    for key in ['created', 'date', 'created_at', 'creation_date']:
+        if key in metadata:
+            value = metadata[key]
+            if isinstance(value, datetime):
+                return value.strftime("%Y-%m-%d")
+            if isinstance(value, str):
+                parsed = parse_note_date(value)
+                if parsed:
+                    return parsed
+
+    # 4. Body text patterns (first 2000 chars)
+    body_sample = body[:2000] if body else ""
+    for pattern in [r"Created:\s*(.+?)(?:\n|$)", r"Date:\s*(.+?)(?:\n|$)"]:
+        match = re.search(pattern, body_sample, re.IGNORECASE)
+        if match:
+            parsed = parse_note_date(match.group(1).strip())
+            if parsed:
+                return parsed
+
+    # 5. No reliable date found - return empty string
+    # The vector store will give these a neutral recency score
+    return ""
+
+
+def infer_note_type(path: Path) -> str:
+    """
+    Infer note type from folder path.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Note type string
+    """
+    path_str = str(path).lower()
+    # Also check case-sensitive for ML
+    path_str_orig = str(path)
+
+    # ML folder = current job (high priority)
+    if "/ML/" in path_str_orig or "\\ML\\" in path_str_orig:
+        return "ML"
+    elif "granola" in path_str:
+        return "Granola"
+    elif "personal" in path_str:
+        return "Personal"
+    elif "work" in path_str:
+        return "Work"
+    elif "lifeos" in path_str:
+        return "LifeOS"
+    else:
+        return "Other"
+
+
+def _key_value(value: Any) -> Optional[str]:
+    """Normalize a frontmatter value for vault_file_keys, or None to skip it."""
+    if value is None or isinstance(value, (dict, list, tuple, set)):
+        return None
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    text = str(value)
+    return text if text else None
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, (date, datetime)):
+        return value.isoformat()
+    return str(value)
+
+
+@dataclass
+class VaultFile:
+    """Catalog record for one vault markdown file."""
+    path: str
+    mtime: float
+    size: int
+    content_hash: str
+    note_date: str = ""
+    note_type: str = "Other"
+    frontmatter: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_row(cls, row) -> "VaultFile":
+        return cls(
+            path=row[0],
+            mtime=row[1],
+            size=row[2],
+            content_hash=row[3],
+            note_date=row[4] or "",
+            note_type=row[5] or "Other",
+            frontmatter=json.loads(row[6]) if row[6] else {},
+        )
+
+    def key_rows(self) -> Iterator[tuple[str, str, str]]:
+        """(path, key, value) rows for vault_file_keys."""
+        for key, value in self.frontmatter.items():
+            values = value if isinstance(value, list) else [value]
+            for item in values:
+                normalized = _key_value(item)
+                if normalized is not None:
+                    yield (self.path, str(key), normalized)
+
+
+@dataclass
+class CatalogChanges:
+    """Files added, modified and removed by a reconcile()."""
+    added: list[str] = field(default_factory=list)
+    modified: list[str] = field(default_factory=list)
+    removed: list[str] = field(default_factory=list)
+
+    @property
+    def total(self) -> int:
+        return len(self.added) + len(self.modified) + len(self.removed)
+
+
+_SELECT_COLUMNS = "path, mtime, size, content_hash, note_date, note_type, frontmatter"
+
+
+class VaultEventHandler(FileSystemEventHandler):
+    """Debounce vault file events and apply them to the catalog."""
+
+    def __init__(self, catalog: "VaultCatalog"):
+        self.catalog = catalog
+        self._debounce_timers: dict[str, threading.Timer] = {}
+        self._lock = threading.Lock()
+
+    def _debounced_process(self, file_path: str, action: str):
+        """Process file change with debouncing."""
+        with self._lock:
+            # Cancel existing timer for this file
+            if file_path in self._debounce_timers:
+                self._debounce_timers[file_path].cancel()
+
+            def process():
+                with self._lock:
+                    self._debounce_timers.pop(file_path, None)
+                self.catalog.apply_event(file_path, action)
+
+            timer = threading.Timer(DEBOUNCE_SECONDS, process)
+            timer.daemon = True
+            self._debounce_timers[file_path] = timer
+            timer.start()
+
+    def cancel_pending(self) -> None:
+        """Drop events that haven't fired yet."""
+        with self._lock:
+            for timer in self._debounce_timers.values():
+                timer.cancel()
+            self._debounce_timers.clear()
+
+    def on_created(self, event: FileSystemEvent):
+        if not event.is_directory and event.src_path.endswith(".md"):
+            logger.info(f"File created: {event.src_path}")
+            self._debounced_process(event.src_path, "index")
+
+    def on_modified(self, event: FileSystemEvent):
+        if not event.is_directory and event.src_path.endswith(".md"):
+            logger.info(f"File modified: {event.src_path}")
+            self._debounced_process(event.src_path, "index")
+
+    def on_deleted(self, event: FileSystemEvent):
+        if not event.is_directory and event.src_path.endswith(".md"):
+            logger.info(f"File deleted: {event.src_path}")
+            self._debounced_process(event.src_path, "delete")
+
+    def on_moved(self, event: FileSystemEvent):
+        if not event.is_directory:
+            if hasattr(event, 'src_path') and event.src_path.endswith(".md"):
+                logger.info(f"File moved from: {event.src_path}")
+                self._debounced_process(event.src_path, "delete")
+            if hasattr(event, 'dest_path') and event.dest_path.endswith(".md"):
+                logger.info(f"File moved to: {event.dest_path}")
+                self._debounced_process(event.dest_path, "index")
+
+
+class VaultCatalog:
+    """
+    SQLite-backed catalog of one vault's markdown files.
+
+    Paths are stored as str(Path(vault_path) / relative_path), the same
+    form Path.rglob() yields, so they can be used as keys alongside the
+    indexer's state file.
+    """
+
+    def __init__(self, vault_path: Union[str, Path], db_path: Optional[str] = None):
+        """
+        Initialize the catalog.
+
+        Args:
+            vault_path: Path to Obsidian vault
+            db_path: Path to SQLite database (default from settings)
+        """
+        self.vault_path = Path(vault_path)
+        self.root = str(self.vault_path)
+        self.db_path = db_path or get_vault_catalog_db_path()
+        self._reconcile_lock = threading.RLock()
+        self._reconciled = False
+        # Set once start_watching()'s background reconcile has finished
+        self._background_reconcile: Optional[threading.Event] = None
+        self._listeners: list[CatalogListener] = []
+        self._listeners_lock = threading.Lock()
+        self._observer: Optional[Observer] = None
+        self._handler: Optional[VaultEventHandler] = None
+        self._watch_lock = threading.Lock()
+        self._watch_count = 0
+        self._init_db()
+
+    def _init_db(self) -> None:
+        with transaction(self.db_path) as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS vault_files (
+                    path TEXT PRIMARY KEY,
+                    root TEXT NOT NULL,
+                    mtime REAL NOT NULL,
+                    size INTEGER NOT NULL,
+                    content_hash TEXT NOT NULL,
+                    note_date TEXT,
+                    note_type TEXT,
+                    frontmatter TEXT,
+                    cataloged_at TEXT NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_vault_files_root ON vault_files(root)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS vault_file_keys (
+                    key TEXT NOT NULL,
+                    value TEXT NOT NULL,
+                    path TEXT NOT NULL,
+                    PRIMARY KEY (key, value, path)
+                ) WITHOUT ROWID
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_vault_file_keys_path ON vault_file_keys(path)")
+
+    # ------------------------------------------------------------------
+    # Building records
+    # ------------------------------------------------------------------
+
+    def _contains(self, path: str) -> bool:
+        return path.endswith(".md") and path.startswith(self.root + os.sep)
+
+    def _build(self, path: str, data: bytes, st: os.stat_result, content_hash: str) -> VaultFile:
+        text = data.decode("utf-8", errors="replace")
+        try:
+            post = frontmatter.loads(text)
+            metadata, body = dict(post.metadata), post.content
+        except Exception:
+            metadata, body = {}, text
+        file_path = Path(path)
+        return VaultFile(
+            path=path,
+            mtime=st.st_mtime,
+            size=st.st_size,
+            content_hash=content_hash,
+            note_date=extract_note_date(file_path, metadata, body),
+            note_type=infer_note_type(file_path),
+            # Round-trip through JSON so dates etc. match what get() returns
+            frontmatter=json.loads(json.dumps(metadata, default=_json_default)),
+        )
+
+    def _write(self, conn, files: list[VaultFile]) -> None:
+        now = datetime.now().isoformat()
+        conn.executemany(
+            """
+            INSERT INTO vault_files (
+                path, root, mtime, size, content_hash, note_date, note_type, frontmatter, cataloged_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(path) DO UPDATE SET
+                root = excluded.root,
+                mtime = excluded.mtime,
+                size = excluded.size,
+                content_hash = excluded.content_hash,
+                note_date = excluded.note_date,
+                note_type = excluded.note_type,
+                frontmatter = excluded.frontmatter,
+                cataloged_at = excluded.cataloged_at
+            """,
+            [
+                (f.path, self.root, f.mtime, f.size, f.content_hash, f.note_date,
+                 f.note_type, json.dumps(f.frontmatter), now)
+                for f in files
+            ],
+        )
+        conn.executemany(
+            "DELETE FROM vault_file_keys WHERE path = ?", [(f.path,) for f in files]
+        )
+        conn.executemany(
+            "INSERT OR IGNORE INTO vault_file_keys (path, key, value) VALUES (?, ?, ?)",
+            [row for f in files for row in f.key_rows()],
+        )
+
+    def _delete(self, conn, paths: list[str]) -> None:
+        conn.executemany("DELETE FROM vault_files WHERE path = ?", [(p,) for p in paths])
+        conn.executemany("DELETE FROM vault_file_keys WHERE path = ?", [(p,) for p in paths])
+
+    # ------------------------------------------------------------------
+    # Keeping the catalog current
+    # ------------------------------------------------------------------
+
+    def _scan(self) -> dict[str, os.stat_result]:
+        """Stat every markdown file under the vault (same files as rglob("*.md"))."""
+        found: dict[str, os.stat_result] = {}
+        for dirpath, _dirnames, filenames in os.walk(self.root):
+            for name in filenames:
+                if not name.endswith(".md"):
+                    continue
+                path = os.path.join(dirpath, name)
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue  # Vanished or dangling symlink
+                found[path] = st
+        return found
+
+    def reconcile(self) -> CatalogChanges:
+        """
+        Bring the catalog in line with the vault on disk.
+
+        Only files whose mtime or size changed are read; of those, only
+        files whose content hash changed are re-parsed.
+
+        Returns:
+            CatalogChanges listing added, modified and removed paths
+        """
+        with self._reconcile_lock:
+            on_disk = self._scan()
+            conn = get_connection(self.db_path)
+            try:
+                known = {
+                    row[0]: (row[1], row[2], row[3])
+                    for row in conn.execute(
+                        "SELECT path, mtime, size, content_hash FROM vault_files WHERE root = ?",
+                        (self.root,),
+                    )
+                }
+            finally:
+                conn.close()
+
+            changes = CatalogChanges(removed=sorted(set(known) - set(on_disk)))
+            updated: list[VaultFile] = []
+            restatted: list[tuple[float, int, str]] = []
+            for path, st in on_disk.items():
+                previous = known.get(path)
+                if previous is not None and previous[:2] == (st.st_mtime, st.st_size):
+                    continue
+                try:
+                    data = Path(path).read_bytes()
+                except OSError as e:
+                    logger.debug(f"Could not read {path} for catalog: {e}")
+                    continue
+                content_hash = hashlib.sha256(data).hexdigest()
+                if previous is not None and previous[2] == content_hash:
+                    restatted.append((st.st_mtime, st.st_size, path))
+                    continue
+                updated.append(self._build(path, data, st, content_hash))
+                (changes.modified if previous is not None else changes.added).append(path)
+
+            with transaction(self.db_path) as conn:
+                self._delete(conn, changes.removed)
+                self._write(conn, updated)
+                conn.executemany(
+                    "UPDATE vault_files SET mtime = ?, size = ? WHERE path = ?", restatted
+                )
+
+            self._reconciled = True
+
+        if changes.total:
+            logger.info(
+                f"Vault catalog reconciled: {len(changes.added)} added, "
+                f"{len(changes.modified)} modified, {len(changes.removed)} removed"
+            )
+        return changes
+
+    def ensure_reconciled(self) -> None:
+        """Reconcile once per process before the first lookup."""
+        if self._reconciled:
+            return
+        # Wait for start_watching()'s scan, even if it hasn't taken the lock yet
+        background = self._background_reconcile
+        if background is not None:
+            background.wait()
+        with self._reconcile_lock:
+            if not self._reconciled:
+                self.reconcile()
+
+    def refresh_file(self, file_path: Union[str, Path]) -> Optional[VaultFile]:
+        """
+        Re-catalog a single file after it was written, moved or deleted.
+
+        Args:
+            file_path: Path to the file
+
+        Returns:
+            The file's record, or None if it no longer exists (its record is removed)
+        """
+        path = str(file_path)
+        if not self._contains(path):
+            return None
+        try:
+            st = os.stat(path)
+            data = Path(path).read_bytes()
+        except OSError:
+            self.remove_file(path)
+            return None
+
+        record = self._build(path, data, st, hashlib.sha256(data).hexdigest())
+        with transaction(self.db_path) as conn:
+            self._write(conn, [record])
+        return record
+
+    def remove_file(self, file_path: Union[str, Path]) -> None:
+        """Drop a deleted file from the catalog."""
+        with transaction(self.db_path) as conn:
+            self._delete(conn, [str(file_path)])
+
+    def apply_event(self, file_path: str, action: str) -> None:
+        """
+        Apply a (debounced) watcher event and pass it on to subscribers.
+
+        Args:
+            file_path: Path from the event
+            action: "index" for created/modified/moved-to, "delete" otherwise
+        """
+        try:
+            if action == "delete":
+                self.remove_file(file_path)
+            else:
+                self.refresh_file(file_path)
+        except Exception as e:
+            logger.error(f"Failed to update vault catalog for {file_path}: {e}")
+
+        with self._listeners_lock:
+            listeners = list(self._listeners)
+        for listener in listeners:
+            try:
+                listener(file_path, action)
+            except Exception as e:
+                logger.error(f"Vault listener {listener!r} failed for {file_path}: {e}")
+
+    # ------------------------------------------------------------------
+    # Lookups
+    # ------------------------------------------------------------------
+
+    def get(self, file_path: Union[str, Path]) -> Optional[VaultFile]:
+        """Get the catalog record for a file."""
+        self.ensure_reconciled()
+        conn = get_connection(self.db_path)
+        try:
+            row = conn.execute(
+                f"SELECT {_SELECT_COLUMNS} FROM vault_files WHERE path = ?", (str(file_path),)
+            ).fetchone()
+        finally:
+            conn.close()
+        return VaultFile.from_row(row) if row else None
+
+    def find(self, key: str, value: Any) -> list[VaultFile]:
+        """
+        Find files whose frontmatter has key == value (or value in a list).
+
+        Args:
+            key: Top-level frontmatter key, e.g. "granola_id", "people", "tags"
+            value: Value to match
+
+        Returns:
+            Matching records, ordered by path
+        """
+        normalized = _key_value(value)
+        if normalized is None:
+            return []
+        self.ensure_reconciled()
+        conn = get_connection(self.db_path)
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT {', '.join('f.' + c for c in _SELECT_COLUMNS.split(', '))}
+                FROM vault_file_keys k
+                JOIN vault_files f ON f.path = k.path
+                WHERE k.key = ? AND k.value = ? AND f.root = ?
+                ORDER BY f.path
+                """,
+                (key, normalized, self.root),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [VaultFile.from_row(row) for row in rows]
+
+    def find_paths(self, key: str, value: Any) -> list[Path]:
+        """Paths of files whose frontmatter has key == value."""
+        return [Path(f.path) for f in self.find(key, value)]
+
+    def find_duplicates(self, key: str) -> dict[str, list[Path]]:
+        """
+        Group files sharing a frontmatter value.
+
+        Args:
+            key: Frontmatter key, e.g. "granola_id"
+
+        Returns:
+            Dict mapping value to paths, only for values on 2+ files
+        """
+        self.ensure_reconciled()
+        conn = get_connection(self.db_path)
+        try:
+            rows = conn.execute(
+                """
+                SELECT k.value, k.path
+                FROM vault_file_keys k
+                JOIN vault_files f ON f.path = k.path
+                WHERE k.key = ? AND f.root = ?
+                  AND k.value IN (
+                      SELECT k2.value FROM vault_file_keys k2
+                      JOIN vault_files f2 ON f2.path = k2.path
+                      WHERE k2.key = ? AND f2.root = ?
+                      GROUP BY k2.value HAVING COUNT(*) > 1
+                  )
+                ORDER BY k.value, k.path
+                """,
+                (key, self.root, key, self.root),
+            ).fetchall()
+        finally:
+            conn.close()
+
+        duplicates: dict[str, list[Path]] = {}
+        for value, path in rows:
+            duplicates.setdefault(value, []).append(Path(path))
+        return duplicates
+
+    def mtimes(self) -> dict[str, float]:
+        """Map of every cataloged path to its mtime."""
+        self.ensure_reconciled()
+        conn = get_connection(self.db_path)
+        try:
+            return dict(conn.execute(
+                "SELECT path, mtime FROM vault_files WHERE root = ?", (self.root,)
+            ))
+        finally:
+            conn.close()
+
+    def __len__(self) -> int:
+        conn = get_connection(self.db_path)
+        try:
+            return conn.execute(
+                "SELECT COUNT(*) FROM vault_files WHERE root = ?", (self.root,)
+            ).fetchone()[0]
+        finally:
+            conn.close()
+
+    # ------------------------------------------------------------------
+    # Watching
+    # ------------------------------------------------------------------
+
+    def subscribe(self, listener: CatalogListener) -> None:
+        """Call listener(path, action) after each watcher event is applied."""
+        with self._listeners_lock:
+            if listener not in self._listeners:
+                self._listeners.append(listener)
+
+    def unsubscribe(self, listener: CatalogListener) -> None:
+        """Remove a listener added with subscribe()."""
+        with self._listeners_lock:
+            self._listeners = [l for l in self._listeners if l != listener]
+
+    def start_watching(self) -> None:
+        """
+        Start the vault observer, then reconcile changes made while it was down.
+
+        Each call must be paired with a stop_watching(); only the first call
+        starts the observer. The reconcile runs on a background thread: on a
+        cold start it reads and hashes every vault file, and callers (the API
+        lifespan) must not wait for that. Lookups block in ensure_reconciled()
+        until it's done.
+        """
+        with self._watch_lock:
+            self._watch_count += 1
+            if self._observer is not None:
+                return
+            self._handler = VaultEventHandler(self)
+            self._observer = Observer()
+            self._observer.schedule(self._handler, self.root, recursive=True)
+            self._observer.start()
+            logger.info(f"Started watching {self.vault_path}")
+
+        # After the observer starts, so nothing changed mid-scan is missed
+        done = self._background_reconcile = threading.Event()
+        threading.Thread(
+            target=self._reconcile_in_background, args=(done,),
+            name="VaultCatalogReconcile", daemon=True
+        ).start()
+
+    def _reconcile_in_background(self, done: threading.Event) -> None:
+        try:
+            self.reconcile()
+        except Exception as e:
+            logger.error(f"Vault catalog reconcile failed: {e}")
+        finally:
+            done.set()
+
+    def stop_watching(self, force: bool = False) -> None:
+        """
+        Release one start_watching() call; the last release stops the observer.
+
+        Args:
+            force: Stop the observer even if other services still hold it
+        """
+        with self._watch_lock:
+            self._watch_count = 0 if force else max(0, self._watch_count - 1)
+            if self._observer is None or self._watch_count:
+                return
+            self._observer.stop()
+            self._observer.join(timeout=5)
+            self._observer = None
+            if self._handler is not None:
+                self._handler.cancel_pending()
+                self._handler = None
+            logger.info("Stopped watching")
+
+    @property
+    def is_watching(self) -> bool:
+        """Check if the vault observer is running."""
+        return self._observer is not None
+
+
+# Singleton instances, one per vault
+_catalogs: dict[str, VaultCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_vault_catalog(vault_path: Optional[Union[str, Path]] = None) -> VaultCatalog:
+    """
+    Get or create the catalog for a vault.
+
+    Args:
+        vault_path: Path to Obsidian vault (default from settings)
+    """
+    root = str(Path(vault_path if vault_path is not None else settings.vault_path))
+    with _catalogs_lock:
+        catalog = _catalogs.get(root)
+        if catalog is None:
+            catalog = _catalogs[root] = VaultCatalog(root)
+        return catalog
+
+
+def reset_vault_catalogs() -> None:
+    """
+    Stop and forget all catalog singletons.
+
+    For testing only.
+    """
+    with _catalogs_lock:
+        catalogs = list(_catalogs.values())
+        _catalogs.clear()
+    for catalog in catalogs:
+        catalog.stop_watching(force=True)
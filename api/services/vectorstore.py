@@ -1,21 +1,111 @@
 """
 ChromaDB vector store service for LifeOS.
 
-Connects to ChromaDB server via HTTP for thread-safe concurrent access.
+Connects to ChromaDB server via HTTP for thread-safe concurrent access, or
+(with settings.vector_backend = "local") to the embedded index in
+local_vector_index.py, which exposes the same collection API.
 
 NOTE: Heavy dependencies (chromadb, embeddings) are imported lazily
 to speed up pytest collection for unit tests.
 """
 from typing import Optional, Any, TYPE_CHECKING
-from datetime import datetime
+from datetime import date, datetime
 import json
-import math
+
+import numpy as np
 
 from config.settings import settings
+from api.services.chunk_ids import make_chunk_id
 
 if TYPE_CHECKING:
     import chromadb
 
+# Integer day number stored with each chunk so search can score recency
+# with array math instead of parsing date strings per candidate
+EPOCH_DAY_FIELD = "modified_epoch_day"
+_EPOCH = date(1970, 1, 1)
+_DATE_FORMATS = ("%Y-%m-%d", "%Y%m%d")
+
+
+def to_epoch_day(date_str: Optional[str]) -> Optional[int]:
+    """
+    Convert a date string to days since 1970-01-01.
+
+    Args:
+        date_str: Date as YYYY-MM-DD (optionally with a time part) or YYYYMMDD
+
+    Returns:
+        Epoch day, or None if the date is missing or unparseable
+    """
+    if not date_str:
+        return None
+    for fmt in _DATE_FORMATS:
+        try:
+            return (datetime.strptime(date_str[:10], fmt).date() - _EPOCH).days
+        except ValueError:
+            continue
+    return None
+
+
+def today_epoch_day() -> int:
+    """Today's local date as days since 1970-01-01."""
+    return (date.today() - _EPOCH).days
+
+
+def recency_scores(epoch_days: np.ndarray, note_types: Optional[list[str]] = None) -> np.ndarray:
+    """
+    Vectorized recency score with heavy bias toward recent documents.
+
+    Returns scores between 0 and 1, where:
+    - Documents from last 30 days: 0.9-1.0
+    - Documents from last 90 days: 0.7-0.9
+    - Documents from last year: 0.4-0.7
+    - Documents older than 1 year: 0.05-0.4 (exponential decay)
+    - ML folder content: Always boosted (current job)
+    - Undated files (NaN epoch day): Neutral score (0.5)
+
+    Args:
+        epoch_days: Float array of epoch days (NaN for undated)
+        note_types: Optional note types, parallel to epoch_days
+
+    Returns:
+        Float array of recency scores
+    """
+    days_old = today_epoch_day() - epoch_days
+    with np.errstate(invalid="ignore"):
+        scores = np.select(
+            [days_old <= 0, days_old <= 30, days_old <= 90, days_old <= 365],
+            [
+                1.0,
+                0.9 + 0.1 * (1 - days_old / 30),
+                0.7 + 0.2 * (1 - (days_old - 30) / 60),
+                0.4 + 0.3 * (1 - (days_old - 90) / 275),
+            ],
+            default=np.maximum(0.05, 0.4 * np.exp(-0.5 * (days_old / 365 - 1))),
+        )
+    scores[np.isnan(epoch_days)] = 0.5
+    if note_types is not None:
+        # ML folder = current job, always highly relevant
+        scores[np.array([t == "ML" for t in note_types], dtype=bool)] = 0.95
+    return scores
+
+
+def _epoch_day_or_sentinel(date_str: Optional[str]) -> int:
+    """Epoch day for storage in ChromaDB metadata (-1 when undated)."""
+    day = to_epoch_day(date_str)
+    return -1 if day is None else day
+
+
+def _metadata_epoch_day(metadata: dict) -> float:
+    """Epoch day from chunk metadata (NaN when undated)."""
+    day = metadata.get(EPOCH_DAY_FIELD)
+    if day is None:
+        # Chunk indexed before epoch days were stored
+        day = to_epoch_day(metadata.get("modified_date"))
+    if day is None or day < 0:
+        return np.nan
+    return float(day)
+
 
 class VectorStore:
     """ChromaDB-backed vector store for document chunks."""
@@ -32,19 +122,13 @@ class VectorStore:
             collection_name: Name of the collection
             server_url: ChromaDB server URL (default: from settings)
         """
-        import chromadb
-        from chromadb.config import Settings
-
         self.collection_name = collection_name
         self.server_url = server_url or settings.chroma_url
+        self.backend = settings.vector_backend
 
-        # Connect to ChromaDB server via HTTP
+        # Connect to ChromaDB server via HTTP (or open the embedded index)
         try:
-            self._client = chromadb.HttpClient(
-                host=self._parse_host(self.server_url),
-                port=self._parse_port(self.server_url),
-                settings=Settings(anonymized_telemetry=False)
-            )
+            self._client = self._create_client()
 
             # Get or create collection
             self._collection = self._client.get_or_create_collection(
@@ -52,11 +136,11 @@ class VectorStore:
                 metadata={"hnsw:space": "cosine"}
             )
 
-            # Mark ChromaDB as healthy on successful connection
+            # Mark vector store as healthy on successful connection
             from api.services.service_health import mark_service_healthy
             mark_service_healthy("chromadb")
         except Exception as e:
-            # Mark ChromaDB as failed
+            # Mark vector store as failed
             from api.services.service_health import mark_service_failed, Severity
             mark_service_failed("chromadb", str(e), Severity.CRITICAL)
             raise
@@ -65,6 +149,31 @@ class VectorStore:
         from api.services.embeddings import get_embedding_service
         self._embedding_service = get_embedding_service()
 
+    def _create_client(self) -> Any:
+        """Create the backend client (chromadb HttpClient or LocalVectorClient)."""
+        if self.backend == "local":
+            from api.services.local_vector_index import get_local_vector_client
+            return get_local_vector_client()
+        if self.backend != "chroma":
+            raise ValueError(f"Unknown vector backend: {self.backend!r} (expected 'chroma' or 'local')")
+
+        import chromadb
+        from chromadb.config import Settings
+
+        return chromadb.HttpClient(
+            host=self._parse_host(self.server_url),
+            port=self._parse_port(self.server_url),
+            settings=Settings(anonymized_telemetry=False)
+        )
+
+    def reset_collection(self) -> None:
+        """Delete and recreate the collection (e.g. when changing embedding dimensions)."""
+        self._client.delete_collection(self.collection_name)
+        self._collection = self._client.get_or_create_collection(
+            name=self.collection_name,
+            metadata={"hnsw:space": "cosine"}
+        )
+
     def _parse_host(self, url: str) -> str:
         """Extract host from URL."""
         return url.replace("http://", "").replace("https://", "").split(":")[0]
@@ -74,36 +183,30 @@ class VectorStore:
         parts = url.replace("http://", "").replace("https://", "").split(":")
         return int(parts[1]) if len(parts) > 1 else 8000
 
-    def add_document(
+    def _build_records(
         self,
         chunks: list[dict],
         metadata: dict
-    ) -> None:
+    ) -> tuple[list[str], list[str], list[dict]]:
         """
-        Add document chunks to the store.
+        Build ChromaDB ids, documents and flat metadatas for a document's chunks.
 
         Args:
             chunks: List of chunk dicts with 'content' and 'chunk_index'
             metadata: Document metadata (file_path, file_name, etc.)
-        """
-        if not chunks:
-            return
 
+        Returns:
+            Tuple of (ids, documents, metadatas)
+        """
         ids = []
-        embeddings = []
         documents = []
         metadatas = []
 
-        # Generate embeddings for all chunks
-        contents = [c["content"] for c in chunks]
-        chunk_embeddings = self._embedding_service.embed_texts(contents)
-
-        for i, chunk in enumerate(chunks):
-            # Create unique ID: file_path + chunk_index
-            chunk_id = f"{metadata['file_path']}::{chunk['chunk_index']}"
+        for chunk in chunks:
+            # Canonical chunk ID shared with BM25 (file_path::chunk_index)
+            chunk_id = make_chunk_id(metadata["file_path"], chunk["chunk_index"])
             ids.append(chunk_id)
 
-            embeddings.append(chunk_embeddings[i])
             documents.append(chunk["content"])
 
             # Prepare metadata - ChromaDB needs flat values
@@ -113,6 +216,8 @@ class VectorStore:
                 "modified_date": metadata.get("modified_date", ""),
                 "note_type": metadata.get("note_type", ""),
                 "chunk_index": chunk["chunk_index"],
+                # -1 = undated (ChromaDB metadata can't hold None)
+                EPOCH_DAY_FIELD: _epoch_day_or_sentinel(metadata.get("modified_date")),
                 # Store lists as JSON strings
                 "people": json.dumps(metadata.get("people", [])),
                 "tags": json.dumps(metadata.get("tags", []))
@@ -127,6 +232,28 @@ class VectorStore:
                         chunk_meta[key] = ""
             metadatas.append(chunk_meta)
 
+        return ids, documents, metadatas
+
+    def add_document(
+        self,
+        chunks: list[dict],
+        metadata: dict
+    ) -> None:
+        """
+        Add document chunks to the store.
+
+        Args:
+            chunks: List of chunk dicts with 'content' and 'chunk_index'
+            metadata: Document metadata (file_path, file_name, etc.)
+        """
+        if not chunks:
+            return
+
+        ids, documents, metadatas = self._build_records(chunks, metadata)
+
+        # Generate embeddings for all chunks
+        embeddings = self._embedding_service.embed_texts(documents)
+
         # Add to collection
         self._collection.add(
             ids=ids,
@@ -135,56 +262,103 @@ class VectorStore:
             metadatas=metadatas
         )
 
-    def _calculate_recency_score(self, modified_date: str, note_type: str = "") -> float:
+    def update_documents(self, documents: list[tuple[list[dict], dict]]) -> None:
+        """
+        Replace chunks for many documents with one embed call and one insert.
+
+        Batched counterpart of update_document() used by bulk reindexing:
+        chunks from all documents are embedded together, so short notes
+        don't each pay for a tiny encoder batch and an HTTP round trip.
+
+        Args:
+            documents: List of (chunks, metadata) tuples, one per document
         """
-        Calculate recency score with heavy bias toward recent documents.
-
-        Returns score between 0 and 1, where:
-        - Documents from last 30 days: 0.9-1.0
-        - Documents from last 90 days: 0.7-0.9
-        - Documents from last year: 0.4-0.7
-        - Documents older than 1 year: 0.0-0.4 (exponential decay)
-        - ML folder content: Always boosted (current job)
-        - Undated files: Neutral score (0.5)
+        if not documents:
+            return
+
+        # Delete existing chunks for every document in one call
+        file_paths = [metadata["file_path"] for _, metadata in documents]
+        self._collection.delete(where={"file_path": {"$in": file_paths}})
+
+        ids = []
+        texts = []
+        metadatas = []
+        for chunks, metadata in documents:
+            if not chunks:
+                continue
+            doc_ids, doc_texts, doc_metas = self._build_records(chunks, metadata)
+            ids.extend(doc_ids)
+            texts.extend(doc_texts)
+            metadatas.extend(doc_metas)
+
+        if not ids:
+            return
+
+        embeddings = self._embedding_service.embed_texts(texts)
+        self._collection.add(
+            ids=ids,
+            embeddings=embeddings,
+            documents=texts,
+            metadatas=metadatas
+        )
+
+    def upsert_documents(self, documents: list[tuple[list[dict], dict]]) -> None:
         """
-        # ML folder = current job, always highly relevant
-        if note_type == "ML":
-            return 0.95
+        Insert or overwrite specific chunks for many documents.
 
-        # No date in filename = undated, give neutral score
-        if not modified_date:
-            return 0.5
+        Unlike update_documents(), existing chunks that aren't passed in are
+        left untouched, so callers can write only the chunks that changed.
 
-        try:
-            # Parse date (supports various formats)
-            date = None
-            for fmt in ["%Y-%m-%d", "%Y-%m-%dT%H:%M:%S", "%Y%m%d"]:
-                try:
-                    date = datetime.strptime(modified_date[:10], fmt)
-                    break
-                except ValueError:
-                    continue
-
-            if not date:
-                return 0.5  # Couldn't parse date, neutral score
-
-            days_old = (datetime.now() - date).days
-
-            if days_old <= 0:
-                return 1.0
-            elif days_old <= 30:
-                return 0.9 + (0.1 * (1 - days_old / 30))
-            elif days_old <= 90:
-                return 0.7 + (0.2 * (1 - (days_old - 30) / 60))
-            elif days_old <= 365:
-                return 0.4 + (0.3 * (1 - (days_old - 90) / 275))
-            else:
-                # Exponential decay for older documents
-                years_old = days_old / 365
-                return max(0.05, 0.4 * math.exp(-0.5 * (years_old - 1)))
-
-        except Exception:
-            return 0.5
+        Args:
+            documents: List of (chunks, metadata) tuples; chunks may be a subset
+                       of the document's chunks
+        """
+        ids = []
+        texts = []
+        metadatas = []
+        for chunks, metadata in documents:
+            if not chunks:
+                continue
+            doc_ids, doc_texts, doc_metas = self._build_records(chunks, metadata)
+            ids.extend(doc_ids)
+            texts.extend(doc_texts)
+            metadatas.extend(doc_metas)
+
+        if not ids:
+            return
+
+        embeddings = self._embedding_service.embed_texts(texts)
+        self._collection.upsert(
+            ids=ids,
+            embeddings=embeddings,
+            documents=texts,
+            metadatas=metadatas
+        )
+
+    def delete_chunks(self, chunk_ids: list[str]) -> None:
+        """
+        Delete specific chunks by ID.
+
+        Args:
+            chunk_ids: Canonical chunk IDs to remove
+        """
+        if chunk_ids:
+            self._collection.delete(ids=chunk_ids)
+
+    def _calculate_recency_score(self, modified_date: str, note_type: str = "") -> float:
+        """
+        Calculate recency score for a single date (see recency_scores()).
+
+        Args:
+            modified_date: Date string (YYYY-MM-DD or YYYYMMDD)
+            note_type: Note type; "ML" is always boosted
+
+        Returns:
+            Score between 0 and 1
+        """
+        day = to_epoch_day(modified_date)
+        epoch_days = np.array([np.nan if day is None else day], dtype=float)
+        return float(recency_scores(epoch_days, [note_type])[0])
 
     def search(
         self,
@@ -205,8 +379,36 @@ class VectorStore:
         Returns:
             List of result dicts with content, metadata, and score
         """
-        # Generate query embedding
-        query_embedding = self._embedding_service.embed_text(query)
+        return self.search_many([query], top_k=top_k, filters=filters, recency_weight=recency_weight)[0]
+
+    def search_many(
+        self,
+        queries: list[str],
+        top_k: int = 20,
+        filters: Optional[dict] = None,
+        recency_weight: float = 0.6
+    ) -> list[list[dict]]:
+        """
+        Search for several queries with one model pass and one ChromaDB request.
+
+        All query embeddings are generated in a single encode call and sent
+        in one collection.query(), instead of one embed + HTTP round trip per
+        query (e.g. one search per meeting attendee).
+
+        Args:
+            queries: Search query texts
+            top_k: Number of results to return per query
+            filters: Optional metadata filters (applied to every query)
+            recency_weight: Weight for recency vs semantic similarity (0.6 = 60% recency)
+
+        Returns:
+            One result list per query, in the same order as queries
+        """
+        if not queries:
+            return []
+
+        # Generate query embeddings (cached across calls for repeated queries)
+        query_embeddings = self._embedding_service.embed_queries(queries)
 
         # Build where clause for filters
         where = None
@@ -221,55 +423,74 @@ class VectorStore:
 
         # Query collection
         results = self._collection.query(
-            query_embeddings=[query_embedding],
+            query_embeddings=query_embeddings,
             n_results=fetch_count,
             where=where if where else None,
             include=["documents", "metadatas", "distances"]
         )
 
-        # Format and score results
+        return [
+            self._format_results(results, i, top_k, recency_weight)
+            for i in range(len(queries))
+        ]
+
+    def _format_results(
+        self,
+        results: dict,
+        query_index: int,
+        top_k: int,
+        recency_weight: float
+    ) -> list[dict]:
+        """
+        Score and format one query's results from a collection.query() response.
+
+        Scores are computed as array ops over all candidates; result dicts
+        (and the JSON-encoded people/tags fields) are only built for the
+        top_k candidates that are returned.
+        """
+        if not results["ids"] or query_index >= len(results["ids"]):
+            return []
+
+        ids = results["ids"][query_index]
+        if not ids:
+            return []
+        documents = results["documents"][query_index]
+        metadatas = results["metadatas"][query_index]
+
+        semantic_scores = 1 - np.asarray(results["distances"][query_index], dtype=float)
+        epoch_days = np.array([_metadata_epoch_day(meta) for meta in metadatas], dtype=float)
+        recency = recency_scores(epoch_days, [meta.get("note_type", "") for meta in metadatas])
+
+        # Combined score: heavily weighted toward recency
+        combined = (1 - recency_weight) * semantic_scores + recency_weight * recency
+
+        # Stable sort keeps ChromaDB's order for equal scores
+        top = np.argsort(-combined, kind="stable")[:top_k]
+
         formatted = []
-        if results["ids"] and results["ids"][0]:
-            for i, doc_id in enumerate(results["ids"][0]):
-                metadata = results["metadatas"][0][i]
-                semantic_score = 1 - results["distances"][0][i]
-
-                # Calculate recency score
-                recency_score = self._calculate_recency_score(
-                    metadata.get("modified_date", ""),
-                    metadata.get("note_type", "")
-                )
-
-                # Combined score: heavily weighted toward recency
-                combined_score = (
-                    (1 - recency_weight) * semantic_score +
-                    recency_weight * recency_score
-                )
-
-                result = {
-                    "content": results["documents"][0][i],
-                    "score": combined_score,
-                    "semantic_score": semantic_score,
-                    "recency_score": recency_score,
-                    **metadata
-                }
-                # Parse JSON fields
-                if "people" in result and isinstance(result["people"], str):
-                    try:
-                        result["people"] = json.loads(result["people"])
-                    except json.JSONDecodeError:
-                        result["people"] = []
-                if "tags" in result and isinstance(result["tags"], str):
-                    try:
-                        result["tags"] = json.loads(result["tags"])
-                    except json.JSONDecodeError:
-                        result["tags"] = []
-                formatted.append(result)
-
-        # Re-rank by combined score
-        formatted.sort(key=lambda x: x["score"], reverse=True)
-
-        return formatted[:top_k]
+        for i in top:
+            result = {
+                "id": ids[i],
+                "content": documents[i],
+                "score": float(combined[i]),
+                "semantic_score": float(semantic_scores[i]),
+                "recency_score": float(recency[i]),
+                **metadatas[i]
+            }
+            # Parse JSON fields
+            if "people" in result and isinstance(result["people"], str):
+                try:
+                    result["people"] = json.loads(result["people"])
+                except json.JSONDecodeError:
+                    result["people"] = []
+            if "tags" in result and isinstance(result["tags"], str):
+                try:
+                    result["tags"] = json.loads(result["tags"])
+                except json.JSONDecodeError:
+                    result["tags"] = []
+            formatted.append(result)
+
+        return formatted
 
     def delete_document(self, file_path: str) -> None:
         """
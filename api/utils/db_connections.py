@@ -0,0 +1,353 @@
+"""
+Shared SQLite connection manager for LifeOS stores.
+
+Every SQLite-backed store gets its connections from here instead of calling
+sqlite3.connect() per method, so a CRM page load that touches five stores
+reuses warm connections (and their prepared-statement caches) instead of
+opening a fresh file handle for every query.
+
+## Key Design Decisions
+
+- **Per-thread pools**: idle connections are cached per thread and per DB
+  path. FastAPI's threadpool workers and sync scripts each keep their own,
+  so no connection is ever used by two threads at once
+- **Drop-in close()**: get_connection() returns a PooledConnection whose
+  close() rolls back anything uncommitted and hands the connection back to
+  the pool, so existing try/finally conn.close() code keeps working
+- **Uniform pragmas**: WAL, synchronous=NORMAL, busy timeout, mmap and a
+  larger page cache on every connection; stores may override (e.g. the
+  person entity store keeps synchronous=FULL)
+- **Replaced files**: a pooled connection is discarded if its DB file was
+  deleted or replaced since it was opened (tests, restores, rebuilds)
+- **Timing hooks**: execute/executemany/executescript are timed and passed
+  to registered hooks; slow single statements are logged
+
+## Usage
+
+    from api.utils.db_connections import get_connection, transaction
+
+    conn = get_connection(db_path)
+    try:
+        rows = conn.execute("SELECT ...").fetchall()
+    finally:
+        conn.close()  # returns the connection to this thread's pool
+
+    with transaction(db_path) as conn:
+        conn.execute("UPDATE ...")  # committed on exit, rolled back on error
+"""
+import logging
+import os
+import sqlite3
+import threading
+import time
+import weakref
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, Union
+
+logger = logging.getLogger(__name__)
+
+StrPath = Union[str, "os.PathLike[str]"]
+QueryHook = Callable[[str, str, float], None]
+
+DEFAULT_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": 30000,
+    "cache_size": -16000,  # KiB, i.e. ~16MB page cache per connection
+    "mmap_size": 268435456,
+    "temp_store": "MEMORY",
+}
+
+CONNECT_TIMEOUT_SECONDS = 30.0
+CACHED_STATEMENTS = 256
+MAX_IDLE_PER_THREAD = 4
+SLOW_QUERY_SECONDS = 1.0
+
+_local = threading.local()
+_pools: "weakref.WeakSet[_IdlePool]" = weakref.WeakSet()
+_pools_lock = threading.Lock()
+_generations: dict[str, int] = {}
+_query_hooks: tuple[QueryHook, ...] = ()
+_hooks_lock = threading.Lock()
+
+
+class _IdlePool:
+    """Idle connections for one (path, pragmas) key on one thread."""
+
+    __slots__ = ("__weakref__", "db_path", "entries")
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.entries: list[_Entry] = []
+
+
+class _Entry:
+    """A raw connection plus what is needed to decide whether to reuse it."""
+
+    __slots__ = ("conn", "file_id", "generation")
+
+    def __init__(self, conn: sqlite3.Connection, file_id: Optional[tuple[int, int]], generation: int):
+        self.conn = conn
+        self.file_id = file_id
+        self.generation = generation
+
+
+def _is_memory_path(db_path: str) -> bool:
+    return db_path in ("", ":memory:") or db_path.startswith("file:")
+
+
+def _file_id(db_path: str) -> Optional[tuple[int, int]]:
+    try:
+        st = os.stat(db_path)
+    except OSError:
+        return None
+    return (st.st_dev, st.st_ino)
+
+
+def _open(db_path: str, pragmas: dict) -> sqlite3.Connection:
+    # check_same_thread=False only so close_all() and garbage collection can
+    # close connections from any thread; each is used by one thread at a time
+    conn = sqlite3.connect(
+        db_path,
+        timeout=CONNECT_TIMEOUT_SECONDS,
+        check_same_thread=False,
+        cached_statements=CACHED_STATEMENTS,
+    )
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name}={value}")
+    return conn
+
+
+def _close_quietly(conn: sqlite3.Connection) -> None:
+    try:
+        conn.close()
+    except sqlite3.Error:
+        pass
+
+
+def _thread_pool(key: tuple) -> _IdlePool:
+    pools = getattr(_local, "pools", None)
+    if pools is None:
+        pools = _local.pools = {}
+    pool = pools.get(key)
+    if pool is None:
+        pool = pools[key] = _IdlePool(key[0])
+        with _pools_lock:
+            _pools.add(pool)
+    return pool
+
+
+def _record(db_path: str, sql: str, elapsed: float) -> None:
+    for hook in _query_hooks:
+        try:
+            hook(db_path, sql, elapsed)
+        except Exception as e:
+            logger.warning(f"Query hook {hook!r} failed: {e}")
+
+
+class PooledConnection:
+    """
+    sqlite3.Connection stand-in handed out by get_connection().
+
+    Attribute access (row_factory, commit, cursor, backup, ...) is forwarded
+    to the underlying connection. close() releases it back to the pool;
+    using the object afterwards raises sqlite3.ProgrammingError, the same
+    as a closed sqlite3.Connection.
+    """
+
+    __slots__ = ("_entry", "_pool", "db_path")
+
+    def __init__(self, entry: _Entry, pool: Optional[_IdlePool], db_path: str):
+        object.__setattr__(self, "_entry", entry)
+        object.__setattr__(self, "_pool", pool)
+        object.__setattr__(self, "db_path", db_path)
+
+    @property
+    def raw(self) -> sqlite3.Connection:
+        """The underlying sqlite3.Connection (for APIs that need the real type)."""
+        entry = self._entry
+        if entry is None:
+            raise sqlite3.ProgrammingError("Cannot operate on a released connection.")
+        return entry.conn
+
+    def __getattr__(self, name: str):
+        return getattr(self.raw, name)
+
+    def __setattr__(self, name: str, value) -> None:
+        setattr(self.raw, name, value)
+
+    def execute(self, sql: str, parameters=()) -> sqlite3.Cursor:
+        start = time.perf_counter()
+        try:
+            return self.raw.execute(sql, parameters)
+        finally:
+            elapsed = time.perf_counter() - start
+            if elapsed >= SLOW_QUERY_SECONDS:
+                logger.warning(f"Slow query on {self.db_path} ({elapsed:.2f}s): {sql.strip()[:200]}")
+            if _query_hooks:
+                _record(self.db_path, sql, elapsed)
+
+    def executemany(self, sql: str, seq_of_parameters) -> sqlite3.Cursor:
+        start = time.perf_counter()
+        try:
+            return self.raw.executemany(sql, seq_of_parameters)
+        finally:
+            if _query_hooks:
+                _record(self.db_path, sql, time.perf_counter() - start)
+
+    def executescript(self, sql_script: str) -> sqlite3.Cursor:
+        start = time.perf_counter()
+        try:
+            return self.raw.executescript(sql_script)
+        finally:
+            if _query_hooks:
+                _record(self.db_path, sql_script, time.perf_counter() - start)
+
+    def __enter__(self) -> "PooledConnection":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        # Same as sqlite3.Connection: commit or roll back, but stay open
+        self.raw.__exit__(exc_type, exc, tb)
+        return False
+
+    def close(self) -> None:
+        """Roll back any open transaction and return the connection to the pool."""
+        entry = self._entry
+        if entry is None:
+            return
+        object.__setattr__(self, "_entry", None)
+        _release(entry, self._pool)
+
+    def __del__(self):
+        # Callers that never close() (e.g. `with store._get_connection() as c:`)
+        # still give the connection back once the wrapper is collected
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+def _release(entry: _Entry, pool: Optional[_IdlePool]) -> None:
+    conn = entry.conn
+    if pool is None:
+        _close_quietly(conn)
+        return
+    try:
+        if conn.in_transaction:
+            conn.rollback()
+        conn.row_factory = None
+        conn.text_factory = str
+        conn.isolation_level = ""
+    except sqlite3.Error:
+        _close_quietly(conn)
+        return
+    if (
+        entry.generation != _generations.get(pool.db_path, 0)
+        or len(pool.entries) >= MAX_IDLE_PER_THREAD
+    ):
+        _close_quietly(conn)
+        return
+    pool.entries.append(entry)
+
+
+def get_connection(db_path: StrPath, **pragmas) -> PooledConnection:
+    """
+    Get a connection to db_path from this thread's pool, opening one if needed.
+
+    Args:
+        db_path: Path to the SQLite database
+        **pragmas: Overrides for DEFAULT_PRAGMAS (e.g. synchronous="FULL").
+            Connections with different overrides are pooled separately.
+
+    Returns:
+        A PooledConnection; call close() (or use transaction()) to release it
+    """
+    path = os.fspath(db_path)
+    effective = {**DEFAULT_PRAGMAS, **pragmas} if pragmas else DEFAULT_PRAGMAS
+
+    if _is_memory_path(path):
+        # Each in-memory connection is its own database; never share them
+        return PooledConnection(_Entry(_open(path, effective), None, 0), None, path)
+
+    pool = _thread_pool((path, tuple(sorted(pragmas.items()))))
+    generation = _generations.get(path, 0)
+    file_id = None
+    while pool.entries:
+        entry = pool.entries.pop()
+        if file_id is None:
+            file_id = _file_id(path)
+        if entry.generation == generation and entry.file_id == file_id and file_id is not None:
+            return PooledConnection(entry, pool, path)
+        _close_quietly(entry.conn)
+
+    conn = _open(path, effective)
+    return PooledConnection(_Entry(conn, _file_id(path), generation), pool, path)
+
+
+@contextmanager
+def transaction(db_path: StrPath, immediate: bool = False, **pragmas) -> Iterator[PooledConnection]:
+    """
+    Run a block in one transaction on a pooled connection.
+
+    Commits when the block exits normally, rolls back if it raises, and
+    releases the connection either way.
+
+    Args:
+        db_path: Path to the SQLite database
+        immediate: Take the write lock up front (BEGIN IMMEDIATE) so a
+            read-then-write block can't fail with SQLITE_BUSY half way
+        **pragmas: Passed through to get_connection()
+    """
+    conn = get_connection(db_path, **pragmas)
+    try:
+        if immediate:
+            conn.execute("BEGIN IMMEDIATE")
+        yield conn
+        conn.commit()
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        conn.close()
+
+
+def add_query_hook(hook: QueryHook) -> None:
+    """Register hook(db_path, sql, elapsed_seconds), called after every statement."""
+    global _query_hooks
+    with _hooks_lock:
+        if hook not in _query_hooks:
+            _query_hooks = _query_hooks + (hook,)
+
+
+def remove_query_hook(hook: QueryHook) -> None:
+    """Unregister a hook added with add_query_hook()."""
+    global _query_hooks
+    with _hooks_lock:
+        _query_hooks = tuple(h for h in _query_hooks if h is not hook)
+
+
+def close_all(db_path: Optional[StrPath] = None) -> None:
+    """
+    Close idle pooled connections on every thread.
+
+    Connections currently checked out are closed when released instead of
+    being returned to the pool.
+
+    Args:
+        db_path: Only close connections to this database (default: all)
+    """
+    path = os.fspath(db_path) if db_path is not None else None
+    with _pools_lock:
+        pools = [p for p in _pools if path is None or p.db_path == path]
+    for pool in pools:
+        _generations[pool.db_path] = _generations.get(pool.db_path, 0) + 1
+    if path is not None:
+        _generations[path] = _generations.get(path, 0) + 1
+    for pool in pools:
+        while pool.entries:
+            try:
+                entry = pool.entries.pop()
+            except IndexError:
+                break
+            _close_quietly(entry.conn)
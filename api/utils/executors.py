@@ -0,0 +1,130 @@
+"""
+Bounded thread pools for blocking work called from async request handlers.
+
+Most CRM and chat handlers are `async def` but call synchronous SQLite
+stores, Google API clients or model SDKs. Run directly on the event loop,
+one slow family dashboard query stalls every streaming chat response.
+Handlers hand that work to a pool sized for the resource it hits instead.
+
+## Key Design Decisions
+
+- **One pool per resource class**: "sqlite" (local stores and files),
+  "google" (Google and other remote API clients) and "models" (LLM and
+  embedding calls), sized by settings.*_executor_workers. A burst of slow
+  Google calls can't starve the SQLite pool and vice versa
+- **Still coroutines**: @offload keeps the decorated function awaitable
+  and its signature intact, so FastAPI routing and existing tests that
+  `await handler()` are unchanged
+- **Context propagation**: contextvars are copied into the worker thread,
+  like asyncio.to_thread
+- **Lazy pools**: created on first use and recreated after shutdown, so
+  the app lifespan can tear them down without breaking later tests
+
+## Usage
+
+    from api.utils.executors import SQLITE, GOOGLE, offload, run_blocking
+
+    @router.get("/people")
+    @offload(SQLITE)
+    def list_people(...):
+        return get_person_entity_store().get_all()
+
+    events = await run_blocking(GOOGLE, calendar.get_upcoming_events, days=7)
+"""
+import asyncio
+import contextvars
+import functools
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, TypeVar
+
+from config.settings import settings
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SQLITE = "sqlite"
+GOOGLE = "google"
+MODELS = "models"
+
+_WORKER_SETTINGS = {
+    SQLITE: "sqlite_executor_workers",
+    GOOGLE: "google_executor_workers",
+    MODELS: "model_executor_workers",
+}
+
+_executors: dict[str, ThreadPoolExecutor] = {}
+_lock = threading.Lock()
+
+
+def get_executor(resource: str) -> ThreadPoolExecutor:
+    """
+    Get the thread pool for a resource class, creating it if needed.
+
+    Args:
+        resource: SQLITE, GOOGLE or MODELS
+
+    Raises:
+        ValueError: For an unknown resource class
+    """
+    if resource not in _WORKER_SETTINGS:
+        raise ValueError(f"Unknown executor resource: {resource}")
+    with _lock:
+        executor = _executors.get(resource)
+        if executor is None:
+            workers = max(1, getattr(settings, _WORKER_SETTINGS[resource]))
+            executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f"{resource}-io")
+            _executors[resource] = executor
+        return executor
+
+
+async def run_blocking(resource: str, fn: Callable[..., T], *args, **kwargs) -> T:
+    """
+    Run a blocking callable on a resource's pool without blocking the event loop.
+
+    Args:
+        resource: SQLITE, GOOGLE or MODELS
+        fn: Synchronous callable
+        *args, **kwargs: Passed to fn
+
+    Returns:
+        fn's return value (exceptions propagate to the caller)
+    """
+    loop = asyncio.get_running_loop()
+    ctx = contextvars.copy_context()
+    call = functools.partial(ctx.run, fn, *args, **kwargs)
+    return await loop.run_in_executor(get_executor(resource), call)
+
+
+def offload(resource: str) -> Callable[[Callable[..., T]], Callable[..., Awaitable[T]]]:
+    """
+    Decorator turning a blocking function into a coroutine run on a resource pool.
+
+    Place it under the @router decorator; FastAPI sees the original
+    signature and treats the handler as async.
+    """
+    if resource not in _WORKER_SETTINGS:
+        raise ValueError(f"Unknown executor resource: {resource}")
+
+    def decorator(fn: Callable[..., T]) -> Callable[..., Awaitable[T]]:
+        if asyncio.iscoroutinefunction(fn):
+            raise TypeError(f"@offload expects a sync function, got coroutine function {fn.__name__}")
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs) -> T:
+            return await run_blocking(resource, fn, *args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def shutdown_executors(wait: bool = False) -> None:
+    """Shut down all pools (app shutdown). Later calls create fresh pools."""
+    with _lock:
+        executors = list(_executors.values())
+        _executors.clear()
+    for executor in executors:
+        executor.shutdown(wait=wait, cancel_futures=True)
@@ -0,0 +1,173 @@
+"""
+SQLite FTS5 shadow indexes for message archives.
+
+Message stores (the iMessage export, WhatsApp interactions) keep their rows
+in ordinary tables; this module hangs an external-content FTS5 index off a
+text column and keeps it in sync with triggers, so text search is an index
+lookup instead of a LIKE '%term%' scan over years of messages.
+
+## Key Design Decisions
+
+- **External content**: the FTS table stores only the index; text is read
+  back from the source table by rowid (snippet() still works)
+- **Trigger maintained**: INSERT/UPDATE/DELETE on the source table update
+  the index in the same transaction. Like the interaction rollup triggers,
+  rows removed by INSERT OR REPLACE are missed unless recursive_triggers is
+  on, so writers use ON CONFLICT upserts
+- **Partial indexes**: an optional filter (e.g. source_type = 'whatsapp')
+  limits which rows are indexed
+- **Rowid keyed**: the source table's rowid must be stable (INTEGER PRIMARY
+  KEY, or a rowid table that is never VACUUMed); rebuild_fts_index()
+  recovers if it isn't
+"""
+import re
+import sqlite3
+from typing import Optional
+
+# unicode61 folds case and diacritics; the prefix index keeps 2-3 character
+# prefix queries ("jo*") from scanning the whole term list
+FTS_TOKENIZE = "unicode61 remove_diacritics 2"
+FTS_PREFIX = "2 3"
+
+_PHRASE_RE = re.compile(r'"([^"]*)"')
+_WORD_RE = re.compile(r"\w+\*?", re.UNICODE)
+
+
+def _row_filter(where: Optional[str], row: str) -> str:
+    return f"WHERE {where.format(row=row)}" if where else ""
+
+
+def ensure_fts_index(
+    conn: sqlite3.Connection,
+    fts_table: str,
+    content_table: str,
+    column: str,
+    where: Optional[str] = None,
+) -> bool:
+    """
+    Create an FTS5 index over content_table.column with its triggers.
+
+    Safe to call on every startup; the index is only backfilled the first
+    time it is created.
+
+    Args:
+        conn: Open connection (caller commits)
+        fts_table: Name of the FTS5 table to create
+        content_table: Table holding the text
+        column: Text column to index
+        where: Optional row filter using {row} as the column prefix,
+            e.g. "{row}source_type = 'whatsapp'"
+
+    Returns:
+        True if the index was created (and backfilled) by this call
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (fts_table,)
+    ).fetchone()
+
+    conn.execute(f"""
+        CREATE VIRTUAL TABLE IF NOT EXISTS {fts_table} USING fts5(
+            {column},
+            content='{content_table}',
+            content_rowid='rowid',
+            tokenize='{FTS_TOKENIZE}',
+            prefix='{FTS_PREFIX}'
+        )
+    """)
+
+    add_new = f"""
+        INSERT INTO {fts_table}(rowid, {column})
+        SELECT NEW.rowid, NEW.{column} {_row_filter(where, 'NEW.')};
+    """
+    remove_old = f"""
+        INSERT INTO {fts_table}({fts_table}, rowid, {column})
+        SELECT 'delete', OLD.rowid, OLD.{column} {_row_filter(where, 'OLD.')};
+    """
+    watched = column
+    if where:
+        # Re-evaluate the filter when any column it reads changes
+        filter_columns = set(re.findall(r"\{row\}(\w+)", where)) - {column}
+        watched = ", ".join([column, *sorted(filter_columns)])
+
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{fts_table}_insert
+        AFTER INSERT ON {content_table}
+        BEGIN {add_new} END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{fts_table}_delete
+        AFTER DELETE ON {content_table}
+        BEGIN {remove_old} END
+    """)
+    conn.execute(f"""
+        CREATE TRIGGER IF NOT EXISTS trg_{fts_table}_update
+        AFTER UPDATE OF {watched} ON {content_table}
+        BEGIN {remove_old} {add_new} END
+    """)
+
+    if exists:
+        return False
+    _backfill(conn, fts_table, content_table, column, where)
+    return True
+
+
+def _backfill(
+    conn: sqlite3.Connection,
+    fts_table: str,
+    content_table: str,
+    column: str,
+    where: Optional[str],
+) -> None:
+    if where:
+        # 'rebuild' would index every row, ignoring the filter
+        conn.execute(f"""
+            INSERT INTO {fts_table}(rowid, {column})
+            SELECT rowid, {column} FROM {content_table} {_row_filter(where, '')}
+        """)
+    else:
+        conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('rebuild')")
+
+
+def rebuild_fts_index(
+    conn: sqlite3.Connection,
+    fts_table: str,
+    content_table: str,
+    column: str,
+    where: Optional[str] = None,
+) -> None:
+    """Drop all index entries and re-index content_table from scratch."""
+    conn.execute(f"INSERT INTO {fts_table}({fts_table}) VALUES ('delete-all')")
+    _backfill(conn, fts_table, content_table, column, where)
+
+
+def build_match_query(text: str) -> Optional[str]:
+    """
+    Turn user search text into a safe FTS5 MATCH expression.
+
+    - "quoted words" become a phrase query
+    - word* becomes a prefix query
+    - remaining words are ANDed
+    - FTS5 operators and punctuation are treated as plain text
+
+    Args:
+        text: Raw search text
+
+    Returns:
+        MATCH expression, or None if the text has no searchable words
+    """
+    if not text:
+        return None
+
+    terms = []
+    for phrase in _PHRASE_RE.findall(text):
+        words = re.findall(r"\w+", phrase, re.UNICODE)
+        if words:
+            terms.append('"' + " ".join(words) + '"')
+
+    for word in _WORD_RE.findall(_PHRASE_RE.sub(" ", text)):
+        if word.endswith("*"):
+            terms.append(f'"{word[:-1]}"*')
+        else:
+            terms.append(f'"{word}"')
+
+    return " ".join(terms) if terms else None
@@ -29,6 +29,20 @@ class Settings(BaseSettings):
         alias="LIFEOS_CHROMA_URL",
         description="ChromaDB server URL"
     )
+    # Vector store backend: "chroma" (HTTP server) or "local" (embedded,
+    # see api/services/local_vector_index.py; migrate with
+    # scripts/migrate_vectors_to_local.py)
+    vector_backend: str = Field(
+        default="chroma",
+        alias="LIFEOS_VECTOR_BACKEND",
+        description="Vector store backend: chroma or local"
+    )
+    local_vector_path: Path = Field(
+        default=Path("./data/vector_index"),
+        alias="LIFEOS_LOCAL_VECTOR_PATH"
+    )
+    local_vector_ivf_min_rows: int = 50_000  # exact scan below this many chunks
+    local_vector_ivf_nprobe: int = 8  # IVF lists probed per query
 
     # Server (port 8000 is canonical - keep in sync with scripts/server.sh)
     port: int = Field(default=8000, alias="LIFEOS_PORT")
@@ -45,11 +59,41 @@ class Settings(BaseSettings):
         alias="LIFEOS_EMBEDDING_CACHE",
         description="Directory for caching embedding model files"
     )
+    # Persistent cache of document embeddings keyed by (model, sha256(chunk text))
+    embedding_cache_enabled: bool = Field(
+        default=True,
+        alias="LIFEOS_EMBEDDING_CACHE_ENABLED",
+        description="Reuse stored embeddings for unchanged chunk text when reindexing"
+    )
+    embedding_cache_max_entries: int = 500_000  # ~1 GB at 1024-dim float16
+    # In-process LRU of query embeddings (repeated searches skip the model)
+    query_embedding_cache_size: int = 512  # entries; 0 disables
+    query_embedding_cache_ttl: int = 3600  # seconds
+    # Load embedding + cross-encoder models in the background at startup
+    preload_models: bool = Field(
+        default=True,
+        alias="LIFEOS_PRELOAD_MODELS",
+        description="Warm up ML models on server startup so the first query isn't slow"
+    )
 
     # Chunking
     chunk_size: int = 500  # tokens
     chunk_overlap: int = 100  # tokens (20% overlap for better boundary handling)
 
+    # Bulk vault indexing (index_all)
+    # Chunks from many files are accumulated and embedded/written together
+    index_batch_size: int = 256  # chunks per embedding + ChromaDB/BM25 flush
+    index_prefetch_files: int = 64  # files read/chunked ahead of the writer
+    # Person stats touched by file-watcher events are coalesced and refreshed
+    # together at most this many seconds after the first change
+    person_stats_flush_interval: float = 5.0
+    # Granola/Omi inbox notes classified and moved concurrently (per processor)
+    inbox_processor_workers: int = 2
+    # Threads for blocking calls made from async API handlers, per resource
+    sqlite_executor_workers: int = 16  # local stores and vault files
+    google_executor_workers: int = 8  # Google/Slack API clients
+    model_executor_workers: int = 4  # LLM and embedding calls
+
     # Search
     default_top_k: int = 20
 
@@ -64,6 +108,12 @@ class Settings(BaseSettings):
     reranker_model: str = "cross-encoder/ms-marco-MiniLM-L6-v2"
     reranker_enabled: bool = True  # Re-enabled with query-aware protection
     reranker_candidates: int = 50
+    reranker_batch_size: int = 16  # (query, chunk) pairs per predict batch
+    reranker_max_length: int = 256  # tokens per pair; longer chunks are truncated
+    reranker_score_cache_size: int = 10_000  # cached (query, chunk) scores; 0 disables
+    # Skip reranking when the top pre-boost fused (RRF) score leads the
+    # runner-up by this fraction (0.5 = top is 2x the second); 0 disables
+    reranker_skip_margin: float = 0.5
 
     # Notifications
     alert_email: str = Field(
@@ -120,8 +170,8 @@ class Settings(BaseSettings):
     )
 
     # CRM Owner (the user's person ID for relationship tracking)
-    # WARNING: This ID is from people_entities.json and must remain stable.
-    # If you rebuild people_entities.json from scratch, this ID will become
+    # WARNING: This ID is from the person entity store (people_entities.db) and must remain stable.
+    # If you rebuild the entity store from scratch, this ID will become
     # invalid and you'll need to find your new ID and update this value.
     # See data/README.md for why you should NEVER rebuild from scratch.
     my_person_id: str = Field(
@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 """
-Clean up orphaned records after people_entities.json recovery.
+Clean up orphaned records after person entity store recovery.
 
 This script removes or nullifies records that reference person IDs
-that no longer exist in people_entities.json.
+that no longer exist in the person entity store.
 
 Run this after vault_reindex completes to clean up orphaned data.
 
@@ -11,7 +11,6 @@ Usage:
     python scripts/cleanup_orphaned_records.py [--dry-run]
 """
 import argparse
-import json
 import sqlite3
 import sys
 from pathlib import Path
@@ -27,9 +26,9 @@ def cleanup_orphaned_records(dry_run: bool = True) -> dict:
         Stats dict with counts of cleaned records
     """
     # Load valid person IDs
-    with open('data/people_entities.json') as f:
-        entities = json.load(f)
-    valid_ids = {e['id'] for e in entities}
+    from api.services.person_entity import PersonEntityStore
+    store = PersonEntityStore()
+    valid_ids = {e.id for e in store.get_all(include_hidden=True, include_merged=True)}
     print(f"Valid person IDs: {len(valid_ids)}")
 
     # Connect to CRM database with timeout
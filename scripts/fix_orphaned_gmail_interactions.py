@@ -3,7 +3,7 @@
 Fix orphaned Gmail interactions by deleting those that reference non-existent person_ids.
 
 This script:
-1. Loads all valid person IDs from people_entities.json
+1. Loads all valid person IDs from the person entity store
 2. Finds Gmail interactions referencing invalid person_ids
 3. Deletes the orphaned interactions (they'll be recreated on next sync)
 
@@ -11,7 +11,6 @@ Run with --execute to actually delete. Default is dry-run.
 """
 
 import argparse
-import json
 import sqlite3
 import sys
 from pathlib import Path
@@ -27,10 +26,9 @@ def main():
     args = parser.parse_args()
 
     # Load valid person IDs
-    entities_path = Path(__file__).parent.parent / 'data' / 'people_entities.json'
-    with open(entities_path) as f:
-        people = json.load(f)
-    valid_ids = {p['id'] for p in people}
+    from api.services.person_entity import PersonEntityStore
+    store = PersonEntityStore()
+    valid_ids = {p.id for p in store.get_all(include_hidden=True, include_merged=True)}
     print(f"Loaded {len(valid_ids):,} valid person IDs")
 
     # Find orphaned Gmail interactions
@@ -175,7 +175,7 @@ def main():
                 continue
 
             conn.execute("""
-                UPDATE interactions SET person_id = ?
+                UPDATE OR IGNORE interactions SET person_id = ?
                 WHERE person_id = ? AND source_type IN ('vault', 'granola')
             """, (target_id, source_id))
             affected_person_ids.add(source_id)
@@ -203,7 +203,7 @@ def main():
                         target_id = find_person_id(store, target_name)
 
                         if target_id and target_id != source_id:
-                            conn.execute("UPDATE interactions SET person_id = ? WHERE id = ?",
+                            conn.execute("UPDATE OR IGNORE interactions SET person_id = ? WHERE id = ?",
                                        (target_id, int_id))
                             affected_person_ids.add(source_id)
                             affected_person_ids.add(target_id)
@@ -303,10 +303,16 @@ def merge_people(primary_id: str, secondary_id: str, dry_run: bool = True) -> di
         if count > 0:
             logger.info(f"   {count} interactions to update for {old_id}")
             if not dry_run:
+                # OR IGNORE: rows the primary already has (same source item)
+                # stay behind and are dropped as duplicates
                 int_conn.execute(
-                    "UPDATE interactions SET person_id = ? WHERE person_id = ?",
+                    "UPDATE OR IGNORE interactions SET person_id = ? WHERE person_id = ?",
                     (canonical_primary_id, old_id)
                 )
+                int_conn.execute(
+                    "DELETE FROM interactions WHERE person_id = ?",
+                    (old_id,)
+                )
             total_count += count
 
     stats['interactions_updated'] = total_count
@@ -484,10 +490,13 @@ def merge_people(primary_id: str, secondary_id: str, dry_run: bool = True) -> di
 
         logger.info(f"   Deleted secondary record: {secondary.canonical_name}")
 
-        # Refresh stats from InteractionStore (the source of truth)
-        from api.services.person_stats import refresh_person_stats
+        # Refresh stats from InteractionStore (the source of truth); flushing
+        # the shared refresher also picks up anything else already queued
+        from api.services.person_stats import get_person_stats_refresher
         logger.info("   Refreshing stats from InteractionStore...")
-        refresh_person_stats([canonical_primary_id])
+        refresher = get_person_stats_refresher()
+        refresher.mark_dirty([canonical_primary_id])
+        refresher.flush()
 
         # Reload to get updated counts
         primary = store.get_by_id(canonical_primary_id)
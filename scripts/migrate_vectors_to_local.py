@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Export ChromaDB collections into the embedded local vector index.
+
+Copies ids, stored embeddings, documents and metadata page by page from the
+ChromaDB server into api/services/local_vector_index.py collections, so
+switching to LIFEOS_VECTOR_BACKEND=local needs no re-embedding. Safe to
+re-run: records are upserted by id.
+
+Usage:
+    # Dry run (show collection sizes)
+    uv run python scripts/migrate_vectors_to_local.py
+
+    # Migrate lifeos_vault only
+    uv run python scripts/migrate_vectors_to_local.py --execute --collection lifeos_vault
+
+    # Migrate every collection on the server, then set LIFEOS_VECTOR_BACKEND=local
+    uv run python scripts/migrate_vectors_to_local.py --execute
+"""
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import argparse
+import logging
+import time
+
+logging.basicConfig(level=logging.INFO, format='%(levelname)s: %(message)s')
+logger = logging.getLogger(__name__)
+
+PAGE_SIZE = 1000
+
+
+def get_chroma_client():
+    """Connect to the ChromaDB server configured in settings."""
+    import chromadb
+    from chromadb.config import Settings
+    from config.settings import settings
+
+    url = settings.chroma_url.replace("http://", "").replace("https://", "")
+    host, _, port = url.partition(":")
+    return chromadb.HttpClient(
+        host=host,
+        port=int(port) if port else 8000,
+        settings=Settings(anonymized_telemetry=False)
+    )
+
+
+def migrate_collection(source, target, page_size: int = PAGE_SIZE) -> int:
+    """
+    Copy all records from a ChromaDB collection into a local collection.
+
+    Args:
+        source: ChromaDB collection
+        target: LocalVectorCollection
+        page_size: Records fetched per request
+
+    Returns:
+        Number of records copied
+    """
+    copied = 0
+    offset = 0
+    while True:
+        page = source.get(
+            limit=page_size,
+            offset=offset,
+            include=["embeddings", "documents", "metadatas"]
+        )
+        ids = page["ids"]
+        if not ids:
+            break
+
+        target.upsert(
+            ids=ids,
+            embeddings=page["embeddings"],
+            documents=page["documents"],
+            metadatas=page["metadatas"],
+        )
+        copied += len(ids)
+        offset += len(ids)
+        logger.info(f"  {source.name}: {copied} records copied")
+
+    return copied
+
+
+def migrate_vectors(collections: list[str] | None = None, dry_run: bool = True) -> dict:
+    """
+    Migrate ChromaDB collections into the local vector index.
+
+    Args:
+        collections: Collection names to migrate (default: all on the server)
+        dry_run: If True, just report collection sizes
+
+    Returns:
+        Stats dict mapping collection name -> records copied (or found)
+    """
+    from api.services.local_vector_index import get_local_vector_client
+
+    client = get_chroma_client()
+    if not collections:
+        collections = [c if isinstance(c, str) else c.name for c in client.list_collections()]
+
+    stats = {}
+    for name in collections:
+        source = client.get_collection(name)
+        total = source.count()
+
+        if dry_run:
+            logger.info(f"DRY RUN - would migrate {name}: {total} records")
+            stats[name] = total
+            continue
+
+        logger.info(f"Migrating {name} ({total} records)...")
+        start_time = time.time()
+        target = get_local_vector_client().get_or_create_collection(name)
+        copied = migrate_collection(source, target)
+
+        if target.count() != total:
+            logger.warning(f"  {name}: local count {target.count()} != source count {total}")
+        logger.info(f"  {name}: {copied} records in {time.time() - start_time:.1f}s")
+        stats[name] = copied
+
+    if not dry_run:
+        logger.info("Done. Set LIFEOS_VECTOR_BACKEND=local to use the local index.")
+    return stats
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Export ChromaDB collections into the local vector index')
+    parser.add_argument('--execute', action='store_true', help='Actually perform the migration')
+    parser.add_argument('--collection', action='append', dest='collections',
+                        help='Collection to migrate (repeatable; default: all)')
+    args = parser.parse_args()
+
+    migrate_vectors(collections=args.collections, dry_run=not args.execute)
@@ -121,7 +121,7 @@ def move_interactions(from_person_id: str, to_person_id: str, source_types: list
         return count
 
     cursor = conn.execute(f"""
-        UPDATE interactions
+        UPDATE OR IGNORE interactions
         SET person_id = ?
         WHERE person_id = ?
         AND source_type IN ({placeholders})
@@ -338,9 +338,11 @@ def split_person(from_name: str, to_name: str, source_types: list[str],
         logger.info(f"Updated {stats['to_person']['name']} sources: {to_sources}")
 
         # Refresh stats from InteractionStore for both affected people
-        from api.services.person_stats import refresh_person_stats
+        from api.services.person_stats import get_person_stats_refresher
         logger.info("Refreshing stats from InteractionStore...")
-        refresh_person_stats([from_person.id, to_id])
+        refresher = get_person_stats_refresher()
+        refresher.mark_dirty([from_person.id, to_id])
+        refresher.flush()
 
         # Recalculate relationship strength for both affected people
         # (also updates is_peripheral_contact; dunbar_circle requires full recalc)
@@ -20,7 +20,7 @@ from api.services.calendar import CalendarService
 from api.services.google_auth import GoogleAccount
 from api.services.entity_resolver import get_entity_resolver
 from api.services.person_entity import get_person_entity_store
-from api.services.interaction_store import get_interaction_db_path
+from api.services.interaction_store import Interaction, get_interaction_db_path, get_interaction_store
 from api.services.source_entity import (
     get_source_entity_store,
     create_gmail_source_entity,
@@ -293,6 +293,7 @@ def sync_gmail_interactions(
                     if email.cc:
                         other_participants.extend(_parse_email_addresses(email.cc))
 
+                    new_participants = []
                     for participant_name, participant_email in other_participants:
                         # Skip marketing/automated addresses
                         if is_marketing_email(participant_email, participant_name):
@@ -302,12 +303,18 @@ def sync_gmail_interactions(
                         participant_source_id = f"{message_id}:cc:{participant_email}"
                         if participant_source_id in existing:
                             continue
+                        if any(p[2] == participant_source_id for p in new_participants):
+                            continue  # Listed in both To and CC
+                        new_participants.append((participant_name, participant_email, participant_source_id))
 
-                        participant_result = resolver.resolve(
-                            name=participant_name,
-                            email=participant_email,
-                            create_if_missing=True,
-                        )
+                    participant_results = resolver.resolve_many(
+                        [(name, addr) for name, addr, _ in new_participants],
+                        create_if_missing=True,
+                    )
+
+                    for (participant_name, participant_email, participant_source_id), participant_result in zip(
+                        new_participants, participant_results
+                    ):
                         if not participant_result or not participant_result.entity:
                             continue
                         if participant_result.entity.id == my_person_id:
@@ -362,7 +369,7 @@ def sync_gmail_interactions(
                         stats['no_person'] += 1
                         continue
 
-                    created_for_this_email = 0
+                    new_recipients = []
                     for recipient_name, recipient_email in recipients:
                         # Skip marketing/promotional recipients
                         if is_marketing_email(recipient_email, recipient_name):
@@ -374,12 +381,17 @@ def sync_gmail_interactions(
                         if source_id in existing:
                             stats['already_exists'] += 1
                             continue
+                        new_recipients.append((recipient_name, recipient_email, source_id))
 
-                        recipient_result = resolver.resolve(
-                            name=recipient_name,
-                            email=recipient_email,
-                            create_if_missing=True,
-                        )
+                    recipient_results = resolver.resolve_many(
+                        [(name, addr) for name, addr, _ in new_recipients],
+                        create_if_missing=True,
+                    )
+
+                    created_for_this_email = 0
+                    for (recipient_name, recipient_email, source_id), recipient_result in zip(
+                        new_recipients, recipient_results
+                    ):
                         if not recipient_result or not recipient_result.entity:
                             continue
                         if recipient_result.entity.id == my_person_id:
@@ -424,8 +436,7 @@ def sync_gmail_interactions(
 
                 if len(batch) >= batch_size:
                     if not dry_run:
-                        _insert_batch(conn, batch)
-                        conn.commit()  # Commit after each batch to avoid losing progress
+                        _insert_batch(batch)  # Commits each batch to avoid losing progress
                     stats['inserted'] += len(batch)
                     batch = []
 
@@ -440,7 +451,7 @@ def sync_gmail_interactions(
         # Insert remaining
         if batch:
             if not dry_run:
-                _insert_batch(conn, batch)
+                _insert_batch(batch)
             stats['inserted'] += len(batch)
 
         if not dry_run:
@@ -542,6 +553,7 @@ def sync_calendar_interactions(
             # This is used to determine calendar_1on1 vs calendar_small_group vs calendar_large_meeting
             other_attendee_count = len(attendees)  # All attendees here are "other" (self excluded by resolver)
 
+            new_attendees = []
             for attendee in attendees:
                 # Create unique source_id per event+attendee
                 source_id = f"{event.event_id}:{attendee}"
@@ -563,14 +575,15 @@ def sync_calendar_interactions(
                     attendee_email = attendee
                 else:
                     attendee_name = attendee
+                new_attendees.append((attendee_name, attendee_email, source_id))
 
-                # Resolve to PersonEntity
-                result = resolver.resolve(
-                    name=attendee_name,
-                    email=attendee_email,
-                    create_if_missing=True,
-                )
+            # Resolve the event's attendees to PersonEntities in one batch
+            results = resolver.resolve_many(
+                [(name, addr) for name, addr, _ in new_attendees],
+                create_if_missing=True,
+            )
 
+            for (attendee_name, attendee_email, source_id), result in zip(new_attendees, results):
                 if not result or not result.entity:
                     stats['no_person'] += 1
                     continue
@@ -631,8 +644,7 @@ def sync_calendar_interactions(
 
         # Insert batch
         if batch and not dry_run:
-            _insert_batch(conn, batch)
-            conn.commit()
+            _insert_batch(batch)
 
     except Exception as e:
         logger.error(f"Failed to sync Calendar: {e}")
@@ -751,19 +763,34 @@ def _parse_attendees_from_title(title: str) -> list[str]:
     return list(set(names))
 
 
-def _insert_batch(conn: sqlite3.Connection, batch: list):
-    """Insert a batch of interactions.
+def _insert_batch(batch: list) -> int:
+    """Insert a batch of interactions in one transaction, skipping existing ones.
 
     Batch tuples should have 11 elements:
     (id, person_id, timestamp, source_type, title, snippet, source_link, source_id,
      created_at, source_account, attendee_count)
+
+    Returns:
+        Number of interactions inserted
     """
-    conn.executemany("""
-        INSERT OR IGNORE INTO interactions
-        (id, person_id, timestamp, source_type, title, snippet, source_link, source_id,
-         created_at, source_account, attendee_count)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, batch)
+    interactions = [
+        Interaction(
+            id=row[0],
+            person_id=row[1],
+            timestamp=datetime.fromisoformat(row[2]),
+            source_type=row[3],
+            title=row[4],
+            snippet=row[5],
+            source_link=row[6],
+            source_id=row[7],
+            created_at=datetime.fromisoformat(row[8]),
+            source_account=row[9],
+            attendee_count=row[10],
+        )
+        for row in batch
+    ]
+    inserted, _ = get_interaction_store().add_many(interactions)
+    return inserted
 
 
 def main():
@@ -16,7 +16,7 @@ import logging
 import uuid
 from datetime import datetime, timezone
 
-from api.services.interaction_store import get_interaction_db_path
+from api.services.interaction_store import Interaction, get_interaction_db_path, get_interaction_store
 from api.services.person_entity import get_person_entity_store
 from api.services.source_entity import (
     get_source_entity_store,
@@ -67,6 +67,7 @@ def sync_imessage_interactions(dry_run: bool = True, limit: int = None) -> dict:
     # STEP 3: Sync linked messages to interactions database
     imessage_db = get_imessage_db_path()
     interactions_db = get_interaction_db_path()
+    interaction_store = get_interaction_store()
     person_store = get_person_entity_store()
     source_entity_store = get_source_entity_store()
 
@@ -151,22 +152,18 @@ def sync_imessage_interactions(dry_run: bool = True, limit: int = None) -> dict:
         title = f"{direction} {text_preview}"
 
         # Create interaction record
-        interaction_id = str(uuid.uuid4())
-        batch.append((
-            interaction_id,
-            person_id,
-            ts.isoformat(),
-            'imessage',
-            title,
-            text[:200] if text else None,  # snippet
-            '',  # source_link (no web link for iMessage)
-            source_id,
-            datetime.now(timezone.utc).isoformat(),
+        batch.append(Interaction(
+            id=str(uuid.uuid4()),
+            person_id=person_id,
+            timestamp=ts,
+            source_type='imessage',
+            title=title,
+            snippet=text[:200] if text else None,
+            source_link='',  # No web link for iMessage
+            source_id=source_id,
+            created_at=datetime.now(timezone.utc),
         ))
 
-        # Track this person for stats refresh
-        affected_person_ids.add(person_id)
-
         # Create source entity for this handle (deduped by add_or_update)
         if not dry_run and handle:
             source_entity = create_imessage_source_entity(
@@ -183,20 +180,13 @@ def sync_imessage_interactions(dry_run: bool = True, limit: int = None) -> dict:
 
         # Insert in batches
         if len(batch) >= batch_size:
-            if not dry_run:
-                _insert_batch(interactions_conn, batch)
-            stats['inserted'] += len(batch)
+            _insert_batch(interaction_store, batch, stats, affected_person_ids, dry_run)
             logger.info(f"Processed {stats['messages_checked']} messages, inserted {stats['inserted']}")
             batch = []
 
     # Insert remaining
     if batch:
-        if not dry_run:
-            _insert_batch(interactions_conn, batch)
-        stats['inserted'] += len(batch)
-
-    if not dry_run:
-        interactions_conn.commit()
+        _insert_batch(interaction_store, batch, stats, affected_person_ids, dry_run)
 
     imessage_conn.close()
     interactions_conn.close()
@@ -221,12 +211,17 @@ def sync_imessage_interactions(dry_run: bool = True, limit: int = None) -> dict:
     return stats
 
 
-def _insert_batch(conn: sqlite3.Connection, batch: list):
-    """Insert a batch of interactions."""
-    conn.executemany("""
-        INSERT INTO interactions (id, person_id, timestamp, source_type, title, snippet, source_link, source_id, created_at)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    """, batch)
+def _insert_batch(interaction_store, batch: list, stats: dict,
+                  affected_person_ids: set[str], dry_run: bool):
+    """Insert a batch of interactions in one transaction and record what changed."""
+    if dry_run:
+        stats['inserted'] += len(batch)
+        affected_person_ids.update(i.person_id for i in batch)
+        return
+    inserted, person_ids = interaction_store.add_many(batch)
+    stats['inserted'] += inserted
+    stats['already_exists'] += len(batch) - inserted
+    affected_person_ids.update(person_ids)
 
 
 if __name__ == '__main__':
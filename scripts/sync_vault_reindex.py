@@ -11,6 +11,9 @@ This script triggers indexing of vault notes, which:
 By default uses incremental indexing (only changed files).
 Use --force for full reindex (required when changing embedding models).
 
+Chunks from many files are embedded and written in batches
+(settings.index_batch_size, overridable with --batch-size).
+
 Should run AFTER all CRM data collection is complete so that entity
 resolution has access to the latest people data.
 """
@@ -29,17 +32,13 @@ logger = logging.getLogger(__name__)
 
 
 def clear_vector_store():
-    """Clear the ChromaDB collection (needed when changing embedding dimensions)."""
+    """Clear the vector store collection (needed when changing embedding dimensions)."""
     from api.services.vectorstore import VectorStore
 
     logger.info("Clearing existing vector store collection...")
     store = VectorStore()
     # Delete and recreate the collection
-    store._client.delete_collection(store.collection_name)
-    store._collection = store._client.get_or_create_collection(
-        name=store.collection_name,
-        metadata={"hnsw:space": "cosine"}
-    )
+    store.reset_collection()
     logger.info("Vector store cleared")
 
 
@@ -107,8 +106,13 @@ if __name__ == '__main__':
     parser.add_argument('--force', action='store_true', help='Force full reindex (not incremental)')
     parser.add_argument('--clear-vectors', action='store_true', help='Clear vector store before indexing (use when changing embedding model)')
     parser.add_argument('--skip-summaries', action='store_true', help='Skip LLM summary generation for faster indexing')
+    parser.add_argument('--batch-size', type=int, help='Chunks per embedding/write batch (default: settings.index_batch_size)')
     args = parser.parse_args()
 
+    if args.batch_size:
+        from config.settings import settings
+        settings.index_batch_size = args.batch_size
+
     if args.clear_vectors and args.execute:
         clear_vector_store()
 
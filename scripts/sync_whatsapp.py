@@ -27,7 +27,7 @@ import re
 from datetime import datetime, timezone
 
 from api.services.entity_resolver import get_entity_resolver
-from api.services.interaction_store import get_interaction_db_path
+from api.services.interaction_store import Interaction, get_interaction_db_path, get_interaction_store
 from api.services.source_entity import (
     get_source_entity_store,
     SourceEntity,
@@ -368,6 +368,7 @@ def sync_whatsapp_messages(dry_run: bool = True) -> dict:
 
     resolver = get_entity_resolver()
     interaction_db = get_interaction_db_path()
+    interaction_store = get_interaction_store()
 
     # Connect to wacli database
     wacli_conn = sqlite3.connect(str(wacli_db_path))
@@ -482,9 +483,6 @@ def sync_whatsapp_messages(dry_run: bool = True) -> dict:
 
             person_id = result.entity.id
 
-            # Track for stats refresh
-            affected_person_ids.add(person_id)
-
             # Parse timestamp
             try:
                 if isinstance(timestamp, str):
@@ -495,32 +493,24 @@ def sync_whatsapp_messages(dry_run: bool = True) -> dict:
                 ts = datetime.now(timezone.utc)
 
             # Create interaction record
-            interaction_id = str(uuid.uuid4())
             direction = "→" if from_me else "←"
-            title = f"WhatsApp {direction} {target_name or phone}"
-            snippet = text[:500] if text else ""
-
-            batch.append((
-                interaction_id,
-                person_id,
-                ts.isoformat(),
-                'whatsapp',
-                title,
-                snippet,
-                None,  # source_link
-                source_id,
-                datetime.now(timezone.utc).isoformat(),
+            batch.append(Interaction(
+                id=str(uuid.uuid4()),
+                person_id=person_id,
+                timestamp=ts,
+                source_type='whatsapp',
+                title=f"WhatsApp {direction} {target_name or phone}",
+                snippet=text[:500] if text else "",
+                source_link='',
+                source_id=source_id,
+                created_at=datetime.now(timezone.utc),
             ))
-
-            stats['interactions_created'] += 1
+            # A message seen twice in this run is only queued once
+            existing_ids.add(source_id)
 
             # Insert in batches
-            if len(batch) >= batch_size and not dry_run:
-                int_cursor.executemany("""
-                    INSERT INTO interactions (id, person_id, timestamp, source_type, title, snippet, source_link, source_id, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, batch)
-                int_conn.commit()
+            if len(batch) >= batch_size:
+                _insert_batch(interaction_store, batch, stats, affected_person_ids, dry_run)
                 logger.info(f"Inserted batch of {len(batch)} interactions")
                 batch = []
 
@@ -529,12 +519,8 @@ def sync_whatsapp_messages(dry_run: bool = True) -> dict:
             stats['errors'] += 1
 
     # Insert remaining batch
-    if batch and not dry_run:
-        int_cursor.executemany("""
-            INSERT INTO interactions (id, person_id, timestamp, source_type, title, snippet, source_link, source_id, created_at)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, batch)
-        int_conn.commit()
+    if batch:
+        _insert_batch(interaction_store, batch, stats, affected_person_ids, dry_run)
         logger.info(f"Inserted final batch of {len(batch)} interactions")
 
     wacli_conn.close()
@@ -562,6 +548,20 @@ def sync_whatsapp_messages(dry_run: bool = True) -> dict:
     return stats
 
 
+def _insert_batch(interaction_store, batch: list, stats: dict,
+                  affected_person_ids: set[str], dry_run: bool):
+    """Insert a batch of interactions in one transaction and record what changed."""
+    if dry_run:
+        stats['interactions_created'] += len(batch)
+        affected_person_ids.update(i.person_id for i in batch)
+        return
+    # ON CONFLICT skips rows another writer inserted since the snapshot
+    inserted, person_ids = interaction_store.add_many(batch)
+    stats['interactions_created'] += inserted
+    stats['interactions_skipped'] += len(batch) - inserted
+    affected_person_ids.update(person_ids)
+
+
 if __name__ == '__main__':
     parser = argparse.ArgumentParser(description='Sync WhatsApp contacts and messages to CRM via wacli')
     parser.add_argument('--execute', action='store_true', help='Actually apply changes')
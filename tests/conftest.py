@@ -222,6 +222,40 @@ def reset_singletons_after_test():
         pass  # Skip if module not available (shouldn't happen)
 
 
+@pytest.fixture(autouse=True)
+def isolated_vault_catalog(tmp_path_factory, monkeypatch):
+    """
+    Keep vault catalogs out of the real data directory.
+
+    Processors and the indexer open the catalog through get_vault_catalog(),
+    whose database otherwise lives next to the real ChromaDB data.
+    """
+    from api.services import vault_catalog
+
+    db_path = str(tmp_path_factory.mktemp("vault_catalog") / "vault_catalog.db")
+    monkeypatch.setattr(vault_catalog, "get_vault_catalog_db_path", lambda: db_path)
+    yield
+    vault_catalog.reset_vault_catalogs()
+
+
+@pytest.fixture(autouse=True)
+def isolated_data_files(tmp_path_factory, monkeypatch):
+    """
+    Keep backups, caches and failure lists out of the real data directory.
+
+    Stores built on temporary paths still take rolling backups into
+    settings.backup_path, the embedding cache sits next to ChromaDB, and
+    reindexing records summary failures.
+    """
+    from api.services import embedding_cache, summarizer
+    from config.settings import settings
+
+    data_dir = tmp_path_factory.mktemp("data")
+    monkeypatch.setattr(embedding_cache, "get_embedding_cache_db_path", lambda: str(data_dir / "embedding_cache.db"))
+    monkeypatch.setattr(settings, "backup_path", str(data_dir / "backups"))
+    monkeypatch.setattr(summarizer, "SUMMARY_FAILURES_FILE", str(data_dir / "vault_summary_failures.json"))
+
+
 @pytest.fixture(scope="session", autouse=True)
 def reset_ml_singletons_at_session_end():
     """
@@ -29,6 +29,9 @@ def reset_lightweight_singletons() -> None:
     - ConversationStore
     - HybridSearch
     - BM25Index
+    - EmbeddingCache
+    - LocalVectorClient
+    - PersonStatsRefresher
 
     Does NOT reset embedding service (causes slow model reload).
     """
@@ -37,12 +40,18 @@ def reset_lightweight_singletons() -> None:
     from api.services.conversation_store import reset_conversation_store
     from api.services.hybrid_search import reset_hybrid_search
     from api.services.bm25_index import reset_bm25_index
+    from api.services.embedding_cache import reset_embedding_cache
+    from api.services.local_vector_index import reset_local_vector_client
+    from api.services.person_stats import reset_person_stats_refresher
 
     reset_service_health()
     reset_model_selector()
     reset_conversation_store()
     reset_hybrid_search()
     reset_bm25_index()
+    reset_embedding_cache()
+    reset_local_vector_client()
+    reset_person_stats_refresher()
 
 
 def reset_ml_singletons() -> None:
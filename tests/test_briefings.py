@@ -143,6 +143,23 @@ class TestBriefingsService:
         assert len(context.related_notes) == 1
         assert "Q1 Planning.md" in context.sources
 
+    def test_gather_context_adds_aliases_as_keywords(self, service, mock_entity_resolver, mock_hybrid_search):
+        """Aliases widen the keyword match of a single search, not extra searches."""
+        from api.services.person_entity import PersonEntity
+
+        mock_entity = PersonEntity(id="test-123", canonical_name="Alexander", aliases=["Alex", "Xander"])
+        mock_result = MagicMock()
+        mock_result.entity = mock_entity
+        mock_entity_resolver.resolve.return_value = mock_result
+        mock_hybrid_search.search.return_value = []
+
+        service.gather_context("alex")
+
+        mock_hybrid_search.search.assert_called_once()
+        assert mock_hybrid_search.search.call_args.kwargs["query"] == "Alexander"
+        assert mock_hybrid_search.search.call_args.kwargs["extra_keywords"] == ["Alex", "Xander"]
+        mock_hybrid_search.search_many.assert_not_called()
+
     def test_gather_context_gets_action_items(self, service, mock_task_manager):
         """Should get action items for person."""
         mock_task = MagicMock()
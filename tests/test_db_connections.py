@@ -0,0 +1,203 @@
+"""
+Tests for the shared SQLite connection manager.
+"""
+import sqlite3
+import threading
+
+import pytest
+
+from api.utils.db_connections import (
+    add_query_hook,
+    close_all,
+    get_connection,
+    remove_query_hook,
+    transaction,
+)
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Database with one table, and its pooled connections closed afterwards."""
+    path = str(tmp_path / "test.db")
+    with transaction(path) as conn:
+        conn.execute("CREATE TABLE items (id INTEGER PRIMARY KEY, name TEXT)")
+    yield path
+    close_all(path)
+
+
+def _count(path: str) -> int:
+    conn = get_connection(path)
+    try:
+        return conn.execute("SELECT COUNT(*) FROM items").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestPooling:
+    """Tests for per-thread connection reuse."""
+
+    def test_reuses_connection_after_close(self, db_path):
+        """A released connection is handed back out on the same thread."""
+        conn = get_connection(db_path)
+        raw = conn.raw
+        conn.close()
+
+        again = get_connection(db_path)
+        assert again.raw is raw
+        again.close()
+
+    def test_nested_checkouts_get_distinct_connections(self, db_path):
+        """Two connections held at once on one thread are never shared."""
+        first = get_connection(db_path)
+        second = get_connection(db_path)
+        assert first.raw is not second.raw
+        first.close()
+        second.close()
+
+    def test_threads_do_not_share_connections(self, db_path):
+        """Each thread gets its own connection."""
+        conn = get_connection(db_path)
+        raw = conn.raw
+        conn.close()
+
+        other = []
+
+        def worker():
+            c = get_connection(db_path)
+            other.append(c.raw)
+            c.close()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        assert other[0] is not raw
+
+    def test_uniform_pragmas(self, db_path):
+        """Connections use WAL and NORMAL sync unless overridden."""
+        conn = get_connection(db_path)
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        assert conn.execute("PRAGMA synchronous").fetchone()[0] == 1
+        conn.close()
+
+        full = get_connection(db_path, synchronous="FULL")
+        assert full.execute("PRAGMA synchronous").fetchone()[0] == 2
+        full.close()
+
+    def test_close_rolls_back_and_resets(self, db_path):
+        """Uncommitted writes and row_factory don't leak to the next user."""
+        conn = get_connection(db_path)
+        conn.row_factory = sqlite3.Row
+        conn.execute("INSERT INTO items (name) VALUES ('x')")
+        conn.close()
+
+        again = get_connection(db_path)
+        assert again.row_factory is None
+        assert again.execute("SELECT COUNT(*) FROM items").fetchone()[0] == 0
+        again.close()
+
+    def test_released_connection_is_unusable(self, db_path):
+        """Using a connection after close() raises like sqlite3 does."""
+        conn = get_connection(db_path)
+        conn.close()
+        with pytest.raises(sqlite3.ProgrammingError):
+            conn.execute("SELECT 1")
+
+    def test_reconnects_when_file_replaced(self, tmp_path):
+        """A pooled connection to a deleted database file is not reused."""
+        path = tmp_path / "gone.db"
+        conn = get_connection(path)
+        raw = conn.raw
+        conn.execute("CREATE TABLE t (x)")
+        conn.close()
+
+        path.unlink()
+        (tmp_path / "gone.db-wal").unlink(missing_ok=True)
+        (tmp_path / "gone.db-shm").unlink(missing_ok=True)
+
+        fresh = get_connection(path)
+        assert fresh.raw is not raw
+        assert fresh.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()[0] == 0
+        fresh.close()
+        close_all(path)
+
+    def test_close_all_discards_idle_connections(self, db_path):
+        """close_all() closes idle connections so the next checkout is new."""
+        conn = get_connection(db_path)
+        raw = conn.raw
+        conn.close()
+
+        close_all(db_path)
+        with pytest.raises(sqlite3.ProgrammingError):
+            raw.execute("SELECT 1")
+
+        again = get_connection(db_path)
+        assert again.raw is not raw
+        again.close()
+
+
+class TestTransaction:
+    """Tests for the transaction() helper."""
+
+    def test_commits_on_success(self, db_path):
+        """Writes are committed when the block exits normally."""
+        with transaction(db_path) as conn:
+            conn.execute("INSERT INTO items (name) VALUES ('a')")
+        assert _count(db_path) == 1
+
+    def test_rolls_back_on_error(self, db_path):
+        """Writes are rolled back when the block raises."""
+        with pytest.raises(RuntimeError):
+            with transaction(db_path) as conn:
+                conn.execute("INSERT INTO items (name) VALUES ('a')")
+                raise RuntimeError("boom")
+        assert _count(db_path) == 0
+
+    def test_immediate_takes_write_lock(self, db_path):
+        """BEGIN IMMEDIATE blocks other writers until commit."""
+        with transaction(db_path, immediate=True) as conn:
+            assert conn.in_transaction
+            other = sqlite3.connect(db_path, timeout=0)
+            try:
+                with pytest.raises(sqlite3.OperationalError):
+                    other.execute("BEGIN IMMEDIATE")
+            finally:
+                other.close()
+
+
+class TestQueryHooks:
+    """Tests for per-query timing hooks."""
+
+    def test_hook_receives_timings(self, db_path):
+        """Hooks see the database, statement and elapsed time."""
+        calls = []
+
+        def hook(path, sql, elapsed):
+            calls.append((path, sql, elapsed))
+
+        add_query_hook(hook)
+        try:
+            with transaction(db_path) as conn:
+                conn.execute("INSERT INTO items (name) VALUES (?)", ("a",))
+                conn.executemany("INSERT INTO items (name) VALUES (?)", [("b",), ("c",)])
+        finally:
+            remove_query_hook(hook)
+
+        assert [c[1] for c in calls] == [
+            "INSERT INTO items (name) VALUES (?)",
+            "INSERT INTO items (name) VALUES (?)",
+        ]
+        assert all(c[0] == db_path and c[2] >= 0 for c in calls)
+
+        _count(db_path)
+        assert len(calls) == 2
+
+    def test_failing_hook_does_not_break_queries(self, db_path):
+        """An exception in a hook is logged, not raised."""
+        def hook(path, sql, elapsed):
+            raise ValueError("bad hook")
+
+        add_query_hook(hook)
+        try:
+            assert _count(db_path) == 0
+        finally:
+            remove_query_hook(hook)
@@ -87,3 +87,144 @@ class TestEmbeddingService:
         emb2 = embedding_service.embed_text(text)
 
         np.testing.assert_array_almost_equal(emb1, emb2)
+
+
+@pytest.mark.unit
+class TestEmbeddingCache:
+    """Test the persistent content-hash embedding cache (no model load)."""
+
+    @pytest.fixture
+    def cache(self, tmp_path):
+        from api.services.embedding_cache import EmbeddingCache
+        cache = EmbeddingCache(db_path=str(tmp_path / "cache.db"), max_entries=100)
+        yield cache
+        cache.close()
+
+    @pytest.fixture
+    def service(self, cache):
+        """Embedding service with a fake encoder that records its inputs."""
+        import numpy as np
+        from unittest.mock import MagicMock
+        from api.services.embeddings import EmbeddingService
+
+        service = EmbeddingService(model_name="test-model", embedding_cache=cache)
+        service._model = MagicMock()
+        service._model.encode.side_effect = lambda texts, convert_to_numpy=True: np.array(
+            [[float(len(t)), 1.0, 0.5] for t in texts]
+        )
+        return service
+
+    def test_only_encodes_new_text(self, service):
+        """Second call should only encode texts not seen before."""
+        first = service.embed_texts(["alpha", "beta"])
+        second = service.embed_texts(["alpha", "beta", "gamma!"])
+
+        assert second[:2] == first
+        assert second[2] == [6.0, 1.0, 0.5]
+        encoded = [call.args[0] for call in service._model.encode.call_args_list]
+        assert encoded == [["alpha", "beta"], ["gamma!"]]
+
+    def test_fully_cached_call_skips_model(self, service):
+        """Unchanged chunks (e.g. touched file) shouldn't hit the model at all."""
+        service.embed_texts(["alpha", "beta"])
+        service._model.encode.reset_mock()
+
+        service.embed_texts(["beta", "alpha"])
+
+        service._model.encode.assert_not_called()
+
+    def test_duplicate_texts_encoded_once(self, service):
+        """Identical texts in one call should be encoded once."""
+        result = service.embed_texts(["same", "same", "other"])
+
+        assert result[0] == result[1]
+        assert service._model.encode.call_args.args[0] == ["same", "other"]
+
+    def test_cache_is_keyed_by_model(self, cache):
+        """Embeddings from one model must not be served for another."""
+        cache.put_many("model-a", ["text"], [[1.0, 2.0]])
+
+        assert cache.get_many("model-a", ["text"]) == {0: [1.0, 2.0]}
+        assert cache.get_many("model-b", ["text"]) == {}
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Cache should stay bounded and evict the oldest entries first."""
+        import time
+        from api.services.embedding_cache import EmbeddingCache
+
+        cache = EmbeddingCache(db_path=str(tmp_path / "lru.db"), max_entries=10)
+        cache.put_many("m", [f"old{i}" for i in range(10)], [[float(i)] for i in range(10)])
+        time.sleep(0.01)
+        cache.get_many("m", ["old0"])  # Touch so it survives eviction
+        time.sleep(0.01)
+        cache.put_many("m", [f"new{i}" for i in range(5)], [[float(i)] for i in range(5)])
+
+        assert cache.count() == 10
+        assert 0 in cache.get_many("m", ["old0"])
+        assert cache.get_many("m", ["old1"]) == {}
+        cache.close()
+
+
+@pytest.mark.unit
+class TestQueryEmbeddingCache:
+    """Tests for the in-process query embedding LRU."""
+
+    @pytest.fixture
+    def service(self):
+        """Embedding service with a fake encoder that records its inputs."""
+        import numpy as np
+        from unittest.mock import MagicMock
+        from api.services.embeddings import EmbeddingService
+
+        service = EmbeddingService(model_name="test-model")
+        service._model = MagicMock()
+        service._model.encode.side_effect = lambda texts, convert_to_numpy=True: np.array(
+            [[float(len(t)), 1.0] for t in texts]
+        )
+        return service
+
+    def test_repeated_query_skips_model(self, service):
+        """Same query (modulo whitespace) should only be encoded once."""
+        first = service.embed_query("budget for  Q3")
+        second = service.embed_query("  budget for Q3 ")
+
+        assert first == second
+        assert service._model.encode.call_count == 1
+
+    def test_evicts_least_recently_used(self, service, monkeypatch):
+        """Cache should stay bounded at the configured size."""
+        from config.settings import settings
+        monkeypatch.setattr(settings, "query_embedding_cache_size", 2)
+
+        service.embed_query("a")
+        service.embed_query("b")
+        service.embed_query("a")  # Touch so "b" is the oldest
+        service.embed_query("c")
+        service._model.encode.reset_mock()
+
+        service.embed_query("a")
+        service._model.encode.assert_not_called()
+        service.embed_query("b")
+        assert service._model.encode.call_count == 1
+
+    def test_expired_entries_reencoded(self, service, monkeypatch):
+        """Entries older than the TTL should be recomputed."""
+        from config.settings import settings
+        monkeypatch.setattr(settings, "query_embedding_cache_ttl", 0)
+
+        service.embed_query("who is Sarah")
+        service.embed_query("who is Sarah")
+
+        assert service._model.encode.call_count == 2
+
+    def test_embed_queries_single_encode_for_misses(self, service):
+        """Batched queries should encode only uncached, distinct queries in one call."""
+        service.embed_query("alpha")
+        service._model.encode.reset_mock()
+
+        result = service.embed_queries(["alpha", "beta", "beta", "gamma"])
+
+        assert len(result) == 4
+        assert result[1] == result[2]
+        assert service._model.encode.call_count == 1
+        assert service._model.encode.call_args.args[0] == ["beta", "gamma"]
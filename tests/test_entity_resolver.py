@@ -5,14 +5,17 @@ import pytest
 import tempfile
 from datetime import datetime, timedelta
 from pathlib import Path
+from unittest.mock import patch
 
 from api.services.person_entity import PersonEntity, PersonEntityStore
 from api.services.entity_resolver import (
     EntityResolver,
     ResolutionCandidate,
+    ResolutionRequest,
     ResolutionResult,
     get_entity_resolver,
 )
+from api.services.link_override import get_link_override_store
 
 
 # Module-level fixtures available to all test classes
@@ -393,6 +396,75 @@ class TestEdgeCases:
         assert result.entity.canonical_name == "Jdoe"
 
 
+class TestResolveMany:
+    """Tests for batch resolution."""
+
+    REQUESTS = [
+        ("Alex Johnson", "alex@work.example.com"),
+        ("Sarah", None, None, "Work/ExampleCorp/notes.md"),
+        (None, "new.person@example.com"),
+        ("Dana Scully", None, "+15550001111"),
+        ("Alex Johnson", "alex@work.example.com"),
+        ("Dana Scully", None, "+15550001111"),
+        ("Dana Scully",),
+        (None, None, "+19012295017"),
+        ("Nobody", None),
+    ]
+
+    def test_matches_sequential_resolve(self, populated_resolver):
+        """Batch results equal one resolve() call per request, in order."""
+        with tempfile.TemporaryDirectory() as tmp:
+            sequential_store = PersonEntityStore(str(Path(tmp) / "people.json"))
+            for entity in populated_resolver.store.get_all():
+                sequential_store.add(entity)
+            sequential = EntityResolver(sequential_store)
+            expected = [
+                sequential.resolve(*ResolutionRequest(*r), create_if_missing=True)
+                for r in self.REQUESTS
+            ]
+
+        results = populated_resolver.resolve_many(self.REQUESTS, create_if_missing=True)
+
+        def summary(r):
+            return (r.entity.canonical_name, r.is_new, r.match_type, r.confidence) if r else None
+
+        assert [summary(r) for r in results] == [summary(r) for r in expected]
+
+    def test_duplicates_create_one_entity(self, populated_resolver):
+        """Repeated unknown people are created once and reported new once."""
+        before = populated_resolver.store.count()
+        results = populated_resolver.resolve_many(
+            [("Fox Mulder", "fox@fbi.example.com")] * 3, create_if_missing=True
+        )
+
+        assert populated_resolver.store.count() == before + 1
+        assert [r.is_new for r in results] == [True, False, False]
+        assert len({r.entity.id for r in results}) == 1
+        assert results[1].match_type == "email_exact"
+
+    def test_link_overrides_read_once(self, populated_resolver):
+        """Name matching shares one read of the link override table."""
+        override_store = get_link_override_store()
+        with patch.object(override_store, "get_all", wraps=override_store.get_all) as get_all:
+            populated_resolver.resolve_many([("Sarah C",), ("Alex J",), ("Taylor",), ("Unknown X",)])
+        assert get_all.call_count == 1
+
+    def test_known_emails_skip_name_matching(self, populated_resolver):
+        """Requests anchored by email/phone never reach fuzzy matching."""
+        with patch.object(populated_resolver, "resolve_by_name") as by_name:
+            results = populated_resolver.resolve_many([
+                ResolutionRequest(name="Someone Else", email="sarah@work.example.com"),
+                ResolutionRequest(phone="+15559876543"),
+            ])
+        by_name.assert_not_called()
+        assert [r.entity.canonical_name for r in results] == ["Sarah Chen", "Taylor"]
+        assert [r.match_type for r in results] == ["email_exact", "phone_exact"]
+
+    def test_empty_batch(self, resolver):
+        """An empty batch resolves to an empty list."""
+        assert resolver.resolve_many([]) == []
+
+
 class TestParseName:
     """Tests for the parse_name helper function."""
 
@@ -609,3 +681,271 @@ class TestStructuredNameMatching:
 
         assert result is not None
         assert result.entity.canonical_name == "Mike Johnson"
+
+
+# Recorded corpus for the name blocking index: candidates and scores were
+# captured from the full-scan scorer, which scored every person in the store.
+# (canonical_name, aliases, vault_contexts, last_seen days ago, strength, hidden)
+RESOLUTION_CORPUS = [
+    ('Alex Johnson', ['Alex'], ['Work/ExampleCorp/'], 5, 40.0, False),
+    ('Alexander Johnston', [], ['Work/Other/'], 200, 0.0, False),
+    ('Sarah Chen', [], ['Work/ExampleCorp/'], 10, 35.0, False),
+    ('Sarah Miller', ['Sarah Mills'], ['Personal/zArchive/OldCorp/'], 100, 5.0, False),
+    ('Sara Milller', [], [], None, 0.0, False),
+    ('Taylor', [], ['Personal/'], 0, 80.0, False),
+    ('Dr. Mary Katherine Palmer MD', ['Kate Palmer'], ['Work/Clinic/'], 20, 12.0, False),
+    ('Katherine Smith', ['Kathy Jones'], [], 400, 0.0, False),
+    ('Mike Johnson', [], [], 5, 0.0, False),
+    ("Michael O'Brien", ['Mick'], ['Personal/'], 3, 60.0, False),
+    ('J. Robert Oppenheim', [], [], None, 0.0, False),
+    ('John Smith Jr', [], ['Work/ExampleCorp/'], 15, 20.0, False),
+    ('Jane Smith', [], [], 45, 28.0, False),
+    ('Ben Okafor', [], [], 1, 55.0, False),
+    ('Benjamin Okafor', [], [], 300, 0.0, False),
+    ('Benji', [], ['Personal/'], 2, 31.0, False),
+    ('Anne Marie Smith', [], [], None, 0.0, False),
+    ('Marie Curie', ['Marie Sklodowska'], [], None, 90.0, False),
+    ('Chris P. Bacon', [], [], 12, 0.0, False),
+    ('Christopher Bacon', [], ['Work/ExampleCorp/'], 400, 8.0, False),
+    ('Hidden Person', [], [], 1, 0.0, True),
+    ('Sarah Long, CLC, CSC', [], [], 7, 0.0, False),
+    ('S. Long', [], [], None, 0.0, False),
+    ('Wei Zhang', ['David Zhang'], [], 30, 15.0, False),
+    ('Zhang Wei', [], [], None, 0.0, False),
+    ('Liz Warren', ['Elizabeth Warren'], [], 8, 33.0, False),
+    ('Beth', [], ['Personal/'], 4, 45.0, False),
+    ('Elisabeth Waren', [], [], None, 0.0, False),
+    ('Robert Downey', ['Bob Downey', 'Rob D'], [], 50, 0.0, False),
+    ('Bobby Brown', [], [], 2, 70.0, False),
+    ('Rob', [], [], 90, 0.0, False),
+    ('Mr. Bean', [], [], None, 0.0, False),
+    ('Jose Alvarez', [], [], 6, 0.0, False),
+    ('José Álvarez', [], [], None, 0.0, False),
+    ('Li', [], [], 1, 10.0, False),
+    ('Lee Li', [], [], 1, 0.0, False),
+]
+
+# (query, context_path) -> [(canonical_name, score, match_type), ...]
+RECORDED_CANDIDATES = {
+    ('Alex', None): [
+        ('Alex Johnson', 60.0, 'first_name_context_clear'),
+        ('Alexander Johnston', 20.0, 'structured'),
+    ],
+    ('Alex Johnson', None): [
+        ('Alex Johnson', 95.0, 'structured_relationship'),
+        ('Alexander Johnston', 45.0, 'structured'),
+    ],
+    ('Alex Jonson', None): [
+        ('Alex Johnson', 70.0, 'structured_relationship'),
+        ('Alexander Johnston', 45.0, 'structured'),
+    ],
+    ('A. Johnson', None): [],
+    ('Alex J', None): [
+        ('Alex Johnson', 80.0, 'structured_relationship'),
+        ('Alexander Johnston', 55.0, 'structured'),
+    ],
+    ('Alexander', None): [
+        ('Alex Johnson', 55.0, 'first_name_context_clear'),
+        ('Alexander Johnston', 25.0, 'structured'),
+    ],
+    ('Sarah', None): [
+        ('Sarah Chen', 58.125, 'first_name_context_clear'),
+        ('Sarah Miller', 26.875, 'structured'),
+        ('Sara Milller', 20.0, 'structured'),
+        ('Sarah Long, CLC, CSC', 35.0, 'structured'),
+    ],
+    ('Sarah', 'Work/ExampleCorp/notes.md'): [
+        ('Sarah Chen', 88.125, 'first_name_context_clear'),
+        ('Sarah Miller', 26.875, 'structured'),
+        ('Sara Milller', 20.0, 'structured'),
+        ('Sarah Long, CLC, CSC', 35.0, 'structured'),
+    ],
+    ('Sara', None): [
+        ('Sarah Chen', 53.125, 'first_name_context_clear'),
+        ('Sarah Miller', 21.875, 'structured'),
+        ('Sara Milller', 25.0, 'structured'),
+        ('Sarah Long, CLC, CSC', 30.0, 'structured'),
+    ],
+    ('Sarah Miler', None): [('Sarah Miller', 51.25, 'structured')],
+    ('Sarah Mills', None): [('Sarah Miller', 26.25, 'structured')],
+    ('Sarah M', None): [
+        ('Sarah Miller', 61.25, 'structured'),
+        ('Sara Milller', 55.0, 'structured'),
+    ],
+    ('Katherine Palmer', None): [('Dr. Mary Katherine Palmer MD', 78.0, 'structured')],
+    ('Kate Palmer', None): [],
+    ('Kathy', None): [('Katherine Smith', 35.0, 'first_name_unique')],
+    ('Katie Smith', None): [],
+    ('Mary Palmer', None): [('Dr. Mary Katherine Palmer MD', 88.0, 'structured')],
+    ('Michael Johnson', None): [('Mike Johnson', 80.0, 'structured')],
+    ('Mike', None): [
+        ('Mike Johnson', 35.0, 'structured'),
+        ("Michael O'Brien", 62.5, 'first_name_context_clear'),
+    ],
+    ('Mick', None): [
+        ('Mike Johnson', 30.0, 'structured'),
+        ("Michael O'Brien", 62.5, 'first_name_context_clear'),
+    ],
+    ("Mickey O'Brien", None): [("Michael O'Brien", 95.0, 'structured_relationship')],
+    ('Robert Oppenheim', None): [('J. Robert Oppenheim', 65.0, 'structured')],
+    ('J Oppenheim', None): [('J. Robert Oppenheim', 60.0, 'structured')],
+    ('John Smith', None): [('John Smith Jr', 90.0, 'structured')],
+    ('Jon Smith', 'Work/ExampleCorp/x.md'): [('John Smith Jr', 115.0, 'structured_context')],
+    ('Jane', None): [('Jane Smith', 50.5, 'first_name_unique')],
+    ('J Smith', None): [
+        ('John Smith Jr', 75.0, 'structured'),
+        ('Jane Smith', 67.0, 'structured_relationship'),
+    ],
+    ('Marie', None): [
+        ('Dr. Mary Katherine Palmer MD', 34.5, 'structured'),
+        ('Marie Curie', 68.75, 'first_name_context_clear'),
+    ],
+    ('Anne Smith', None): [('Anne Marie Smith', 75.0, 'structured')],
+    ('Marie Smith', None): [('Anne Marie Smith', 65.0, 'structured')],
+    ('Ben', None): [
+        ('Ben Okafor', 65.625, 'first_name_context_clear'),
+        ('Benjamin Okafor', 20.0, 'structured'),
+        ('Mr. Bean', 20.0, 'structured'),
+    ],
+    ('Benjamin', None): [
+        ('Ben Okafor', 60.625, 'first_name_context_clear'),
+        ('Benjamin Okafor', 25.0, 'structured'),
+    ],
+    ('Benny Okafor', None): [
+        ('Ben Okafor', 93.75, 'structured_relationship'),
+        ('Benjamin Okafor', 70.0, 'structured'),
+    ],
+    ('Ben Okafor', None): [
+        ('Ben Okafor', 98.75, 'structured_relationship'),
+        ('Benjamin Okafor', 70.0, 'structured'),
+    ],
+    ('Chris Bacon', None): [
+        ('Chris P. Bacon', 85.0, 'structured'),
+        ('Christopher Bacon', 72.0, 'structured'),
+    ],
+    ('Christopher', 'Work/ExampleCorp/y.md'): [
+        ('Chris P. Bacon', 30.0, 'structured'),
+        ('Christopher Bacon', 68.0, 'first_name_context_clear'),
+    ],
+    ('P Bacon', None): [],
+    ('Hidden', None): [],
+    ('Sarah Long', None): [('Sarah Long, CLC, CSC', 85.0, 'structured')],
+    ('S Long', None): [
+        ('Sarah Long, CLC, CSC', 70.0, 'structured'),
+        ('S. Long', 60.0, 'structured'),
+    ],
+    ('Dr. Sarah Long PhD', None): [('Sarah Long, CLC, CSC', 85.0, 'structured')],
+    ('Wei', None): [('Wei Zhang', 45.625, 'first_name_unique')],
+    ('David Zhang', None): [],
+    ('Zhang', None): [('Zhang Wei', 40.0, 'first_name_unique')],
+    ('Elizabeth Warren', None): [
+        ('Liz Warren', 88.25, 'structured_relationship'),
+        ('Elisabeth Waren', 45.0, 'structured'),
+    ],
+    ('Liz', None): [],
+    ('Beth Warren', None): [('Liz Warren', 88.25, 'structured_relationship')],
+    ('Elizabeth', None): [],
+    ('Bob Downey', None): [('Robert Downey', 70.0, 'structured')],
+    ('Bob', None): [
+        ('Robert Downey', 20.0, 'structured'),
+        ('Bobby Brown', 66.25, 'first_name_context_clear'),
+        ('Rob', 20.0, 'structured'),
+    ],
+    ('Rob', None): [
+        ('Robert Downey', 20.0, 'structured'),
+        ('Bobby Brown', 66.25, 'first_name_context_clear'),
+        ('Rob', 25.0, 'structured'),
+    ],
+    ('Robert', None): [
+        ('Robert Downey', 25.0, 'structured'),
+        ('Bobby Brown', 66.25, 'first_name_context_clear'),
+        ('Rob', 20.0, 'structured'),
+    ],
+    ('Bean', None): [
+        ('Ben Okafor', 60.625, 'first_name_context_clear'),
+        ('Mr. Bean', 25.0, 'structured'),
+    ],
+    ('Mr.', None): [],
+    ('Jose', None): [('Jose Alvarez', 50.0, 'first_name_unique')],
+    ('José Alvarez', None): [('José Álvarez', 50.0, 'structured')],
+    ('Li', None): [('Li', 53.75, 'first_name_unique')],
+    ('L Li', None): [('Lee Li', 70.0, 'structured')],
+    ('Lee', None): [('Lee Li', 50.0, 'first_name_unique')],
+    ('Taylor', None): [('Taylor', 80.0, 'first_name_unique')],
+    ('Tayler', 'Personal/a.md'): [],
+    ('Nobody Here', None): [],
+    ('X', None): [],
+    ('M', None): [
+        ('Dr. Mary Katherine Palmer MD', 24.5, 'structured'),
+        ('Mike Johnson', 20.0, 'structured'),
+        ("Michael O'Brien", 42.5, 'structured_relationship'),
+        ('Marie Curie', 53.75, 'first_name_relationship_dominant'),
+    ],
+    ('B. Okafor', None): [],
+    ('Benjamin O', None): [
+        ('Ben Okafor', 78.75, 'structured_relationship'),
+        ('Benjamin Okafor', 60.0, 'structured'),
+    ],
+    ('Mary Katherine Palmer', None): [('Dr. Mary Katherine Palmer MD', 98.0, 'structured')],
+    ('Katherine M Palmer', None): [('Dr. Mary Katherine Palmer MD', 78.0, 'structured')],
+    ('Robert D', None): [('Robert Downey', 60.0, 'structured')],
+}
+
+
+@pytest.fixture
+def corpus_store(temp_store):
+    """Entity store loaded with RESOLUTION_CORPUS."""
+    for name, aliases, contexts, days_ago, strength, hidden in RESOLUTION_CORPUS:
+        entity = PersonEntity(
+            canonical_name=name,
+            aliases=aliases,
+            vault_contexts=contexts,
+            last_seen=None if days_ago is None else datetime.now() - timedelta(days=days_ago),
+            hidden=hidden,
+        )
+        entity.relationship_strength = strength
+        temp_store.add(entity)
+    return temp_store
+
+
+class TestNameBlockingIndex:
+    """Tests for candidate blocking in _score_candidates."""
+
+    @pytest.mark.parametrize("query,context_path", list(RECORDED_CANDIDATES))
+    def test_matches_recorded_scores(self, corpus_store, query, context_path):
+        """Blocked scoring returns exactly what the full scan did."""
+        resolver = EntityResolver(corpus_store)
+        candidates = resolver._score_candidates(query, context_path)
+        assert [
+            (c.entity.canonical_name, c.score, c.match_type) for c in candidates
+        ] == RECORDED_CANDIDATES[(query, context_path)]
+
+    def test_update_reindexes_and_keeps_order(self, corpus_store):
+        """Renames are picked up, and updated people keep their position."""
+        resolver = EntityResolver(corpus_store)
+        sarah = corpus_store.get_by_name("Sarah Chen")
+        sarah.canonical_name = "Sarah Chenoweth"
+        corpus_store.update(sarah)
+
+        assert resolver._score_candidates("Sarah Chen", None) == []
+        names = [c.entity.canonical_name for c in resolver._score_candidates("Sarah", None)]
+        assert names[0] == "Sarah Chenoweth"
+
+    def test_delete_and_merge_filtering(self, corpus_store):
+        """Deleted and merged-away people are never candidates."""
+        resolver = EntityResolver(corpus_store)
+        chen = corpus_store.get_by_name("Sarah Chen")
+        miller = corpus_store.get_by_name("Sarah Miller")
+        corpus_store.delete(chen.id)
+        corpus_store._merged_ids[miller.id] = chen.id
+
+        names = [c.entity.canonical_name for c in resolver._score_candidates("Sarah", None)]
+        assert "Sarah Chen" not in names
+        assert "Sarah Miller" not in names
+        assert "Sara Milller" in names
+
+    def test_alias_last_name_is_blocked(self, corpus_store):
+        """People are found through an alias's last name (e.g. maiden names)."""
+        resolver = EntityResolver(corpus_store)
+        candidates = resolver._score_candidates("Marie Sklodowska", None)
+        assert [c.entity.canonical_name for c in candidates] == ["Marie Curie"]
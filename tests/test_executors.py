@@ -0,0 +1,109 @@
+"""Tests for the blocking-call executors used by async API handlers."""
+import asyncio
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import httpx
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
+
+from api.routes import crm
+from api.utils import executors
+from api.utils.executors import GOOGLE, SQLITE, offload, run_blocking, shutdown_executors
+
+
+@pytest.fixture(autouse=True)
+def fresh_executors():
+    shutdown_executors(wait=True)
+    yield
+    shutdown_executors(wait=True)
+
+
+class TestRunBlocking:
+    """Tests for run_blocking/offload."""
+
+    async def test_runs_off_the_event_loop_thread(self):
+        """Work runs on the resource's named pool, not the loop thread."""
+        loop_thread = threading.current_thread().name
+        worker = await run_blocking(GOOGLE, lambda: threading.current_thread().name)
+        assert worker != loop_thread
+        assert worker.startswith("google-io")
+
+    async def test_pool_is_bounded(self):
+        """No more than settings.*_executor_workers calls run at once."""
+        running, peak = 0, 0
+        lock = threading.Lock()
+
+        def work():
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.05)
+            with lock:
+                running -= 1
+
+        with patch.object(executors.settings, "google_executor_workers", 2):
+            await asyncio.gather(*(run_blocking(GOOGLE, work) for _ in range(6)))
+        assert peak == 2
+
+    async def test_offload_keeps_handler_awaitable(self):
+        """Decorated functions are coroutines that return the wrapped result."""
+        @offload(SQLITE)
+        def add(a, b=1):
+            return a + b
+
+        assert asyncio.iscoroutinefunction(add)
+        assert await add(2, b=3) == 5
+
+    def test_unknown_resource_rejected(self):
+        with pytest.raises(ValueError):
+            offload("gpu")
+
+
+class TestEventLoopStaysFree:
+    """A slow CRM query must not stall concurrent SSE streams."""
+
+    async def test_sse_streams_flow_during_heavy_crm_query(self):
+        app = FastAPI()
+        app.include_router(crm.router)
+        tick_times: dict[int, list[float]] = {0: [], 1: []}
+
+        @app.get("/stream/{stream_id}")
+        async def stream(stream_id: int):
+            async def generate():
+                for i in range(20):
+                    tick_times[stream_id].append(time.monotonic())
+                    yield f"data: {i}\n\n"
+                    await asyncio.sleep(0.05)
+            return StreamingResponse(generate(), media_type="text/event-stream")
+
+        def slow_statistics():
+            time.sleep(1.0)
+            return {"total_entities": 3}
+
+        person_store = MagicMock()
+        person_store.get_statistics.side_effect = slow_statistics
+        other_store = MagicMock()
+        other_store.get_statistics.return_value = {}
+
+        transport = httpx.ASGITransport(app=app)
+        with patch.object(crm, "get_person_entity_store", return_value=person_store), \
+                patch.object(crm, "get_source_entity_store", return_value=other_store), \
+                patch.object(crm, "get_relationship_store", return_value=other_store):
+            async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+                streams = [asyncio.create_task(client.get(f"/stream/{i}")) for i in tick_times]
+                while not all(len(times) >= 2 for times in tick_times.values()):
+                    await asyncio.sleep(0.01)
+                stats = await client.get("/api/crm/statistics")
+                streams = await asyncio.gather(*streams)
+
+        assert stats.status_code == 200
+        assert stats.json()["total_people"] == 3
+        for response in streams:
+            assert response.text.count("data: ") == 20
+        for times in tick_times.values():
+            gaps = [b - a for a, b in zip(times, times[1:])]
+            assert max(gaps) < 0.5
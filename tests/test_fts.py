@@ -0,0 +1,21 @@
+"""
+Tests for FTS5 query building.
+"""
+from api.utils.fts import build_match_query
+
+
+class TestBuildMatchQuery:
+    """Tests for build_match_query."""
+
+    def test_words_are_quoted_and_anded(self):
+        assert build_match_query("dinner tonight") == '"dinner" "tonight"'
+
+    def test_phrase_and_prefix(self):
+        assert build_match_query('"see you" tom*') == '"see you" "tom"*'
+
+    def test_operators_and_punctuation_are_literal(self):
+        assert build_match_query('NEAR(a b) OR c"') == '"NEAR" "a" "b" "OR" "c"'
+
+    def test_nothing_searchable(self):
+        assert build_match_query("") is None
+        assert build_match_query("?! *") is None
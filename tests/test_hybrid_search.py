@@ -318,6 +318,48 @@ class TestHybridSearch:
         assert len(results) == 1
         assert results[0]["id"] == "chunk1"
 
+    def test_search_many_batches_vector_queries(self, temp_db):
+        """search_many should issue one vector request and fuse each query separately."""
+        from api.services.hybrid_search import HybridSearch
+        from api.services.bm25_index import BM25Index
+        from unittest.mock import MagicMock
+
+        bm25 = BM25Index(db_path=temp_db)
+        bm25.add_document("chunk1", "Q4 budget planning meeting", "Budget.md")
+        bm25.add_document("chunk2", "Team standup notes", "Standup.md")
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.search_many.return_value = [
+            [{"id": "chunk1", "content": "Q4 budget planning meeting", "metadata": {}}],
+            [{"id": "chunk2", "content": "Team standup notes", "metadata": {}}],
+        ]
+
+        hybrid = HybridSearch(vector_store=mock_vector_store, bm25_index=bm25)
+        results = hybrid.search_many(["budget", "standup"], top_k=5, use_reranker=False)
+
+        mock_vector_store.search_many.assert_called_once()
+        mock_vector_store.search.assert_not_called()
+        assert [r[0]["id"] for r in results] == ["chunk1", "chunk2"]
+
+    def test_extra_keywords_only_widen_bm25(self, temp_db):
+        """extra_keywords reach BM25 but not the vector query."""
+        from api.services.hybrid_search import HybridSearch
+        from api.services.bm25_index import BM25Index
+        from unittest.mock import MagicMock
+
+        bm25 = BM25Index(db_path=temp_db)
+        bm25.add_document("chunk1", "Lunch with Xander", "Lunch.md")
+        bm25.add_document("chunk2", "Team standup notes", "Standup.md")
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.search.return_value = []
+
+        hybrid = HybridSearch(vector_store=mock_vector_store, bm25_index=bm25)
+        results = hybrid.search("Alexander", top_k=5, use_reranker=False, extra_keywords=["Xander"])
+
+        assert mock_vector_store.search.call_args.kwargs["query"] == "Alexander"
+        assert [r["id"] for r in results] == ["chunk1"]
+
 
 class TestHybridBenchmark:
     """Benchmark tests for hybrid retrieval quality."""
@@ -540,3 +582,144 @@ class TestQueryAwareReranking:
         assert 1 in protected
         assert 0 not in protected
         assert 2 not in protected
+
+
+class TestChunkIds:
+    """Test canonical chunk IDs shared by vector store and BM25 (RRF fusion)."""
+
+    @pytest.fixture
+    def temp_db(self):
+        """Create a temporary database file."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            yield f.name
+        os.unlink(f.name)
+
+    def test_make_and_parse_round_trip(self):
+        """Chunk and summary IDs should parse back to file path and index."""
+        from api.services.chunk_ids import make_chunk_id, make_summary_id, parse_chunk_id
+
+        assert make_chunk_id("/vault/Note.md", 3) == "/vault/Note.md::3"
+        assert parse_chunk_id("/vault/Note.md::3") == ("/vault/Note.md", 3)
+        assert parse_chunk_id(make_summary_id("/vault/Note.md")) == ("/vault/Note.md", None)
+        # Legacy BM25 format still parses
+        assert parse_chunk_id("/vault/My_Note.md_12") == ("/vault/My_Note.md", 12)
+        assert parse_chunk_id("chunk1") == ("chunk1", None)
+
+    def test_migrates_legacy_bm25_ids(self, temp_db):
+        """Opening an old index should rewrite {path}_{N} rows to {path}::{N}."""
+        import sqlite3
+        from api.services.bm25_index import BM25Index
+
+        conn = sqlite3.connect(temp_db)
+        conn.execute("""
+            CREATE VIRTUAL TABLE chunks_fts USING fts5(
+                doc_id, content, file_name, people, tokenize='porter unicode61'
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO chunks_fts (doc_id, content, file_name, people) VALUES (?, ?, ?, ?)",
+            [
+                ("/vault/Budget.md_0", "Q4 budget planning", "Budget.md", ""),
+                ("/vault/Budget.md::summary", "Document summary for Budget.md", "Budget.md", ""),
+            ]
+        )
+        conn.commit()
+        conn.close()
+
+        index = BM25Index(db_path=temp_db)
+        results = index.search("budget")
+
+        doc_ids = {r["doc_id"] for r in results}
+        assert doc_ids == {"/vault/Budget.md::0", "/vault/Budget.md::summary"}
+        chunk = next(r for r in results if r["doc_id"] == "/vault/Budget.md::0")
+        assert chunk["file_path"] == "/vault/Budget.md"
+        assert chunk["chunk_index"] == 0
+
+    def test_fusion_merges_hits_from_both_searches(self, temp_db):
+        """A chunk found by vector and BM25 should be fused into one result."""
+        from api.services.hybrid_search import HybridSearch
+        from api.services.bm25_index import BM25Index
+        from unittest.mock import MagicMock
+
+        bm25 = BM25Index(db_path=temp_db)
+        bm25.add_document("/vault/Budget.md::0", "Q4 budget planning", "Budget.md")
+        bm25.add_document("/vault/Review.md::2", "Budget review", "Review.md")
+
+        mock_vector_store = MagicMock()
+        mock_vector_store.search.return_value = [
+            {"id": "/vault/Standup.md::0", "content": "Team standup", "file_path": "/vault/Standup.md"},
+            {"id": "/vault/Budget.md::0", "content": "Q4 budget planning", "file_path": "/vault/Budget.md"},
+        ]
+
+        hybrid = HybridSearch(vector_store=mock_vector_store, bm25_index=bm25)
+        results = hybrid.search("budget", top_k=5, use_reranker=False, apply_recency_boost=False)
+
+        ids = [r["id"] for r in results]
+        assert ids.count("/vault/Budget.md::0") == 1
+        assert ids[0] == "/vault/Budget.md::0"
+        bm25_only = next(r for r in results if r["id"] == "/vault/Review.md::2")
+        assert bm25_only["file_path"] == "/vault/Review.md"
+
+
+class TestBM25FileReplace:
+    """Test per-file replace and persistent connections in BM25Index."""
+
+    @pytest.fixture
+    def temp_db(self):
+        """Create a temporary database file."""
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            yield f.name
+        os.unlink(f.name)
+
+    def _chunks(self, file_path, texts):
+        from api.services.chunk_ids import make_chunk_id
+        return [
+            {"doc_id": make_chunk_id(file_path, i), "content": text, "file_name": "Note.md"}
+            for i, text in enumerate(texts)
+        ]
+
+    def test_replace_file_removes_stale_chunks(self, temp_db):
+        """Shrinking a file should drop chunks beyond the new chunk count."""
+        from api.services.bm25_index import BM25Index
+
+        index = BM25Index(db_path=temp_db)
+        index.replace_file("/vault/Note.md", self._chunks("/vault/Note.md", ["alpha", "beta", "gamma"]))
+        index.replace_file("/vault/Note.md", self._chunks("/vault/Note.md", ["alpha revised"]))
+
+        assert index.count() == 1
+        assert index.search("gamma") == []
+        assert index.search("revised")[0]["doc_id"] == "/vault/Note.md::0"
+
+    def test_replace_file_keeps_summary(self, temp_db):
+        """Summary chunks survive replace_file but not delete_file."""
+        from api.services.bm25_index import BM25Index
+        from api.services.chunk_ids import make_summary_id
+
+        index = BM25Index(db_path=temp_db)
+        index.add_document(make_summary_id("/vault/Note.md"), "Document summary budget", "Note.md")
+        index.replace_file("/vault/Note.md", self._chunks("/vault/Note.md", ["alpha"]))
+        assert index.count() == 2
+
+        deleted = index.delete_file("/vault/Note.md")
+        assert deleted == 2
+        assert index.count() == 0
+
+    def test_reuses_connection_per_thread(self, temp_db):
+        """Repeated calls on one thread should share a single connection."""
+        import threading
+        from api.services.bm25_index import BM25Index
+
+        index = BM25Index(db_path=temp_db)
+        conn = index._get_connection()
+        index.add_document("/vault/A.md::0", "alpha", "A.md")
+        index.search("alpha")
+        assert index._get_connection() is conn
+
+        other = []
+        thread = threading.Thread(target=lambda: other.append(index._get_connection()))
+        thread.start()
+        thread.join()
+        assert other[0] is not conn
+
+        index.close()
+        assert index.count() == 1
@@ -196,6 +196,61 @@ class TestIMessageStore:
         assert temp_store._get_last_synced_rowid() == 0
 
 
+class TestIMessageFullTextSearch:
+    """Tests for the messages_fts index behind search_messages/query_messages."""
+
+    @pytest.fixture
+    def store(self, tmp_path):
+        store = IMessageStore(str(tmp_path / "imessage.db"))
+        base = datetime(2024, 6, 1, 12, 0, tzinfo=timezone.utc)
+        store._insert_batch([
+            (1, "Dinner at the Italian place?", base.isoformat(), 1, "+15551111111", "+15551111111", "iMessage"),
+            (2, "Italian food again, italian italian", (base + timedelta(days=1)).isoformat(), 0, "+15551111111", "+15551111111", "iMessage"),
+            (3, "Place the order for dinner", (base + timedelta(days=40)).isoformat(), 0, "+15552222222", "+15552222222", "SMS"),
+        ])
+        store.update_entity_mappings({"+15551111111": "entity-a", "+15552222222": "entity-b"})
+        return store
+
+    def test_ranked_with_snippets(self, store):
+        """Best match first, with highlighted excerpts."""
+        results = store.search_messages("italian")
+        assert [r.rowid for r in results] == [2, 1]
+        assert "**Italian**" in results[1].match_snippet
+
+    def test_phrase_and_prefix(self, store):
+        """Quoted phrases match in order; word* matches prefixes."""
+        assert [r.rowid for r in store.search_messages('"italian place"')] == [1]
+        assert [r.rowid for r in store.search_messages('"place italian"')] == []
+        assert {r.rowid for r in store.search_messages("din*")} == {1, 3}
+
+    def test_query_filters_by_entity_and_dates(self, store):
+        """Text search combines with entity and date string filters."""
+        results = store.query_messages(entity_id="entity-a", search_term="dinner")
+        assert [r.rowid for r in results] == [1]
+
+        results = store.query_messages(search_term="dinner", start_date="2024-06-02")
+        assert [r.rowid for r in results] == [3]
+
+        results = store.query_messages(entity_id="entity-a", end_date="2024-06-01")
+        assert [r.rowid for r in results] == [1]
+
+    def test_index_follows_updates_and_deletes(self, store):
+        """Re-exported and cleared messages are reflected in search."""
+        now = datetime.now(timezone.utc).isoformat()
+        store._insert_batch([(1, "Sushi instead?", now, 1, "+15551111111", "+15551111111", "iMessage")])
+        assert [r.rowid for r in store.search_messages("sushi")] == [1]
+        assert [r.rowid for r in store.search_messages("italian")] == [2]
+
+        store._clear_data()
+        assert store.search_messages("sushi") == []
+
+    def test_operators_are_plain_text(self, store):
+        """FTS5 syntax in user input doesn't raise."""
+        assert {r.rowid for r in store.search_messages("dinner (")} == {1, 3}
+        assert store.search_messages("dinner OR NEAR") == []
+        assert store.search_messages("???") == []
+
+
 class TestIMessageRecord:
     """Tests for IMessageRecord dataclass."""
 
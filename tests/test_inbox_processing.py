@@ -0,0 +1,194 @@
+"""Tests for event-driven Granola/Omi inbox processing."""
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from api.services.granola_processor import GranolaProcessor
+from api.services.omi_processor import OmiProcessor
+from api.services.inbox_processing import InboxDispatcher, ProcessedFileLedger
+from api.services.vault_catalog import VaultCatalog
+
+
+def _granola_note(path: Path, granola_id: str, body: str = "## Notes\nWeekly sync.") -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(f"---\ngranola_id: {granola_id}\n---\n\n{body}\n", encoding="utf-8")
+    return path
+
+
+def _wait_for(condition, timeout: float = 5.0) -> bool:
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if condition():
+            return True
+        time.sleep(0.05)
+    return condition()
+
+
+@pytest.fixture
+def vault(tmp_path):
+    vault = tmp_path / "vault"
+    (vault / "Granola").mkdir(parents=True)
+    return vault
+
+
+@pytest.fixture
+def catalog(vault, tmp_path):
+    catalog = VaultCatalog(vault, db_path=str(tmp_path / "catalog.db"))
+    yield catalog
+    catalog.stop_watching()
+
+
+@pytest.fixture
+def processor(vault, catalog):
+    processor = GranolaProcessor(str(vault), catalog=catalog)
+    yield processor
+    processor.stop()
+
+
+class TestProcessedFileLedger:
+    """Tests for the (path, hash) ledger."""
+
+    def test_record_and_discard(self, tmp_path):
+        """Only the recorded hash for the same processor counts as unchanged."""
+        db_path = str(tmp_path / "catalog.db")
+        ledger = ProcessedFileLedger("granola", db_path)
+        other = ProcessedFileLedger("omi", db_path)
+
+        ledger.record("/v/Granola/a.md", "h1")
+
+        assert ledger.is_unchanged("/v/Granola/a.md", "h1")
+        assert not ledger.is_unchanged("/v/Granola/a.md", "h2")
+        assert not other.is_unchanged("/v/Granola/a.md", "h1")
+
+        ledger.discard("/v/Granola/a.md")
+        assert not ledger.is_unchanged("/v/Granola/a.md", "h1")
+
+
+class TestProcessIfChanged:
+    """Tests for GranolaProcessor.process_if_changed."""
+
+    def test_moved_file_is_not_remembered(self, processor, vault):
+        """A note moved out of the inbox can be processed again if it reappears."""
+        source = _granola_note(vault / "Granola" / "Sync 2025-01-01.md", "g-1")
+        content = source.read_text()
+
+        first = processor.process_if_changed(str(source))
+        assert first is not None and not source.exists()
+
+        # Same note re-synced into the inbox: old copy is replaced
+        source.write_text(content)
+        second = processor.process_if_changed(str(source))
+        assert second == first
+        assert not source.exists()
+
+    def test_unchanged_file_left_in_place_is_skipped(self, processor, vault, monkeypatch):
+        """A file that stayed in the inbox isn't re-processed until it changes."""
+        source = _granola_note(vault / "Granola" / "Stuck.md", "g-2")
+        processor._ledger.record(source, processor.catalog.refresh_file(source).content_hash)
+
+        calls = []
+        monkeypatch.setattr(processor, "process_file", lambda path: calls.append(path))
+        assert processor.process_if_changed(str(source)) is None
+        assert calls == []
+
+        _granola_note(source, "g-2", body="## Notes\nEdited.")
+        processor.process_if_changed(str(source))
+        assert calls == [str(source)]
+
+    def test_backlog_force_ignores_ledger(self, processor, vault):
+        """process_backlog(force=True) re-processes unchanged files."""
+        source = _granola_note(vault / "Granola" / "Stuck.md", "g-3")
+        processor._ledger.record(source, processor.catalog.refresh_file(source).content_hash)
+
+        assert processor.process_backlog()["skipped"] == 1
+        assert source.exists()
+        assert processor.process_backlog(force=True)["processed"] == 1
+        assert not source.exists()
+
+
+class TestInboxDispatcher:
+    """Tests for the bounded worker pool."""
+
+    def test_only_inbox_markdown_is_queued(self, tmp_path):
+        """Files outside the inbox folder, deletes and non-markdown are ignored."""
+        handled = []
+        dispatcher = InboxDispatcher("Test", tmp_path / "Inbox", handled.append, max_workers=1)
+        dispatcher.start()
+        try:
+            dispatcher.on_vault_event(str(tmp_path / "Inbox" / "a.md"), "index")
+            dispatcher.on_vault_event(str(tmp_path / "Inbox" / "b.md"), "delete")
+            dispatcher.on_vault_event(str(tmp_path / "Inbox" / "Sub" / "c.md"), "index")
+            dispatcher.on_vault_event(str(tmp_path / "Other" / "d.md"), "index")
+            dispatcher.on_vault_event(str(tmp_path / "Inbox" / "e.png"), "index")
+            assert _wait_for(lambda: handled)
+        finally:
+            dispatcher.stop(wait=True)
+        assert handled == [str(tmp_path / "Inbox" / "a.md")]
+
+    def test_change_during_run_requeues_once(self, tmp_path):
+        """Events for a running file coalesce into a single re-run."""
+        started, release = threading.Event(), threading.Event()
+        handled = []
+
+        def handle(path):
+            handled.append(path)
+            started.set()
+            release.wait(5)
+
+        path = str(tmp_path / "Inbox" / "a.md")
+        dispatcher = InboxDispatcher("Test", tmp_path / "Inbox", handle, max_workers=2)
+        dispatcher.start()
+        try:
+            dispatcher.submit(path)
+            assert started.wait(5)
+            dispatcher.submit(path)
+            dispatcher.submit(path)
+            release.set()
+            assert _wait_for(lambda: len(handled) == 2)
+            time.sleep(0.2)
+        finally:
+            dispatcher.stop(wait=True)
+        assert handled == [path, path]
+
+
+class TestEventDriven:
+    """End-to-end: new inbox notes are processed from watcher events."""
+
+    def test_new_note_processed_within_seconds(self, processor, vault):
+        """A note dropped into Granola/ is classified and moved without polling."""
+        backlog = _granola_note(vault / "Granola" / "Backlog 2025-01-01.md", "g-old")
+        processor.start()
+        assert processor.is_running
+        assert _wait_for(lambda: not backlog.exists())
+
+        note = _granola_note(vault / "Granola" / "Fresh 2025-02-01.md", "g-new")
+        assert _wait_for(lambda: not note.exists())
+
+        # The catalog is updated just after the move
+        def moved():
+            return [p for p in processor.catalog.find_paths("granola_id", "g-new") if p != note]
+
+        assert _wait_for(lambda: len(moved()) == 1)
+        assert moved()[0].exists()
+        assert "Granola" not in moved()[0].parent.name
+
+    def test_stopping_one_processor_keeps_the_shared_watcher(self, processor, vault, catalog):
+        """Stopping Granola must not blind Omi, which shares the catalog's observer."""
+        (vault / "Omi" / "Events").mkdir(parents=True)
+        omi = OmiProcessor(str(vault), catalog=catalog)
+        processor.start()
+        omi.start()
+        try:
+            processor.stop()
+            assert catalog.is_watching
+
+            seen = []
+            catalog.subscribe(lambda path, action: seen.append(path))
+            note = vault / "Omi" / "Events" / "Walk.md"
+            note.write_text("---\nomi_id: o-1\n---\n\nWalk.\n", encoding="utf-8")
+            assert _wait_for(lambda: str(note) in seen)
+        finally:
+            omi.stop()
+        assert not catalog.is_watching
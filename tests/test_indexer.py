@@ -78,6 +78,7 @@ We talked about Q1 targets.
         mock_source_entity_store = MagicMock()
         mock_entity_resolver = MagicMock()
         mock_entity_resolver.resolve.return_value = None  # Don't create entities
+        mock_entity_resolver.resolve_many.side_effect = lambda requests, **kw: [None] * len(requests)
 
         indexer = IndexerService(
             vault_path=str(temp_vault),
@@ -199,6 +200,7 @@ No frontmatter here, just content.
         mock_source_entity_store = MagicMock()
         mock_entity_resolver = MagicMock()
         mock_entity_resolver.resolve.return_value = None
+        mock_entity_resolver.resolve_many.side_effect = lambda requests, **kw: [None] * len(requests)
 
         # Create new indexer (simulating restart)
         indexer2 = IndexerService(
@@ -247,6 +249,7 @@ class TestFileWatcher:
         mock_source_entity_store = MagicMock()
         mock_entity_resolver = MagicMock()
         mock_entity_resolver.resolve.return_value = None
+        mock_entity_resolver.resolve_many.side_effect = lambda requests, **kw: [None] * len(requests)
 
         indexer = IndexerService(
             vault_path=str(temp_vault),
@@ -327,3 +330,166 @@ This is freshly created content about testing.
         results = indexer.vector_store.search("will be deleted")
         deleted_results = [r for r in results if "to_delete.md" in r["file_name"]]
         assert len(deleted_results) == 0
+
+
+class TestBatchedIndexing:
+    """Test the cross-file batched pipeline used by index_all()."""
+
+    @pytest.fixture
+    def batched_indexer(self, tmp_path, monkeypatch):
+        """Indexer with a mocked vector store and a real temp BM25 index."""
+        from unittest.mock import MagicMock, patch
+        from api.services.bm25_index import BM25Index
+        from api.services.indexer import IndexerService
+
+        vault = tmp_path / "vault"
+        vault.mkdir()
+        for i in range(5):
+            (vault / f"note{i}.md").write_text(f"# Note {i}\n\nShort note number {i} about budgets.")
+
+        with patch("api.services.indexer.VectorStore") as mock_vs_cls, \
+                patch("api.services.indexer.BM25Index", lambda: BM25Index(db_path=str(tmp_path / "bm25.db"))), \
+                patch("api.services.indexer.HAS_V2_PEOPLE", False):
+            mock_vs_cls.return_value = MagicMock()
+            indexer = IndexerService(vault_path=str(vault), db_path=str(tmp_path / "chroma"))
+            indexer.INDEX_STATE_FILE = str(tmp_path / "vault_index_state.json")
+            yield indexer, vault
+
+    def test_batches_chunks_across_files(self, batched_indexer, monkeypatch):
+        """Chunks from several files should be embedded and written together."""
+        from config.settings import settings
+
+        indexer, vault = batched_indexer
+        monkeypatch.setattr(settings, "index_batch_size", 3)
+
+        count = indexer.index_all(skip_summaries=True)
+
+        assert count == 5
+        # 5 single-chunk files with batch size 3 -> two bulk writes, not five
+        calls = indexer.vector_store.update_documents.call_args_list
+        assert [len(call.args[0]) for call in calls] == [3, 2]
+        assert indexer.bm25_index.count() == 5
+
+    def test_checkpoint_state_compatible(self, batched_indexer):
+        """State file should still map file path -> mtime for every indexed file."""
+        import json
+
+        indexer, vault = batched_indexer
+        indexer.index_all(skip_summaries=True)
+
+        state = json.loads(Path(indexer.INDEX_STATE_FILE).read_text())
+        expected = {str(f): f.stat().st_mtime for f in vault.rglob("*.md")}
+        assert state == expected
+
+        # Nothing changed -> incremental run indexes nothing
+        assert indexer.index_all(skip_summaries=True) == 0
+
+    def test_failed_batch_falls_back_per_file(self, batched_indexer, monkeypatch):
+        """A failing bulk write should retry files individually."""
+        import json
+        from config.settings import settings
+
+        indexer, vault = batched_indexer
+        monkeypatch.setattr(settings, "index_batch_size", 100)
+
+        def update_documents(documents):
+            if len(documents) > 1 or documents[0][1]["file_name"] == "note2.md":
+                raise RuntimeError("boom")
+
+        indexer.vector_store.update_documents.side_effect = update_documents
+
+        count = indexer.index_all(skip_summaries=True)
+
+        assert count == 4
+        state = json.loads(Path(indexer.INDEX_STATE_FILE).read_text())
+        assert str(vault / "note2.md") not in state
+
+    def test_reindex_writes_only_changed_chunks(self, batched_indexer):
+        """Appending to a note should upsert only new/changed chunks."""
+        indexer, vault = batched_indexer
+        note = vault / "long.md"
+        sections = [f"## Section {i}\n\n" + f"Paragraph {i} about budgets and planning. " * 60 for i in range(4)]
+        note.write_text("# Long\n\n" + "\n\n".join(sections))
+
+        indexer.index_file(str(note))
+        assert indexer.vector_store.update_documents.call_count == 1
+        first_chunks = indexer.vector_store.update_documents.call_args.args[0][0][0]
+        assert len(first_chunks) > 2
+
+        # Unchanged file -> nothing rewritten
+        indexer.index_file(str(note))
+        assert indexer.vector_store.update_documents.call_count == 1
+        indexer.vector_store.upsert_documents.assert_not_called()
+        indexer.vector_store.delete_chunks.assert_not_called()
+
+        # Append a section -> only the tail is written
+        sections.append("## Section 4\n\n" + "Brand new paragraph about travel. " * 60)
+        note.write_text("# Long\n\n" + "\n\n".join(sections))
+        indexer.index_file(str(note))
+
+        assert indexer.vector_store.update_documents.call_count == 1
+        upserted = indexer.vector_store.upsert_documents.call_args.args[0][0][0]
+        assert 0 < len(upserted) < len(first_chunks)
+        assert any("Brand new paragraph" in c["content"] for c in upserted)
+
+        bm25_hits = indexer.bm25_index.search("travel")
+        assert bm25_hits and bm25_hits[0]["file_path"] == str(note)
+
+    def test_reindex_deletes_removed_chunks(self, batched_indexer):
+        """Chunks that disappear from a note should be deleted from both indexes."""
+        indexer, vault = batched_indexer
+        note = vault / "shrink.md"
+        sections = [f"## Section {i}\n\n" + f"Paragraph {i} about budgets. " * 60 for i in range(4)]
+        note.write_text("# Shrink\n\n" + "\n\n".join(sections))
+        indexer.index_file(str(note))
+        before = indexer.bm25_index.count()
+
+        note.write_text("# Shrink\n\n" + sections[0])
+        indexer.index_file(str(note))
+
+        removed = indexer.vector_store.delete_chunks.call_args.args[0]
+        assert removed
+        assert all(doc_id.startswith(f"{note}::") for doc_id in removed)
+        assert indexer.bm25_index.count() == before - len(removed)
+
+
+class TestSyncPeopleToV2:
+    """Test resolving a note's people into v2 interactions."""
+
+    def test_batch_failure_falls_back_per_person(self, tmp_path):
+        """A name that breaks the batch resolve only skips that person."""
+        from datetime import datetime, timezone
+        from unittest.mock import MagicMock, patch
+        from api.services.entity_resolver import ResolutionResult
+        from api.services.indexer import IndexerService
+        from api.services.person_entity import PersonEntity
+
+        alex = PersonEntity(canonical_name="Alex")
+
+        def resolve(name, **kwargs):
+            if name == "Bad Name":
+                raise ValueError("unparseable name")
+            return ResolutionResult(entity=alex, is_new=False, confidence=1.0, match_type="exact")
+
+        resolver = MagicMock()
+        resolver.resolve_many.side_effect = ValueError("unparseable name")
+        resolver.resolve.side_effect = resolve
+        interaction_store = MagicMock()
+        interaction_store.add_if_not_exists.return_value = (None, True)
+
+        with patch("api.services.indexer.VectorStore"), patch("api.services.indexer.BM25Index"):
+            indexer = IndexerService(
+                vault_path=str(tmp_path),
+                db_path=str(tmp_path / "chroma"),
+                interaction_store=interaction_store,
+                source_entity_store=MagicMock(),
+                entity_resolver=resolver,
+            )
+
+        affected = indexer._sync_people_to_v2(
+            tmp_path / "Standup.md", ["Bad Name", "Alex"], datetime.now(timezone.utc)
+        )
+
+        assert affected == {alex.id}
+        assert interaction_store.add_if_not_exists.call_count == 1
+        assert [c.kwargs["name"] for c in resolver.resolve.call_args_list] == ["Bad Name", "Alex"]
@@ -565,3 +565,474 @@ class TestTimezoneHandling:
         interaction = Interaction.from_row(row)
         assert interaction.timestamp.tzinfo is not None
         assert interaction.created_at.tzinfo is not None
+
+
+class TestEpochTimestamps:
+    """Tests for the ts_epoch column and epoch-based range queries."""
+
+    @pytest.fixture
+    def temp_store(self, tmp_path):
+        return InteractionStore(str(tmp_path / "interactions.db"))
+
+    def _insert_raw(self, store, interaction_id, person_id, timestamp, source_type="imessage"):
+        """Insert a row the way sync scripts do (raw SQL, no ts_epoch)."""
+        import sqlite3
+        conn = sqlite3.connect(store.db_path)
+        conn.execute(
+            """
+            INSERT INTO interactions (id, person_id, timestamp, source_type, title, created_at)
+            VALUES (?, ?, ?, ?, ?, ?)
+            """,
+            (interaction_id, person_id, timestamp, source_type, interaction_id, timestamp),
+        )
+        conn.commit()
+        conn.close()
+
+    def _ts_epoch(self, store, interaction_id):
+        import sqlite3
+        conn = sqlite3.connect(store.db_path)
+        value = conn.execute(
+            "SELECT ts_epoch FROM interactions WHERE id = ?", (interaction_id,)
+        ).fetchone()[0]
+        conn.close()
+        return value
+
+    def test_add_writes_ts_epoch(self, temp_store):
+        from datetime import timezone
+        from api.services.interaction_store import to_epoch
+
+        ts = datetime(2024, 6, 15, 10, 30, tzinfo=timezone.utc)
+        temp_store.add(Interaction(
+            id="i1", person_id="p1", timestamp=ts, source_type="gmail", title="Hi",
+        ))
+
+        assert self._ts_epoch(temp_store, "i1") == to_epoch(ts)
+
+    def test_raw_inserts_normalize_offsets(self, temp_store):
+        """Rows inserted with raw SQL get ts_epoch via trigger, across offsets."""
+        for interaction_id, ts in [
+            ("est", "2024-02-24T16:00:00-05:00"),
+            ("utc", "2024-02-24T21:00:00+00:00"),
+            ("zulu", "2024-02-24T21:00:00Z"),
+        ]:
+            self._insert_raw(temp_store, interaction_id, "p1", ts)
+
+        epochs = {self._ts_epoch(temp_store, i) for i in ("est", "utc", "zulu")}
+        assert len(epochs) == 1
+
+    def test_migration_backfills_legacy_rows(self, tmp_path):
+        import sqlite3
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE interactions (
+                id TEXT PRIMARY KEY, person_id TEXT NOT NULL, timestamp TIMESTAMP NOT NULL,
+                source_type TEXT NOT NULL, title TEXT NOT NULL, snippet TEXT,
+                source_link TEXT, source_id TEXT, created_at TIMESTAMP
+            )
+        """)
+        conn.execute(
+            "INSERT INTO interactions (id, person_id, timestamp, source_type, title) "
+            "VALUES ('old', 'p1', '2024-01-01T12:00:00-05:00', 'gmail', 'Old')"
+        )
+        conn.commit()
+        conn.close()
+
+        store = InteractionStore(db_path)
+
+        assert self._ts_epoch(store, "old") == int(
+            datetime.fromisoformat("2024-01-01T12:00:00-05:00").timestamp()
+        )
+        assert store.get_by_id("old").title == "Old"
+
+    def test_range_orders_by_instant_not_string(self, temp_store):
+        """Later instants sort first even when their offset makes the string smaller."""
+        from datetime import timezone
+
+        now = datetime.now(timezone.utc).replace(microsecond=0)
+        earlier = (now - timedelta(hours=3)).isoformat()
+        # Same instant as now - 1h, written with a -08:00 offset (lexically smaller)
+        later = (now - timedelta(hours=1)).astimezone(timezone(timedelta(hours=-8))).isoformat()
+        self._insert_raw(temp_store, "earlier", "p1", earlier)
+        self._insert_raw(temp_store, "later", "p1", later)
+
+        results = temp_store.get_for_person("p1", days_back=1)
+
+        assert [i.id for i in results] == ["later", "earlier"]
+
+    def test_all_in_range_includes_end_day(self, temp_store):
+        self._insert_raw(temp_store, "start", "p1", "2024-03-01T09:00:00-05:00")
+        self._insert_raw(temp_store, "end", "p1", "2024-03-02T22:00:00-05:00")
+        self._insert_raw(temp_store, "after", "p1", "2024-03-03T08:00:00+00:00")
+
+        results = temp_store.get_all_in_range(datetime(2024, 3, 1), datetime(2024, 3, 2))
+
+        assert {i.id for i in results} == {"start", "end"}
+
+    def test_specific_date_uses_recorded_day(self, temp_store):
+        # 22:00 at -05:00 is already March 3 in UTC, but was recorded on March 2
+        self._insert_raw(temp_store, "late", "p1", "2024-03-02T22:00:00-05:00")
+        self._insert_raw(temp_store, "next", "p1", "2024-03-03T01:00:00+00:00")
+
+        results = temp_store.get_for_person("p1", specific_date="2024-03-02")
+
+        assert [i.id for i in results] == ["late"]
+
+
+class TestAddMany:
+    """Tests for bulk interaction ingest."""
+
+    @pytest.fixture
+    def temp_store(self, tmp_path):
+        return InteractionStore(str(tmp_path / "interactions.db"))
+
+    def _interaction(self, person_id, source_id, title="Hello"):
+        from datetime import timezone
+        return Interaction(
+            id=str(uuid.uuid4()),
+            person_id=person_id,
+            timestamp=datetime(2024, 5, 1, 12, 0, tzinfo=timezone.utc),
+            source_type="gmail",
+            title=title,
+            source_id=source_id,
+            source_account="work",
+        )
+
+    def test_inserts_and_reports_people(self, temp_store):
+        inserted, person_ids = temp_store.add_many([
+            self._interaction("p1", "m1"),
+            self._interaction("p2", "m2"),
+        ])
+
+        assert inserted == 2
+        assert person_ids == {"p1", "p2"}
+        assert temp_store.get_by_source("gmail", "m1").source_account == "work"
+
+    def test_ignores_existing_rows(self, temp_store):
+        temp_store.add_many([self._interaction("p1", "m1")])
+
+        inserted, person_ids = temp_store.add_many([
+            self._interaction("p1", "m1", title="Duplicate"),
+            self._interaction("p1", "m1", title="Duplicate in batch"),
+            self._interaction("p3", "m3"),
+        ])
+
+        assert inserted == 1
+        assert person_ids == {"p3"}
+        assert temp_store.get_by_source("gmail", "m1").title == "Hello"
+        assert temp_store.count() == 2
+
+    def test_same_source_for_different_people(self, temp_store):
+        """One source item (e.g. a photo) may link to several people."""
+        inserted, _ = temp_store.add_many([
+            self._interaction("p1", "shared"),
+            self._interaction("p2", "shared"),
+        ])
+
+        assert inserted == 2
+
+    def test_replace_overwrites_content(self, temp_store):
+        temp_store.add_many([self._interaction("p1", "m1")])
+
+        inserted, _ = temp_store.add_many(
+            [self._interaction("p1", "m1", title="Edited")], on_conflict="replace"
+        )
+
+        assert inserted == 1
+        assert temp_store.get_by_source("gmail", "m1").title == "Edited"
+        assert temp_store.count() == 1
+
+    def test_resolves_merged_ids_once_per_person(self, temp_store):
+        from unittest.mock import MagicMock, patch
+
+        person_store = MagicMock()
+        person_store.get_canonical_id.side_effect = lambda pid: "primary" if pid == "merged" else pid
+
+        with patch("api.services.person_entity.get_person_entity_store", return_value=person_store):
+            inserted, person_ids = temp_store.add_many([
+                self._interaction("merged", "m1"),
+                self._interaction("merged", "m2"),
+            ])
+
+        assert person_store.get_canonical_id.call_count == 1
+        assert person_ids == {"primary"}
+        assert temp_store.get_by_source("gmail", "m2").person_id == "primary"
+
+    def test_unknown_conflict_mode(self, temp_store):
+        with pytest.raises(ValueError):
+            temp_store.add_many([], on_conflict="upsert")
+
+    def test_migration_removes_exact_duplicates(self, tmp_path):
+        import sqlite3
+        db_path = str(tmp_path / "dupes.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE interactions (
+                id TEXT PRIMARY KEY, person_id TEXT NOT NULL, timestamp TIMESTAMP NOT NULL,
+                source_type TEXT NOT NULL, title TEXT NOT NULL, snippet TEXT,
+                source_link TEXT, source_id TEXT, created_at TIMESTAMP
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO interactions (id, person_id, timestamp, source_type, title, source_id) "
+            "VALUES (?, ?, '2024-01-01T00:00:00', 'photos', 'Photo', ?)",
+            [("a", "p1", "photo-1"), ("b", "p1", "photo-1"), ("c", "p2", "photo-1")],
+        )
+        conn.commit()
+        conn.close()
+
+        store = InteractionStore(db_path)
+
+        assert store.count() == 2
+        assert store.get_by_id("a") is not None
+
+
+class TestDailyRollup:
+    """Tests for the trigger-maintained daily interaction rollup."""
+
+    @pytest.fixture
+    def temp_store(self, tmp_path):
+        return InteractionStore(str(tmp_path / "interactions.db"))
+
+    def _rollup(self, store):
+        import sqlite3
+        conn = sqlite3.connect(store.db_path)
+        try:
+            return conn.execute("""
+                SELECT person_id, day, source_type, subtype, source_account, count
+                FROM interaction_daily_rollup ORDER BY 1, 2, 3, 4, 5
+            """).fetchall()
+        finally:
+            conn.close()
+
+    def _interaction(self, person_id, source_id, title="→ Hello", source_type="gmail",
+                     days_ago=1, attendee_count=None, source_account="work"):
+        from datetime import timezone
+        return Interaction(
+            id=str(uuid.uuid4()),
+            person_id=person_id,
+            timestamp=datetime.now(timezone.utc) - timedelta(days=days_ago),
+            source_type=source_type,
+            title=title,
+            source_id=source_id,
+            source_account=source_account,
+            attendee_count=attendee_count,
+        )
+
+    def test_subtypes_derived_at_write_time(self, temp_store):
+        temp_store.add_many([
+            self._interaction("p1", "m1", title="→ Sent"),
+            self._interaction("p1", "m2", title="← Received"),
+            self._interaction("p1", "m3", title="← Received again"),
+            self._interaction("p1", "m4", title="↔ CC"),
+            self._interaction("p1", "e1", title="1:1", source_type="calendar", attendee_count=1),
+            self._interaction("p1", "e2", title="Standup", source_type="calendar", attendee_count=4),
+            self._interaction("p1", "e3", title="All hands", source_type="calendar", attendee_count=40),
+            self._interaction("p1", "t1", title="Hi", source_type="imessage", source_account=None),
+        ])
+
+        counts = {
+            (c["source_type"], c["subtype"], c["source_account"]): c["count"]
+            for c in temp_store.get_interaction_counts_with_subtypes("p1")
+        }
+
+        assert counts == {
+            ("gmail", "gmail_sent", "work"): 1,
+            ("gmail", "gmail_received", "work"): 2,
+            ("gmail", "gmail_cc", "work"): 1,
+            ("calendar", "calendar_1on1", "work"): 1,
+            ("calendar", "calendar_small_group", "work"): 1,
+            ("calendar", "calendar_large_meeting", "work"): 1,
+            ("imessage", None, None): 1,
+        }
+
+    def test_raw_sql_writes_update_rollup(self, temp_store):
+        import sqlite3
+        conn = sqlite3.connect(temp_store.db_path)
+        conn.execute(
+            "INSERT INTO interactions (id, person_id, timestamp, source_type, title, source_id) "
+            "VALUES ('a', 'p1', '2024-03-02T22:00:00-05:00', 'imessage', 'Hi', 'imessage_1')"
+        )
+        conn.commit()
+        assert self._rollup(temp_store) == [("p1", "2024-03-02", "imessage", "", "", 1)]
+
+        # Reassigning to another person moves the count
+        conn.execute("UPDATE interactions SET person_id = 'p2' WHERE id = 'a'")
+        conn.commit()
+        assert self._rollup(temp_store) == [("p2", "2024-03-02", "imessage", "", "", 1)]
+
+        conn.execute("DELETE FROM interactions WHERE id = 'a'")
+        conn.commit()
+        conn.close()
+        assert self._rollup(temp_store) == []
+
+    def test_replace_moves_subtype(self, temp_store):
+        temp_store.add_many([self._interaction("p1", "m1", title="← Received")])
+        temp_store.add_many([self._interaction("p1", "m1", title="→ Sent")], on_conflict="replace")
+
+        counts = temp_store.get_interaction_counts_with_subtypes("p1")
+
+        assert [(c["subtype"], c["count"]) for c in counts] == [("gmail_sent", 1)]
+
+    def test_delete_helpers_update_rollup(self, temp_store):
+        temp_store.add_many([
+            self._interaction("p1", "m1"),
+            self._interaction("p1", "m2"),
+            self._interaction("p2", "m3"),
+        ])
+
+        temp_store.delete_for_person("p1")
+
+        assert [row[0] for row in self._rollup(temp_store)] == ["p2"]
+
+    def test_counts_respect_window(self, temp_store):
+        temp_store.add_many([
+            self._interaction("p1", "m1", days_ago=1),
+            self._interaction("p1", "m2", days_ago=100),
+            self._interaction("p1", "t1", source_type="imessage", days_ago=500),
+        ])
+
+        assert temp_store.get_interaction_counts("p1", days_back=30) == {"gmail": 1}
+        assert temp_store.get_interaction_counts("p1", days_back=3650) == {"gmail": 2, "imessage": 1}
+        assert temp_store.get_source_counts_for_people(["p1"]) == {"p1": {"gmail": 2, "imessage": 1}}
+        assert temp_store.get_source_counts_for_people(["p1"], days_back=30) == {"p1": {"gmail": 1}}
+
+    def test_batch_counts_for_all_people(self, temp_store, monkeypatch):
+        from api.services import interaction_store
+
+        monkeypatch.setattr(interaction_store, "_QUERY_BATCH_SIZE", 1)
+        temp_store.add_many([
+            self._interaction("p1", "m1"),
+            self._interaction("p2", "m2"),
+            self._interaction("p2", "m3"),
+        ])
+
+        everyone = temp_store.get_all_interaction_counts_with_subtypes(days_back=30)
+        selected = temp_store.get_all_interaction_counts_with_subtypes(
+            days_back=30, person_ids=["p2", "p1", "p2"]
+        )
+
+        assert everyone == selected
+        assert everyone["p2"] == [
+            {"source_type": "gmail", "source_account": "work", "subtype": "gmail_sent", "count": 2}
+        ]
+
+    def test_daily_counts_and_latest_per_day(self, temp_store):
+        import sqlite3
+        from datetime import timezone
+        conn = sqlite3.connect(temp_store.db_path)
+        today = datetime.now(timezone.utc).strftime("%Y-%m-%d")
+        conn.executemany(
+            "INSERT INTO interactions (id, person_id, timestamp, source_type, title, source_id) "
+            "VALUES (?, 'p1', ?, ?, ?, ?)",
+            [
+                ("a", f"{today}T08:00:00+00:00", "imessage", "Morning", "imessage_1"),
+                ("b", f"{today}T09:00:00+00:00", "imessage", "Later", "imessage_2"),
+                ("c", f"{today}T07:00:00+00:00", "gmail", "→ Mail", "m1"),
+                ("d", "2001-01-01T07:00:00+00:00", "gmail", "→ Old", "m2"),
+            ],
+        )
+        conn.commit()
+        conn.close()
+
+        assert temp_store.get_daily_counts("p1", days_back=30) == {today: {"imessage": 2, "gmail": 1}}
+        assert temp_store.get_daily_counts("p1", days_back=30, source_types=["gmail"]) == {today: {"gmail": 1}}
+
+        latest = temp_store.get_latest_per_day("p1", days_back=30)
+        assert [i.id for i in latest[(today, "imessage")]] == ["b"]
+
+        latest = temp_store.get_latest_per_day("p1", days_back=30, per_group=5)
+        assert [i.id for i in latest[(today, "imessage")]] == ["b", "a"]
+        assert set(latest) == {(today, "imessage"), (today, "gmail")}
+
+    def test_backfills_existing_database(self, tmp_path):
+        import sqlite3
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""
+            CREATE TABLE interactions (
+                id TEXT PRIMARY KEY, person_id TEXT NOT NULL, timestamp TIMESTAMP NOT NULL,
+                source_type TEXT NOT NULL, title TEXT NOT NULL, snippet TEXT,
+                source_link TEXT, source_id TEXT, created_at TIMESTAMP
+            )
+        """)
+        conn.executemany(
+            "INSERT INTO interactions (id, person_id, timestamp, source_type, title, source_id) "
+            "VALUES (?, 'p1', '2024-01-01T10:00:00', 'gmail', ?, ?)",
+            [("a", "→ One", "m1"), ("b", "→ Two", "m2"), ("c", "← Three", "m3")],
+        )
+        conn.commit()
+        conn.close()
+
+        store = InteractionStore(db_path)
+        # Re-opening must not double count
+        store = InteractionStore(db_path)
+
+        assert self._rollup(store) == [
+            ("p1", "2024-01-01", "gmail", "gmail_received", "", 1),
+            ("p1", "2024-01-01", "gmail", "gmail_sent", "", 2),
+        ]
+
+
+class TestMessageSearch:
+    """Tests for the WhatsApp message FTS index (interactions_fts)."""
+
+    def _insert_raw(self, db_path, rows):
+        """Insert rows the way sync_whatsapp does (raw SQL)."""
+        import sqlite3
+        conn = sqlite3.connect(db_path)
+        conn.executemany(
+            "INSERT INTO interactions (id, person_id, timestamp, source_type, title, snippet, source_id) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            rows,
+        )
+        conn.commit()
+        conn.close()
+
+    @pytest.fixture
+    def temp_store(self, tmp_path):
+        store = InteractionStore(str(tmp_path / "interactions.db"))
+        self._insert_raw(store.db_path, [
+            ("w1", "p1", "2024-03-01T09:00:00+00:00", "whatsapp", "WhatsApp → Sam", "Flight lands at noon", "whatsapp_1"),
+            ("w2", "p1", "2024-03-05T09:00:00+00:00", "whatsapp", "WhatsApp ← Sam", "flight delayed, flight moved", "whatsapp_2"),
+            ("w3", "p2", "2024-03-06T09:00:00+00:00", "whatsapp", "WhatsApp ← Ana", "Flights are cheap", "whatsapp_3"),
+            ("g1", "p1", "2024-03-02T09:00:00+00:00", "gmail", "← Flight receipt", "Your flight receipt", "gmail_1"),
+        ])
+        return store
+
+    def test_only_message_sources_indexed(self, temp_store):
+        """Email snippets are not searched."""
+        results = temp_store.query_messages(search_term="flight")
+        assert [i.id for i in results] == ["w2", "w1"]
+
+    def test_ranked_prefix_and_filters(self, temp_store):
+        """Prefix matches, relevance order and person/day filters."""
+        assert [i.id for i in temp_store.query_messages(search_term="flight*", ranked=True)][0] == "w2"
+        assert {i.id for i in temp_store.query_messages(search_term="flight*")} == {"w1", "w2", "w3"}
+        assert [i.id for i in temp_store.query_messages(person_id="p1", end_day="2024-03-04")] == ["w1"]
+        assert [i.id for i in temp_store.query_messages(search_term='"lands at"', person_id="p1")] == ["w1"]
+
+    def test_index_tracks_changes(self, temp_store):
+        """Deletes and source type changes update the index."""
+        temp_store.delete("w2")
+        assert [i.id for i in temp_store.query_messages(search_term="delayed")] == []
+
+        import sqlite3
+        conn = sqlite3.connect(temp_store.db_path)
+        conn.execute("UPDATE interactions SET source_type = 'whatsapp' WHERE id = 'g1'")
+        conn.commit()
+        conn.close()
+        assert [i.id for i in temp_store.query_messages(search_term="receipt")] == ["g1"]
+
+    def test_backfills_existing_database(self, temp_store):
+        """Opening an existing database indexes rows already present."""
+        import sqlite3
+        conn = sqlite3.connect(temp_store.db_path)
+        conn.execute("DROP TABLE interactions_fts")
+        for suffix in ("insert", "delete", "update"):
+            conn.execute(f"DROP TRIGGER trg_interactions_fts_{suffix}")
+        conn.commit()
+        conn.close()
+
+        store = InteractionStore(temp_store.db_path)
+        assert [i.id for i in store.query_messages(search_term="cheap")] == ["w3"]
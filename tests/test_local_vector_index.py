@@ -0,0 +1,271 @@
+"""
+Tests for the embedded local vector index.
+
+Checks the Chroma-compatible collection API (add/upsert/get/query/delete,
+where filters) and that IVF search agrees with the exact scan.
+"""
+import subprocess
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def client(tmp_path):
+    from api.services.local_vector_index import LocalVectorClient
+    client = LocalVectorClient(path=str(tmp_path / "vector_index"))
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def collection(client):
+    collection = client.get_or_create_collection("test")
+    collection.add(
+        ids=["a", "b", "c"],
+        embeddings=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0], [0.7, 0.7, 0.0]],
+        documents=["doc a", "doc b", "doc c"],
+        metadatas=[
+            {"file_path": "/v/a.md", "modified_epoch_day": 100},
+            {"file_path": "/v/b.md", "modified_epoch_day": 200},
+            {"file_path": "/v/a.md", "modified_epoch_day": 300},
+        ],
+    )
+    return collection
+
+
+class TestLocalVectorCollection:
+    """Test the Chroma-compatible collection API."""
+
+    def test_query_returns_nearest_with_cosine_distance(self, collection):
+        results = collection.query(query_embeddings=[[1.0, 0.1, 0.0]], n_results=2)
+
+        assert results["ids"] == [["a", "c"]]
+        assert results["documents"] == [["doc a", "doc c"]]
+        assert results["metadatas"][0][0]["file_path"] == "/v/a.md"
+        assert results["distances"][0][0] == pytest.approx(1 - 1 / (1.01 ** 0.5), abs=1e-3)
+
+    def test_query_many_at_once(self, collection):
+        results = collection.query(query_embeddings=[[1.0, 0.0, 0.0], [0.0, 1.0, 0.0]], n_results=1)
+
+        assert results["ids"] == [["a"], ["b"]]
+
+    def test_query_with_where_filter(self, collection):
+        results = collection.query(
+            query_embeddings=[[1.0, 0.0, 0.0]],
+            n_results=5,
+            where={"$and": [{"file_path": "/v/a.md"}, {"modified_epoch_day": {"$gte": 200}}]},
+        )
+
+        assert results["ids"] == [["c"]]
+
+    def test_add_keeps_existing_and_upsert_replaces(self, collection):
+        collection.add(ids=["a"], embeddings=[[0.0, 0.0, 1.0]], documents=["ignored"])
+        assert collection.get(ids=["a"])["documents"] == ["doc a"]
+
+        collection.upsert(ids=["a"], embeddings=[[0.0, 0.0, 1.0]], documents=["new a"])
+        results = collection.query(query_embeddings=[[0.0, 0.0, 1.0]], n_results=1)
+        assert results["ids"] == [["a"]]
+        assert results["documents"] == [["new a"]]
+        assert collection.count() == 3
+
+    def test_delete_by_where_and_reuse_rows(self, collection):
+        collection.delete(where={"file_path": {"$in": ["/v/a.md"]}})
+        assert collection.count() == 1
+        assert collection.get(where={"file_path": "/v/a.md"})["ids"] == []
+
+        collection.add(ids=["d"], embeddings=[[1.0, 0.0, 0.0]], documents=["doc d"])
+        assert collection.query(query_embeddings=[[1.0, 0.0, 0.0]], n_results=1)["ids"] == [["d"]]
+        assert collection.count() == 2
+
+    def test_delete_without_filter_is_rejected(self, collection):
+        """delete() with neither ids nor where must not wipe the collection."""
+        with pytest.raises(ValueError):
+            collection.delete()
+        assert collection.count() == 3
+
+    def test_rejects_dimension_mismatch(self, collection):
+        with pytest.raises(ValueError):
+            collection.add(ids=["x"], embeddings=[[1.0, 0.0]])
+
+    def test_persists_across_reopen(self, tmp_path, client, collection):
+        from api.services.local_vector_index import LocalVectorClient
+
+        reopened = LocalVectorClient(path=str(client.path)).get_collection("test")
+
+        assert reopened.count() == 3
+        assert reopened.query(query_embeddings=[[0.0, 1.0, 0.0]], n_results=1)["ids"] == [["b"]]
+        reopened.close()
+
+    def test_sees_writes_from_other_connection(self, client, collection):
+        from api.services.local_vector_index import LocalVectorClient
+
+        other = LocalVectorClient(path=str(client.path)).get_collection("test")
+        other.upsert(ids=["e"], embeddings=[[0.0, 0.0, 1.0]], documents=["doc e"])
+
+        assert collection.count() == 4
+        assert collection.query(query_embeddings=[[0.0, 0.0, 1.0]], n_results=1)["ids"] == [["e"]]
+        other.close()
+
+    def test_delete_collection(self, client, collection):
+        client.delete_collection("test")
+
+        with pytest.raises(ValueError):
+            client.get_collection("test")
+
+
+_WRITER_SCRIPT = """
+import sys
+from api.services.local_vector_index import LocalVectorClient
+
+path, writer = sys.argv[1], int(sys.argv[2])
+collection = LocalVectorClient(path=path).get_or_create_collection("test")
+for batch in range(40):
+    ids = [f"w{writer}-{batch}-{i}" for i in range(5)]
+    embeddings = [[1.0, writer, batch, i] for i in range(5)]
+    collection.upsert(ids=ids, embeddings=embeddings, metadatas=[{"writer": writer}] * 5)
+    if batch % 4 == 3:
+        collection.delete(ids=ids[:2])
+collection.close()
+"""
+
+
+class TestMultiProcessWrites:
+    """Concurrent writers in separate processes must not share rows."""
+
+    def test_two_processes_keep_ids_and_vectors_paired(self, tmp_path):
+        from api.services.local_vector_index import LocalVectorClient
+
+        path = str(tmp_path / "vector_index")
+        repo_root = Path(__file__).resolve().parent.parent
+        writers = [
+            subprocess.Popen([sys.executable, "-c", _WRITER_SCRIPT, path, str(writer)], cwd=repo_root)
+            for writer in (1, 2)
+        ]
+        assert [w.wait(timeout=120) for w in writers] == [0, 0]
+
+        collection = LocalVectorClient(path=path).get_collection("test")
+        result = collection.get(include=["embeddings", "metadatas"])
+        # 40 batches of 5, 10 deletes of 2, per writer
+        assert len(result["ids"]) == 2 * (200 - 20)
+        for doc_id, embedding, metadata in zip(result["ids"], result["embeddings"], result["metadatas"]):
+            writer, batch, i = (int(part) for part in doc_id[1:].split("-"))
+            expected = np.array([1.0, writer, batch, i])
+            expected /= np.linalg.norm(expected)
+            assert metadata["writer"] == writer
+            assert np.allclose(embedding, expected, atol=1e-2), doc_id
+        collection.close()
+
+
+class TestIVFSearch:
+    """Test approximate search on larger collections."""
+
+    def test_ivf_matches_exact_top_result(self, client, monkeypatch):
+        import numpy as np
+        from config.settings import settings
+
+        rng = np.random.default_rng(42)
+        vectors = rng.normal(size=(2000, 16)).astype(np.float32)
+        collection = client.get_or_create_collection("big")
+        collection.add(ids=[str(i) for i in range(2000)], embeddings=vectors.tolist())
+        queries = vectors[:20] + rng.normal(scale=0.05, size=(20, 16))
+
+        monkeypatch.setattr(settings, "local_vector_ivf_min_rows", 10**9)
+        exact = collection.query(query_embeddings=queries.tolist(), n_results=1, include=[])
+
+        monkeypatch.setattr(settings, "local_vector_ivf_min_rows", 1000)
+        monkeypatch.setattr(settings, "local_vector_ivf_nprobe", 8)
+        approx = collection.query(query_embeddings=queries.tolist(), n_results=1, include=[])
+
+        assert collection._ivf is not None
+        assert approx["ids"] == exact["ids"]
+
+        # Rows written after the build are still found
+        collection.add(ids=["new"], embeddings=[[5.0] * 16])
+        assert collection.query(query_embeddings=[[1.0] * 16], n_results=1, include=[])["ids"] == [["new"]]
+
+    def test_ivf_finds_upserted_and_reused_rows(self, client, monkeypatch):
+        """Rows rewritten after the build are rescanned, not looked up in their old list."""
+        import numpy as np
+        from config.settings import settings
+
+        monkeypatch.setattr(settings, "local_vector_ivf_min_rows", 1000)
+        monkeypatch.setattr(settings, "local_vector_ivf_nprobe", 1)
+        rng = np.random.default_rng(7)
+        vectors = rng.normal(size=(2000, 16)).astype(np.float32)
+        collection = client.get_or_create_collection("big")
+        collection.add(ids=[str(i) for i in range(2000)], embeddings=vectors.tolist())
+        collection.query(query_embeddings=[vectors[0].tolist()], n_results=1, include=[])
+        assert collection._ivf is not None
+
+        # Move id "0" to the opposite side of the sphere
+        target = (-vectors[0]).tolist()
+        collection.upsert(ids=["0"], embeddings=[target])
+        assert collection.query(query_embeddings=[target], n_results=1, include=[])["ids"] == [["0"]]
+
+        # A freed row reused by a new id is found at its new position
+        collection.delete(ids=["1"])
+        reused = (-vectors[1]).tolist()
+        collection.add(ids=["reused"], embeddings=[reused])
+        assert collection.query(query_embeddings=[reused], n_results=1, include=[])["ids"] == [["reused"]]
+
+    def test_reload_drops_ivf_index(self, client, monkeypatch):
+        """Changes committed by another process invalidate the in-memory IVF index."""
+        from api.services.local_vector_index import LocalVectorCollection
+        from config.settings import settings
+
+        monkeypatch.setattr(settings, "local_vector_ivf_min_rows", 1000)
+        rng = np.random.default_rng(3)
+        vectors = rng.normal(size=(1200, 8)).astype(np.float32)
+        collection = client.get_or_create_collection("big")
+        collection.add(ids=[str(i) for i in range(1200)], embeddings=vectors.tolist())
+        collection.query(query_embeddings=[vectors[0].tolist()], n_results=1, include=[])
+        assert collection._ivf is not None
+
+        other = LocalVectorCollection("big", collection.path)
+        target = (-vectors[5]).tolist()
+        other.upsert(ids=["5"], embeddings=[target])
+        other.close()
+
+        assert collection.query(query_embeddings=[target], n_results=1, include=[])["ids"] == [["5"]]
+
+
+class TestVectorStoreLocalBackend:
+    """Test VectorStore running on the local backend."""
+
+    def test_add_and_search(self, tmp_path, monkeypatch):
+        from unittest.mock import MagicMock
+        from config.settings import settings
+        from api.services import local_vector_index
+        from api.services.vectorstore import VectorStore
+
+        monkeypatch.setattr(settings, "vector_backend", "local")
+        monkeypatch.setattr(settings, "local_vector_path", tmp_path / "vector_index")
+        local_vector_index.reset_local_vector_client()
+
+        fake_embeddings = MagicMock()
+        fake_embeddings.embed_texts.side_effect = lambda texts: [
+            [1.0, 0.0] if "budget" in t else [0.0, 1.0] for t in texts
+        ]
+        fake_embeddings.embed_queries.side_effect = lambda queries: [
+            [1.0, 0.0] if "budget" in q else [0.0, 1.0] for q in queries
+        ]
+        monkeypatch.setattr("api.services.embeddings.get_embedding_service", lambda: fake_embeddings)
+
+        store = VectorStore(collection_name="test_vault")
+        store.add_document(
+            [{"content": "Q4 budget review", "chunk_index": 0}, {"content": "Hiking trip", "chunk_index": 1}],
+            {"file_path": "/v/note.md", "file_name": "note.md", "modified_date": "2026-01-01", "people": ["Alex"]},
+        )
+
+        results = store.search("budget", top_k=1)
+
+        assert results[0]["id"] == "/v/note.md::0"
+        assert results[0]["people"] == ["Alex"]
+        store.delete_document("/v/note.md")
+        assert store.get_document_count() == 0
+        local_vector_index.reset_local_vector_client()
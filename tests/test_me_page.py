@@ -46,8 +46,17 @@ class TestMeStatsEndpoint:
         """Stats endpoint should return totals across all people."""
         from api.routes.crm import get_me_stats
 
+        mock_interaction_store = MagicMock()
+        mock_interaction_store.get_source_counts_for_people.return_value = {
+            "person-1": {"gmail": 100, "calendar": 20, "imessage": 400, "whatsapp": 100},
+            "person-2": {"gmail": 50, "calendar": 10, "slack": 200, "vault": 7},
+            "person-3": {"gmail": 25, "calendar": 5, "imessage": 100},
+            # Hidden/merged people are not in get_all() and are not counted
+            "hidden-person": {"gmail": 1000},
+        }
+
         with patch('api.routes.crm.get_person_entity_store', return_value=mock_person_store):
-            with patch('api.routes.crm.get_interaction_store'):
+            with patch('api.routes.crm.get_interaction_store', return_value=mock_interaction_store):
                 result = await get_me_stats()
 
         assert result.total_people == 3
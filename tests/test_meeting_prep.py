@@ -88,31 +88,46 @@ class TestFindPeopleNotes:
     def test_finds_people_notes(self):
         """Should find People notes for given names."""
         mock_search = MagicMock()
-        mock_search.search.return_value = [
+        mock_search.search_many.return_value = [[
             {
                 "file_path": "/vault/Work/ML/People/Alex Rechtman.md",
                 "file_name": "Alex Rechtman.md",
                 "content": "Alex is the director...",
             }
-        ]
+        ]]
 
         notes = _find_people_notes(["Alex"], mock_search)
 
         assert len(notes) == 1
         assert notes[0].title == "Alex Rechtman"
         assert notes[0].relevance == "attendee"
-        mock_search.search.assert_called()
+        mock_search.search_many.assert_called()
+
+    def test_searches_all_attendees_in_one_call(self):
+        """Attendee searches should be batched into a single search_many call."""
+        mock_search = MagicMock()
+        mock_search.search_many.return_value = [
+            [{"file_path": "/vault/People/Alex Rechtman.md", "file_name": "Alex Rechtman.md"}],
+            [{"file_path": "/vault/People/Sarah Chen.md", "file_name": "Sarah Chen.md"}],
+        ]
+
+        notes = _find_people_notes(["Alex", "Sarah"], mock_search)
+
+        assert [n.title for n in notes] == ["Alex Rechtman", "Sarah Chen"]
+        mock_search.search_many.assert_called_once()
+        assert mock_search.search_many.call_args.args[0] == ["Alex file:People", "Sarah file:People"]
+        mock_search.search.assert_not_called()
 
     def test_skips_non_people_notes(self):
         """Should skip results not in People folder."""
         mock_search = MagicMock()
-        mock_search.search.return_value = [
+        mock_search.search_many.return_value = [[
             {
                 "file_path": "/vault/Work/ML/Meetings/meeting.md",
                 "file_name": "meeting.md",
                 "content": "Alex attended...",
             }
-        ]
+        ]]
 
         notes = _find_people_notes(["Alex"], mock_search)
         assert len(notes) == 0
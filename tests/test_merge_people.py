@@ -320,6 +320,37 @@ class TestMergePeople:
             assert 'interactions_updated' in result
             assert 'source_entities_updated' in result
 
+    def test_merge_refreshes_stats_before_strength(self, mock_person_store, tmp_path):
+        """Queued stats are flushed before the primary's strength is recomputed."""
+        merged_file = tmp_path / "merged.json"
+        merged_file.write_text('{}')
+        order = []
+
+        mock_rel_store = MagicMock()
+        mock_rel_store.get_for_person.return_value = []
+
+        with patch('scripts.merge_people.get_person_entity_store', return_value=mock_person_store), \
+             patch('scripts.merge_people.get_interaction_db_path', return_value=":memory:"), \
+             patch('scripts.merge_people.get_crm_db_path', return_value=":memory:"), \
+             patch('api.services.relationship.get_relationship_store', return_value=mock_rel_store), \
+             patch('api.services.person_stats.refresh_person_stats',
+                   side_effect=lambda ids: order.append(("refresh", sorted(ids))) or {}), \
+             patch('api.services.relationship_metrics.update_strength_for_person',
+                   side_effect=lambda pid: order.append(("strength", pid)) or 0.0), \
+             patch('scripts.merge_people.MERGED_IDS_FILE', merged_file), \
+             patch('sqlite3.connect') as mock_conn:
+
+            mock_cursor = MagicMock()
+            mock_cursor.rowcount = 0
+            mock_cursor.fetchone.return_value = (0,)
+            mock_cursor.fetchall.return_value = []
+            mock_conn.return_value.execute.return_value = mock_cursor
+
+            from scripts.merge_people import merge_people
+            merge_people("primary-id", "secondary-id", dry_run=False)
+
+        assert order == [("refresh", ["primary-id"]), ("strength", "primary-id")]
+
 
 class TestMergeOperationDetails:
     """Tests for specific merge operation behaviors."""
@@ -303,6 +303,7 @@ class TestPersonEntityStore:
             yield store
             # Cleanup
             Path(f.name).unlink(missing_ok=True)
+            store.db_path.unlink(missing_ok=True)
 
     def test_add_and_get_by_id(self, temp_store):
         """Test adding an entity and retrieving by ID."""
@@ -468,6 +469,16 @@ class TestPersonEntityStore:
             assert retrieved.company == "Test Corp"
         finally:
             Path(storage_path).unlink(missing_ok=True)
+            Path(storage_path).with_suffix(".db").unlink(missing_ok=True)
+
+    def test_load_does_not_create_database(self, tmp_path):
+        """Opening an empty store leaves the disk untouched until save()."""
+        store = PersonEntityStore(str(tmp_path / "people_entities.json"))
+        assert not store.db_path.exists()
+
+        store.add(PersonEntity(canonical_name="New Person"))
+        store.save()
+        assert store.db_path.exists()
 
     def test_statistics(self, temp_store):
         """Test getting store statistics."""
@@ -525,6 +536,139 @@ class TestPersonEntityStore:
         assert temp_store.count() == 2
 
 
+class TestIncrementalPersistence:
+    """Tests for per-entity persistence in PersonEntityStore."""
+
+    @pytest.fixture
+    def storage_path(self, tmp_path, monkeypatch):
+        from config.settings import settings
+        monkeypatch.setattr(settings, "backup_path", str(tmp_path / "backups"))
+        return str(tmp_path / "people_entities.json")
+
+    def _make_store(self, storage_path):
+        store = PersonEntityStore(storage_path)
+        store._blocklist.clear()
+        return store
+
+    def _stored_rows(self, store):
+        import sqlite3
+        with sqlite3.connect(store.db_path) as conn:
+            return dict(conn.execute("SELECT id, data FROM person_entities"))
+
+    def test_imports_legacy_json(self, storage_path):
+        """Test that an existing people_entities.json is imported on first load."""
+        legacy = PersonEntity(canonical_name="Legacy Person", emails=["legacy@test.com"])
+        Path(storage_path).write_text(json.dumps([legacy.to_dict()]))
+
+        store = self._make_store(storage_path)
+
+        assert store.get_by_email("legacy@test.com").id == legacy.id
+        assert legacy.id in self._stored_rows(store)
+        # Legacy file is kept as a pre-migration backup
+        assert Path(storage_path).exists()
+
+    def test_save_writes_only_changed_entities(self, storage_path):
+        """Test that save() leaves untouched rows alone."""
+        store = self._make_store(storage_path)
+        alice = store.add(PersonEntity(canonical_name="Alice", emails=["alice@test.com"]))
+        bob = store.add(PersonEntity(canonical_name="Bob", emails=["bob@test.com"]))
+        store.save()
+
+        # Another process edits Alice directly in the database
+        import sqlite3
+        edited = dict(alice.to_dict(), company="Edited Elsewhere")
+        with sqlite3.connect(store.db_path) as conn:
+            conn.execute(
+                "UPDATE person_entities SET data = ? WHERE id = ?",
+                (json.dumps(edited), alice.id),
+            )
+
+        bob.company = "Bob Corp"
+        store.update(bob)
+        store.save()
+
+        rows = self._stored_rows(store)
+        assert json.loads(rows[alice.id])["company"] == "Edited Elsewhere"
+        assert json.loads(rows[bob.id])["company"] == "Bob Corp"
+
+    def test_delete_is_persisted(self, storage_path):
+        """Test that deleted entities are removed from disk on save."""
+        store = self._make_store(storage_path)
+        entity = store.add(PersonEntity(canonical_name="Gone", emails=["gone@test.com"]))
+        store.save()
+
+        store.delete(entity.id)
+        store.save()
+
+        reloaded = self._make_store(storage_path)
+        assert reloaded.get_by_id(entity.id) is None
+        assert reloaded.get_by_email("gone@test.com") is None
+
+    def test_mass_delete_aborts_save(self, storage_path):
+        """Test that deleting more than half the store is refused."""
+        store = self._make_store(storage_path)
+        entities = [
+            store.add(PersonEntity(canonical_name=f"Person {i}", emails=[f"p{i}@test.com"]))
+            for i in range(120)
+        ]
+        store.save()
+
+        for entity in entities[:70]:
+            store.delete(entity.id)
+
+        with pytest.raises(ValueError, match="Save aborted"):
+            store.save()
+        assert len(self._stored_rows(store)) == 120
+        # The refused deletes stay pending
+        assert store._deleted_ids == {e.id for e in entities[:70]}
+
+    def test_update_during_save_is_not_lost(self, storage_path, monkeypatch):
+        """Test that an entity marked dirty while save() is writing is saved next time."""
+        store = self._make_store(storage_path)
+        alice = store.add(PersonEntity(canonical_name="Alice", emails=["alice@test.com"]))
+        bob = PersonEntity(canonical_name="Bob", emails=["bob@test.com"])
+
+        write = store._write
+
+        def write_with_concurrent_add(rows, deleted_ids):
+            # Another thread adds Bob after the pending set was taken
+            store.add(bob)
+            write(rows, deleted_ids)
+
+        monkeypatch.setattr(store, "_write", write_with_concurrent_add)
+        store.save()
+        assert set(self._stored_rows(store)) == {alice.id}
+
+        monkeypatch.setattr(store, "_write", write)
+        store.save()
+        assert set(self._stored_rows(store)) == {alice.id, bob.id}
+
+    def test_failed_save_requeues_changes(self, storage_path, monkeypatch):
+        """Test that IDs from a failed write are retried by the next save()."""
+        store = self._make_store(storage_path)
+        alice = store.add(PersonEntity(canonical_name="Alice", emails=["alice@test.com"]))
+
+        write = store._write
+        monkeypatch.setattr(store, "_write", lambda rows, deleted_ids: (_ for _ in ()).throw(OSError("disk full")))
+        with pytest.raises(OSError):
+            store.save()
+
+        monkeypatch.setattr(store, "_write", write)
+        store.save()
+        assert alice.id in self._stored_rows(store)
+
+    def test_backup_is_rate_limited(self, storage_path, tmp_path):
+        """Test that save() takes at most one rolling backup per interval."""
+        store = self._make_store(storage_path)
+        store.add(PersonEntity(canonical_name="One", emails=["one@test.com"]))
+        store.save()
+        store.add(PersonEntity(canonical_name="Two", emails=["two@test.com"]))
+        store.save()
+
+        backups = list((tmp_path / "backups").glob("people_entities.*.db"))
+        assert len(backups) == 1
+
+
 class TestTimezoneHandling:
     """Tests for timezone-aware datetime handling."""
 
@@ -0,0 +1,132 @@
+"""
+Tests for person stats refresh and write-behind coalescing.
+"""
+import sqlite3
+import threading
+import pytest
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def entity_store(tmp_path, monkeypatch):
+    """PersonEntityStore and interactions db wired into refresh_person_stats."""
+    from api.services import interaction_store, person_entity
+    from api.services.person_entity import PersonEntity, PersonEntityStore
+
+    db_path = tmp_path / "interactions.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE interactions (id INTEGER PRIMARY KEY, person_id TEXT, source_type TEXT)")
+    conn.executemany("INSERT INTO interactions (person_id, source_type) VALUES (?, ?)", [
+        ("alice", "gmail"), ("alice", "gmail"), ("alice", "imessage"),
+        ("bob", "calendar"), ("bob", "vault"),
+        ("carol", "slack"),
+    ])
+    conn.commit()
+    conn.close()
+
+    store = PersonEntityStore(str(tmp_path / "people_entities.json"))
+    store._blocklist.clear()
+    for person_id in ("alice", "bob", "carol"):
+        store.add(PersonEntity(id=person_id, canonical_name=person_id.title()))
+    store.save()
+
+    monkeypatch.setattr(interaction_store, "get_interaction_db_path", lambda: str(db_path))
+    monkeypatch.setattr(person_entity, "get_person_entity_store", lambda: store)
+    return store
+
+
+class TestRefreshPersonStats:
+    """Test targeted stats refresh."""
+
+    def test_targeted_refresh_updates_counts(self, entity_store):
+        from api.services.person_stats import refresh_person_stats
+
+        stats = refresh_person_stats(["alice", "bob", "alice", "missing"])
+
+        assert stats == {"updated": 2, "total_interactions": 5}
+        alice = entity_store.get_by_id("alice")
+        assert alice.email_count == 2
+        assert alice.message_count == 1
+        bob = entity_store.get_by_id("bob")
+        assert bob.meeting_count == 1
+        assert bob.mention_count == 1
+        # Not requested, not touched
+        assert entity_store.get_by_id("carol").message_count == 0
+
+    def test_batches_large_id_lists(self, entity_store, monkeypatch):
+        from api.services import person_stats
+
+        monkeypatch.setattr(person_stats, "_QUERY_BATCH_SIZE", 2)
+        stats = person_stats.refresh_person_stats(["alice", "bob", "carol"])
+
+        assert stats["total_interactions"] == 6
+        assert entity_store.get_by_id("carol").message_count == 1
+
+
+class TestPersonStatsRefresher:
+    """Test write-behind coalescing of stats refreshes."""
+
+    @pytest.fixture
+    def calls(self, monkeypatch):
+        from api.services import person_stats
+
+        calls = []
+        monkeypatch.setattr(
+            person_stats, "refresh_person_stats",
+            lambda person_ids: calls.append(sorted(person_ids)) or {"updated": len(person_ids)},
+        )
+        return calls
+
+    def test_burst_coalesces_into_one_refresh(self, calls):
+        from api.services.person_stats import PersonStatsRefresher
+
+        refresher = PersonStatsRefresher(flush_interval=60)
+        for i in range(200):
+            refresher.mark_dirty({f"p{i % 3}"})
+
+        assert calls == []
+        assert refresher.pending() == 3
+
+        refresher.flush()
+
+        assert calls == [["p0", "p1", "p2"]]
+        assert refresher.pending() == 0
+
+    def test_timer_flushes_after_interval(self, calls, monkeypatch):
+        from api.services import person_stats
+
+        flushed = threading.Event()
+        monkeypatch.setattr(
+            person_stats, "refresh_person_stats",
+            lambda person_ids: calls.append(sorted(person_ids)) or flushed.set() or {},
+        )
+
+        refresher = person_stats.PersonStatsRefresher(flush_interval=0.05)
+        refresher.mark_dirty(["a"])
+        refresher.mark_dirty(["b"])
+
+        assert flushed.wait(timeout=5)
+        assert calls == [["a", "b"]]
+
+    def test_zero_interval_flushes_immediately(self, calls):
+        from api.services.person_stats import PersonStatsRefresher
+
+        refresher = PersonStatsRefresher(flush_interval=0)
+        refresher.mark_dirty(["a"])
+
+        assert calls == [["a"]]
+
+    def test_failed_flush_requeues(self, monkeypatch):
+        from api.services import person_stats
+
+        def fail(person_ids):
+            raise sqlite3.OperationalError("database is locked")
+
+        monkeypatch.setattr(person_stats, "refresh_person_stats", fail)
+        refresher = person_stats.PersonStatsRefresher(flush_interval=60)
+        refresher.mark_dirty(["a"])
+
+        refresher.flush()
+
+        assert refresher.pending() == 1
@@ -314,3 +314,75 @@ class TestRelationshipStore:
         assert stats["by_type"][TYPE_COWORKER] == 1
         assert stats["by_type"][TYPE_FRIEND] == 1
         assert stats["avg_shared_interactions"] > 0
+
+    def test_upsert_many_inserts_new_pairs(self, store):
+        """Test bulk upsert creates relationships for unseen pairs."""
+        result = store.upsert_many([
+            Relationship(person_a_id="p1", person_b_id="p2", shared_events_count=3,
+                         shared_contexts=["calendar"]),
+            Relationship(person_a_id="p3", person_b_id="p1", shared_events_count=1,
+                         shared_contexts=["calendar"]),
+        ], context="calendar", count_field="shared_events_count")
+
+        assert len(result) == 2
+        assert store.count() == 2
+        assert store.get_between("p1", "p3").shared_events_count == 1
+
+    def test_upsert_many_merges_existing(self, store):
+        """Test bulk upsert overwrites the count and widens the date range."""
+        store.add(Relationship(
+            person_a_id="p1",
+            person_b_id="p2",
+            relationship_type=TYPE_FRIEND,
+            shared_events_count=5,
+            shared_threads_count=2,
+            first_seen_together=datetime(2022, 1, 1, tzinfo=timezone.utc),
+            last_seen_together=datetime(2023, 1, 1, tzinfo=timezone.utc),
+            shared_contexts=["calendar"],
+        ))
+
+        store.upsert_many([Relationship(
+            person_a_id="p1",
+            person_b_id="p2",
+            shared_threads_count=7,
+            # Later first_seen must not replace the earlier one (offsets compared as instants)
+            first_seen_together=datetime.fromisoformat("2022-01-01T01:00:00-05:00"),
+            last_seen_together=datetime(2024, 6, 1, tzinfo=timezone.utc),
+            shared_contexts=["gmail"],
+        )], context="gmail", count_field="shared_threads_count")
+
+        rel = store.get_between("p1", "p2")
+        assert store.count() == 1
+        assert rel.relationship_type == TYPE_FRIEND
+        assert rel.shared_events_count == 5
+        assert rel.shared_threads_count == 7
+        assert rel.first_seen_together == datetime(2022, 1, 1, tzinfo=timezone.utc)
+        assert rel.last_seen_together == datetime(2024, 6, 1, tzinfo=timezone.utc)
+        assert rel.shared_contexts == ["calendar", "gmail"]
+
+    def test_upsert_many_context_only(self, store):
+        """Test bulk upsert without a count field keeps counts and dates."""
+        last_seen = datetime(2024, 1, 1, tzinfo=timezone.utc)
+        store.add(Relationship(
+            person_a_id="p1",
+            person_b_id="p2",
+            shared_messages_count=4,
+            last_seen_together=last_seen,
+            shared_contexts=["vault"],
+        ))
+
+        store.upsert_many(
+            [Relationship(person_a_id="p1", person_b_id="p2", shared_contexts=["vault"])],
+            context="vault",
+        )
+
+        rel = store.get_between("p1", "p2")
+        assert rel.shared_messages_count == 4
+        assert rel.last_seen_together == last_seen
+        assert rel.shared_contexts == ["vault"]
+
+    def test_upsert_many_rejects_unknown_field(self, store):
+        """Test bulk upsert only overwrites known per-source columns."""
+        with pytest.raises(ValueError):
+            store.upsert_many([Relationship(person_a_id="p1", person_b_id="p2")],
+                              context="calendar", count_field="id")
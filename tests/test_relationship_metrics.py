@@ -188,3 +188,144 @@ class TestRelationshipStrength:
         )
         # Check it's a reasonable precision (1 decimal for 0-100 scale)
         assert len(str(strength).split(".")[-1]) <= 1
+
+
+class TestBatchEngine:
+    """Golden-output tests: batch engine matches the per-person implementation."""
+
+    @pytest.fixture
+    def population(self):
+        """People with varied recency, counts, subtypes, sources and bonuses."""
+        import random
+        from api.services.person_entity import PersonEntity
+        from api.services.relationship import Relationship, TYPE_FAMILY, TYPE_FRIEND
+
+        rng = random.Random(42)
+        now = datetime.now(timezone.utc)
+        source_rows = [
+            ("gmail", "gmail_sent", "work"),
+            ("gmail", "gmail_received", "personal"),
+            ("gmail", "gmail_cc", None),
+            ("calendar", "calendar_1on1", "personal"),
+            ("calendar", "calendar_large_meeting", "work"),
+            ("imessage", None, None),
+            ("whatsapp", None, None),
+            ("slack", None, None),
+            ("vault", None, None),
+        ]
+
+        people, recent, lifetime, relationships = [], {}, {}, {}
+        for i in range(120):
+            # Mid-day offsets keep day boundaries away from test timing
+            last_seen = None
+            if i % 7:
+                last_seen = now - timedelta(days=rng.randint(0, 400), hours=12)
+            if i % 11 == 0 and last_seen:
+                last_seen = last_seen.replace(tzinfo=None)
+            person = PersonEntity(
+                id=f"person-{i:03d}",
+                canonical_name=f"Person {i}",
+                last_seen=last_seen,
+                sources=rng.sample(["contacts", "linkedin", "gmail", "calendar"], rng.randint(0, 2)),
+            )
+            people.append(person)
+
+            if i % 5 == 0:
+                continue  # No interactions at all
+            rows = rng.sample(source_rows, rng.randint(1, 4))
+            lifetime[person.id] = [
+                {"source_type": st, "subtype": sub, "source_account": acct, "count": rng.randint(1, 900 if i % 3 else 8)}
+                for st, sub, acct in rows
+            ]
+            recent[person.id] = [
+                dict(item, count=item["count"] // rng.randint(1, 4))
+                for item in lifetime[person.id][:rng.randint(0, len(rows))]
+            ]
+
+            if i % 4 == 0:
+                relationships[person.id] = Relationship(
+                    person_a_id="me",
+                    person_b_id=person.id,
+                    relationship_type=TYPE_FAMILY if i % 8 == 0 else TYPE_FRIEND,
+                    is_linkedin_connection=i % 12 == 0,
+                )
+
+        return people, recent, lifetime, relationships
+
+    def test_strengths_match_per_person(self, population, monkeypatch):
+        """compute_strengths_batch reproduces compute_strength_for_person exactly."""
+        from unittest.mock import MagicMock
+        from config.settings import settings
+        from api.services.relationship_metrics import compute_strength_for_person, compute_strengths_batch
+
+        people, recent, lifetime, relationships = population
+        monkeypatch.setattr(settings, "my_person_id", "me")
+        rel_store = MagicMock()
+        rel_store.get_between.side_effect = lambda a, b: relationships.get(b if a == "me" else a)
+        monkeypatch.setattr("api.services.relationship.get_relationship_store", lambda: rel_store)
+        monkeypatch.setattr("api.services.relationship_metrics.get_interaction_store", MagicMock)
+
+        expected = [
+            compute_strength_for_person(
+                p,
+                recent_interactions=recent.get(p.id, []),
+                lifetime_interactions=lifetime.get(p.id, []),
+            )
+            for p in people
+        ]
+        actual = compute_strengths_batch(people, recent, lifetime, relationships).tolist()
+
+        assert actual == expected
+        assert len(set(expected)) > 20  # population actually exercises the formula
+
+    def test_empty_population(self):
+        """Batch engine handles no people."""
+        from api.services.relationship_metrics import compute_strengths_batch, assign_dunbar_circles
+        import numpy as np
+
+        assert compute_strengths_batch([], {}, {}).tolist() == []
+        assert assign_dunbar_circles([], np.array([]), np.array([], dtype=bool)).tolist() == []
+
+    def test_circles_match_ranking_loop(self, monkeypatch):
+        """assign_dunbar_circles reproduces the sequential ranking algorithm."""
+        import random
+        import numpy as np
+        from api.services import relationship_metrics
+        from api.services.relationship_metrics import assign_dunbar_circles
+
+        rng = random.Random(7)
+        ids = [f"p{i}" for i in range(3000)]
+        # Coarse strengths create many ties; ~20% work people
+        strengths = [round(rng.uniform(5, 100), 0) for _ in ids]
+        is_work = [rng.random() < 0.2 for _ in ids]
+        overrides = {"p3": 0, "p10": 1, "p2500": 0}
+        monkeypatch.setattr(relationship_metrics, "CIRCLE_OVERRIDES_BY_ID", overrides)
+
+        # Reference: the original per-person loop
+        order = sorted(range(len(ids)), key=lambda i: strengths[i], reverse=True)
+        thresholds = [5, 20, 70, 220, 720, 2220]
+        expected, cutoffs, rank = {}, {}, 0
+        for i in (i for i in order if not is_work[i]):
+            if ids[i] in overrides:
+                expected[i] = overrides[ids[i]]
+                continue
+            circle = 6
+            for c, threshold in enumerate(thresholds):
+                if rank < threshold:
+                    circle = c + 1
+                    break
+            rank += 1
+            cutoffs[circle] = strengths[i]
+            expected[i] = circle
+        for i in (i for i in order if is_work[i]):
+            if ids[i] in overrides:
+                expected[i] = overrides[ids[i]]
+                continue
+            expected[i] = next(
+                (c for c in range(1, 7) if cutoffs.get(c) is not None and strengths[i] >= cutoffs[c]), 6
+            )
+
+        actual = assign_dunbar_circles(ids, np.array(strengths), np.array(is_work)).tolist()
+
+        assert actual == [expected[i] for i in range(len(ids))]
+        assert set(actual) == {0, 1, 2, 3, 4, 5, 6}
@@ -345,3 +345,150 @@ class TestProtectedReranking:
         assert reranked[1]["id"] == "match_2"
         assert reranked[1].get("protected") is True
         assert len(reranked) == 3
+
+
+class TestRerankerPerformance:
+    """Test score caching, batching and adaptive skipping."""
+
+    def _results(self):
+        return [
+            {"id": f"doc{i}", "content": f"content {i}", "hybrid_score": 0.9 - i * 0.01}
+            for i in range(5)
+        ]
+
+    def test_scores_cached_across_calls(self):
+        """Repeated searches should only score candidates not seen before."""
+        from api.services.reranker import RerankerService
+        from unittest.mock import MagicMock, patch
+
+        reranker = RerankerService(batch_size=8, cache_size=100)
+        mock_model = MagicMock()
+        mock_model.predict.side_effect = lambda pairs, **kwargs: [float(len(p[1])) for p in pairs]
+
+        with patch.object(reranker, '_get_model', return_value=mock_model):
+            reranker.rerank("budget", self._results(), top_k=2)
+            results = self._results() + [{"id": "doc5", "content": "content 5", "hybrid_score": 0.1}]
+            reranker.rerank("budget", results, top_k=2)
+
+        assert mock_model.predict.call_count == 2
+        second_pairs = mock_model.predict.call_args_list[1].args[0]
+        assert second_pairs == [("budget", "content 5")]
+        assert mock_model.predict.call_args.kwargs["batch_size"] == 8
+
+    def test_changed_content_is_rescored(self):
+        """A reindexed chunk (same id, new text) must not reuse a stale score."""
+        from api.services.reranker import RerankerService
+        from unittest.mock import MagicMock, patch
+
+        reranker = RerankerService(cache_size=100)
+        mock_model = MagicMock()
+        mock_model.predict.side_effect = lambda pairs, **kwargs: [0.5] * len(pairs)
+
+        with patch.object(reranker, '_get_model', return_value=mock_model):
+            reranker.rerank("budget", self._results(), top_k=2)
+            changed = self._results()
+            changed[0]["content"] = "rewritten"
+            reranker.rerank("budget", changed, top_k=2)
+
+        assert mock_model.predict.call_args.args[0] == [("budget", "rewritten")]
+
+    def test_decisive_lead_detection(self):
+        """Only a clear gap between the top two results counts as decisive."""
+        from api.services.hybrid_search import has_decisive_lead
+
+        assert has_decisive_lead([{"rrf_score": 0.06}, {"rrf_score": 0.02}], 0.5)
+        assert not has_decisive_lead([{"rrf_score": 0.033}, {"rrf_score": 0.032}], 0.5)
+        assert not has_decisive_lead([{"rrf_score": 0.06}, {"rrf_score": 0.02}], 0)
+        assert not has_decisive_lead([{"rrf_score": 0.06}], 0.5)
+
+    def test_boosted_lead_is_not_decisive(self):
+        """A lead that only exists after boosting doesn't skip reranking."""
+        from api.services.hybrid_search import has_decisive_lead
+
+        boosted = [
+            {"hybrid_score": 0.066, "rrf_score": 0.033},
+            {"hybrid_score": 0.032, "rrf_score": 0.032},
+        ]
+        assert not has_decisive_lead(boosted, 0.5)
+        # Runner-up by hybrid score isn't necessarily the runner-up by RRF
+        reordered = [
+            {"hybrid_score": 0.06, "rrf_score": 0.03},
+            {"hybrid_score": 0.02, "rrf_score": 0.01},
+            {"hybrid_score": 0.019, "rrf_score": 0.019},
+        ]
+        assert not has_decisive_lead(reordered, 0.5)
+
+    def test_search_skips_reranker_on_decisive_lead(self):
+        """HybridSearch should not call the cross-encoder when the winner is clear."""
+        import os
+        import tempfile
+        from unittest.mock import MagicMock, patch
+        from api.services.bm25_index import BM25Index
+        from api.services.hybrid_search import HybridSearch
+
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            temp_db = f.name
+        try:
+            bm25 = BM25Index(db_path=temp_db)
+            for i in range(4):
+                bm25.add_document(f"doc{i}", f"budget note {i}", f"Note{i}.md")
+
+            mock_vector_store = MagicMock()
+            mock_vector_store.search.return_value = [
+                {"id": f"doc{i}", "content": f"budget note {i}", "metadata": {}} for i in range(4)
+            ]
+            hybrid = HybridSearch(vector_store=mock_vector_store, bm25_index=bm25)
+
+            with patch("api.services.hybrid_search.has_decisive_lead", return_value=True), \
+                    patch("api.services.reranker.get_reranker") as mock_get_reranker:
+                results = hybrid.search("budget", top_k=2, use_reranker=True)
+
+            mock_get_reranker.assert_not_called()
+            assert len(results) == 2
+        finally:
+            os.unlink(temp_db)
+
+    def test_boosted_top_hit_still_reranks_the_rest(self):
+        """A filename-boosted winner must not stop positions 2..N being reranked."""
+        import os
+        import tempfile
+        from unittest.mock import MagicMock, patch
+        from api.services.bm25_index import BM25Index
+        from api.services.hybrid_search import HybridSearch
+        from api.services.reranker import RerankerService
+
+        with tempfile.NamedTemporaryFile(suffix='.db', delete=False) as f:
+            temp_db = f.name
+        try:
+            names = ["Taylor.md"] + [f"Note{i}.md" for i in range(1, 6)]
+            bm25 = BM25Index(db_path=temp_db)
+            for i, name in enumerate(names):
+                bm25.add_document(f"doc{i}", f"taylor budget {i}", name)
+
+            mock_vector_store = MagicMock()
+            mock_vector_store.search.return_value = [
+                {"id": f"doc{i}", "content": f"taylor budget {i}", "file_name": name, "metadata": {}}
+                for i, name in enumerate(names)
+            ]
+            hybrid = HybridSearch(vector_store=mock_vector_store, bm25_index=bm25)
+
+            # Cross-encoder agrees on the top hit but reverses the rest
+            reranker = RerankerService(cache_size=0)
+            mock_model = MagicMock()
+            mock_model.predict.side_effect = lambda pairs, **kwargs: [
+                10.0 if p[1].endswith(" 0") else float(p[1][-1]) for p in pairs
+            ]
+
+            with patch.dict("api.services.people.ALIAS_MAP", {"taylor": "Taylor"}), \
+                    patch("api.services.hybrid_search.find_protected_indices", return_value=[]), \
+                    patch("api.services.reranker.get_reranker", return_value=reranker), \
+                    patch.object(reranker, "_get_model", return_value=mock_model):
+                results = hybrid.search(
+                    "taylor budget", top_k=4, use_reranker=True, apply_recency_boost=False
+                )
+
+            assert results[0]["hybrid_score"] == 2 * results[0]["rrf_score"]
+            mock_model.predict.assert_called_once()
+            assert [r["id"] for r in results] == ["doc0", "doc5", "doc4", "doc3"]
+        finally:
+            os.unlink(temp_db)
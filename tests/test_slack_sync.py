@@ -0,0 +1,139 @@
+"""Tests for Slack message indexing and incremental sync state."""
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from api.services.slack_indexer import INDEX_BATCH_SIZE, SlackIndexer
+from api.services.slack_integration import SlackChannel, SlackMessage
+from api.services.slack_sync import SlackChannelStateStore, SlackSync
+
+
+def _message(i: int, text: str = "hello", channel_id: str = "D1") -> SlackMessage:
+    ts = datetime(2025, 1, 1, tzinfo=timezone.utc) + timedelta(minutes=i)
+    return SlackMessage(
+        ts=f"{ts.timestamp():.6f}",
+        channel_id=channel_id,
+        user_id="U1",
+        text=text,
+        timestamp=ts,
+    )
+
+
+def _dm() -> SlackChannel:
+    return SlackChannel(channel_id="D1", name="U1", is_im=True)
+
+
+@pytest.fixture
+def indexer():
+    """SlackIndexer with mocked client and vector store."""
+    client = MagicMock()
+    client.get_user_cached.return_value = None
+    idx = SlackIndexer(client=client)
+    idx._vector_store = MagicMock()
+    return idx
+
+
+@pytest.fixture
+def state_store(tmp_path):
+    """Channel state store backed by a temporary database."""
+    return SlackChannelStateStore(db_path=str(tmp_path / "crm.db"))
+
+
+class TestIndexMessagesBatching:
+    """Tests for SlackIndexer.index_messages."""
+
+    def test_upserts_in_batches(self, indexer):
+        """Messages are written INDEX_BATCH_SIZE at a time, skipping empty ones."""
+        messages = [_message(i) for i in range(INDEX_BATCH_SIZE + 5)]
+        messages.append(_message(999, text="   "))
+
+        indexed = indexer.index_messages(messages, _dm())
+
+        assert indexed == INDEX_BATCH_SIZE + 5
+        calls = indexer.vector_store.upsert_documents.call_args_list
+        assert [len(c.args[0]) for c in calls] == [INDEX_BATCH_SIZE, 5]
+        chunks, metadata = calls[0].args[0][0]
+        assert metadata["file_path"] == f"slack:D1:{messages[0].ts}"
+        assert chunks[0]["channel_id"] == "D1"
+        indexer.vector_store.add_document.assert_not_called()
+
+    def test_failed_batch_not_counted(self, indexer):
+        """A batch that fails to upsert is skipped, later batches still run."""
+        indexer.vector_store.upsert_documents.side_effect = [RuntimeError("down"), None]
+        messages = [_message(i) for i in range(INDEX_BATCH_SIZE + 3)]
+
+        assert indexer.index_messages(messages, _dm()) == 3
+
+
+class TestSlackChannelStateStore:
+    """Tests for channel high-water marks."""
+
+    def test_unknown_channel(self, state_store):
+        """Channels never synced have no mark."""
+        assert state_store.get("D1") is None
+        assert state_store.get_latest_timestamp("D1") is None
+
+    def test_advance_accumulates_and_never_rewinds(self, state_store):
+        """Counts add up and the mark only moves forward."""
+        newer, older = _message(10), _message(5)
+        state_store.advance("D1", newer.ts, newer.timestamp, indexed=4)
+        state_store.advance("D1", older.ts, older.timestamp, indexed=2)
+
+        state = state_store.get("D1")
+        assert state["latest_ts"] == newer.ts
+        assert state["latest_at"] == newer.timestamp
+        assert state["message_count"] == 6
+
+    def test_reset_replaces_count(self, state_store):
+        """Full syncs replace the message count."""
+        msg = _message(1)
+        state_store.advance("D1", msg.ts, msg.timestamp, indexed=10)
+        state_store.advance("D1", msg.ts, msg.timestamp, indexed=3, reset=True)
+        assert state_store.get("D1")["message_count"] == 3
+
+
+class TestSyncChannelHighWaterMark:
+    """Tests for SlackSync._sync_channel using the channel state."""
+
+    @pytest.fixture
+    def sync(self, indexer, state_store):
+        client = MagicMock()
+        return SlackSync(client=client, indexer=indexer, channel_state=state_store)
+
+    def test_incremental_uses_mark_without_scanning(self, sync, state_store):
+        """Incremental sync fetches from the stored mark, not the collection."""
+        last = _message(10)
+        state_store.advance("D1", last.ts, last.timestamp, indexed=1)
+        sync.client.get_all_channel_history.return_value = [_message(11), _message(12)]
+        sync.indexer.get_latest_timestamp = MagicMock()
+
+        stats = sync._sync_channel(_dm(), full=False, create_interactions=False)
+
+        sync.indexer.get_latest_timestamp.assert_not_called()
+        oldest = sync.client.get_all_channel_history.call_args.kwargs["oldest"]
+        assert oldest == last.timestamp - timedelta(seconds=1)
+        assert stats["messages_indexed"] == 2
+        state = state_store.get("D1")
+        assert state["latest_ts"] == _message(12).ts
+        assert state["message_count"] == 3
+
+    def test_overlap_is_not_counted_twice(self, sync, state_store):
+        """Messages re-fetched by the overlap buffer don't add to the count."""
+        last = _message(10)
+        state_store.advance("D1", last.ts, last.timestamp, indexed=5)
+        sync.client.get_all_channel_history.return_value = [last, _message(11)]
+
+        sync._sync_channel(_dm(), full=False, create_interactions=False)
+        sync._sync_channel(_dm(), full=False, create_interactions=False)
+
+        assert state_store.get("D1")["message_count"] == 6
+
+    def test_mark_not_advanced_on_partial_index(self, sync, state_store):
+        """If some messages fail to index, the mark stays put."""
+        sync.client.get_all_channel_history.return_value = [_message(1)]
+        sync.indexer.vector_store.upsert_documents.side_effect = RuntimeError("down")
+
+        sync._sync_channel(_dm(), full=True, create_interactions=False)
+
+        assert state_store.get("D1") is None
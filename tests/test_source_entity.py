@@ -203,6 +203,25 @@ class TestSourceEntityStore:
         entities = store.get_for_person("person2")
         assert len(entities) == 1
 
+    def test_get_for_people_batch_limits_per_person(self, store):
+        """The per-person limit keeps each person's most recent entities."""
+        for i in range(4):
+            for person_id in ("person1", "person2"):
+                entity = SourceEntity(
+                    source_type="gmail",
+                    source_id=f"{person_id}-msg{i}",
+                    canonical_person_id=person_id,
+                    observed_at=datetime(2025, 1, i + 1, tzinfo=timezone.utc),
+                )
+                store.add(entity, validate_person=False)
+
+        result = store.get_for_people_batch(["person1", "person2", "person3"], limit_per_person=2)
+
+        assert [e.source_id for e in result["person1"]] == ["person1-msg3", "person1-msg2"]
+        assert [e.source_id for e in result["person2"]] == ["person2-msg3", "person2-msg2"]
+        assert result["person3"] == []
+        assert len(store.get_for_people_batch(["person1"])["person1"]) == 4
+
     def test_get_unlinked(self, store):
         """Test getting unlinked entities."""
         # Add linked and unlinked entities
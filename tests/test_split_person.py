@@ -12,23 +12,43 @@ from pathlib import Path
 from unittest.mock import MagicMock, patch
 from datetime import datetime, timezone
 
-
-class TestRecalculatePersonStats:
-    """Tests for _recalculate_person_stats helper function."""
+from api.services.interaction_store import to_epoch
+
+
+def _interactions_db(rows: list[tuple[str, str, str, str]]) -> sqlite3.Connection:
+    """In-memory interactions table with ts_epoch filled in like the store does."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""
+        CREATE TABLE interactions (
+            id TEXT PRIMARY KEY,
+            person_id TEXT,
+            source_type TEXT,
+            timestamp TEXT,
+            ts_epoch INTEGER
+        )
+    """)
+    conn.executemany(
+        "INSERT INTO interactions VALUES (?, ?, ?, ?, ?)",
+        [(*row, to_epoch(datetime.fromisoformat(row[3]))) for row in rows],
+    )
+    conn.commit()
+    return conn
+
+
+class TestRecalculateSeenRange:
+    """Tests for _recalculate_seen_range helper function."""
+
+    @pytest.fixture(autouse=True)
+    def no_source_entities(self):
+        """Source entities (crm.db) contribute no observed_at dates."""
+        crm_conn = MagicMock()
+        crm_conn.execute.return_value.fetchone.return_value = (None, None)
+        with patch("api.routes.crm.get_connection", return_value=crm_conn):
+            yield
 
     @pytest.fixture
     def mock_int_conn(self):
         """Create an in-memory SQLite connection with test data."""
-        conn = sqlite3.connect(":memory:")
-        conn.execute("""
-            CREATE TABLE interactions (
-                id TEXT PRIMARY KEY,
-                person_id TEXT,
-                source_type TEXT,
-                timestamp TEXT
-            )
-        """)
-        # Insert test interactions
         test_data = [
             ("i1", "person-1", "gmail", "2024-01-01T10:00:00"),
             ("i2", "person-1", "gmail", "2024-01-02T10:00:00"),
@@ -37,12 +57,7 @@ class TestRecalculatePersonStats:
             ("i5", "person-1", "vault", "2024-01-05T10:00:00"),
             ("i6", "person-2", "gmail", "2024-01-06T10:00:00"),
         ]
-        conn.executemany(
-            "INSERT INTO interactions VALUES (?, ?, ?, ?)",
-            test_data
-        )
-        conn.commit()
-        return conn
+        return _interactions_db(test_data)
 
     @pytest.fixture
     def mock_person_store(self):
@@ -52,10 +67,8 @@ class TestRecalculatePersonStats:
         person = PersonEntity(
             id="person-1",
             canonical_name="Test Person",
-            email_count=10,  # Old value
-            meeting_count=5,
-            message_count=3,
-            mention_count=1,
+            first_seen=datetime(2023, 6, 1, tzinfo=timezone.utc),  # Old value
+            last_seen=datetime(2024, 2, 1, tzinfo=timezone.utc),
         )
 
         store = MagicMock()
@@ -63,35 +76,51 @@ class TestRecalculatePersonStats:
         store.update.return_value = None
         return store
 
-    def test_recalculates_stats_from_interactions(self, mock_int_conn, mock_person_store):
-        """Stats are recalculated from interactions table."""
-        from api.routes.crm import _recalculate_person_stats
+    def test_recalculates_seen_range_from_interactions(self, mock_int_conn, mock_person_store):
+        """first_seen/last_seen come from the person's own interactions."""
+        from api.routes.crm import _recalculate_seen_range
+
+        result = _recalculate_seen_range("person-1", mock_int_conn, mock_person_store)
 
-        result = _recalculate_person_stats("person-1", mock_int_conn, mock_person_store)
+        assert result['new']['first_seen'] == datetime(2024, 1, 1, 10, 0, tzinfo=timezone.utc)
+        assert result['new']['last_seen'] == datetime(2024, 1, 5, 10, 0, tzinfo=timezone.utc)
+        mock_person_store.update.assert_called_once()
 
-        # Verify stats were recalculated
-        assert result['new']['email_count'] == 2  # 2 gmail interactions
-        assert result['new']['meeting_count'] == 1  # 1 calendar interaction
-        assert result['new']['message_count'] == 1  # 1 imessage interaction
-        assert result['new']['mention_count'] == 1  # 1 vault interaction
+    def test_preserves_old_range_for_comparison(self, mock_int_conn, mock_person_store):
+        """Old dates are returned for logging/comparison."""
+        from api.routes.crm import _recalculate_seen_range
 
-    def test_preserves_old_stats_for_comparison(self, mock_int_conn, mock_person_store):
-        """Old stats are returned for logging/comparison."""
-        from api.routes.crm import _recalculate_person_stats
+        result = _recalculate_seen_range("person-1", mock_int_conn, mock_person_store)
 
-        result = _recalculate_person_stats("person-1", mock_int_conn, mock_person_store)
+        assert result['old']['first_seen'] == datetime(2023, 6, 1, tzinfo=timezone.utc)
+        assert result['old']['last_seen'] == datetime(2024, 2, 1, tzinfo=timezone.utc)
 
-        assert result['old']['email_count'] == 10
-        assert result['old']['meeting_count'] == 5
+    def test_first_last_seen_use_instants_not_strings(self, mock_person_store):
+        """Mixed Z/offset/naive timestamps are ordered by time, not lexically."""
+        from api.routes.crm import _recalculate_seen_range
+
+        conn = _interactions_db([
+            # Lexically smallest, but 2024-01-02 02:00 UTC
+            ("i1", "person-1", "gmail", "2024-01-01T20:00:00-06:00"),
+            ("i2", "person-1", "gmail", "2024-01-01T23:00:00Z"),
+            # Lexically largest, but 2024-01-02 01:00 UTC
+            ("i3", "person-1", "imessage", "2024-01-02T10:00:00+09:00"),
+        ])
+
+        _recalculate_seen_range("person-1", conn, mock_person_store)
+
+        person = mock_person_store.get_by_id.return_value
+        assert person.first_seen == datetime(2024, 1, 1, 23, 0, tzinfo=timezone.utc)
+        assert person.last_seen == datetime(2024, 1, 2, 2, 0, tzinfo=timezone.utc)
 
     def test_returns_empty_for_nonexistent_person(self, mock_int_conn):
         """Returns empty dict if person not found."""
-        from api.routes.crm import _recalculate_person_stats
+        from api.routes.crm import _recalculate_seen_range
 
         store = MagicMock()
         store.get_by_id.return_value = None
 
-        result = _recalculate_person_stats("nonexistent", mock_int_conn, store)
+        result = _recalculate_seen_range("nonexistent", mock_int_conn, store)
 
         assert result == {}
 
@@ -102,16 +131,6 @@ class TestRecalculateRelationshipWithMe:
     @pytest.fixture
     def mock_int_conn(self):
         """Create an in-memory SQLite connection with test data."""
-        conn = sqlite3.connect(":memory:")
-        conn.execute("""
-            CREATE TABLE interactions (
-                id TEXT PRIMARY KEY,
-                person_id TEXT,
-                source_type TEXT,
-                timestamp TEXT
-            )
-        """)
-        # Insert test interactions
         test_data = [
             ("i1", "person-1", "gmail", "2024-01-01T10:00:00"),
             ("i2", "person-1", "gmail", "2024-01-02T10:00:00"),
@@ -121,12 +140,7 @@ class TestRecalculateRelationshipWithMe:
             ("i6", "person-1", "phone", "2024-01-06T10:00:00"),
             ("i7", "person-1", "slack", "2024-01-07T10:00:00"),
         ]
-        conn.executemany(
-            "INSERT INTO interactions VALUES (?, ?, ?, ?)",
-            test_data
-        )
-        conn.commit()
-        return conn
+        return _interactions_db(test_data)
 
     def test_updates_existing_relationship(self, mock_int_conn):
         """Updates existing relationship with new counts."""
@@ -176,15 +190,7 @@ class TestRecalculateRelationshipWithMe:
         from api.services.relationship import Relationship
 
         # Empty interactions database
-        conn = sqlite3.connect(":memory:")
-        conn.execute("""
-            CREATE TABLE interactions (
-                id TEXT PRIMARY KEY,
-                person_id TEXT,
-                source_type TEXT,
-                timestamp TEXT
-            )
-        """)
+        conn = _interactions_db([])
 
         mock_existing = Relationship(
             id="rel-1",
@@ -0,0 +1,232 @@
+"""Tests for the vault metadata catalog and its use by the note processors."""
+import os
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+from api.services.granola_processor import GranolaProcessor
+from api.services.omi_processor import OmiProcessor
+from api.services.vault_catalog import VaultCatalog
+
+
+def _note(path, body="Body text.", **metadata):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    lines = ["---"]
+    for key, value in metadata.items():
+        if isinstance(value, list):
+            lines.append(f"{key}: [{', '.join(value)}]")
+        else:
+            lines.append(f"{key}: {value}")
+    lines.append("---")
+    path.write_text("\n".join(lines) + f"\n\n{body}\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def vault(tmp_path):
+    vault = tmp_path / "vault"
+    _note(vault / "Work" / "Meetings" / "Standup 2025-03-04.md", granola_id="g-1", people=["Alex", "Sam"], tags=["meeting"])
+    _note(vault / "Personal" / "Journal.md", body="Date: March 5, 2025\n\nThoughts.", tags=["journal"])
+    (vault / "attachment.png").write_bytes(b"\x89PNG")
+    return vault
+
+
+@pytest.fixture
+def catalog(vault, tmp_path):
+    catalog = VaultCatalog(vault, db_path=str(tmp_path / "catalog.db"))
+    yield catalog
+    catalog.stop_watching()
+
+
+class TestReconcile:
+    """Tests for VaultCatalog.reconcile."""
+
+    def test_catalogs_markdown_files(self, catalog, vault):
+        """Every .md file gets stat, hash, frontmatter, note date and type."""
+        changes = catalog.reconcile()
+
+        standup = str(vault / "Work" / "Meetings" / "Standup 2025-03-04.md")
+        journal = str(vault / "Personal" / "Journal.md")
+        assert sorted(changes.added) == sorted([standup, journal])
+        assert set(catalog.mtimes()) == {standup, journal}
+
+        entry = catalog.get(standup)
+        assert entry.size == os.stat(standup).st_size
+        assert entry.frontmatter["people"] == ["Alex", "Sam"]
+        assert entry.note_date == "2025-03-04"
+        assert entry.note_type == "Work"
+        assert catalog.get(journal).note_date == "2025-03-05"
+
+    def test_detects_modified_and_removed(self, catalog, vault):
+        """Changed files are re-parsed and deleted files dropped."""
+        catalog.reconcile()
+        journal = vault / "Personal" / "Journal.md"
+        _note(journal, tags=["journal", "private"])
+        (vault / "Work" / "Meetings" / "Standup 2025-03-04.md").unlink()
+
+        changes = catalog.reconcile()
+
+        assert changes.modified == [str(journal)]
+        assert len(changes.removed) == 1
+        assert catalog.find_paths("tags", "private") == [journal]
+        assert catalog.find("granola_id", "g-1") == []
+
+    def test_unchanged_content_is_not_reparsed(self, catalog, vault, monkeypatch):
+        """A touched file with the same hash only gets its stat updated."""
+        catalog.reconcile()
+        journal = vault / "Personal" / "Journal.md"
+        later = time.time() + 10
+        os.utime(journal, (later, later))
+
+        monkeypatch.setattr(catalog, "_build", lambda *a: pytest.fail("re-parsed unchanged file"))
+        changes = catalog.reconcile()
+
+        assert changes.total == 0
+        assert catalog.mtimes()[str(journal)] == os.stat(journal).st_mtime
+
+    def test_vaults_do_not_share_rows(self, catalog, vault, tmp_path):
+        """Two vaults in one database only see their own files."""
+        other_vault = tmp_path / "other"
+        _note(other_vault / "Note.md", granola_id="g-1")
+        other = VaultCatalog(other_vault, db_path=catalog.db_path)
+
+        catalog.reconcile()
+        other.reconcile()
+
+        assert catalog.find_paths("granola_id", "g-1") == [vault / "Work" / "Meetings" / "Standup 2025-03-04.md"]
+        assert other.find_paths("granola_id", "g-1") == [other_vault / "Note.md"]
+        assert len(catalog) == 2 and len(other) == 1
+
+
+class TestLookups:
+    """Tests for frontmatter key lookups."""
+
+    def test_list_values_are_indexed_per_element(self, catalog, vault):
+        """people/tags lists match on any element."""
+        standup = vault / "Work" / "Meetings" / "Standup 2025-03-04.md"
+        assert catalog.find_paths("people", "Sam") == [standup]
+        assert catalog.find_paths("tags", "journal") == [vault / "Personal" / "Journal.md"]
+        assert catalog.find_paths("people", "Nobody") == []
+
+    def test_find_duplicates(self, catalog, vault):
+        """Only values shared by two or more files are returned."""
+        copy = _note(vault / "Granola" / "Standup.md", granola_id="g-1")
+        _note(vault / "Granola" / "Other.md", granola_id="g-2")
+
+        duplicates = catalog.find_duplicates("granola_id")
+
+        assert duplicates == {"g-1": [copy, vault / "Work" / "Meetings" / "Standup 2025-03-04.md"]}
+
+    def test_refresh_and_remove_file(self, catalog, vault):
+        """Writers keep the catalog current without a full reconcile."""
+        catalog.reconcile()
+        new = _note(vault / "Granola" / "New.md", granola_id="g-9")
+        assert catalog.find_paths("granola_id", "g-9") == []
+
+        catalog.refresh_file(new)
+        assert catalog.find_paths("granola_id", "g-9") == [new]
+
+        new.unlink()
+        assert catalog.refresh_file(new) is None
+        assert catalog.get(new) is None
+
+
+class TestWatching:
+    """Tests for the shared vault observer."""
+
+    def test_events_update_catalog_and_notify_subscribers(self, catalog, vault):
+        """Debounced events are applied before subscribers are called."""
+        seen = []
+        catalog.subscribe(lambda path, action: seen.append((path, action, catalog.get(path))))
+        catalog.start_watching()
+        time.sleep(0.5)
+
+        new = _note(vault / "Granola" / "Live.md", granola_id="g-live")
+
+        deadline = time.time() + 5
+        while not seen and time.time() < deadline:
+            time.sleep(0.1)
+
+        assert seen and seen[0][:2] == (str(new), "index")
+        assert seen[0][2].frontmatter["granola_id"] == "g-live"
+
+    def test_start_reconciles_in_background(self, catalog, vault, monkeypatch):
+        """start_watching() returns before the vault scan; lookups wait for it."""
+        release = threading.Event()
+        scan = catalog._scan
+
+        def slow_scan():
+            release.wait(5)
+            return scan()
+
+        monkeypatch.setattr(catalog, "_scan", slow_scan)
+        started = time.time()
+        catalog.start_watching()
+        assert time.time() - started < 1
+        assert catalog.is_watching
+
+        threading.Timer(0.2, release.set).start()
+        standup = vault / "Work" / "Meetings" / "Standup 2025-03-04.md"
+        assert catalog.find_paths("granola_id", "g-1") == [standup]
+
+    def test_lookup_waits_for_background_reconcile(self, catalog, monkeypatch):
+        """A lookup racing the startup reconcile doesn't start a second scan."""
+        scans = []
+        scan = catalog._scan
+        reconcile = catalog.reconcile
+
+        def counting_scan():
+            scans.append(threading.current_thread().name)
+            return scan()
+
+        def late_reconcile():
+            if threading.current_thread().name == "VaultCatalogReconcile":
+                time.sleep(0.3)
+            return reconcile()
+
+        monkeypatch.setattr(catalog, "_scan", counting_scan)
+        monkeypatch.setattr(catalog, "reconcile", late_reconcile)
+        catalog.start_watching()
+
+        assert len(catalog.find_paths("granola_id", "g-1")) == 1
+        assert scans == ["VaultCatalogReconcile"]
+
+
+class TestProcessorDuplicates:
+    """Granola/Omi duplicate detection goes through the catalog."""
+
+    def test_granola_find_files_by_id(self, catalog, vault, monkeypatch):
+        """Duplicates are found without walking the vault."""
+        source = _note(vault / "Granola" / "Standup.md", granola_id="g-1")
+        processor = GranolaProcessor(str(vault), catalog=catalog)
+        catalog.reconcile()
+
+        monkeypatch.setattr(type(vault), "rglob", lambda *a: pytest.fail("vault walked"))
+        matches = processor.find_files_by_granola_id("g-1", exclude_path=source)
+
+        assert matches == [vault / "Work" / "Meetings" / "Standup 2025-03-04.md"]
+
+    def test_granola_process_file_updates_catalog(self, catalog, vault):
+        """Processing deletes the old copy and catalogs the moved note."""
+        source = _note(vault / "Granola" / "Standup 2025-03-04.md", body="## Notes\nWeekly sync.", granola_id="g-1")
+        processor = GranolaProcessor(str(vault), catalog=catalog)
+
+        dest = processor.process_file(str(source))
+
+        assert dest is not None
+        assert catalog.find_paths("granola_id", "g-1") == [Path(dest)]
+        assert catalog.get(source) is None
+
+    def test_omi_find_all_duplicates_skips_missing_files(self, catalog, vault):
+        """Stale catalog rows for deleted files don't count as duplicates."""
+        first = _note(vault / "Omi" / "Events" / "a.md", omi_id="o-1")
+        second = _note(vault / "Personal" / "Omi" / "a.md", omi_id="o-1")
+        _note(vault / "Personal" / "Omi" / "b.md", omi_id="o-2")
+        stale = _note(vault / "Personal" / "Omi" / "c.md", omi_id="o-2")
+        processor = OmiProcessor(str(vault), catalog=catalog)
+        catalog.reconcile()
+        stale.unlink()
+
+        assert processor.find_all_duplicates() == {"o-1": [first, second]}
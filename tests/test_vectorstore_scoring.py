@@ -0,0 +1,123 @@
+"""
+Tests for vector store result scoring (recency + semantic).
+
+These run without a ChromaDB server: results are fed to the scoring code
+in the same shape collection.query() returns.
+"""
+import json
+import pytest
+from datetime import date, timedelta
+
+pytestmark = pytest.mark.unit
+
+
+def _days_ago(days: int) -> str:
+    return (date.today() - timedelta(days=days)).isoformat()
+
+
+class TestEpochDays:
+    """Test date -> epoch day conversion."""
+
+    def test_parses_supported_formats(self):
+        from api.services.vectorstore import to_epoch_day
+
+        assert to_epoch_day("1970-01-02") == 1
+        assert to_epoch_day("2026-01-21T10:30:00") == to_epoch_day("20260121")
+
+    def test_unparseable_returns_none(self):
+        from api.services.vectorstore import to_epoch_day
+
+        assert to_epoch_day("") is None
+        assert to_epoch_day(None) is None
+        assert to_epoch_day("last week") is None
+
+    def test_stored_in_chunk_metadata(self):
+        from api.services.vectorstore import VectorStore, EPOCH_DAY_FIELD, to_epoch_day
+
+        store = VectorStore.__new__(VectorStore)
+        chunks = [{"content": "a", "chunk_index": 0}]
+        _, _, metadatas = store._build_records(
+            chunks, {"file_path": "/v/a.md", "file_name": "a.md", "modified_date": "2026-01-21"}
+        )
+        assert metadatas[0][EPOCH_DAY_FIELD] == to_epoch_day("2026-01-21")
+
+        _, _, metadatas = store._build_records(chunks, {"file_path": "/v/b.md", "file_name": "b.md"})
+        assert metadatas[0][EPOCH_DAY_FIELD] == -1
+
+
+class TestRecencyScores:
+    """Test vectorized recency scoring."""
+
+    @pytest.mark.parametrize("days_old,expected", [
+        (0, 1.0),
+        (15, 0.95),
+        (60, 0.8),
+        (365, 0.4),
+    ])
+    def test_score_bands(self, days_old, expected):
+        from api.services.vectorstore import VectorStore
+
+        store = VectorStore.__new__(VectorStore)
+        assert store._calculate_recency_score(_days_ago(days_old)) == pytest.approx(expected)
+
+    def test_undated_and_ml_scores(self):
+        import numpy as np
+        from api.services.vectorstore import recency_scores, to_epoch_day
+
+        old = float(to_epoch_day(_days_ago(2000)))
+        scores = recency_scores(np.array([np.nan, old, old]), ["", "", "ML"])
+
+        assert scores[0] == 0.5
+        assert scores[1] == pytest.approx(0.05)
+        assert scores[2] == 0.95
+
+
+class TestFormatResults:
+    """Test ranking and formatting of collection.query() results."""
+
+    @pytest.fixture
+    def store(self):
+        from api.services.vectorstore import VectorStore
+        return VectorStore.__new__(VectorStore)
+
+    def _query_result(self, rows):
+        return {
+            "ids": [[r[0] for r in rows]],
+            "documents": [[f"content {r[0]}" for r in rows]],
+            "metadatas": [[r[1] for r in rows]],
+            "distances": [[r[2] for r in rows]],
+        }
+
+    def test_recent_documents_rank_first(self, store):
+        from api.services.vectorstore import EPOCH_DAY_FIELD, to_epoch_day
+
+        results = self._query_result([
+            ("old", {EPOCH_DAY_FIELD: to_epoch_day(_days_ago(800))}, 0.1),
+            ("new", {EPOCH_DAY_FIELD: to_epoch_day(_days_ago(1))}, 0.3),
+        ])
+
+        formatted = store._format_results(results, 0, top_k=2, recency_weight=0.6)
+
+        assert [r["id"] for r in formatted] == ["new", "old"]
+        assert formatted[0]["score"] > formatted[1]["score"]
+
+    def test_legacy_chunks_fall_back_to_modified_date(self, store):
+        results = self._query_result([
+            ("legacy", {"modified_date": _days_ago(0)}, 0.5),
+        ])
+
+        formatted = store._format_results(results, 0, top_k=1, recency_weight=0.6)
+
+        assert formatted[0]["recency_score"] == 1.0
+
+    def test_top_k_with_json_fields_decoded(self, store):
+        rows = [
+            (f"doc{i}", {"people": json.dumps([f"P{i}"]), "tags": "not json"}, i / 10)
+            for i in range(5)
+        ]
+
+        formatted = store._format_results(self._query_result(rows), 0, top_k=2, recency_weight=0.0)
+
+        assert [r["id"] for r in formatted] == ["doc0", "doc1"]
+        assert formatted[0]["people"] == ["P0"]
+        assert formatted[0]["tags"] == []